@@ -0,0 +1,31 @@
+-- Migration 030: Batch posting_url rewrite RPC
+--
+-- url_validator.py rewrites custom Greenhouse career-page URLs to canonical
+-- job-board URLs. Every row gets a different URL, so the rewrite cannot be a
+-- single .update().in_("id", ...) call. This function applies a whole batch of
+-- (id, posting_url) pairs in one round trip.
+--
+-- Usage (supabase-py):
+--   supabase.rpc("update_raw_job_posting_urls", {
+--       "updates": [{"id": 123, "posting_url": "https://job-boards.greenhouse.io/acme/jobs/456"}]
+--   }).execute()
+--
+-- Returns the number of rows updated. Until this migration is applied,
+-- url_validator.py falls back to one update per row.
+
+CREATE OR REPLACE FUNCTION update_raw_job_posting_urls(updates JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH updated AS (
+        UPDATE raw_jobs r
+        SET posting_url = u.posting_url
+        FROM jsonb_to_recordset(updates) AS u(id BIGINT, posting_url TEXT)
+        WHERE r.id = u.id
+        RETURNING r.id
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$;
+
+-- Verification:
+-- SELECT update_raw_job_posting_urls('[]'::jsonb);  -- returns 0
@@ -0,0 +1,70 @@
+-- Migration 031: Server-side join for the API freshness checker
+--
+-- api_freshness_checker.py needs, per ATS source, every non-terminal job with
+-- its ATS job id and company slug. It used to page enriched_jobs, fetch
+-- raw_jobs in .in_() batches and join/parse metadata in Python. This function
+-- does the join in Postgres and returns the whole source as one JSONB array,
+-- ordered (grouped) by (company_slug, enriched_job_id).
+--
+-- One call per source: company_slug comes from raw_jobs.metadata after the
+-- join, so no index serves that order and keyset pages would each re-join and
+-- re-sort the source. A single scalar result is also not truncated by the
+-- PostgREST max-rows limit.
+--
+-- Usage (supabase-py):
+--   supabase.rpc("get_active_jobs_by_source", {"p_source": "lever"}).execute()
+--   -> data: [{enriched_job_id, source_job_id, company_slug, lever_instance,
+--              api_last_seen_at}, ...]
+--
+-- Until this migration is applied, api_freshness_checker.py falls back to the
+-- client-side join.
+--
+-- Risk Level: LOW (new function and partial index only)
+
+-- ============================================
+-- STEP 1: Source scan index
+-- ============================================
+
+-- Filter enriched_jobs by source and non-terminal status
+CREATE INDEX IF NOT EXISTS idx_enriched_jobs_source_open
+ON enriched_jobs (data_source, raw_job_id)
+WHERE url_status NOT IN ('404', '410', 'soft_404');
+
+-- ============================================
+-- STEP 2: Whole-source function
+-- ============================================
+
+CREATE OR REPLACE FUNCTION get_active_jobs_by_source(p_source TEXT)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(
+        jsonb_agg(to_jsonb(jobs) ORDER BY jobs.company_slug, jobs.enriched_job_id),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT
+            ej.id::BIGINT AS enriched_job_id,
+            rj.source_job_id::TEXT AS source_job_id,
+            rj.metadata::jsonb ->> 'company_slug' AS company_slug,
+            COALESCE(rj.metadata::jsonb ->> 'lever_instance', 'global') AS lever_instance,
+            ej.api_last_seen_at::TIMESTAMPTZ AS api_last_seen_at
+        FROM enriched_jobs ej
+        JOIN raw_jobs rj ON rj.id = ej.raw_job_id
+        WHERE ej.data_source = p_source
+          AND ej.url_status NOT IN ('404', '410', 'soft_404')
+          AND rj.source_job_id IS NOT NULL
+    ) jobs
+    WHERE COALESCE(jobs.company_slug, '') <> '';
+$$;
+
+COMMENT ON FUNCTION get_active_jobs_by_source(TEXT) IS 'Non-terminal jobs of an ATS source joined to raw_jobs metadata, as one JSONB array ordered by company slug (pipeline/api_freshness_checker.py).';
+
+-- ============================================
+-- Verification
+-- ============================================
+-- SELECT jsonb_array_length(get_active_jobs_by_source('ashby'));
+-- SELECT j ->> 'company_slug', COUNT(*)
+-- FROM jsonb_array_elements(get_active_jobs_by_source('ashby')) j
+-- GROUP BY 1 ORDER BY 2 DESC LIMIT 10;
@@ -0,0 +1,31 @@
+-- Migration 032: Per-company ATS listing snapshots
+--
+-- The nightly ingest (fetch_jobs.py) downloads every company's complete job
+-- listing; api_freshness_checker.py used to download the same listings again
+-- just to compute job id sets. The ingest now stores a compact snapshot per
+-- (source, company_slug): the listed job ids with their updated_at values and
+-- the fetch time. The freshness checker reuses any snapshot younger than
+-- --snapshot-max-age hours instead of calling the ATS API.
+--
+-- Written by: pipeline/listing_snapshots.py (save_listing_snapshot)
+-- Read by:    pipeline/api_freshness_checker.py (load_listing_snapshots)
+--
+-- Risk Level: LOW (new table, additive)
+
+CREATE TABLE IF NOT EXISTS ats_listing_snapshots (
+    source TEXT NOT NULL,
+    company_slug TEXT NOT NULL,
+    job_ids JSONB NOT NULL DEFAULT '{}'::jsonb,   -- {"<source_job_id>": <updated_at or null>}
+    job_count INTEGER NOT NULL DEFAULT 0,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source, company_slug)
+);
+
+-- Freshness checker reads one source's recent snapshots
+CREATE INDEX IF NOT EXISTS idx_ats_listing_snapshots_source_fetched
+ON ats_listing_snapshots (source, fetched_at);
+
+COMMENT ON TABLE ats_listing_snapshots IS 'Latest complete ATS listing per company (job ids + updated_at), written by the ingest and reused by the API freshness checker.';
+
+-- Verification:
+-- SELECT source, COUNT(*), MAX(fetched_at) FROM ats_listing_snapshots GROUP BY source;
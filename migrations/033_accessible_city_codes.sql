@@ -0,0 +1,87 @@
+-- Migration 033: Server-side report accessibility filter
+--
+-- report_generator.py used to fetch a deliberately broad set of jobs (every
+-- country-scoped remote and country-wide job worldwide) because PostgREST's
+-- cs operator cannot match compound JSON conditions, then discarded the wrong
+-- countries in Python (_is_job_accessible). A London report downloaded the
+-- whole US remote catalogue.
+--
+-- This migration stores, per job, the report cities whose candidates can
+-- apply (accessible_city_codes, computed from locations) and indexes it with
+-- GIN, so reports filter exactly on the server:
+--
+--   .contains('accessible_city_codes', ['lon'])
+--
+-- The rules mirror ReportGenerator._is_job_accessible() and CITY_CONFIG: a
+-- location grants access to a city on a direct city match, global remote
+-- scope, country-scoped remote or country-wide location in the city's
+-- country, or a matching region.
+--
+-- Adding a report city: update the VALUES list below and ReportGenerator's
+-- CITY_CONFIG/CITY_CODE_MAP, then recreate the column (DROP COLUMN + re-run
+-- STEP 2) so stored values are recomputed.
+--
+-- Until this migration is applied, report_generator.py falls back to the
+-- broad filter plus client-side refinement.
+--
+-- Risk Level: LOW (additive; adding a stored generated column rewrites enriched_jobs once)
+
+-- ============================================
+-- STEP 1: Accessibility function (IMMUTABLE, usable in a generated column)
+-- ============================================
+
+CREATE OR REPLACE FUNCTION report_accessible_city_codes(p_locations JSONB)
+RETURNS TEXT[]
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT COALESCE(array_agg(c.code ORDER BY c.code), '{}'::TEXT[])
+    FROM (VALUES
+        ('lon', 'london',        'GB', 'EMEA'),
+        ('nyc', 'new_york',      'US', 'AMER'),
+        ('den', 'denver',        'US', 'AMER'),
+        ('sfo', 'san_francisco', 'US', 'AMER'),
+        ('sgp', 'singapore',     'SG', 'APAC')
+    ) AS c(code, city, country_code, region)
+    WHERE EXISTS (
+        SELECT 1
+        FROM jsonb_array_elements(
+            CASE WHEN jsonb_typeof(p_locations) = 'array' THEN p_locations ELSE '[]'::jsonb END
+        ) AS loc
+        WHERE loc->>'city' = c.city
+           OR loc->>'scope' = 'global'
+           OR (loc->>'scope' = 'country' AND loc->>'country_code' = c.country_code)
+           OR (loc->>'type' = 'country' AND loc->>'country_code' = c.country_code)
+           OR loc->>'region' = c.region
+    )
+$$;
+
+COMMENT ON FUNCTION report_accessible_city_codes(JSONB) IS 'Report city codes (lon/nyc/den/sfo/sgp) whose candidates can apply to a job with these locations. Mirrors ReportGenerator._is_job_accessible().';
+
+-- ============================================
+-- STEP 2: Stored generated column + GIN index
+-- ============================================
+
+ALTER TABLE enriched_jobs
+ADD COLUMN IF NOT EXISTS accessible_city_codes TEXT[]
+GENERATED ALWAYS AS (report_accessible_city_codes(locations)) STORED;
+
+COMMENT ON COLUMN enriched_jobs.accessible_city_codes IS 'Report cities this job is accessible from (generated from locations, see migration 033).';
+
+CREATE INDEX IF NOT EXISTS idx_enriched_jobs_accessible_city_codes
+ON enriched_jobs USING GIN (accessible_city_codes);
+
+-- ============================================
+-- Verification
+-- ============================================
+-- Codes per location shape:
+-- SELECT report_accessible_city_codes('[{"type":"city","city":"london","country_code":"GB"}]');   -- {lon}
+-- SELECT report_accessible_city_codes('[{"type":"remote","scope":"country","country_code":"US"}]'); -- {den,nyc,sfo}
+-- SELECT report_accessible_city_codes('[{"type":"remote","scope":"global"}]');                      -- {den,lon,nyc,sfo,sgp}
+--
+-- Jobs per report city:
+-- SELECT code, COUNT(*) FROM enriched_jobs, unnest(accessible_city_codes) AS code GROUP BY code;
+--
+-- Index used by report filters:
+-- EXPLAIN SELECT id FROM enriched_jobs WHERE accessible_city_codes @> ARRAY['lon'];
@@ -0,0 +1,311 @@
+-- Migration 034: Daily report rollups
+--
+-- report_generator.py recomputes every count from raw enriched_jobs rows for
+-- the report's date range, so report latency grows with the table. This
+-- migration adds per-day rollups, written nightly by
+-- pipeline/report_rollups.py, keyed by (posted_date, city_code, job_family):
+--
+--   report_daily_counts             job counts per dimension value
+--                                   (summary, employer, seniority, job_subfamily,
+--                                    track, working_arrangement, skill)
+--   report_daily_salary_histograms  salary midpoint histograms (exact value ->
+--                                   job count) overall and per seniority/subfamily
+--   report_rollup_runs              finished rollup runs; the start of the latest
+--                                   finished backfill/incremental run is the
+--                                   incremental watermark
+--   report_rollup_dirty_days        posted_dates whose rollups went stale, logged
+--                                   by statement triggers on enriched_jobs
+--
+-- Both rollup tables are mergeable: a report range is the SUM over its days,
+-- and exact value histograms reproduce the sort-and-index percentiles exactly.
+-- Skill pairs are not rolled up (they grow quadratically per job and cannot be
+-- summed exactly from bounded per-day rows).
+--
+-- Incremental runs recompute the days logged since the watermark. A job
+-- marks its posted_date when it is inserted or deleted, and its old and new
+-- posted_date when a column the rollups read changes (reclassification,
+-- agency/employer/location backfills, posted_date moves). Writes that only
+-- touch other columns (url_status, api_last_seen_at, ...) mark nothing, so
+-- the nightly freshness checks do not dirty every day.
+--
+-- A run replaces each recomputed day with replace_report_rollup_day(), one
+-- transaction per day, so readers never see a deleted or half-written day.
+-- The run is recorded in report_rollup_runs only after its last day is
+-- written: a failed run is redone from the previous watermark, and
+-- get_report_rollup() reports days = 0 (the rollups engine computes from
+-- jobs) until a backfill has finished. get_report_rollup() does the summing
+-- in Postgres and returns one JSONB document, so
+-- ReportGenerator(engine='rollups') reads O(distinct values) instead of
+-- O(jobs).
+--
+-- Usage (supabase-py):
+--   supabase.rpc("get_report_rollup", {
+--       "p_city_code": "lon",
+--       "p_job_family": "data",
+--       "p_start_date": "2025-12-01",
+--       "p_end_date": "2025-12-31",
+--   }).execute()
+--
+--   supabase.rpc("replace_report_rollup_day", {
+--       "p_posted_date": "2025-12-01",
+--       "p_counts": [...],       -- report_daily_counts rows for the day
+--       "p_salaries": [...],     -- report_daily_salary_histograms rows
+--       "p_sketches": [...],     -- report_daily_salary_sketches rows (migration 035)
+--   }).execute()
+--
+-- Requires migration 033 (accessible_city_codes). Until this migration is
+-- applied, the rollups engine falls back to computing from enriched_jobs.
+--
+-- Risk Level: MEDIUM (new tables and functions; adds statement-level
+-- triggers to enriched_jobs writes)
+
+-- ============================================
+-- STEP 1: Rollup tables
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS report_daily_counts (
+    posted_date DATE NOT NULL,
+    city_code TEXT NOT NULL,
+    job_family TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    jobs INTEGER NOT NULL,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (city_code, job_family, posted_date, dimension, value)
+);
+
+COMMENT ON TABLE report_daily_counts IS 'Per-day job counts per report dimension value (written by pipeline/report_rollups.py).';
+COMMENT ON COLUMN report_daily_counts.computed_at IS 'Start of the rollup run that wrote the row.';
+
+CREATE TABLE IF NOT EXISTS report_daily_salary_histograms (
+    posted_date DATE NOT NULL,
+    city_code TEXT NOT NULL,
+    job_family TEXT NOT NULL,
+    segment TEXT NOT NULL,              -- overall, seniority, job_subfamily
+    segment_value TEXT NOT NULL,        -- '' for overall
+    salary_midpoint NUMERIC NOT NULL,   -- (salary_min + salary_max) / 2
+    jobs INTEGER NOT NULL,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (city_code, job_family, posted_date, segment, segment_value, salary_midpoint)
+);
+
+COMMENT ON TABLE report_daily_salary_histograms IS 'Per-day salary midpoint histograms per report segment (written by pipeline/report_rollups.py).';
+
+-- Day replacement
+CREATE INDEX IF NOT EXISTS idx_report_daily_counts_posted_date
+ON report_daily_counts (posted_date);
+
+CREATE INDEX IF NOT EXISTS idx_report_daily_salary_histograms_posted_date
+ON report_daily_salary_histograms (posted_date);
+
+-- ============================================
+-- STEP 2: Run log
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS report_rollup_runs (
+    id BIGSERIAL PRIMARY KEY,
+    kind TEXT NOT NULL CHECK (kind IN ('backfill', 'incremental', 'range')),
+    started_at TIMESTAMPTZ NOT NULL,    -- incremental watermark (backfill/incremental runs)
+    finished_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    start_date DATE,                    -- first/last posted_date recomputed
+    end_date DATE,
+    days INTEGER NOT NULL,
+    jobs INTEGER NOT NULL
+);
+
+COMMENT ON TABLE report_rollup_runs IS 'Finished report rollup runs (written by pipeline/report_rollups.py after the last day).';
+COMMENT ON COLUMN report_rollup_runs.kind IS 'backfill / incremental runs advance the watermark; range runs (--start/--end) do not.';
+
+CREATE INDEX IF NOT EXISTS idx_report_rollup_runs_started_at
+ON report_rollup_runs (kind, started_at DESC);
+
+-- ============================================
+-- STEP 3: Dirty-day log
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS report_rollup_dirty_days (
+    id BIGSERIAL PRIMARY KEY,
+    posted_date DATE NOT NULL,
+    marked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE report_rollup_dirty_days IS 'posted_dates whose report rollups are stale (enriched_jobs triggers); pruned by pipeline/report_rollups.py after each finished run.';
+
+CREATE INDEX IF NOT EXISTS idx_report_rollup_dirty_days_marked_at
+ON report_rollup_dirty_days (marked_at);
+
+-- One insert per statement (transition tables), appended without conflicts
+-- so concurrent ingest batches never wait on each other
+CREATE OR REPLACE FUNCTION mark_report_rollup_dirty_days()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO report_rollup_dirty_days (posted_date)
+        SELECT DISTINCT posted_date FROM new_rows WHERE posted_date IS NOT NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO report_rollup_dirty_days (posted_date)
+        SELECT DISTINCT posted_date FROM old_rows WHERE posted_date IS NOT NULL;
+    ELSE
+        -- Columns read by pipeline/report_rollups.py (ROLLUP_COLUMNS)
+        INSERT INTO report_rollup_dirty_days (posted_date)
+        SELECT DISTINCT days.posted_date
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        CROSS JOIN LATERAL (VALUES (o.posted_date), (n.posted_date)) AS days (posted_date)
+        WHERE days.posted_date IS NOT NULL
+          AND (o.posted_date, o.job_family, o.accessible_city_codes, o.employer_name,
+               o.is_agency, o.data_source, o.seniority, o.job_subfamily, o.track,
+               o.working_arrangement, o.skills, o.salary_min, o.salary_max)
+              IS DISTINCT FROM
+              (n.posted_date, n.job_family, n.accessible_city_codes, n.employer_name,
+               n.is_agency, n.data_source, n.seniority, n.job_subfamily, n.track,
+               n.working_arrangement, n.skills, n.salary_min, n.salary_max);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS report_rollup_dirty_insert ON enriched_jobs;
+CREATE TRIGGER report_rollup_dirty_insert
+    AFTER INSERT ON enriched_jobs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_report_rollup_dirty_days();
+
+DROP TRIGGER IF EXISTS report_rollup_dirty_update ON enriched_jobs;
+CREATE TRIGGER report_rollup_dirty_update
+    AFTER UPDATE ON enriched_jobs
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_report_rollup_dirty_days();
+
+DROP TRIGGER IF EXISTS report_rollup_dirty_delete ON enriched_jobs;
+CREATE TRIGGER report_rollup_dirty_delete
+    AFTER DELETE ON enriched_jobs
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_report_rollup_dirty_days();
+
+-- ============================================
+-- STEP 4: Atomic day replacement RPC
+-- ============================================
+
+-- p_sketches is ignored here; migration 035 redefines the function to swap
+-- report_daily_salary_sketches as well.
+CREATE OR REPLACE FUNCTION replace_report_rollup_day(
+    p_posted_date DATE,
+    p_counts JSONB,
+    p_salaries JSONB,
+    p_sketches JSONB DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('replace_report_rollup_day'), p_posted_date - DATE '2000-01-01');
+
+    DELETE FROM report_daily_counts WHERE posted_date = p_posted_date;
+    DELETE FROM report_daily_salary_histograms WHERE posted_date = p_posted_date;
+
+    INSERT INTO report_daily_counts
+    SELECT * FROM jsonb_populate_recordset(NULL::report_daily_counts, COALESCE(p_counts, '[]'::jsonb))
+    WHERE posted_date = p_posted_date;
+
+    INSERT INTO report_daily_salary_histograms
+    SELECT * FROM jsonb_populate_recordset(NULL::report_daily_salary_histograms, COALESCE(p_salaries, '[]'::jsonb))
+    WHERE posted_date = p_posted_date;
+END;
+$$;
+
+COMMENT ON FUNCTION replace_report_rollup_day(DATE, JSONB, JSONB, JSONB) IS 'Replace one posted_date of the report rollup tables in a single transaction (pipeline/report_rollups.py).';
+
+-- ============================================
+-- STEP 5: Range summing RPC
+-- ============================================
+
+CREATE OR REPLACE FUNCTION get_report_rollup(
+    p_city_code TEXT,
+    p_job_family TEXT,
+    p_start_date DATE,
+    p_end_date DATE
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'counts', COALESCE((
+            SELECT jsonb_object_agg(dimension, dimension_values)
+            FROM (
+                SELECT dimension, jsonb_object_agg(value, jobs) AS dimension_values
+                FROM (
+                    SELECT dimension, value, SUM(jobs) AS jobs
+                    FROM report_daily_counts
+                    WHERE city_code = p_city_code
+                      AND job_family = p_job_family
+                      AND posted_date BETWEEN p_start_date AND p_end_date
+                    GROUP BY dimension, value
+                ) summed
+                GROUP BY dimension
+            ) dimensions
+        ), '{}'::jsonb),
+        'salary', COALESCE((
+            SELECT jsonb_object_agg(segment, segment_values)
+            FROM (
+                SELECT segment, jsonb_object_agg(segment_value, histogram) AS segment_values
+                FROM (
+                    SELECT segment, segment_value, jsonb_object_agg(salary_midpoint::TEXT, jobs) AS histogram
+                    FROM (
+                        SELECT segment, segment_value, salary_midpoint, SUM(jobs) AS jobs
+                        FROM report_daily_salary_histograms
+                        WHERE city_code = p_city_code
+                          AND job_family = p_job_family
+                          AND posted_date BETWEEN p_start_date AND p_end_date
+                        GROUP BY segment, segment_value, salary_midpoint
+                    ) summed
+                    GROUP BY segment, segment_value
+                ) histograms
+                GROUP BY segment
+            ) segments
+        ), '{}'::jsonb),
+        'days', CASE
+            WHEN EXISTS (SELECT 1 FROM report_rollup_runs WHERE kind IN ('backfill', 'incremental'))
+            THEN (
+                SELECT COUNT(DISTINCT posted_date)
+                FROM report_daily_counts
+                WHERE city_code = p_city_code
+                  AND job_family = p_job_family
+                  AND posted_date BETWEEN p_start_date AND p_end_date
+            )
+            ELSE 0
+        END
+    );
+$$;
+
+COMMENT ON FUNCTION get_report_rollup(TEXT, TEXT, DATE, DATE) IS 'Summed report_daily_counts and salary histograms for a city/family/date range, as {counts, salary, days}; days = 0 until a rollup backfill has finished.';
+
+-- ============================================
+-- Verification
+-- ============================================
+-- Days rolled up:
+-- SELECT MIN(posted_date), MAX(posted_date), COUNT(DISTINCT posted_date) FROM report_daily_counts;
+--
+-- Latest finished runs and the incremental watermark:
+-- SELECT kind, started_at, finished_at, start_date, end_date, days, jobs
+-- FROM report_rollup_runs ORDER BY finished_at DESC LIMIT 10;
+--
+-- Pending dirty days (since the last finished run):
+-- SELECT posted_date, COUNT(*), MAX(marked_at) FROM report_rollup_dirty_days
+-- GROUP BY posted_date ORDER BY posted_date DESC LIMIT 20;
+--
+-- Rollup totals vs raw jobs for one day (should match):
+-- SELECT jobs FROM report_daily_counts
+-- WHERE city_code = 'lon' AND job_family = 'data' AND posted_date = CURRENT_DATE - 1
+--   AND dimension = 'summary' AND value = 'total';
+-- SELECT COUNT(*) FROM enriched_jobs
+-- WHERE job_family = 'data' AND posted_date = CURRENT_DATE - 1 AND accessible_city_codes @> ARRAY['lon'];
+--
+-- Summed report document:
+-- SELECT get_report_rollup('lon', 'data', '2025-12-01', '2025-12-31') -> 'counts' -> 'summary';
@@ -0,0 +1,121 @@
+-- Migration 035: Mergeable salary quantile sketches
+--
+-- Compensation percentiles (p25/median/p75 of salary midpoints, overall and
+-- per seniority/subfamily) need the full value distribution. Migration 034
+-- stores it as exact per-day histograms, which grow with the number of
+-- distinct salaries. This migration adds a compact, fixed-size t-digest per
+-- (day, city, family, segment), written by pipeline/report_rollups.py
+-- alongside the histograms (see pipeline/quantile_sketch.py).
+--
+-- Sketches merge: a month's, quarter's or multi-city percentiles are built by
+-- merging daily sketches in Python, without refetching jobs. Merging across
+-- cities counts a job once per city it is accessible from.
+--
+-- replace_report_rollup_day() (migration 034) is redefined to swap the
+-- day's sketches in the same transaction as its counts and histograms.
+--
+-- Usage (supabase-py):
+--   supabase.rpc("get_report_salary_sketches", {
+--       "p_city_codes": ["nyc", "sfo"],
+--       "p_job_family": "data",
+--       "p_start_date": "2025-10-01",
+--       "p_end_date": "2025-12-31",
+--   }).execute()
+--   -> [[segment, segment_value, sketch], ...]  (one entry per day/city/segment)
+--
+-- Requires migration 034.
+--
+-- Risk Level: LOW (new table and function; 034's day replacement redefined
+-- with the same signature)
+
+-- ============================================
+-- STEP 1: Sketch table
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS report_daily_salary_sketches (
+    posted_date DATE NOT NULL,
+    city_code TEXT NOT NULL,
+    job_family TEXT NOT NULL,
+    segment TEXT NOT NULL,              -- overall, seniority, job_subfamily
+    segment_value TEXT NOT NULL,        -- '' for overall
+    jobs INTEGER NOT NULL,
+    sketch JSONB NOT NULL,              -- TDigest.to_dict(): {compression, min, max, centroids}
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (city_code, job_family, posted_date, segment, segment_value)
+);
+
+COMMENT ON TABLE report_daily_salary_sketches IS 'Per-day t-digest of salary midpoints per report segment (written by pipeline/report_rollups.py).';
+
+CREATE INDEX IF NOT EXISTS idx_report_daily_salary_sketches_posted_date
+ON report_daily_salary_sketches (posted_date);
+
+-- ============================================
+-- STEP 2: Range RPC
+-- ============================================
+
+CREATE OR REPLACE FUNCTION get_report_salary_sketches(
+    p_city_codes TEXT[],
+    p_job_family TEXT,
+    p_start_date DATE,
+    p_end_date DATE
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(jsonb_agg(jsonb_build_array(segment, segment_value, sketch)), '[]'::jsonb)
+    FROM report_daily_salary_sketches
+    WHERE city_code = ANY(p_city_codes)
+      AND job_family = p_job_family
+      AND posted_date BETWEEN p_start_date AND p_end_date;
+$$;
+
+COMMENT ON FUNCTION get_report_salary_sketches(TEXT[], TEXT, DATE, DATE) IS 'Daily salary sketches for cities/family/date range, merged client-side (pipeline/quantile_sketch.py).';
+
+-- ============================================
+-- STEP 3: Swap sketches with the rest of the day
+-- ============================================
+
+CREATE OR REPLACE FUNCTION replace_report_rollup_day(
+    p_posted_date DATE,
+    p_counts JSONB,
+    p_salaries JSONB,
+    p_sketches JSONB DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('replace_report_rollup_day'), p_posted_date - DATE '2000-01-01');
+
+    DELETE FROM report_daily_counts WHERE posted_date = p_posted_date;
+    DELETE FROM report_daily_salary_histograms WHERE posted_date = p_posted_date;
+    DELETE FROM report_daily_salary_sketches WHERE posted_date = p_posted_date;
+
+    INSERT INTO report_daily_counts
+    SELECT * FROM jsonb_populate_recordset(NULL::report_daily_counts, COALESCE(p_counts, '[]'::jsonb))
+    WHERE posted_date = p_posted_date;
+
+    INSERT INTO report_daily_salary_histograms
+    SELECT * FROM jsonb_populate_recordset(NULL::report_daily_salary_histograms, COALESCE(p_salaries, '[]'::jsonb))
+    WHERE posted_date = p_posted_date;
+
+    INSERT INTO report_daily_salary_sketches
+    SELECT * FROM jsonb_populate_recordset(NULL::report_daily_salary_sketches, COALESCE(p_sketches, '[]'::jsonb))
+    WHERE posted_date = p_posted_date;
+END;
+$$;
+
+-- ============================================
+-- Verification
+-- ============================================
+-- Sketch size per segment-day (centroids stay bounded):
+-- SELECT segment, MAX(jsonb_array_length(sketch -> 'centroids')), MAX(jobs)
+-- FROM report_daily_salary_sketches GROUP BY segment;
+--
+-- Sketch jobs match histogram jobs:
+-- SELECT SUM(jobs) FROM report_daily_salary_sketches WHERE segment = 'overall';
+-- SELECT SUM(jobs) FROM report_daily_salary_histograms WHERE segment = 'overall';
+--
+-- Accuracy against the exact percentiles:
+--   python pipeline/report_rollups.py --verify-sketches --start 2025-10-01 --end 2025-12-31
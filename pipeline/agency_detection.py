@@ -4,20 +4,22 @@ Implements soft flagging of recruitment agencies using pattern matching.
 This supplements the hard filter applied during job ingestion.
 """
 
-import yaml
-from typing import Tuple
+import re
+from typing import Dict, List, Optional, Set, Tuple
 
-# Load agency configuration
-with open('config/agency_blacklist.yaml', 'r') as f:
-    AGENCY_CONFIG = yaml.safe_load(f)
+from pipeline.config_registry import clear_config_cache, get_compiled, get_config
 
-# Extract config sections
-HARD_FILTER = set(AGENCY_CONFIG['hard_filter'])
-HIGH_CONF_KEYWORDS = set(AGENCY_CONFIG['keywords']['high_confidence'])
-MED_CONF_KEYWORDS = set(AGENCY_CONFIG['keywords']['medium_confidence'])
-HIGH_CONF_SUFFIXES = AGENCY_CONFIG['suffixes']['high_confidence']
-MED_CONF_SUFFIXES = AGENCY_CONFIG['suffixes']['medium_confidence']
-LEGITIMATE_COMPANIES = set(AGENCY_CONFIG['legitimate_companies'])
+# Config sections exposed as module attributes, derived from
+# config/agency_blacklist.yaml on first access (see __getattr__ below)
+_CONFIG_SECTIONS = {
+    'AGENCY_CONFIG': lambda config: config,
+    'HARD_FILTER': lambda config: set(config['hard_filter']),
+    'HIGH_CONF_KEYWORDS': lambda config: set(config['keywords']['high_confidence']),
+    'MED_CONF_KEYWORDS': lambda config: set(config['keywords']['medium_confidence']),
+    'HIGH_CONF_SUFFIXES': lambda config: config['suffixes']['high_confidence'],
+    'MED_CONF_SUFFIXES': lambda config: config['suffixes']['medium_confidence'],
+    'LEGITIMATE_COMPANIES': lambda config: set(config['legitimate_companies']),
+}
 
 # Agency phrases in job descriptions
 AGENCY_PHRASES = [
@@ -31,6 +33,197 @@ AGENCY_PHRASES = [
 ]
 
 
+class _PhraseMatcher:
+    """
+    Compiled multi-phrase matcher.
+
+    Scans a text once with a single alternation (run by the C regex engine)
+    instead of one substring check per phrase. Matches are found at every
+    start position via lookahead, and phrases contained in a longer matched
+    phrase are added back, so the result equals {p for p in phrases if p in text}.
+    """
+
+    def __init__(self, phrases):
+        self.phrases = frozenset(p for p in phrases if p)
+        ordered = sorted(self.phrases, key=len, reverse=True)
+        self._pattern = (
+            re.compile('(?=(' + '|'.join(re.escape(p) for p in ordered) + '))')
+            if ordered else None
+        )
+        self._contained = {
+            p: frozenset(q for q in self.phrases if q != p and q in p)
+            for p in self.phrases
+        }
+
+    def find(self, text: str, stop_at: Optional[int] = None) -> Set[str]:
+        """
+        Return the set of phrases that occur in text.
+
+        Args:
+            text: Text to scan (already lowercased)
+            stop_at: Stop scanning once this many distinct phrases are found
+        """
+        found: Set[str] = set()
+        if self._pattern is None or not text:
+            return found
+
+        for match in self._pattern.finditer(text):
+            phrase = match.group(1)
+            if phrase in found:
+                continue
+            found.add(phrase)
+            found |= self._contained[phrase]
+            if stop_at is not None and len(found) >= stop_at:
+                break
+
+        return found
+
+    def count(self, text: str, stop_at: Optional[int] = None) -> int:
+        """Number of distinct phrases found in text (capped at stop_at if given)."""
+        return len(self.find(text, stop_at))
+
+
+class AgencyDetector:
+    """
+    Agency detector compiled once from the agency blacklist config.
+
+    Keyword sets are compiled into single-pass matchers, and the name-only
+    part of the verdict is memoized per employer, so repeated calls for the
+    same employer (is_agency_job, then validate_agency_classification, then
+    the next job from the same company) cost a dict lookup.
+    """
+
+    # Medium suffixes that are common business words; only flag them when the
+    # name also contains a recruitment-related word
+    GENERIC_SUFFIXES = frozenset(['solutions', 'consulting', 'partners', 'associates', 'group', 'agency'])
+    RECRUITMENT_WORDS = ['talent', 'staff', 'recruit', 'search']
+
+    def __init__(self, config: Dict, agency_phrases: List[str] = None):
+        self.hard_filter = set(config['hard_filter'])
+        self.legitimate_companies = set(config['legitimate_companies'])
+        self.high_conf_suffixes = tuple(config['suffixes']['high_confidence'])
+        self.med_conf_suffixes = tuple(config['suffixes']['medium_confidence'])
+
+        self._high_keywords = _PhraseMatcher(config['keywords']['high_confidence'])
+        self._med_keywords = _PhraseMatcher(config['keywords']['medium_confidence'])
+        self._recruitment_words = _PhraseMatcher(self.RECRUITMENT_WORDS)
+        self._phrases = _PhraseMatcher(agency_phrases if agency_phrases is not None else AGENCY_PHRASES)
+
+        self._name_cache: Dict[str, Tuple[Optional[Tuple[bool, str]], int]] = {}
+
+    def _name_verdict(self, name_lower: str) -> Tuple[Optional[Tuple[bool, str]], int]:
+        """
+        Name-only checks (steps 1-3 of detect), memoized per normalized name.
+
+        Returns:
+            Tuple of (verdict or None if undecided by name, medium keyword count)
+        """
+        cached = self._name_cache.get(name_lower)
+        if cached is not None:
+            return cached
+
+        result = self._compute_name_verdict(name_lower)
+        self._name_cache[name_lower] = result
+        return result
+
+    def _compute_name_verdict(self, name_lower: str) -> Tuple[Optional[Tuple[bool, str]], int]:
+        # 1. Legitimate companies first (avoid false positives)
+        if name_lower in self.legitimate_companies:
+            return (False, 'low'), 0
+
+        # 2. High confidence: hard filter, 2+ high keywords, high suffix
+        if name_lower in self.hard_filter:
+            return (True, 'high'), 0
+
+        keyword_matches = self._high_keywords.count(name_lower, stop_at=2)
+        if keyword_matches >= 2:
+            return (True, 'high'), 0
+
+        if name_lower.endswith(self.high_conf_suffixes):
+            return (True, 'high'), 0
+
+        # 3. Medium confidence: single high keyword, medium suffix, 2+ medium keywords
+        if keyword_matches == 1:
+            return (True, 'medium'), 0
+
+        for suffix in self.med_conf_suffixes:
+            if name_lower.endswith(suffix):
+                if suffix not in self.GENERIC_SUFFIXES:
+                    return (True, 'medium'), 0
+                if self._recruitment_words.count(name_lower, stop_at=1):
+                    return (True, 'medium'), 0
+
+        med_keyword_matches = self._med_keywords.count(name_lower)
+        if med_keyword_matches >= 2:
+            return (True, 'medium'), med_keyword_matches
+
+        return None, med_keyword_matches
+
+    def detect(self, employer_name: str, job_description: str = None) -> Tuple[bool, str]:
+        """Same contract as detect_agency()."""
+        if not employer_name:
+            return False, 'low'
+
+        verdict, med_keyword_matches = self._name_verdict(employer_name.lower().strip())
+        if verdict is not None:
+            return verdict
+
+        # 4. Check job description (if provided)
+        if job_description:
+            phrase_matches = self._phrases.count(job_description.lower(), stop_at=2)
+
+            if phrase_matches >= 2:
+                # Multiple agency phrases = medium confidence
+                return True, 'medium'
+            elif phrase_matches == 1 and med_keyword_matches >= 1:
+                # Single phrase + suspicious name = medium confidence
+                return True, 'medium'
+
+        # 5. Default: Not an agency
+        return False, 'low'
+
+    def detect_batch(
+        self,
+        employer_names: List[str],
+        job_descriptions: Optional[List[Optional[str]]] = None
+    ) -> List[Tuple[bool, str]]:
+        """Run detect() over aligned lists of employer names and descriptions."""
+        if job_descriptions is None:
+            return [self.detect(name) for name in employer_names]
+        if len(job_descriptions) != len(employer_names):
+            raise ValueError(
+                f"job_descriptions has {len(job_descriptions)} rows, expected {len(employer_names)}"
+            )
+        return [self.detect(name, desc) for name, desc in zip(employer_names, job_descriptions)]
+
+
+def __getattr__(name: str):
+    """Lazy config sections (HARD_FILTER, HIGH_CONF_KEYWORDS, ...)."""
+    if name in _CONFIG_SECTIONS:
+        return _CONFIG_SECTIONS[name](get_config('agency_blacklist'))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_agency_detector() -> AgencyDetector:
+    """Compile the detector from config/agency_blacklist.yaml (config_registry builder)."""
+    return AgencyDetector(get_config('agency_blacklist'))
+
+
+def get_agency_detector() -> AgencyDetector:
+    """
+    Get the shared AgencyDetector, compiling it on first use.
+
+    Returns:
+        AgencyDetector built from config/agency_blacklist.yaml
+    """
+    return get_compiled('agency_detector')
+
+
+def clear_detector_cache():
+    """Drop the compiled detector and its per-employer cache (useful for testing)."""
+    clear_config_cache(['agency_detector'])
+
+
 def detect_agency(employer_name: str, job_description: str = None) -> Tuple[bool, str]:
     """
     Detect if employer is a recruitment agency using pattern matching.
@@ -57,84 +250,26 @@ def detect_agency(employer_name: str, job_description: str = None) -> Tuple[bool
         >>> detect_agency("Data Consulting Partners")
         (True, 'medium')
     """
-    if not employer_name:
-        return False, 'low'
-    
-    name_lower = employer_name.lower().strip()
-    
-    # ========================================
-    # 1. Check legitimate companies first (avoid false positives)
-    # ========================================
-    if name_lower in LEGITIMATE_COMPANIES:
-        return False, 'low'
-    
-    # ========================================
-    # 2. High confidence checks
-    # ========================================
-    
-    # Check if in hard filter list (shouldn't happen, but safety check)
-    if name_lower in HARD_FILTER:
-        return True, 'high'
-    
-    # Count high-confidence keywords in name
-    keyword_matches = sum(1 for kw in HIGH_CONF_KEYWORDS if kw in name_lower)
-    if keyword_matches >= 2:
-        return True, 'high'
-    
-    # Check for high-confidence suffixes
-    for suffix in HIGH_CONF_SUFFIXES:
-        if name_lower.endswith(suffix):
-            return True, 'high'
-    
-    # ========================================
-    # 3. Medium confidence checks
-    # ========================================
-    
-    # Single high-confidence keyword = medium confidence
-    if keyword_matches == 1:
-        return True, 'medium'
-    
-    # Check for medium-confidence suffixes (with false positive filtering)
-    for suffix in MED_CONF_SUFFIXES:
-        if name_lower.endswith(suffix):
-            # Avoid false positives for common business suffixes
-            if suffix in ['solutions', 'consulting', 'partners', 'associates', 'group', 'agency']:
-                # Only flag if there's also a recruitment-related word
-                if any(kw in name_lower for kw in ['talent', 'staff', 'recruit', 'search']):
-                    return True, 'medium'
-                # Otherwise, might be legitimate consulting/tech company
-                continue
-            else:
-                return True, 'medium'
-    
-    # Count medium-confidence keywords
-    med_keyword_matches = sum(1 for kw in MED_CONF_KEYWORDS if kw in name_lower)
-    if med_keyword_matches >= 2:
-        return True, 'medium'
-    
-    # ========================================
-    # 4. Check job description (if provided)
-    # ========================================
-    
-    if job_description:
-        desc_lower = job_description.lower()
-        
-        # Check for agency phrases in description
-        phrase_matches = sum(1 for phrase in AGENCY_PHRASES if phrase in desc_lower)
-        
-        if phrase_matches >= 2:
-            # Multiple agency phrases = medium confidence
-            return True, 'medium'
-        elif phrase_matches == 1:
-            # Single phrase + suspicious name = medium confidence
-            if med_keyword_matches >= 1:
-                return True, 'medium'
-    
-    # ========================================
-    # 5. Default: Not an agency
-    # ========================================
-    
-    return False, 'low'
+    return get_agency_detector().detect(employer_name, job_description)
+
+
+def detect_agency_batch(
+    employer_names: List[str],
+    job_descriptions: Optional[List[Optional[str]]] = None
+) -> List[Tuple[bool, str]]:
+    """
+    Batch version of detect_agency for backfills.
+
+    Name-only verdicts are computed once per distinct employer.
+
+    Args:
+        employer_names: Company names, one per job
+        job_descriptions: Optional job texts aligned with employer_names
+
+    Returns:
+        List of (is_agency, confidence) tuples, aligned with employer_names
+    """
+    return get_agency_detector().detect_batch(employer_names, job_descriptions)
 
 
 def validate_agency_classification(
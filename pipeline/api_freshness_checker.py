@@ -10,23 +10,41 @@ All 5 sources use the same model: job present in API listing = active; job absen
 = closed (soft_404). Company-level safeguards (API errors, empty responses, total
 absence) prevent false positives from API glitches or slug changes.
 
+Listings fetched by the nightly ingest are stored as listing snapshots
+(pipeline/listing_snapshots.py); snapshots younger than --snapshot-max-age
+hours are used instead of calling the ATS API again. The ingest also closes
+jobs itself (IngestClosureDetector) as it fetches each listing, so this pass
+mainly covers companies the ingest skipped or failed to fetch.
+
+Sources are checked in parallel, and each source fetches several companies at
+once. A shared HostRateLimiter spaces request starts per API host by
+RATE_LIMITS, so concurrency overlaps network latency without raising the
+request rate on any one API.
+
 USAGE:
     python pipeline/api_freshness_checker.py                    # Check all API sources
     python pipeline/api_freshness_checker.py --source ashby     # Single source
     python pipeline/api_freshness_checker.py --dry-run          # Preview without DB updates
     python pipeline/api_freshness_checker.py --stats            # Show api_last_seen_at distribution
+    python pipeline/api_freshness_checker.py --snapshot-max-age 0   # Always fetch live listings
 """
 
 import sys
 sys.path.insert(0, '.')
 
 import json
+import threading
 import time
 import argparse
+import ijson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from itertools import chain, groupby
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 from pipeline.db_connection import supabase
+from pipeline.listing_snapshots import load_listing_snapshots
 
 # ============================================
 # Configuration
@@ -34,7 +52,7 @@ from pipeline.db_connection import supabase
 
 API_SOURCES = ['greenhouse', 'ashby', 'lever', 'workable', 'smartrecruiters']
 
-# Rate limits per source (seconds between requests)
+# Rate limits per source (minimum seconds between request starts on its API host)
 RATE_LIMITS = {
     'greenhouse': 0.5,
     'ashby': 1.0,
@@ -43,8 +61,22 @@ RATE_LIMITS = {
     'smartrecruiters': 2.0,
 }
 
+# Companies fetched concurrently per source (request starts are still spaced
+# by RATE_LIMITS; extra workers only overlap slow responses)
+SOURCE_CONCURRENCY = {
+    'greenhouse': 8,
+    'ashby': 4,
+    'lever': 4,
+    'workable': 2,
+    'smartrecruiters': 2,
+}
+
 DB_BATCH_SIZE = 500  # Batch size for .in_() updates
 
+# Ingest listing snapshots younger than this are used instead of the ATS API
+# (the ingest finishes ~2h before the freshness check)
+SNAPSHOT_MAX_AGE_HOURS = 6.0
+
 # API endpoints
 GREENHOUSE_API_URL = "https://boards-api.greenhouse.io/v1/boards"
 ASHBY_API_URL = "https://api.ashbyhq.com/posting-api/job-board"
@@ -54,141 +86,210 @@ LEVER_API_URLS = {
 }
 WORKABLE_API_URL = "https://www.workable.com/api/accounts"
 SMARTRECRUITERS_API_URL = "https://api.smartrecruiters.com/v1/companies"
+SMARTRECRUITERS_PAGE_LIMIT = 100  # API maximum per page
 
 # HTTP settings
 REQUEST_TIMEOUT = 30
 USER_AGENT = "job-analytics-bot/1.0 (github.com/job-analytics)"
 
+
+# ============================================
+# Per-host rate limiting
+# ============================================
+
+class HostRateLimiter:
+    """
+    Spaces request starts on each host by a minimum interval, across threads.
+
+    Each wait() reserves the host's next free slot under a lock and sleeps
+    outside it, so callers for different hosts never block each other.
+
+    Usage:
+        limiter = HostRateLimiter({'api.lever.co': 1.0})
+        limiter.wait(url)
+        requests.get(url)
+    """
+
+    def __init__(self, intervals: Dict[str, float], default_interval: float = 1.0):
+        self.intervals = intervals
+        self.default_interval = default_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str):
+        """Block until a request to url's host may start."""
+        host = urlsplit(url).netloc
+        interval = self.intervals.get(host, self.default_interval)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _host_intervals() -> Dict[str, float]:
+    """API host -> RATE_LIMITS interval of the source it belongs to."""
+    source_urls = {
+        'greenhouse': [GREENHOUSE_API_URL],
+        'ashby': [ASHBY_API_URL],
+        'lever': list(LEVER_API_URLS.values()),
+        'workable': [WORKABLE_API_URL],
+        'smartrecruiters': [SMARTRECRUITERS_API_URL],
+    }
+    return {
+        urlsplit(url).netloc: RATE_LIMITS[source]
+        for source, urls in source_urls.items()
+        for url in urls
+    }
+
+
+# Shared by every fetcher (and thread) in this process
+RATE_LIMITER = HostRateLimiter(_host_intervals())
+
 # ============================================
 # API Fetchers (minimal, listing-only)
 # ============================================
+#
+# Each fetcher requests the lightest listing the ATS offers (no inline
+# descriptions, details or compensation) and streams the response through an
+# incremental JSON parser, keeping only the job id of each listed job. Memory
+# stays flat however large the board or its descriptions are.
 
-def fetch_greenhouse_job_ids(slug: str) -> Optional[Set[str]]:
-    """Fetch all active job IDs from a Greenhouse company listing."""
-    url = f"{GREENHOUSE_API_URL}/{slug}/jobs"
+def _stream_listing_ids(response, list_path: str, id_field: str,
+                        extra_fields: Tuple[str, ...] = ()) -> Tuple[Optional[Set[str]], Dict]:
+    """Collect job ids from a streamed JSON listing.
+
+    Args:
+        response: requests response opened with stream=True
+        list_path: ijson prefix of the jobs array ('' for a top-level array)
+        id_field: Id key within each job object
+        extra_fields: ijson prefixes of top-level numbers to return too
+                      (e.g. 'totalFound')
+
+    Returns:
+        (ids, extras): ids is None if the body has no array at list_path
+    """
+    item_prefix = f"{list_path}.item" if list_path else "item"
+    id_prefix = f"{item_prefix}.{id_field}"
+    ids = set()
+    extras = {}
+    found_list = False
+
+    response.raw.decode_content = True
+    for prefix, event, value in ijson.parse(response.raw):
+        if prefix == id_prefix and event in ('string', 'number'):
+            if value:
+                # str() cast required: Greenhouse API returns numeric IDs but
+                # raw_jobs.source_job_id stores strings
+                ids.add(str(value))
+        elif prefix == list_path and event == 'start_array':
+            found_list = True
+        elif prefix in extra_fields and event == 'number':
+            extras[prefix] = value
+
+    return (ids if found_list else None), extras
+
+
+def _fetch_listing(url: str, list_path: str, id_field: str, params: Optional[Dict] = None,
+                   skip_statuses: Tuple[int, ...] = (404,),
+                   extra_fields: Tuple[str, ...] = ()) -> Tuple[Optional[Set[str]], Dict]:
+    """Fetch one listing page (rate limited) and stream its job ids.
+
+    Returns:
+        (ids, extras) as _stream_listing_ids; (None, {}) on any failure or a
+        status in skip_statuses
+    """
     headers = {'User-Agent': USER_AGENT, 'Accept': 'application/json'}
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        if response.status_code == 404:
-            return None
+        RATE_LIMITER.wait(url)
+        response = requests.get(url, headers=headers, params=params,
+                                timeout=REQUEST_TIMEOUT, stream=True)
+    except Exception:
+        return None, {}
+
+    try:
+        if response.status_code in skip_statuses:
+            return None, {}
         response.raise_for_status()
-        data = response.json()
-        jobs = data.get('jobs', [])
-        if not isinstance(jobs, list):
-            return None
-        # str() cast required: Greenhouse API returns numeric IDs but
-        # raw_jobs.source_job_id stores strings
-        return {str(job.get('id', '')) for job in jobs if job.get('id')}
+        return _stream_listing_ids(response, list_path, id_field, extra_fields)
     except Exception:
-        return None
+        return None, {}
+    finally:
+        response.close()
+
+
+def fetch_greenhouse_job_ids(slug: str) -> Optional[Set[str]]:
+    """Fetch all active job IDs from a Greenhouse company listing.
+
+    The listing is requested without content=true (no inline descriptions).
+    """
+    ids, _ = _fetch_listing(f"{GREENHOUSE_API_URL}/{slug}/jobs", 'jobs', 'id')
+    return ids
 
 
 def fetch_ashby_job_ids(slug: str) -> Optional[Set[str]]:
     """Fetch all active job IDs from an Ashby company listing.
 
+    Ashby has no id-only listing, so descriptions are streamed past unparsed.
+
     Returns set of job IDs, or None on failure.
     """
-    url = f"{ASHBY_API_URL}/{slug}"
-    params = {'includeCompensation': 'false'}
-    headers = {'User-Agent': USER_AGENT, 'Accept': 'application/json'}
-
-    try:
-        response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        data = response.json()
-        jobs = data.get('jobs', [])
-        if not isinstance(jobs, list):
-            return None
-        return {job.get('id', '') for job in jobs if job.get('id')}
-    except Exception:
-        return None
+    ids, _ = _fetch_listing(f"{ASHBY_API_URL}/{slug}", 'jobs', 'id',
+                            params={'includeCompensation': 'false'})
+    return ids
 
 
 def fetch_lever_job_ids(slug: str, instance: str = 'global') -> Optional[Set[str]]:
     """Fetch all active job IDs from a Lever company listing.
 
+    Lever returns full postings as a top-level array; only ids are kept.
+
     Returns set of posting IDs, or None on failure.
     """
     base_url = LEVER_API_URLS.get(instance, LEVER_API_URLS['global'])
-    url = f"{base_url}/{slug}?mode=json"
-    headers = {'User-Agent': USER_AGENT, 'Accept': 'application/json'}
-
-    try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        jobs_data = response.json()
-        if not isinstance(jobs_data, list):
-            return None
-        return {job.get('id', '') for job in jobs_data if job.get('id')}
-    except Exception:
-        return None
+    ids, _ = _fetch_listing(f"{base_url}/{slug}", '', 'id', params={'mode': 'json'})
+    return ids
 
 
 def fetch_workable_job_ids(slug: str) -> Optional[Set[str]]:
     """Fetch all active job shortcodes from a Workable company listing.
 
+    The listing is requested without details=true (no descriptions).
+
     Returns set of shortcodes, or None on failure.
     """
-    url = f"{WORKABLE_API_URL}/{slug}"
-    headers = {'User-Agent': USER_AGENT, 'Accept': 'application/json'}
-
-    try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        if response.status_code in (404, 429):
-            return None
-        response.raise_for_status()
-        data = response.json()
-        jobs = data.get('jobs', [])
-        if not isinstance(jobs, list):
-            return None
-        return {job.get('shortcode', '') for job in jobs if job.get('shortcode')}
-    except Exception:
-        return None
+    ids, _ = _fetch_listing(f"{WORKABLE_API_URL}/{slug}", 'jobs', 'shortcode',
+                            skip_statuses=(404, 429))
+    return ids
 
 
 def fetch_smartrecruiters_job_ids(slug: str) -> Optional[Set[str]]:
     """Fetch all active job IDs from a SmartRecruiters company listing (paginated).
 
+    Pages hold SMARTRECRUITERS_PAGE_LIMIT postings (the API maximum); pages
+    are spaced by the shared per-host rate limit rather than a fixed sleep.
+
     Returns set of posting IDs, or None on failure.
     """
-    headers = {'User-Agent': USER_AGENT, 'Accept': 'application/json'}
+    url = f"{SMARTRECRUITERS_API_URL}/{slug}/postings"
     all_ids = set()
     offset = 0
-    page_limit = 100
 
-    try:
-        while True:
-            url = f"{SMARTRECRUITERS_API_URL}/{slug}/postings"
-            params = {'offset': offset, 'limit': page_limit}
-            response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
-
-            if response.status_code in (404, 429):
-                return None
-            response.raise_for_status()
-            data = response.json()
-
-            content = data.get('content', [])
-            if not isinstance(content, list):
-                return None
-
-            for job in content:
-                job_id = job.get('id', '')
-                if job_id:
-                    all_ids.add(job_id)
-
-            total_found = data.get('totalFound', 0)
-            if offset + page_limit >= total_found or not content:
-                break
-            offset += page_limit
-            time.sleep(RATE_LIMITS['smartrecruiters'])
+    while True:
+        params = {'offset': offset, 'limit': SMARTRECRUITERS_PAGE_LIMIT}
+        ids, extras = _fetch_listing(url, 'content', 'id', params=params,
+                                     skip_statuses=(404, 429), extra_fields=('totalFound',))
+        if ids is None:
+            return None
+        all_ids |= ids
 
-        return all_ids
-    except Exception:
-        return None
+        total_found = extras.get('totalFound', 0)
+        if offset + SMARTRECRUITERS_PAGE_LIMIT >= total_found or not ids:
+            break
+        offset += SMARTRECRUITERS_PAGE_LIMIT
+
+    return all_ids
 
 
 # Map source to fetcher function
@@ -205,11 +306,49 @@ API_FETCHERS = {
 # DB Queries
 # ============================================
 
+def iter_active_jobs_by_source(source: str) -> Iterator[Dict]:
+    """Yield active jobs for a source, ordered by (company_slug, enriched_job_id).
+
+    Uses the get_active_jobs_by_source RPC (migration 031), which joins
+    enriched_jobs to raw_jobs server-side and returns the whole source as one
+    JSON array, so the join and sort run once per source.
+
+    Yields dicts with: enriched_job_id, source_job_id, company_slug,
+    api_last_seen_at, lever_instance.
+    """
+    result = supabase.rpc('get_active_jobs_by_source', {'p_source': source}).execute()
+    yield from result.data or []
+
+
+def iter_companies(source: str) -> Iterator[Tuple[str, List[Dict]]]:
+    """Yield (company_slug, jobs) for a source, one company at a time.
+
+    Rows arrive ordered by company, so consecutive rows are grouped. Falls
+    back to the client-side join (grouped in memory) if the RPC is missing.
+    """
+    rows = iter_active_jobs_by_source(source)
+    try:
+        first = next(rows, None)
+    except Exception as e:
+        print(f"[{source.upper()}] [DB] get_active_jobs_by_source RPC unavailable ({e}); "
+              f"joining client-side")
+        yield from group_by_company(get_active_jobs_by_source(source)).items()
+        return
+
+    if first is None:
+        return
+    for slug, company_jobs in groupby(chain([first], rows), key=lambda job: job['company_slug']):
+        yield slug, list(company_jobs)
+
+
 def get_active_jobs_by_source(source: str) -> List[Dict]:
     """Get active enriched_jobs for a given API source, joined with raw_jobs metadata.
 
+    Client-side join, used when the get_active_jobs_by_source RPC (migration
+    031) is not available.
+
     Returns list of dicts with: enriched_job_id, source_job_id, company_slug,
-    posting_url, api_last_seen_at, lever_instance.
+    api_last_seen_at, lever_instance.
     """
     all_jobs = []
     offset = 0
@@ -304,28 +443,329 @@ def _batch_update(job_ids: list, fields: dict):
 # Main Logic
 # ============================================
 
+def compare_listing(company_jobs: List[Dict], api_job_ids: Optional[Set[str]]) -> Dict:
+    """Compare a company's listed job ids with its tracked jobs.
+
+    Applies the company-level safeguards:
+    - API error/404 (api_job_ids is None) -> skip company
+    - API returns 0 jobs -> skip company
+    - ALL tracked jobs absent with >1 tracked -> skip company (slug change?)
+
+    Args:
+        company_jobs: Tracked jobs for the company (from iter_companies)
+        api_job_ids: Job ids currently listed by the ATS, or None if the fetch failed
+
+    Returns:
+        Dict with 'outcome' ('checked', 'error', 'empty' or 'suspicious'),
+        'api_count', and for checked companies 'active_ids' / 'closed_ids'
+        (enriched_job ids)
+    """
+    # Safeguard 1: API failure
+    if api_job_ids is None:
+        return {'outcome': 'error', 'api_count': 0}
+
+    # Safeguard 2: Empty API response when we have tracked jobs
+    if len(api_job_ids) == 0 and len(company_jobs) > 0:
+        return {'outcome': 'empty', 'api_count': 0}
+
+    # Safeguard 3: ALL our tracked jobs absent (suspicious - slug change?)
+    our_job_ids = {j['source_job_id'] for j in company_jobs}
+    if not (our_job_ids & api_job_ids) and len(company_jobs) > 1:
+        return {'outcome': 'suspicious', 'api_count': len(api_job_ids)}
+
+    active_ids = []
+    closed_ids = []
+    for job in company_jobs:
+        if job['source_job_id'] in api_job_ids:
+            active_ids.append(job['enriched_job_id'])
+        else:
+            closed_ids.append(job['enriched_job_id'])
+
+    return {
+        'outcome': 'checked',
+        'api_count': len(api_job_ids),
+        'active_ids': active_ids,
+        'closed_ids': closed_ids,
+    }
+
+
+def check_company(source: str, slug: str, company_jobs: List[Dict],
+                  snapshot_ids: Optional[Set[str]] = None) -> Dict:
+    """Fetch one company's listing and compare it with its tracked jobs.
+
+    If snapshot_ids (a recent ingest listing snapshot) is given, it is used
+    instead of fetching the listing. See compare_listing() for the safeguards
+    and the returned dict.
+
+    Args:
+        source: ATS source
+        slug: Company slug
+        company_jobs: Tracked jobs for the company (from iter_companies)
+        snapshot_ids: Listed job ids from a listing snapshot, if one is recent
+
+    Returns:
+        compare_listing() result
+    """
+    fetcher = API_FETCHERS[source]
+    if snapshot_ids is not None:
+        api_job_ids = snapshot_ids
+    elif source == 'lever':
+        # Lever needs instance (global/eu)
+        api_job_ids = fetcher(slug, company_jobs[0].get('lever_instance', 'global'))
+    else:
+        api_job_ids = fetcher(slug)
+
+    return compare_listing(company_jobs, api_job_ids)
+
+
+class ListingUpdates:
+    """Buffers active/closed enriched_job ids across companies.
+
+    Ids are written with _batch_update once DB_BATCH_SIZE accumulate, and on
+    flush(force=True). Active jobs get api_last_seen_at/url_checked_at and
+    url_status 'active'; closed jobs get url_status 'soft_404'.
+    """
+
+    def __init__(self, now: datetime, dry_run: bool = False):
+        self.now = now
+        self.dry_run = dry_run
+        self.active = []
+        self.closed = []
+
+    def add(self, result: Dict):
+        """Queue a 'checked' compare_listing() result and flush full batches."""
+        self.active.extend(result['active_ids'])
+        self.closed.extend(result['closed_ids'])
+        self.flush()
+
+    def flush(self, force: bool = False):
+        if self.dry_run:
+            self.active.clear()
+            self.closed.clear()
+            return
+        if self.active and (force or len(self.active) >= DB_BATCH_SIZE):
+            _batch_update(self.active, {
+                "api_last_seen_at": self.now.isoformat(),
+                "url_checked_at": self.now.isoformat(),
+                "url_status": "active",
+            })
+            self.active.clear()
+        if self.closed and (force or len(self.closed) >= DB_BATCH_SIZE):
+            _batch_update(self.closed, {
+                "url_status": "soft_404",
+                "url_checked_at": self.now.isoformat(),
+            })
+            self.closed.clear()
+
+
+def check_source(source: str, now: datetime, dry_run: bool = False,
+                 snapshot_max_age_hours: float = SNAPSHOT_MAX_AGE_HOURS) -> Dict[str, int]:
+    """Check every tracked company of one source, several companies at a time.
+
+    Companies with a listing snapshot younger than snapshot_max_age_hours are
+    compared against it without an API request.
+
+    Company listings are fetched by SOURCE_CONCURRENCY worker threads (request
+    starts spaced per host by RATE_LIMITER). Active/closed ids are collected
+    across companies by ListingUpdates.
+
+    Args:
+        source: ATS source
+        now: Timestamp written to api_last_seen_at / url_checked_at
+        dry_run: If True, preview without DB updates
+        snapshot_max_age_hours: Maximum listing snapshot age (0 = always fetch)
+
+    Returns:
+        Stats dict (same keys as run_freshness_check's totals)
+    """
+    tag = f"[{source.upper()}]"
+    stats = {
+        'companies_checked': 0,
+        'companies_skipped_error': 0,
+        'companies_skipped_suspicious': 0,
+        'companies_from_snapshot': 0,
+        'jobs_confirmed_active': 0,
+        'jobs_marked_closed': 0,
+    }
+
+    if source not in API_FETCHERS:
+        return stats
+
+    try:
+        snapshots = load_listing_snapshots(source, snapshot_max_age_hours)
+    except Exception as e:
+        print(f"{tag} [WARN] Listing snapshots unavailable ({e}); fetching all listings")
+        snapshots = {}
+    if snapshots:
+        print(f"{tag} {len(snapshots)} listing snapshots younger than {snapshot_max_age_hours:g}h")
+
+    updates = ListingUpdates(now, dry_run)
+
+    with ThreadPoolExecutor(max_workers=SOURCE_CONCURRENCY.get(source, 1)) as executor:
+        # Step 1: Stream tracked jobs company by company; each company's
+        # listing fetch starts as soon as its rows have been read
+        futures = {}
+        tracked = 0
+        for slug, company_jobs in iter_companies(source):
+            snapshot_ids = snapshots.get(slug)
+            if snapshot_ids is not None:
+                stats['companies_from_snapshot'] += 1
+            future = executor.submit(check_company, source, slug, company_jobs, snapshot_ids)
+            futures[future] = (slug, company_jobs)
+            tracked += len(company_jobs)
+
+        if not futures:
+            print(f"{tag} No active jobs found")
+            return stats
+        print(f"{tag} Active jobs tracked: {tracked} across {len(futures)} companies")
+
+        # Step 2: Compare listings as they arrive
+        for future in as_completed(futures):
+            slug, company_jobs = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'outcome': 'error', 'api_count': 0}
+                print(f"{tag} [ERROR] {slug}: {e}")
+
+            if result['outcome'] == 'error':
+                stats['companies_skipped_error'] += 1
+                print(f"{tag} [SKIP] {slug}: API error or not found")
+                continue
+            if result['outcome'] == 'empty':
+                stats['companies_skipped_error'] += 1
+                print(f"{tag} [SKIP] {slug}: API returned 0 jobs but we track {len(company_jobs)}")
+                continue
+            if result['outcome'] == 'suspicious':
+                stats['companies_skipped_suspicious'] += 1
+                print(f"{tag} [SUSPICIOUS] {slug}: 0/{len(company_jobs)} jobs found in API "
+                      f"(API has {result['api_count']} jobs) - possible slug change")
+                continue
+
+            stats['companies_checked'] += 1
+
+            # Step 3: Batch update (accumulated across companies)
+            active_ids = result['active_ids']
+            closed_ids = result['closed_ids']
+            updates.add(result)
+
+            stats['jobs_confirmed_active'] += len(active_ids)
+            stats['jobs_marked_closed'] += len(closed_ids)
+
+            # Only log companies with closures
+            if closed_ids:
+                print(f"{tag} {slug}: {len(active_ids)} active, {len(closed_ids)} closed "
+                      f"(API has {result['api_count']} total)")
+            elif len(futures) <= 20:
+                print(f"{tag} {slug}: {len(active_ids)} active [OK]")
+
+    updates.flush(force=True)
+    print(f"{tag} Done: {stats['companies_checked']}/{len(futures)} companies checked, "
+          f"{stats['jobs_marked_closed']} jobs closed")
+    return stats
+
+
+class IngestClosureDetector:
+    """Mark closed jobs from listings the ingest has already fetched.
+
+    fetch_jobs.py holds each company's complete listing (stats['listing'])
+    while it processes the company. check() compares it with the company's
+    tracked active jobs, with the same safeguards and updates as
+    check_source(), so closures land in the ingest run itself rather than
+    waiting for the next freshness pass.
+
+    Tracked jobs for the whole source are loaded once, on the first check().
+
+    Usage:
+        closures = IngestClosureDetector('greenhouse')
+        for slug in companies:
+            jobs, fetch_stats = fetch_greenhouse_jobs(slug)
+            closures.check(slug, fetch_stats['listing'])
+        closures.finish()
+    """
+
+    def __init__(self, source: str, dry_run: bool = False, now: Optional[datetime] = None):
+        self.source = source
+        self.updates = ListingUpdates(now or datetime.utcnow(), dry_run)
+        self.stats = {
+            'companies_checked': 0,
+            'companies_skipped_error': 0,
+            'companies_skipped_suspicious': 0,
+            'jobs_confirmed_active': 0,
+            'jobs_marked_closed': 0,
+        }
+        self._tracked = None
+
+    def _company_jobs(self, slug: str) -> List[Dict]:
+        if self._tracked is None:
+            try:
+                self._tracked = dict(iter_companies(self.source))
+            except Exception as e:
+                print(f"[{self.source.upper()}] [WARN] Tracked jobs unavailable ({e}); "
+                      f"skipping in-run closure detection")
+                self._tracked = {}
+        return self._tracked.pop(slug, [])
+
+    def check(self, slug: str, listing: Optional[Dict]) -> Dict:
+        """Compare one company's fetched listing with its tracked active jobs.
+
+        Args:
+            slug: Company slug (as stored in raw_jobs.metadata)
+            listing: The scraper's stats['listing'] ({job_id: updated_at}),
+                     or None if the fetch failed
+
+        Returns:
+            compare_listing() result (companies without tracked jobs return
+            'checked' with no ids)
+        """
+        if listing is None:
+            return {'outcome': 'error', 'api_count': 0}
+
+        company_jobs = self._company_jobs(slug)
+        result = compare_listing(company_jobs, set(listing))
+        if not company_jobs:
+            return result
+
+        if result['outcome'] == 'checked':
+            self.stats['companies_checked'] += 1
+            self.stats['jobs_confirmed_active'] += len(result['active_ids'])
+            self.stats['jobs_marked_closed'] += len(result['closed_ids'])
+            self.updates.add(result)
+        elif result['outcome'] == 'suspicious':
+            self.stats['companies_skipped_suspicious'] += 1
+        else:
+            self.stats['companies_skipped_error'] += 1
+        return result
+
+    def finish(self) -> Dict[str, int]:
+        """Write any buffered updates and return the stats."""
+        self.updates.flush(force=True)
+        return self.stats
+
+
 def run_freshness_check(
     sources: Optional[List[str]] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    snapshot_max_age_hours: float = SNAPSHOT_MAX_AGE_HOURS
 ):
     """Run API freshness check for specified sources.
 
     For each source, fetches each company's job listing via API and compares
     against tracked jobs. Present = active, absent = closed (soft_404).
-
-    Company-level safeguards prevent false positives:
-    - API error/404 -> skip company
-    - API returns 0 jobs -> skip company
-    - ALL tracked jobs absent with >1 tracked -> skip company (slug change?)
+    Sources run in parallel; see check_source() for per-company concurrency
+    and check_company() for the safeguards against false positives.
 
     Args:
         sources: List of ATS sources to check (default: all API sources)
         dry_run: If True, preview without DB updates
+        snapshot_max_age_hours: Reuse ingest listing snapshots up to this age
+                                (0 = always fetch listings from the APIs)
     """
     if sources is None:
         sources = API_SOURCES
 
     now = datetime.utcnow()
+    started = time.monotonic()
 
     print("=" * 70)
     print("API FRESHNESS CHECKER")
@@ -333,6 +773,7 @@ def run_freshness_check(
     print(f"Timestamp: {now.isoformat()}")
     print(f"Sources: {', '.join(sources)}")
     print(f"Dry run: {dry_run}")
+    print(f"Listing snapshot max age: {snapshot_max_age_hours:g}h")
     print()
 
     # Aggregate stats
@@ -340,101 +781,25 @@ def run_freshness_check(
         'companies_checked': 0,
         'companies_skipped_error': 0,
         'companies_skipped_suspicious': 0,
+        'companies_from_snapshot': 0,
         'jobs_confirmed_active': 0,
         'jobs_marked_closed': 0,
     }
 
-    for source in sources:
-        print(f"\n{'='*50}")
-        print(f"SOURCE: {source.upper()}")
-        print(f"{'='*50}")
-
-        # Step 1: Get active jobs for this source
-        jobs = get_active_jobs_by_source(source)
-        if not jobs:
-            print(f"  No active jobs found for {source}")
-            continue
-
-        print(f"  Active jobs tracked: {len(jobs)}")
-        companies = group_by_company(jobs)
-        print(f"  Companies with active jobs: {len(companies)}")
-
-        # Step 2: For each company, fetch listing and compare
-        for slug, company_jobs in companies.items():
-            fetcher = API_FETCHERS.get(source)
-            if not fetcher:
-                continue
-
-            # Fetch active job IDs from API
-            if source == 'lever':
-                # Lever needs instance (global/eu)
-                instance = company_jobs[0].get('lever_instance', 'global')
-                api_job_ids = fetcher(slug, instance)
-            else:
-                api_job_ids = fetcher(slug)
-
-            # Rate limit between companies
-            time.sleep(RATE_LIMITS.get(source, 1.0))
-
-            # Safeguard 1: API failure
-            if api_job_ids is None:
-                total_stats['companies_skipped_error'] += 1
-                print(f"  [SKIP] {slug}: API error or not found")
-                continue
-
-            # Safeguard 2: Empty API response when we have tracked jobs
-            if len(api_job_ids) == 0 and len(company_jobs) > 0:
-                total_stats['companies_skipped_error'] += 1
-                print(f"  [SKIP] {slug}: API returned 0 jobs but we track {len(company_jobs)}")
-                continue
-
-            # Safeguard 3: ALL our tracked jobs absent (suspicious - slug change?)
-            our_job_ids = {j['source_job_id'] for j in company_jobs}
-            matches = our_job_ids & api_job_ids
-            if len(matches) == 0 and len(company_jobs) > 1:
-                total_stats['companies_skipped_suspicious'] += 1
-                print(f"  [SUSPICIOUS] {slug}: 0/{len(company_jobs)} jobs found in API "
-                      f"(API has {len(api_job_ids)} jobs) - possible slug change")
+    with ThreadPoolExecutor(max_workers=max(len(sources), 1)) as executor:
+        futures = {
+            executor.submit(check_source, source, now, dry_run, snapshot_max_age_hours): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                source_stats = future.result()
+            except Exception as e:
+                print(f"[{source.upper()}] [ERROR] Source check failed: {e}")
                 continue
-
-            total_stats['companies_checked'] += 1
-
-            # Step 3: Per-job comparison - collect into lists for batch update
-            active_ids = []
-            closed_ids = []
-
-            for job in company_jobs:
-                job_id = job['source_job_id']
-                ej_id = job['enriched_job_id']
-
-                if job_id in api_job_ids:
-                    active_ids.append(ej_id)
-                else:
-                    closed_ids.append(ej_id)
-
-            # Batch update
-            if not dry_run:
-                if active_ids:
-                    _batch_update(active_ids, {
-                        "api_last_seen_at": now.isoformat(),
-                        "url_checked_at": now.isoformat(),
-                        "url_status": "active",
-                    })
-                if closed_ids:
-                    _batch_update(closed_ids, {
-                        "url_status": "soft_404",
-                        "url_checked_at": now.isoformat(),
-                    })
-
-            total_stats['jobs_confirmed_active'] += len(active_ids)
-            total_stats['jobs_marked_closed'] += len(closed_ids)
-
-            # Only log companies with closures
-            if closed_ids:
-                print(f"  {slug}: {len(active_ids)} active, {len(closed_ids)} closed "
-                      f"(API has {len(api_job_ids)} total)")
-            elif len(companies) <= 20:
-                print(f"  {slug}: {len(active_ids)} active [OK]")
+            for key, value in source_stats.items():
+                total_stats[key] += value
 
     # Summary
     print(f"\n{'='*70}")
@@ -443,14 +808,17 @@ def run_freshness_check(
     print(f"  Companies checked:           {total_stats['companies_checked']}")
     print(f"  Companies skipped (error):   {total_stats['companies_skipped_error']}")
     print(f"  Companies skipped (suspicious): {total_stats['companies_skipped_suspicious']}")
+    print(f"  Listings from ingest snapshot: {total_stats['companies_from_snapshot']}")
     print()
     print(f"  Jobs confirmed active:       {total_stats['jobs_confirmed_active']}")
     print(f"  Jobs marked closed:          {total_stats['jobs_marked_closed']}")
+    print(f"  Elapsed:                     {time.monotonic() - started:.0f}s")
 
     if dry_run:
         print("\n  [DRY RUN] No database updates were made.")
 
     print(f"\n[DONE] API freshness check complete!")
+    return total_stats
 
 
 def show_stats():
@@ -529,13 +897,17 @@ if __name__ == "__main__":
                         help='Preview without DB updates')
     parser.add_argument('--stats', action='store_true',
                         help='Show api_last_seen_at distribution')
+    parser.add_argument('--snapshot-max-age', type=float, default=SNAPSHOT_MAX_AGE_HOURS,
+                        metavar='HOURS',
+                        help='Reuse ingest listing snapshots up to this age (0 = always fetch)')
     args = parser.parse_args()
 
     if args.stats:
         show_stats()
     else:
         sources = [args.source] if args.source else None
-        run_freshness_check(sources=sources, dry_run=args.dry_run)
+        run_freshness_check(sources=sources, dry_run=args.dry_run,
+                            snapshot_max_age_hours=args.snapshot_max_age)
 
     print("\n" + "=" * 70)
     print("USAGE:")
@@ -543,4 +915,5 @@ if __name__ == "__main__":
     print("  python pipeline/api_freshness_checker.py --source ashby     # Single source")
     print("  python pipeline/api_freshness_checker.py --dry-run          # Preview without DB updates")
     print("  python pipeline/api_freshness_checker.py --stats            # Show freshness distribution")
+    print("  python pipeline/api_freshness_checker.py --snapshot-max-age 0   # Ignore ingest snapshots")
     print("=" * 70)
@@ -8,12 +8,11 @@ Key design decisions:
 - Agency detection is handled by Python pattern matching, not the LLM
 - Sanitizes string "null" values to Python None for database compatibility
 """
-import os
 import json
-import yaml
 import time
 from typing import Dict, Any
-from dotenv import load_dotenv
+
+from pipeline.config_registry import get_config, get_gemini_client
 
 
 def sanitize_null_strings(obj: Any) -> Any:
@@ -31,19 +30,12 @@ def sanitize_null_strings(obj: Any) -> Any:
         return None
     return obj
 
-load_dotenv()
-
 # ============================================
 # Configuration
 # ============================================
 
-from google import genai
-from google.genai import types
-
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-if not GOOGLE_API_KEY:
-    raise ValueError("Missing GOOGLE_API_KEY in .env file")
-gemini_client = genai.Client(api_key=GOOGLE_API_KEY)
+# The Gemini client and taxonomy are loaded on first use (see config_registry),
+# so importing this module needs neither GOOGLE_API_KEY nor the YAML files.
 
 # Gemini pricing per model (per 1M tokens) - Updated Feb 2026
 # Based on measured V2 prompt: avg 2,848 input / 337 output tokens per job
@@ -65,11 +57,23 @@ SOURCE_MODEL_CONFIG = {
 GEMINI_DEFAULT_MODEL = "gemini-3-flash-preview"
 GEMINI_FALLBACK_MODEL = "gemini-2.5-flash-lite"
 
-_gemini_generation_config = types.GenerateContentConfig(
-    temperature=0.1,
-    max_output_tokens=8000,
-    response_mime_type="application/json"
-)
+_generation_config = None
+
+
+def _get_generation_config():
+    """Build the Gemini generation config on first use."""
+    global _generation_config
+
+    if _generation_config is None:
+        from google.genai import types
+        _generation_config = types.GenerateContentConfig(
+            temperature=0.1,
+            max_output_tokens=8000,
+            response_mime_type="application/json"
+        )
+
+    return _generation_config
+
 
 def get_gemini_model_for_source(source: str = None) -> str:
     """Get the appropriate Gemini model name based on data source."""
@@ -83,9 +87,16 @@ _default_model_name = get_gemini_model_for_source("greenhouse")
 # Track fallbacks for reporting
 _model_fallback_count = 0
 
-# Load taxonomy
-with open('docs/schema_taxonomy.yaml', 'r') as f:
-    taxonomy = yaml.safe_load(f)
+
+def __getattr__(name: str):
+    """Lazy module attributes kept for callers that import them directly."""
+    if name == 'taxonomy':
+        return get_config('schema_taxonomy')
+    if name == 'gemini_client':
+        return get_gemini_client()
+    if name == '_gemini_generation_config':
+        return _get_generation_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============================================
 # Prompt Building
@@ -109,6 +120,7 @@ def build_classification_prompt(job_text: str, structured_input: dict = None) ->
     NOTE: Agency detection is NOT included here - it's handled by Python
     pattern matching after Claude classification completes.
     """
+    taxonomy = get_config('schema_taxonomy')
     
     # Extract key enum values for the prompt
     seniority_levels = "\n".join([
@@ -437,6 +449,8 @@ def build_classification_prompt_v2(job_text: str, structured_input: dict = None)
         job_text: Raw job description text
         structured_input: Optional dict with structured fields from API
     """
+    taxonomy = get_config('schema_taxonomy')
+
     # Extract subfamilies from taxonomy
     product_subfamilies = "\n".join([
         f"    {item['code']}: {item['description']}"
@@ -629,10 +643,10 @@ def classify_job_with_gemini(job_text: str, verbose: bool = False, structured_in
 
     try:
         start_time = time.time()
-        response = gemini_client.models.generate_content(
+        response = get_gemini_client().models.generate_content(
             model=_default_model_name,
             contents=prompt,
-            config=_gemini_generation_config
+            config=_get_generation_config()
         )
         latency_ms = (time.time() - start_time) * 1000
 
@@ -862,10 +876,10 @@ def _classify_job_with_model(job_text: str, model_name: str, verbose: bool = Fal
         print(prompt[:500] + "...\n")
 
     start_time = time.time()
-    response = gemini_client.models.generate_content(
+    response = get_gemini_client().models.generate_content(
         model=model_name,
         contents=prompt,
-        config=_gemini_generation_config
+        config=_get_generation_config()
     )
     latency_ms = (time.time() - start_time) * 1000
 
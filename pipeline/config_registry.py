@@ -0,0 +1,393 @@
+"""
+Config Registry
+Lazy, process-wide access to config files, compiled lookups and API clients.
+
+Nothing is read, parsed or connected at import time:
+- Config files are parsed on first use (paths are resolved from the repo root,
+  not the current working directory).
+- Compiled lookups (inverted maps, detectors) are built on first use from
+  the registered builders.
+- API clients (Supabase, Gemini) are created on first use, so importing a
+  pipeline module never requires credentials.
+
+Parsed configs and compiled lookups live together in a single ConfigSnapshot,
+which is picklable. A parent process can build it once and hand it to
+process-pool workers so they skip all YAML/JSON parsing:
+
+    from concurrent.futures import ProcessPoolExecutor
+    from pipeline.config_registry import build_snapshot, install_snapshot
+
+    snapshot = build_snapshot()
+    with ProcessPoolExecutor(initializer=install_snapshot, initargs=(snapshot,)) as pool:
+        ...
+
+Separate processes (e.g. the per-city fetch_jobs.py runs started by
+run_all_cities.py) share it through a snapshot file instead. The file is keyed
+by the hashes of the config files and builder modules it was built from, and
+is loaded on the first registry miss in each process when the key still
+matches; otherwise configs are parsed from source as usual.
+
+Usage:
+    from pipeline.config_registry import get_config, get_compiled
+
+    taxonomy = get_config('schema_taxonomy')
+    skill_maps = get_compiled('skill_mapping')
+
+Build step (writes the snapshot file for later processes):
+    python pipeline/utilities/build_config_snapshot.py
+"""
+
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import yaml
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Config name -> path relative to the repo root
+CONFIG_FILES: Dict[str, str] = {
+    'agency_blacklist': 'config/agency_blacklist.yaml',
+    'location_mapping': 'config/location_mapping.yaml',
+    'skill_family_mapping': 'config/skill_family_mapping.yaml',
+    'job_family_mapping': 'config/job_family_mapping.yaml',
+    'greenhouse_ats_mapping': 'config/greenhouse/company_ats_mapping.json',
+    'schema_taxonomy': 'docs/schema_taxonomy.yaml',
+}
+
+# Compiled lookup name -> "module:function" that builds it.
+# Builders are referenced by path so the registry never imports pipeline
+# modules until a lookup is actually needed.
+COMPILED_BUILDERS: Dict[str, str] = {
+    'agency_detector': 'pipeline.agency_detection:_build_agency_detector',
+    'country_name_to_iso': 'pipeline.location_extractor:_build_country_name_mapping',
+    'greenhouse_slug_url_types': 'pipeline.url_validator:_load_greenhouse_slug_config',
+    'job_family_mapping': 'pipeline.job_family_mapper:load_job_family_mapping',
+    'skill_index': 'pipeline.skill_family_mapper:_build_skill_index',
+    'skill_mapping': 'pipeline.skill_family_mapper:_build_skill_mapping',
+}
+
+# Bump when the snapshot file layout or ConfigSnapshot changes shape
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Snapshot file location (gitignored); override with CONFIG_SNAPSHOT_PATH
+SNAPSHOT_PATH = Path(os.getenv('CONFIG_SNAPSHOT_PATH', REPO_ROOT / '.cache' / 'config_snapshot.pkl'))
+
+
+@dataclass
+class ConfigSnapshot:
+    """Parsed configs and compiled lookups, picklable for process-pool workers."""
+    configs: Dict[str, Any] = field(default_factory=dict)
+    compiled: Dict[str, Any] = field(default_factory=dict)
+
+
+_snapshot = ConfigSnapshot()
+_clients: Dict[str, Any] = {}
+_lock = threading.RLock()
+_snapshot_file_checked = False
+
+
+# =============================================================================
+# Configs
+# =============================================================================
+
+def get_config_path(name: str) -> Path:
+    """Absolute path of a registered config file."""
+    if name not in CONFIG_FILES:
+        raise KeyError(f"Unknown config: {name}")
+    return REPO_ROOT / CONFIG_FILES[name]
+
+
+def _load_config_file(path: Path) -> Any:
+    if not path.exists():
+        raise FileNotFoundError(f"Config not found: {path}")
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix == '.json':
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+def get_config(name: str) -> Any:
+    """
+    Get a parsed config file, loading it on first use.
+
+    Args:
+        name: Key in CONFIG_FILES (e.g. 'agency_blacklist')
+
+    Returns:
+        Parsed YAML/JSON content
+    """
+    try:
+        return _snapshot.configs[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        _load_snapshot_file_once()
+        if name not in _snapshot.configs:
+            _snapshot.configs[name] = _load_config_file(get_config_path(name))
+        return _snapshot.configs[name]
+
+
+# =============================================================================
+# Compiled lookups
+# =============================================================================
+
+def _resolve_builder(name: str) -> Callable[[], Any]:
+    if name not in COMPILED_BUILDERS:
+        raise KeyError(f"Unknown compiled lookup: {name}")
+    module_name, func_name = COMPILED_BUILDERS[name].split(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def get_compiled(name: str) -> Any:
+    """
+    Get a compiled lookup, building it on first use.
+
+    Args:
+        name: Key in COMPILED_BUILDERS (e.g. 'skill_mapping')
+
+    Returns:
+        Whatever the registered builder returns
+    """
+    try:
+        return _snapshot.compiled[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        _load_snapshot_file_once()
+        if name not in _snapshot.compiled:
+            _snapshot.compiled[name] = _resolve_builder(name)()
+        return _snapshot.compiled[name]
+
+
+def clear_config_cache(names: Optional[Iterable[str]] = None):
+    """
+    Drop cached configs and compiled lookups (useful for testing).
+
+    Args:
+        names: Config or compiled lookup names to drop. Drops everything if None.
+    """
+    with _lock:
+        if names is None:
+            _snapshot.configs.clear()
+            _snapshot.compiled.clear()
+            return
+        for name in names:
+            _snapshot.configs.pop(name, None)
+            _snapshot.compiled.pop(name, None)
+
+
+# =============================================================================
+# Snapshots
+# =============================================================================
+
+def build_snapshot() -> ConfigSnapshot:
+    """
+    Load every registered config and compiled lookup.
+
+    Returns:
+        ConfigSnapshot holding all of them (shares objects with this process)
+    """
+    for name in CONFIG_FILES:
+        get_config(name)
+    for name in COMPILED_BUILDERS:
+        get_compiled(name)
+
+    with _lock:
+        return ConfigSnapshot(
+            configs=dict(_snapshot.configs),
+            compiled=dict(_snapshot.compiled),
+        )
+
+
+def install_snapshot(snapshot: ConfigSnapshot):
+    """
+    Install a snapshot built elsewhere (e.g. as a process-pool initializer).
+
+    Entries in the snapshot replace any already loaded in this process.
+    """
+    with _lock:
+        _snapshot.configs.update(snapshot.configs)
+        _snapshot.compiled.update(snapshot.compiled)
+
+
+# =============================================================================
+# Snapshot file
+# =============================================================================
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def snapshot_key() -> Dict[str, str]:
+    """
+    Fingerprint of everything a snapshot is built from.
+
+    Covers every config file, the source of every builder module, the Python
+    version (pickle/class compatibility) and the pycountry version (source of
+    the country name lookup). Reads files without importing pipeline modules.
+
+    Returns:
+        Dict of input name -> hash or version string
+    """
+    key = {
+        'python': '%d.%d' % sys.version_info[:2],
+        'pycountry': importlib.metadata.version('pycountry'),
+    }
+    for name in CONFIG_FILES:
+        path = get_config_path(name)
+        key[f"config:{name}"] = _sha256(path) if path.exists() else 'missing'
+    for module_name in sorted({ref.split(':')[0] for ref in COMPILED_BUILDERS.values()}):
+        key[f"module:{module_name}"] = _sha256(Path(importlib.util.find_spec(module_name).origin))
+    return key
+
+
+def write_snapshot_file(path: Optional[Path] = None) -> Path:
+    """
+    Build a full snapshot and write it to disk (atomically).
+
+    The file holds two pickles: a small header (format version and
+    snapshot_key()) followed by the ConfigSnapshot, so a stale file is rejected
+    without unpickling the lookups.
+
+    Args:
+        path: Destination (default: SNAPSHOT_PATH)
+
+    Returns:
+        Path written
+    """
+    path = Path(path or SNAPSHOT_PATH)
+    header = {'format_version': SNAPSHOT_FORMAT_VERSION, 'key': snapshot_key()}
+    snapshot = build_snapshot()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return path
+
+
+def load_snapshot_file(path: Optional[Path] = None) -> bool:
+    """
+    Install a snapshot file if it exists and matches the current sources.
+
+    Args:
+        path: Snapshot file (default: SNAPSHOT_PATH)
+
+    Returns:
+        True if the snapshot was installed, False if missing, stale or unreadable
+    """
+    path = Path(path or SNAPSHOT_PATH)
+    if not path.exists():
+        return False
+
+    try:
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if (header.get('format_version') != SNAPSHOT_FORMAT_VERSION
+                    or header.get('key') != snapshot_key()):
+                return False
+            snapshot = pickle.load(f)
+    except Exception:
+        # Truncated file, renamed class, etc. - fall back to parsing sources
+        return False
+
+    install_snapshot(snapshot)
+    return True
+
+
+def _load_snapshot_file_once():
+    """Try the snapshot file on the first registry miss in this process."""
+    global _snapshot_file_checked
+    if _snapshot_file_checked:
+        return
+    _snapshot_file_checked = True
+    load_snapshot_file()
+
+
+# =============================================================================
+# API clients
+# =============================================================================
+
+def get_supabase_client():
+    """
+    Get the shared Supabase client, creating it on first use.
+
+    Raises:
+        ValueError: If SUPABASE_URL or SUPABASE_KEY is not set
+    """
+    with _lock:
+        if 'supabase' not in _clients:
+            from dotenv import load_dotenv
+            from supabase import create_client
+
+            load_dotenv()
+            url = os.getenv("SUPABASE_URL")
+            key = os.getenv("SUPABASE_KEY")
+            if not url or not key:
+                raise ValueError("Missing SUPABASE_URL or SUPABASE_KEY in .env file")
+            _clients['supabase'] = create_client(url, key)
+        return _clients['supabase']
+
+
+def get_gemini_client():
+    """
+    Get the shared Gemini client, creating it on first use.
+
+    Raises:
+        ValueError: If GOOGLE_API_KEY is not set
+    """
+    with _lock:
+        if 'gemini' not in _clients:
+            from dotenv import load_dotenv
+            from google import genai
+
+            load_dotenv()
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                raise ValueError("Missing GOOGLE_API_KEY in .env file")
+            _clients['gemini'] = genai.Client(api_key=api_key)
+        return _clients['gemini']
+
+
+class LazyClient:
+    """
+    Stand-in for an API client that creates the real one on first attribute access.
+
+    Lets modules keep a module-level name (e.g. `supabase`) that callers import
+    and use as before, without connecting at import time.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+
+    def __getattr__(self, name: str) -> Any:
+        # Introspection (mock.patch, copy, pickle, asyncio) probes private and
+        # dunder attributes; answer those without creating the client
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._factory(), name)
+
+    def __repr__(self) -> str:
+        return f"LazyClient({self._factory.__name__})"
+
@@ -1,27 +1,22 @@
 """
 Database connection and helper functions for Supabase
 """
-import os
 import hashlib
 import logging
 from datetime import date, datetime
-from typing import Optional, Dict, List
-from dotenv import load_dotenv
-from supabase import create_client, Client
+from typing import Optional, Dict, List, TYPE_CHECKING
 
-load_dotenv()
+from pipeline.config_registry import LazyClient, get_supabase_client
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 # ============================================
 # Configuration
 # ============================================
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-
-if not SUPABASE_URL or not SUPABASE_KEY:
-    raise ValueError("Missing SUPABASE_URL or SUPABASE_KEY in .env file")
 
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+# Supabase client, created on first use (reads SUPABASE_URL / SUPABASE_KEY)
+supabase: "Client" = LazyClient(get_supabase_client)
 
 logger = logging.getLogger(__name__)
 
@@ -213,7 +213,40 @@ async def get_recently_processed_companies(hours: int = 24, source: str = 'green
         return []
 
 
-async def process_greenhouse_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0) -> Dict:
+def mark_closed_from_listing(closures, slug: str, listing: Optional[Dict]) -> Optional[Dict]:
+    """Close tracked jobs missing from a company's freshly fetched listing
+
+    Uses IngestClosureDetector (api_freshness_checker.py), so the freshness
+    checker's safeguards apply: failed fetches, empty listings and listings
+    containing none of our tracked jobs close nothing.
+
+    Args:
+        closures: IngestClosureDetector for the source, or None when disabled
+        slug: Company slug
+        listing: fetch_stats['listing'] from the scraper
+
+    Returns:
+        The detector's compare result, or None when disabled
+    """
+    if closures is None:
+        return None
+
+    try:
+        result = closures.check(slug, listing)
+    except Exception as e:
+        logger.warning(f"  Closure check failed: {str(e)[:100]}")
+        return None
+
+    if result['outcome'] == 'checked' and result['closed_ids']:
+        logger.info(f"  Closed: {len(result['closed_ids'])} tracked jobs no longer listed")
+    elif result['outcome'] in ('empty', 'suspicious'):
+        logger.warning(f"  Closure check skipped ({result['outcome']}): "
+                       f"listing has {result['api_count']} jobs")
+    return result
+
+
+async def process_greenhouse_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0,
+                                         detect_closures: bool = True) -> Dict:
     """Process Greenhouse jobs incrementally with per-company database writes
 
     This function implements the incremental architecture (same as Ashby/Lever):
@@ -232,11 +265,14 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
     Args:
         companies: Optional list of company slugs to process. If None, processes all from mapping.
         resume_hours: If > 0, skip companies processed within last N hours (resume capability)
+        detect_closures: If True, close tracked jobs missing from each fetched listing
 
     Returns:
         Dict with processing statistics
     """
     from scrapers.greenhouse.greenhouse_api_fetcher import fetch_greenhouse_jobs, load_company_mapping
+    from pipeline.listing_snapshots import save_listing_snapshot
+    from pipeline.api_freshness_checker import IngestClosureDetector
     from pipeline.db_connection import (
         insert_raw_job_upsert, insert_enriched_job, get_working_arrangement_fallback,
         ensure_employer_metadata
@@ -277,6 +313,7 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
         'jobs_with_salary': 0,
         'cost_saved_filtering': 0.0,
         'cost_classification': 0.0,
+        'jobs_marked_closed': 0,
         'errors': [],
         'zero_job_companies': []
     }
@@ -332,6 +369,9 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
     # Cost per classification
     cost_per_classification = 0.00388
 
+    # In-run closure detection against each company's fetched listing
+    closures = IngestClosureDetector('greenhouse') if detect_closures else None
+
     for company_name, company_data in companies_to_process.items():
         slug = company_data['slug']
         company_start_time = time.time()
@@ -370,6 +410,10 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
             logger.warning(f"  Error: {fetch_stats['error']}")
             continue
 
+        # Full listing snapshot, reused by api_freshness_checker.py
+        save_listing_snapshot('greenhouse', slug, fetch_stats.get('listing'))
+        mark_closed_from_listing(closures, slug, fetch_stats.get('listing'))
+
         if not jobs:
             stats['zero_job_companies'].append(slug)
             logger.info(f"  No jobs to process for {company_name}")
@@ -577,6 +621,9 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
         logger.info(f"  - Processing time: {company_elapsed:.1f}s")
         logger.info(f"{'='*80}")
 
+    if closures is not None:
+        stats['jobs_marked_closed'] = closures.finish()['jobs_marked_closed']
+
     # Final summary
     total_elapsed = time.time() - pipeline_start_time
     end_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -605,6 +652,7 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
     logger.info(f"  - Jobs classified: {stats['jobs_classified']}")
     logger.info(f"  - Enriched jobs: {stats['jobs_written_enriched']}")
     logger.info(f"  - Agency flags: {stats['jobs_agency_filtered']}")
+    logger.info(f"  - Closed jobs marked: {stats['jobs_marked_closed']}")
 
     logger.info(f"\nGreenhouse Data Quality:")
     logger.info(f"  - Jobs with structured salary: {stats['jobs_with_salary']}")
@@ -627,7 +675,8 @@ async def process_greenhouse_incremental(companies: Optional[List[str]] = None,
     return stats
 
 
-async def process_lever_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0) -> Dict:
+async def process_lever_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0,
+                                    detect_closures: bool = True) -> Dict:
     """Process Lever jobs incrementally with per-company database writes
 
     This function implements the incremental architecture (same as Greenhouse):
@@ -640,11 +689,14 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
     Args:
         companies: Optional list of company slugs to process. If None, processes all from mapping.
         resume_hours: If > 0, skip companies processed in the last N hours
+        detect_closures: If True, close tracked jobs missing from each fetched listing
 
     Returns:
         Dict with processing statistics
     """
     from scrapers.lever.lever_fetcher import fetch_lever_jobs, load_company_mapping
+    from pipeline.listing_snapshots import save_listing_snapshot
+    from pipeline.api_freshness_checker import IngestClosureDetector
     from pipeline.db_connection import (
         insert_raw_job_upsert, insert_enriched_job, get_working_arrangement_fallback,
         ensure_employer_metadata
@@ -682,6 +734,7 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
         'jobs_written_enriched': 0,
         'cost_saved_filtering': 0.0,
         'cost_classification': 0.0,
+        'jobs_marked_closed': 0,
         'errors': []
     }
 
@@ -729,6 +782,9 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
     # Load filter patterns once (for cost savings calculation)
     cost_per_classification = 0.00388  # Haiku cost per job
 
+    # In-run closure detection against each company's fetched listing
+    closures = IngestClosureDetector('lever') if detect_closures else None
+
     for company_name, company_data in companies_to_process.items():
         slug = company_data['slug']
         instance = company_data.get('instance', 'global')
@@ -769,6 +825,10 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
             logger.warning(f"  Error: {fetch_stats['error']}")
             continue
 
+        # Full listing snapshot, reused by api_freshness_checker.py
+        save_listing_snapshot('lever', slug, fetch_stats.get('listing'))
+        mark_closed_from_listing(closures, slug, fetch_stats.get('listing'))
+
         if not jobs:
             logger.info(f"  No jobs to process for {company_name}")
             continue
@@ -975,6 +1035,9 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
         logger.info(f"  - Processing time: {company_elapsed:.1f}s")
         logger.info(f"{'='*80}")
 
+    if closures is not None:
+        stats['jobs_marked_closed'] = closures.finish()['jobs_marked_closed']
+
     # Final summary
     total_elapsed = time.time() - pipeline_start_time
     end_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1002,6 +1065,7 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
     logger.info(f"  - Jobs classified: {stats['jobs_classified']}")
     logger.info(f"  - Enriched jobs: {stats['jobs_written_enriched']}")
     logger.info(f"  - Agency flags: {stats['jobs_agency_filtered']}")
+    logger.info(f"  - Closed jobs marked: {stats['jobs_marked_closed']}")
 
     logger.info(f"\nCost Analysis:")
     logger.info(f"  - Saved from filtering: ${stats['cost_saved_filtering']:.2f}")
@@ -1018,7 +1082,8 @@ async def process_lever_incremental(companies: Optional[List[str]] = None, resum
     return stats
 
 
-async def process_ashby_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0) -> Dict:
+async def process_ashby_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0,
+                                    detect_closures: bool = True) -> Dict:
     """Process Ashby jobs incrementally with per-company database writes
 
     This function implements the incremental architecture (same as Lever):
@@ -1037,11 +1102,14 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
     Args:
         companies: Optional list of company slugs to process. If None, processes all from mapping.
         resume_hours: If > 0, skip companies processed in the last N hours
+        detect_closures: If True, close tracked jobs missing from each fetched listing
 
     Returns:
         Dict with processing statistics
     """
     from scrapers.ashby.ashby_fetcher import fetch_ashby_jobs, load_company_mapping
+    from pipeline.listing_snapshots import save_listing_snapshot
+    from pipeline.api_freshness_checker import IngestClosureDetector
     from pipeline.db_connection import (
         insert_raw_job_upsert, insert_enriched_job, get_working_arrangement_fallback,
         ensure_employer_metadata
@@ -1080,6 +1148,7 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
         'jobs_with_salary': 0,  # Track Ashby's structured compensation
         'cost_saved_filtering': 0.0,
         'cost_classification': 0.0,
+        'jobs_marked_closed': 0,
         'errors': []
     }
 
@@ -1127,6 +1196,9 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
     # Cost per classification
     cost_per_classification = 0.00388  # Haiku cost per job
 
+    # In-run closure detection against each company's fetched listing
+    closures = IngestClosureDetector('ashby') if detect_closures else None
+
     for company_name, company_data in companies_to_process.items():
         slug = company_data['slug']
         company_start_time = time.time()
@@ -1165,6 +1237,10 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
             logger.warning(f"  Error: {fetch_stats['error']}")
             continue
 
+        # Full listing snapshot, reused by api_freshness_checker.py
+        save_listing_snapshot('ashby', slug, fetch_stats.get('listing'))
+        mark_closed_from_listing(closures, slug, fetch_stats.get('listing'))
+
         if not jobs:
             logger.info(f"  No jobs to process for {company_name}")
             continue
@@ -1380,6 +1456,9 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
         logger.info(f"  - Processing time: {company_elapsed:.1f}s")
         logger.info(f"{'='*80}")
 
+    if closures is not None:
+        stats['jobs_marked_closed'] = closures.finish()['jobs_marked_closed']
+
     # Final summary
     total_elapsed = time.time() - pipeline_start_time
     end_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1407,6 +1486,7 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
     logger.info(f"  - Jobs classified: {stats['jobs_classified']}")
     logger.info(f"  - Enriched jobs: {stats['jobs_written_enriched']}")
     logger.info(f"  - Agency flags: {stats['jobs_agency_filtered']}")
+    logger.info(f"  - Closed jobs marked: {stats['jobs_marked_closed']}")
 
     logger.info(f"\nAshby Data Quality:")
     logger.info(f"  - Jobs with structured salary: {stats['jobs_with_salary']}")
@@ -1429,7 +1509,8 @@ async def process_ashby_incremental(companies: Optional[List[str]] = None, resum
     return stats
 
 
-async def process_workable_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0) -> Dict:
+async def process_workable_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0,
+                                       detect_closures: bool = True) -> Dict:
     """Process Workable jobs incrementally with per-company database writes
 
     This function implements the incremental architecture (same as Ashby):
@@ -1448,11 +1529,14 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
     Args:
         companies: Optional list of company slugs to process. If None, processes all from mapping.
         resume_hours: If > 0, skip companies processed in the last N hours
+        detect_closures: If True, close tracked jobs missing from each fetched listing
 
     Returns:
         Dict with processing statistics
     """
     from scrapers.workable.workable_fetcher import fetch_workable_jobs, load_company_mapping
+    from pipeline.listing_snapshots import save_listing_snapshot
+    from pipeline.api_freshness_checker import IngestClosureDetector
     from pipeline.db_connection import (
         insert_raw_job_upsert, insert_enriched_job, get_working_arrangement_fallback,
         ensure_employer_metadata
@@ -1492,6 +1576,7 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
         'jobs_with_workplace_type': 0,  # Track Workable's workplace_type
         'cost_saved_filtering': 0.0,
         'cost_classification': 0.0,
+        'jobs_marked_closed': 0,
         'errors': []
     }
 
@@ -1539,6 +1624,9 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
     # Cost per classification
     cost_per_classification = 0.00388  # Haiku cost per job
 
+    # In-run closure detection against each company's fetched listing
+    closures = IngestClosureDetector('workable') if detect_closures else None
+
     for company_name, company_data in companies_to_process.items():
         slug = company_data.get('slug', '')
         if not slug:
@@ -1581,6 +1669,10 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
             logger.warning(f"  Error: {fetch_stats['error']}")
             continue
 
+        # Full listing snapshot, reused by api_freshness_checker.py
+        save_listing_snapshot('workable', slug, fetch_stats.get('listing'))
+        mark_closed_from_listing(closures, slug, fetch_stats.get('listing'))
+
         if not jobs:
             logger.info(f"  No jobs to process for {company_name}")
             continue
@@ -1805,6 +1897,9 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
         logger.info(f"  - Processing time: {company_elapsed:.1f}s")
         logger.info(f"{'='*80}")
 
+    if closures is not None:
+        stats['jobs_marked_closed'] = closures.finish()['jobs_marked_closed']
+
     # Final summary
     total_elapsed = time.time() - pipeline_start_time
     end_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1832,6 +1927,7 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
     logger.info(f"  - Jobs classified: {stats['jobs_classified']}")
     logger.info(f"  - Enriched jobs: {stats['jobs_written_enriched']}")
     logger.info(f"  - Agency flags: {stats['jobs_agency_filtered']}")
+    logger.info(f"  - Closed jobs marked: {stats['jobs_marked_closed']}")
 
     logger.info(f"\nWorkable Data Quality:")
     logger.info(f"  - Jobs with structured salary: {stats['jobs_with_salary']}")
@@ -1857,7 +1953,8 @@ async def process_workable_incremental(companies: Optional[List[str]] = None, re
     return stats
 
 
-async def process_smartrecruiters_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0) -> Dict:
+async def process_smartrecruiters_incremental(companies: Optional[List[str]] = None, resume_hours: int = 0,
+                                              detect_closures: bool = True) -> Dict:
     """Process SmartRecruiters jobs incrementally with per-company database writes
 
     This function implements the incremental architecture (same as Workable):
@@ -1876,11 +1973,14 @@ async def process_smartrecruiters_incremental(companies: Optional[List[str]] = N
     Args:
         companies: Optional list of company slugs to process. If None, processes all from mapping.
         resume_hours: If > 0, skip companies processed in the last N hours
+        detect_closures: If True, close tracked jobs missing from each fetched listing
 
     Returns:
         Dict with processing statistics
     """
     from scrapers.smartrecruiters.smartrecruiters_fetcher import fetch_smartrecruiters_jobs, load_company_mapping
+    from pipeline.listing_snapshots import save_listing_snapshot
+    from pipeline.api_freshness_checker import IngestClosureDetector
     from pipeline.db_connection import (
         insert_raw_job_upsert, insert_enriched_job, get_working_arrangement_fallback,
         ensure_employer_metadata
@@ -1920,6 +2020,7 @@ async def process_smartrecruiters_incremental(companies: Optional[List[str]] = N
         'jobs_with_experience_level': 0,  # Track experienceLevel
         'cost_saved_filtering': 0.0,
         'cost_classification': 0.0,
+        'jobs_marked_closed': 0,
         'errors': []
     }
 
@@ -1967,6 +2068,9 @@ async def process_smartrecruiters_incremental(companies: Optional[List[str]] = N
     # Cost per classification
     cost_per_classification = 0.00388  # Haiku cost per job
 
+    # In-run closure detection against each company's fetched listing
+    closures = IngestClosureDetector('smartrecruiters') if detect_closures else None
+
     for company_name, company_data in companies_to_process.items():
         slug = company_data.get('slug', '')
         if not slug:
@@ -2009,6 +2113,10 @@ async def process_smartrecruiters_incremental(companies: Optional[List[str]] = N
             logger.warning(f"  Error: {fetch_stats['error']}")
             continue
 
+        # Full listing snapshot, reused by api_freshness_checker.py
+        save_listing_snapshot('smartrecruiters', slug, fetch_stats.get('listing'))
+        mark_closed_from_listing(closures, slug, fetch_stats.get('listing'))
+
         if not jobs:
             logger.info(f"  No jobs to process for {company_name}")
             continue
@@ -2229,6 +2337,9 @@ async def process_smartrecruiters_incremental(companies: Optional[List[str]] = N
         logger.info(f"  - Processing time: {company_elapsed:.1f}s")
         logger.info(f"{'='*80}")
 
+    if closures is not None:
+        stats['jobs_marked_closed'] = closures.finish()['jobs_marked_closed']
+
     # Final summary
     total_elapsed = time.time() - pipeline_start_time
     end_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -2256,6 +2367,7 @@ async def process_smartrecruiters_incremental(companies: Optional[List[str]] = N
     logger.info(f"  - Jobs classified: {stats['jobs_classified']}")
     logger.info(f"  - Enriched jobs: {stats['jobs_written_enriched']}")
     logger.info(f"  - Agency flags: {stats['jobs_agency_filtered']}")
+    logger.info(f"  - Closed jobs marked: {stats['jobs_marked_closed']}")
 
     logger.info(f"\nSmartRecruiters Data Quality:")
     logger.info(f"  - Jobs with location_type: {stats['jobs_with_location_type']}")
@@ -2918,6 +3030,12 @@ Examples:
         help='Skip storage step (just fetch and classify)'
     )
 
+    parser.add_argument(
+        '--skip-closure-check',
+        action='store_true',
+        help='Skip in-run closure detection (leave closed-job marking to api_freshness_checker.py)'
+    )
+
     parser.add_argument(
         '--resume-hours',
         type=int,
@@ -2968,7 +3086,8 @@ Examples:
             logger.info(f"Resume Mode: Enabled ({args.resume_hours} hour window)")
         logger.info("="*80 + "\n")
 
-        greenhouse_stats = await process_greenhouse_incremental(companies, resume_hours=args.resume_hours)
+        greenhouse_stats = await process_greenhouse_incremental(companies, resume_hours=args.resume_hours,
+                                                                detect_closures=not args.skip_closure_check)
         total_stats['greenhouse'] = greenhouse_stats
 
     # LEVER PIPELINE: Incremental processing (same pattern as Greenhouse)
@@ -2984,7 +3103,8 @@ Examples:
             logger.info(f"Resume Mode: Enabled ({args.resume_hours} hour window)")
         logger.info("="*80 + "\n")
 
-        lever_stats = await process_lever_incremental(lever_companies, resume_hours=args.resume_hours)
+        lever_stats = await process_lever_incremental(lever_companies, resume_hours=args.resume_hours,
+                                                      detect_closures=not args.skip_closure_check)
         total_stats['lever'] = lever_stats
 
     # ASHBY PIPELINE: Incremental processing (same pattern as Lever)
@@ -3000,7 +3120,8 @@ Examples:
             logger.info(f"Resume Mode: Enabled ({args.resume_hours} hour window)")
         logger.info("="*80 + "\n")
 
-        ashby_stats = await process_ashby_incremental(ashby_companies, resume_hours=args.resume_hours)
+        ashby_stats = await process_ashby_incremental(ashby_companies, resume_hours=args.resume_hours,
+                                                      detect_closures=not args.skip_closure_check)
         total_stats['ashby'] = ashby_stats
 
     # WORKABLE PIPELINE: Incremental processing (same pattern as Ashby)
@@ -3016,7 +3137,8 @@ Examples:
             logger.info(f"Resume Mode: Enabled ({args.resume_hours} hour window)")
         logger.info("="*80 + "\n")
 
-        workable_stats = await process_workable_incremental(workable_companies, resume_hours=args.resume_hours)
+        workable_stats = await process_workable_incremental(workable_companies, resume_hours=args.resume_hours,
+                                                            detect_closures=not args.skip_closure_check)
         total_stats['workable'] = workable_stats
 
     # SMARTRECRUITERS PIPELINE: Incremental processing (same pattern as Workable)
@@ -3032,7 +3154,8 @@ Examples:
             logger.info(f"Resume Mode: Enabled ({args.resume_hours} hour window)")
         logger.info("="*80 + "\n")
 
-        sr_stats = await process_smartrecruiters_incremental(sr_companies, resume_hours=args.resume_hours)
+        sr_stats = await process_smartrecruiters_incremental(sr_companies, resume_hours=args.resume_hours,
+                                                             detect_closures=not args.skip_closure_check)
         total_stats['smartrecruiters'] = sr_stats
 
     # CUSTOM CONFIG PIPELINE: Google XML + Playwright scrapers (FAANG, banks, etc.)
@@ -5,12 +5,11 @@ This module enforces data consistency by mapping job_subfamily values to their
 correct job_family, overriding any incorrect LLM classifications.
 """
 
-import yaml
-from pathlib import Path
 from typing import Optional
 
-# Load mapping once at module level
-MAPPING_FILE = Path(__file__).parent.parent / "config" / "job_family_mapping.yaml"
+from pipeline.config_registry import get_compiled, get_config, get_config_path
+
+MAPPING_FILE = get_config_path("job_family_mapping")
 
 def load_job_family_mapping() -> dict[str, str]:
     """
@@ -19,8 +18,7 @@ def load_job_family_mapping() -> dict[str, str]:
     Returns:
         dict: Mapping of job_subfamily (lowercase) to job_family
     """
-    with open(MAPPING_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+    config = get_config("job_family_mapping")
 
     # Flatten into subfamily -> family mapping
     mapping = {}
@@ -30,8 +28,12 @@ def load_job_family_mapping() -> dict[str, str]:
 
     return mapping
 
-# Load mapping at module import
-JOB_FAMILY_MAPPING = load_job_family_mapping()
+def __getattr__(name: str):
+    """JOB_FAMILY_MAPPING is built from the YAML on first access."""
+    if name == "JOB_FAMILY_MAPPING":
+        return get_compiled("job_family_mapping")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_correct_job_family(job_subfamily: str) -> Optional[str]:
     """
@@ -54,7 +56,7 @@ def get_correct_job_family(job_subfamily: str) -> Optional[str]:
     if not job_subfamily:
         return None
 
-    return JOB_FAMILY_MAPPING.get(job_subfamily.lower())
+    return get_compiled("job_family_mapping").get(job_subfamily.lower())
 
 def validate_and_fix_job_family(job_subfamily: str, job_family: str) -> tuple[str, bool]:
     """
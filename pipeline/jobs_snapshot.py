@@ -0,0 +1,463 @@
+"""
+Jobs Snapshot - Local Parquet copy of enriched_jobs, raw_jobs and employer_metadata.
+
+The analysis utilities and the report generator page the live tables 1,000
+rows at a time on every run. This module keeps a local snapshot instead and
+syncs it incrementally: each run fetches only rows whose updated_at is at or
+after the table's watermark (migrations 014/015), upserts them by id into
+the month partitions they belong to, and rewrites only those partitions.
+Tools started with --from-snapshot then read just the columns they need,
+memory-mapped through Arrow.
+
+Layout (SNAPSHOT_DIR, default .cache/snapshot):
+    enriched_jobs/posted_month=2025-12/data.parquet
+    raw_jobs/scraped_month=2025-12/data.parquet      (metadata columns only, no text)
+    employer_metadata/data.parquet                    (small; rewritten when changed)
+    state.json                                        (per-table watermark, rows, synced_at)
+
+JSONB columns (locations, skills) are stored as JSON text and decoded by
+rows(). updated_at does not record deletions: each sync compares the local
+row count with the table's and suggests --full when they differ.
+
+Usage:
+    from pipeline.jobs_snapshot import JobsSnapshot
+
+    snapshot = JobsSnapshot()
+    snapshot.sync()                                         # incremental
+    jobs = snapshot.rows('enriched_jobs', ['job_family', 'skills'],
+                         filters=snapshot.window_filters('2025-12-01', '2025-12-31'))
+    total = snapshot.count('raw_jobs')
+
+CLI Usage:
+    python pipeline/jobs_snapshot.py                        # Incremental sync
+    python pipeline/jobs_snapshot.py --full                 # Rebuild from scratch
+    python pipeline/jobs_snapshot.py --tables enriched_jobs --dir /tmp/snapshot
+
+    python pipeline/utilities/check_pipeline_status.py --from-snapshot
+    python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --from-snapshot
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+import os
+import json
+import argparse
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# ============================================
+# Configuration
+# ============================================
+
+# Snapshot directory (gitignored); override with JOBS_SNAPSHOT_DIR or --dir
+SNAPSHOT_DIR = Path(os.getenv('JOBS_SNAPSHOT_DIR', REPO_ROOT / '.cache' / 'snapshot'))
+
+PAGE_SIZE = 1000
+
+# Re-fetch window behind the watermark (rows updated while a sync pages)
+SYNC_OVERLAP = timedelta(minutes=5)
+
+# Partition value for rows without a date
+NONE_PARTITION = 'none'
+
+DATA_FILE = 'data.parquet'
+STATE_FILE = 'state.json'
+
+# Arrow type per column kind; 'json' columns are JSON-encoded text
+ARROW_TYPES = {
+    'int': pa.int64(),
+    'float': pa.float64(),
+    'bool': pa.bool_(),
+    'str': pa.string(),
+    'json': pa.string(),
+    'list': pa.list_(pa.string()),
+}
+
+# Synced tables: partition (name, source column) and column kinds.
+# employer_metadata has no fixed column list (all columns, types inferred).
+TABLES = {
+    'enriched_jobs': {
+        'partition': ('posted_month', 'posted_date'),
+        'columns': {
+            'id': 'int', 'raw_job_id': 'int',
+            'employer_name': 'str', 'employer_department': 'str',
+            'is_agency': 'bool', 'agency_confidence': 'str',
+            'title_display': 'str', 'title_canonical': 'str',
+            'job_family': 'str', 'job_subfamily': 'str', 'track': 'str', 'seniority': 'str',
+            'position_type': 'str', 'experience_range': 'str', 'working_arrangement': 'str',
+            'locations': 'json', 'accessible_city_codes': 'list',
+            'currency': 'str', 'salary_min': 'float', 'salary_max': 'float', 'equity_eligible': 'bool',
+            'skills': 'json',
+            'posted_date': 'str', 'last_seen_date': 'str', 'classified_at': 'str',
+            'data_source': 'str', 'description_source': 'str', 'deduplicated': 'bool',
+            'url_status': 'str', 'created_at': 'str', 'updated_at': 'str',
+        },
+    },
+    'raw_jobs': {
+        'partition': ('scraped_month', 'scraped_at'),
+        'columns': {
+            'id': 'int', 'source': 'str', 'source_job_id': 'str', 'posting_url': 'str',
+            'title': 'str', 'company': 'str', 'text_source': 'str', 'hash': 'str',
+            'scraped_at': 'str', 'created_at': 'str', 'updated_at': 'str',
+        },
+    },
+    'employer_metadata': {
+        'partition': None,
+        'columns': None,
+    },
+}
+
+# Columns added by later migrations; dropped from the select when missing
+OPTIONAL_COLUMNS = {
+    'enriched_jobs': ('accessible_city_codes',),   # migration 033
+}
+
+
+def _convert(value, kind: str):
+    """Supabase JSON value -> Arrow-ready value for a column kind."""
+    if value is None:
+        return None
+    if kind == 'json':
+        return json.dumps(value)
+    if kind == 'str':
+        if isinstance(value, str):
+            return value
+        return json.dumps(value) if isinstance(value, (dict, list)) else str(value)
+    if kind == 'int':
+        return int(value)
+    if kind == 'float':
+        return float(value)
+    if kind == 'bool':
+        return bool(value)
+    return [str(v) for v in value]
+
+
+class JobsSnapshot:
+    """
+    Incrementally synced Parquet snapshot of the job tables.
+
+    Attributes:
+        directory: Snapshot root (see module docstring for the layout)
+    """
+
+    def __init__(self, directory: Path = None, client=None):
+        """
+        Args:
+            directory: Snapshot root (default: SNAPSHOT_DIR)
+            client: Supabase client for sync (default: pipeline.db_connection.supabase)
+        """
+        self.directory = Path(directory or SNAPSHOT_DIR)
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            from pipeline.db_connection import supabase
+            self._client = supabase
+        return self._client
+
+    # ----------------------------------------
+    # State
+    # ----------------------------------------
+
+    def state(self) -> dict:
+        """Per-table sync state ({table: {updated_at, rows, synced_at}})."""
+        path = self.directory / STATE_FILE
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_state(self, state: dict):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+
+    # ----------------------------------------
+    # Arrow conversion
+    # ----------------------------------------
+
+    def _to_arrow(self, table: str, rows: list) -> pa.Table:
+        """Rows from Supabase -> Arrow table (fixed schema, or inferred for employer_metadata)."""
+        columns = TABLES[table]['columns']
+        if columns is None:
+            json_columns = sorted({k for r in rows for k, v in r.items() if isinstance(v, (dict, list))})
+            data = [{k: (json.dumps(v) if k in json_columns and v is not None else v) for k, v in r.items()}
+                    for r in rows]
+            arrow = pa.Table.from_pylist(data)
+        else:
+            json_columns = [c for c, kind in columns.items() if kind == 'json']
+            arrow = pa.table({
+                column: pa.array([_convert(r.get(column), kind) for r in rows], type=ARROW_TYPES[kind])
+                for column, kind in columns.items()
+            })
+        return arrow.replace_schema_metadata({'json_columns': json.dumps(json_columns)})
+
+    def _partition_value(self, table: str, row: dict) -> str:
+        source = TABLES[table]['partition'][1]
+        return str(row.get(source) or '')[:7] or NONE_PARTITION
+
+    def _partition_files(self, table: str) -> Dict[str, Path]:
+        """Existing partition value -> data file."""
+        name = TABLES[table]['partition'][0]
+        root = self.directory / table
+        if not root.exists():
+            return {}
+        return {
+            path.parent.name.split('=', 1)[1]: path
+            for path in root.glob(f'{name}=*/{DATA_FILE}')
+        }
+
+    def _write_file(self, path: Path, arrow: pa.Table):
+        """Write a Parquet file atomically (an empty table removes it)."""
+        if arrow.num_rows == 0:
+            if path.exists():
+                path.unlink()
+                if path.parent != self.directory and not any(path.parent.iterdir()):
+                    path.parent.rmdir()
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        os.close(fd)
+        try:
+            pq.write_table(arrow, tmp_name, compression='zstd')
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    # ----------------------------------------
+    # Sync
+    # ----------------------------------------
+
+    def _select_columns(self, table: str, drop=()) -> str:
+        columns = TABLES[table]['columns']
+        if columns is None:
+            return '*'
+        return ','.join(c for c in columns if c not in drop)
+
+    def _fetch_rows(self, table: str, since: Optional[str]) -> list:
+        """Rows with updated_at >= since (all rows if None), paginated."""
+        dropped = ()
+        while True:
+            columns = self._select_columns(table, dropped)
+            rows, offset = [], 0
+            try:
+                while True:
+                    query = self.client.table(table).select(columns)
+                    if since:
+                        query = query.gte('updated_at', since)
+                    batch = query.order('updated_at').order('id').range(offset, offset + PAGE_SIZE - 1).execute()
+                    if not batch.data:
+                        break
+                    rows.extend(batch.data)
+                    offset += PAGE_SIZE
+                    if len(batch.data) < PAGE_SIZE:
+                        break
+                return rows
+            except Exception as e:
+                optional = [c for c in OPTIONAL_COLUMNS.get(table, ()) if c not in dropped]
+                if not optional:
+                    raise
+                print(f"[DB] {table}.{optional[0]} unavailable ({str(e)[:80]}); syncing without it")
+                dropped += (optional[0],)
+
+    def _server_count(self, table: str) -> Optional[int]:
+        return self.client.table(table).select('id', count='exact').limit(1).execute().count
+
+    def sync(self, tables: List[str] = None, full: bool = False) -> dict:
+        """
+        Bring the snapshot up to date.
+
+        Args:
+            tables: Tables to sync (default: all of TABLES)
+            full: Refetch everything instead of rows changed since the watermark
+
+        Returns:
+            {table: {fetched, partitions, rows}}
+        """
+        state = self.state()
+        stats = {}
+        for table in tables or list(TABLES):
+            started = datetime.now(timezone.utc)
+            since = None if full else state.get(table, {}).get('updated_at')
+            rows = self._fetch_rows(table, since)
+
+            if TABLES[table]['partition'] is None:
+                written = self._sync_whole(table, rows, since)
+            else:
+                written = self._sync_partitions(table, rows, full)
+
+            total = self.count(table)
+            watermark = state.get(table, {}).get('updated_at')
+            if rows:
+                latest = max(r.get('updated_at') or '' for r in rows)
+                watermark = min(latest, (started - SYNC_OVERLAP).isoformat()) or watermark
+            state[table] = {'updated_at': watermark, 'rows': total, 'synced_at': started.isoformat()}
+            self._write_state(state)
+
+            stats[table] = {'fetched': len(rows), 'partitions': written, 'rows': total}
+            print(f"[SNAPSHOT] {table}: {len(rows):,} rows fetched, {written} file(s) written, {total:,} rows")
+
+            server = self._server_count(table)
+            if server is not None and server != total:
+                print(f"[SNAPSHOT] {table}: snapshot has {total:,} rows, table has {server:,} "
+                      f"(deleted rows?) - run with --full to rebuild")
+        return stats
+
+    def _sync_whole(self, table: str, rows: list, since: Optional[str]) -> int:
+        """Unpartitioned table: rewrite it whenever anything changed."""
+        if since and not rows:
+            return 0
+        if since:
+            rows = self._fetch_rows(table, None)
+        self._write_file(self.directory / table / DATA_FILE, self._to_arrow(table, rows))
+        return 1
+
+    def _sync_partitions(self, table: str, rows: list, full: bool) -> int:
+        """Upsert rows by id into their month partitions; rewrite only affected partitions."""
+        existing = self._partition_files(table)
+        by_partition: Dict[str, list] = {}
+        for row in {r['id']: r for r in rows}.values():
+            by_partition.setdefault(self._partition_value(table, row), []).append(row)
+
+        name = TABLES[table]['partition'][0]
+        if full:
+            for value in set(existing) - set(by_partition):
+                self._write_file(existing[value], self._to_arrow(table, []))
+            for value, part_rows in by_partition.items():
+                self._write_file(self.directory / table / f'{name}={value}' / DATA_FILE,
+                                 self._to_arrow(table, part_rows))
+            return len(by_partition)
+
+        changed = pa.array(sorted({r['id'] for r in rows}), type=pa.int64())
+        affected = set(by_partition)
+        for value, path in existing.items():
+            ids = pq.read_table(path, columns=['id'], memory_map=True)['id']
+            if pc.any(pc.is_in(ids, value_set=changed)).as_py():
+                affected.add(value)
+
+        for value in sorted(affected):
+            new = self._to_arrow(table, by_partition.get(value, []))
+            if value in existing:
+                old = pq.read_table(existing[value])
+                old = old.filter(pc.invert(pc.is_in(old['id'], value_set=changed)))
+                new = pa.concat_tables([old.select(new.column_names).cast(new.schema), new])
+            self._write_file(self.directory / table / f'{name}={value}' / DATA_FILE, new.combine_chunks())
+        return len(affected)
+
+    # ----------------------------------------
+    # Reading
+    # ----------------------------------------
+
+    def has(self, table: str) -> bool:
+        root = self.directory / table
+        return root.exists() and any(root.rglob(DATA_FILE))
+
+    @staticmethod
+    def window_filters(start_date: str, end_date: str) -> list:
+        """enriched_jobs filters for a posted_date window (prunes month partitions)."""
+        return [
+            ('posted_month', '>=', start_date[:7]), ('posted_month', '<=', end_date[:7]),
+            ('posted_date', '>=', start_date), ('posted_date', '<=', end_date),
+        ]
+
+    def read(self, table: str, columns: List[str] = None, filters: list = None) -> pa.Table:
+        """
+        Memory-mapped Arrow read of a table.
+
+        Args:
+            columns: Columns to read (default: all)
+            filters: pyarrow filters, e.g. [('job_family', '=', 'data')]
+        """
+        if not self.has(table):
+            raise FileNotFoundError(f"No snapshot of {table} in {self.directory} "
+                                    f"(run python pipeline/jobs_snapshot.py)")
+        if TABLES[table]['partition'] is None:
+            return pq.read_table(self.directory / table / DATA_FILE, columns=columns,
+                                 filters=filters or None, memory_map=True)
+
+        # Fixed schema: no file is opened until its partition survives the filters
+        name = TABLES[table]['partition'][0]
+        partition = pa.schema([(name, pa.string())])
+        schema = pa.schema(list(self._to_arrow(table, []).schema) + list(partition))
+        dataset = ds.dataset(
+            str(self.directory / table), schema=schema, format='parquet',
+            partitioning=ds.partitioning(partition, flavor='hive'),
+            filesystem=fs.LocalFileSystem(use_mmap=True),
+        )
+        return dataset.to_table(columns=columns,
+                                filter=pq.filters_to_expression(filters) if filters else None)
+
+    def rows(self, table: str, columns: List[str] = None, filters: list = None) -> list:
+        """Rows as dicts (like Supabase results), JSON columns decoded."""
+        arrow = self.read(table, columns, filters)
+        spec = TABLES[table]['columns']
+        if spec is not None:
+            json_columns = [c for c, kind in spec.items() if kind == 'json']
+        else:
+            json_columns = json.loads((arrow.schema.metadata or {}).get(b'json_columns', b'[]'))
+        json_columns = [c for c in json_columns if c in arrow.column_names]
+
+        rows = arrow.to_pylist()
+        for row in rows:
+            for column in json_columns:
+                if row[column] is not None:
+                    row[column] = json.loads(row[column])
+        return rows
+
+    def count(self, table: str, filters: list = None) -> int:
+        """Row count (from Parquet footers when unfiltered)."""
+        if not self.has(table):
+            return 0
+        if not filters:
+            return sum(pq.ParquetFile(path).metadata.num_rows
+                       for path in (self.directory / table).rglob(DATA_FILE))
+        return self.read(table, [filters[0][0]], filters).num_rows
+
+
+def main():
+    """CLI entry point for the snapshot sync."""
+    parser = argparse.ArgumentParser(
+        description='Sync a local Parquet snapshot of enriched_jobs, raw_jobs and employer_metadata',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python pipeline/jobs_snapshot.py                       # Incremental (updated_at watermarks)
+    python pipeline/jobs_snapshot.py --full                # Rebuild (picks up deletions)
+    python pipeline/jobs_snapshot.py --tables enriched_jobs employer_metadata
+        """
+    )
+    parser.add_argument('--dir', type=str, default=None,
+                        help=f'Snapshot directory (default: {SNAPSHOT_DIR})')
+    parser.add_argument('--tables', nargs='+', choices=list(TABLES), default=None,
+                        help='Tables to sync (default: all)')
+    parser.add_argument('--full', action='store_true',
+                        help='Refetch every row instead of rows changed since the last sync')
+
+    args = parser.parse_args()
+
+    snapshot = JobsSnapshot(args.dir)
+    print("=" * 70)
+    print("JOBS SNAPSHOT")
+    print("=" * 70)
+    print(f"Directory: {snapshot.directory}")
+    print(f"Mode: {'full' if args.full else 'incremental'}")
+    print()
+
+    snapshot.sync(args.tables, full=args.full)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+ATS Listing Snapshots
+Persist and reuse each company's complete ATS job listing.
+
+The ingest (fetch_jobs.py) already downloads every tracked company's full
+listing. Each scraper returns it as stats['listing'] ({job_id: updated_at},
+see scrapers/common/listing.py), and the ingest stores it here, one row per
+(source, company_slug) in ats_listing_snapshots (migration 032).
+api_freshness_checker.py then reuses snapshots younger than its
+--snapshot-max-age instead of requesting the same boards again.
+
+Usage:
+    from pipeline.listing_snapshots import save_listing_snapshot, load_listing_snapshots
+
+    save_listing_snapshot('ashby', 'acme', fetch_stats['listing'])
+    snapshots = load_listing_snapshots('ashby', max_age_hours=6)  # {slug: {job ids}}
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Set
+
+from pipeline.db_connection import supabase
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TABLE = "ats_listing_snapshots"
+
+
+def save_listing_snapshot(source: str, company_slug: str, listing: Optional[Dict[str, Any]],
+                          fetched_at: Optional[datetime] = None) -> bool:
+    """
+    Store a company's complete listing (replaces the previous snapshot).
+
+    Failures are logged and never interrupt the ingest.
+
+    Args:
+        source: ATS source (e.g. 'greenhouse')
+        company_slug: Company slug as stored in raw_jobs.metadata
+        listing: {job_id: updated_at} from the scraper's stats['listing'];
+                 None (fetch failed) stores nothing
+        fetched_at: When the listing was fetched (default: now, UTC)
+
+    Returns:
+        True if the snapshot was written
+    """
+    if listing is None or not company_slug:
+        return False
+
+    fetched_at = fetched_at or datetime.now(timezone.utc)
+    try:
+        supabase.table(SNAPSHOT_TABLE).upsert({
+            'source': source,
+            'company_slug': company_slug,
+            'job_ids': listing,
+            'job_count': len(listing),
+            'fetched_at': fetched_at.isoformat(),
+        }, on_conflict='source,company_slug').execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to save {source} listing snapshot for {company_slug}: {str(e)[:100]}")
+        return False
+
+
+def load_listing_snapshots(source: str, max_age_hours: float) -> Dict[str, Set[str]]:
+    """
+    Load a source's snapshots fetched within the last max_age_hours.
+
+    Args:
+        source: ATS source
+        max_age_hours: Maximum snapshot age (<= 0 loads nothing)
+
+    Returns:
+        Dict of company_slug -> set of listed job ids
+    """
+    if max_age_hours <= 0:
+        return {}
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).isoformat()
+    snapshots = {}
+    offset = 0
+    page_size = 1000
+
+    while True:
+        result = supabase.table(SNAPSHOT_TABLE) \
+            .select("company_slug, job_ids") \
+            .eq("source", source) \
+            .gte("fetched_at", cutoff) \
+            .range(offset, offset + page_size - 1) \
+            .execute()
+
+        if not result.data:
+            break
+
+        for row in result.data:
+            job_ids = row.get('job_ids')
+            if isinstance(job_ids, dict):
+                snapshots[row['company_slug']] = set(job_ids)
+
+        if len(result.data) < page_size:
+            break
+        offset += page_size
+
+    return snapshots
@@ -28,22 +28,22 @@ Example usage:
     #     {"type": "city", "country_code": "US", "city": "new_york"},
     #     {"type": "remote", "scope": "country", "country_code": "US"}
     # ]
+
+    # Backfills: parse each unique string once, fan results back out per row
+    rows = extract_locations_batch(raw_locations, descriptions)
 """
 
-import os
 import re
-from typing import Dict, List, Optional, Tuple
-import yaml
-import pycountry
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pipeline.config_registry import clear_config_cache as registry_clear_cache, get_compiled, get_config
 
 
 # =============================================================================
 # Configuration Loading
 # =============================================================================
 
-_config_cache: Optional[Dict] = None
-
-
 def load_location_config() -> Dict:
     """
     Load location mapping configuration from YAML file.
@@ -52,31 +52,12 @@ def load_location_config() -> Dict:
     Returns:
         Dict containing cities, countries, regions, and remote_patterns
     """
-    global _config_cache
-
-    if _config_cache is not None:
-        return _config_cache
-
-    # Find config file relative to this module
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        "config",
-        "location_mapping.yaml"
-    )
-
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Location config not found: {config_path}")
-
-    with open(config_path, "r", encoding="utf-8") as f:
-        _config_cache = yaml.safe_load(f)
-
-    return _config_cache
+    return get_config("location_mapping")
 
 
 def clear_config_cache():
     """Clear the config cache (useful for testing)."""
-    global _config_cache
-    _config_cache = None
+    registry_clear_cache(["location_mapping"])
 
 
 # =============================================================================
@@ -277,6 +258,8 @@ def split_multi_location(raw_location: str) -> List[str]:
 
 def _build_country_name_mapping() -> Dict[str, str]:
     """Build country name to ISO code mapping from pycountry + custom aliases."""
+    import pycountry
+
     mapping = {}
 
     for country in pycountry.countries:
@@ -308,7 +291,11 @@ def _build_country_name_mapping() -> Dict[str, str]:
     return mapping
 
 
-COUNTRY_NAME_TO_ISO = _build_country_name_mapping()
+def __getattr__(name: str):
+    """COUNTRY_NAME_TO_ISO is built on first access (pycountry is slow to load)."""
+    if name == "COUNTRY_NAME_TO_ISO":
+        return get_compiled("country_name_to_iso")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -591,7 +578,7 @@ def match_country_remote_pattern(text: str) -> Optional[Dict]:
         return None
 
     # Try to find a country name in the text
-    for country_name, country_code in COUNTRY_NAME_TO_ISO.items():
+    for country_name, country_code in get_compiled("country_name_to_iso").items():
         # For short codes (us, uk), use word boundary matching to avoid false positives
         if len(country_name) <= 2:
             # Use word boundary regex for short codes
@@ -862,6 +849,89 @@ def _deduplicate_locations(locations: List[Dict]) -> List[Dict]:
     return result
 
 
+# =============================================================================
+# Batch Extraction
+# =============================================================================
+
+def _has_global_remote(locations: List[Dict]) -> bool:
+    """True if any location is an unscoped (global) remote entry."""
+    return any(
+        loc.get("type") == "remote" and loc.get("scope") == "global"
+        for loc in locations
+    )
+
+
+def extract_locations_batch(
+    raw_locations: Sequence[Optional[str]],
+    descriptions: Optional[Sequence[Optional[str]]] = None,
+    infer_remote_scope: bool = True,
+    max_workers: Optional[int] = None
+) -> List[List[Dict]]:
+    """
+    Extract locations for many rows at once.
+
+    Equivalent to calling extract_locations(raw, description) per row, but each
+    unique raw location string is parsed once and each unique description is
+    scanned once. Descriptions are only scanned for rows whose location
+    resolved to global remote, since that is the only case where the
+    description can change the result.
+
+    Args:
+        raw_locations: Raw location strings, one per row
+        descriptions: Optional job descriptions aligned with raw_locations
+        infer_remote_scope: Whether to infer remote scope from co-located cities
+        max_workers: If > 1, scan descriptions in a process pool of this size
+
+    Returns:
+        List of location lists, aligned with raw_locations. Every row gets its
+        own copies of the location dicts, so callers can mutate them safely.
+    """
+    if descriptions is not None and len(descriptions) != len(raw_locations):
+        raise ValueError(
+            f"descriptions has {len(descriptions)} rows, expected {len(raw_locations)}"
+        )
+
+    # 1. Parse each unique location string once (without description context)
+    parsed: Dict[Optional[str], List[Dict]] = {}
+    for raw in raw_locations:
+        if raw not in parsed:
+            parsed[raw] = extract_locations(raw, infer_remote_scope=infer_remote_scope)
+
+    # 2. Scan each unique description that can still change a result
+    restrictions: Dict[str, Optional[str]] = {}
+    if descriptions is not None:
+        pending = []
+        for raw, description in zip(raw_locations, descriptions):
+            if description and description not in restrictions and _has_global_remote(parsed[raw]):
+                restrictions[description] = None
+                pending.append(description)
+
+        if max_workers and max_workers > 1 and len(pending) > 1:
+            chunksize = max(1, len(pending) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                country_codes = list(executor.map(
+                    extract_country_restriction_from_description, pending, chunksize=chunksize
+                ))
+        else:
+            country_codes = [extract_country_restriction_from_description(d) for d in pending]
+
+        restrictions.update(zip(pending, country_codes))
+
+    # 3. Fan results back out, applying description restrictions per row
+    results: List[List[Dict]] = []
+    for i, raw in enumerate(raw_locations):
+        country_code = restrictions.get(descriptions[i]) if descriptions is not None and descriptions[i] else None
+        row = []
+        for loc in parsed[raw]:
+            if country_code and loc.get("type") == "remote" and loc.get("scope") == "global":
+                row.append({"type": "remote", "scope": "country", "country_code": country_code})
+            else:
+                row.append(dict(loc))
+        results.append(row)
+
+    return results
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -0,0 +1,190 @@
+"""
+Quantile Sketch - Mergeable t-digest for salary percentiles.
+
+A merging t-digest (Dunning & Ertl) keeps a bounded list of weighted
+centroids, small near the tails and larger in the middle (k1 scale
+function), so p25/median/p75 stay accurate while the sketch stays a few
+hundred numbers regardless of how many salaries it summarises. Sketches
+merge: the sketch of a quarter is the merge of its monthly (or daily)
+sketches, without going back to the jobs.
+
+Quantiles follow ReportGenerator's sort-and-index convention: quantile(q)
+estimates sorted(values)[int(n * q)]. Centroids remember whether they hold a
+single distinct value; when the indexed rank falls in one (always the case
+for small samples, and for the round-number salaries that dominate
+disclosures) the result is exact.
+
+Usage:
+    from pipeline.quantile_sketch import TDigest
+
+    sketch = TDigest()
+    for midpoint in midpoints:
+        sketch.add(midpoint)
+    quarter = TDigest.merge_all([october, november, december])
+    p25, median, p75 = quarter.percentiles()
+
+    stored = sketch.to_dict()            # JSON-serialisable
+    sketch = TDigest.from_dict(stored)
+"""
+
+import math
+from typing import Iterable, List, Tuple
+
+# ============================================
+# Configuration
+# ============================================
+
+DEFAULT_COMPRESSION = 200
+
+# Buffered values before a compression pass (multiple of compression)
+BUFFER_FACTOR = 5
+
+# Percentiles reported by ReportGenerator
+PERCENTILES = (0.25, 0.50, 0.75)
+
+
+class TDigest:
+    """
+    Merging t-digest with the k1 (arcsine) scale function.
+
+    Centroids are (mean, weight, single) tuples sorted by mean; single is
+    True while every value merged into the centroid was the same.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self._centroids: List[Tuple[float, float, bool]] = []
+        self._buffer: List[Tuple[float, float, bool]] = []
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ----------------------------------------
+    # Building
+    # ----------------------------------------
+
+    def add(self, value: float, weight: float = 1):
+        """Add a value (weight = number of occurrences)."""
+        value = float(value)
+        self._buffer.append((value, weight, True))
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) > BUFFER_FACTOR * self.compression:
+            self._compress()
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """Fold another sketch into this one (returns self)."""
+        self._buffer.extend(other.centroids())
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable['TDigest'], compression: int = DEFAULT_COMPRESSION) -> 'TDigest':
+        """A new sketch merging every sketch in sketches."""
+        merged = cls(compression)
+        for sketch in sketches:
+            merged._buffer.extend(sketch.centroids())
+            merged.min = min(merged.min, sketch.min)
+            merged.max = max(merged.max, sketch.max)
+        merged._compress()
+        return merged
+
+    def _k(self, q: float) -> float:
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _q(self, k: float) -> float:
+        return (math.sin(min(max(k * 2 * math.pi / self.compression, -math.pi / 2), math.pi / 2)) + 1) / 2
+
+    def _compress(self):
+        """Merge buffered values into centroids within the scale-function limits."""
+        if not self._buffer:
+            return
+        items = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        total = sum(weight for _, weight, _ in items)
+
+        centroids = []
+        mean, weight, single = items[0]
+        seen = 0.0
+        limit = total * self._q(self._k(0.0) + 1)
+        for value, value_weight, value_single in items[1:]:
+            if value == mean and single and value_single:
+                # Equal values merge losslessly, whatever the size limit
+                weight += value_weight
+            elif seen + weight + value_weight <= limit:
+                weight += value_weight
+                mean += (value - mean) * value_weight / weight
+                single = False
+            else:
+                centroids.append((mean, weight, single))
+                seen += weight
+                limit = total * self._q(self._k(seen / total) + 1)
+                mean, weight, single = value, value_weight, value_single
+        centroids.append((mean, weight, single))
+        self._centroids = centroids
+
+    # ----------------------------------------
+    # Queries
+    # ----------------------------------------
+
+    def centroids(self) -> List[Tuple[float, float, bool]]:
+        self._compress()
+        return list(self._centroids)
+
+    @property
+    def count(self) -> int:
+        return int(round(sum(weight for _, weight, _ in self.centroids())))
+
+    def quantile(self, q: float) -> float:
+        """Estimate of sorted(values)[int(n * q)]."""
+        centroids = self.centroids()
+        if not centroids:
+            return math.nan
+        n = sum(weight for _, weight, _ in centroids)
+        target = min(int(n * q), n - 1) + 0.5   # middle of the indexed value
+
+        seen = 0.0
+        for i, (mean, weight, single) in enumerate(centroids):
+            if target < seen + weight:
+                if single:
+                    return mean
+                center = seen + weight / 2
+                if target < center:
+                    prev_mean, prev_center = (
+                        (centroids[i - 1][0], seen - centroids[i - 1][1] / 2) if i > 0 else (self.min, 0.0)
+                    )
+                    return prev_mean + (mean - prev_mean) * (target - prev_center) / (center - prev_center)
+                next_mean, next_center = (
+                    (centroids[i + 1][0], seen + weight + centroids[i + 1][1] / 2)
+                    if i + 1 < len(centroids) else (self.max, n)
+                )
+                return mean + (next_mean - mean) * (target - center) / (next_center - center)
+            seen += weight
+        return self.max
+
+    def percentiles(self) -> List[float]:
+        """p25/median/p75 (ReportGenerator's compensation percentiles)."""
+        return [self.quantile(q) for q in PERCENTILES]
+
+    # ----------------------------------------
+    # Storage
+    # ----------------------------------------
+
+    def to_dict(self) -> dict:
+        """JSON-serialisable form (stored in report_daily_salary_sketches.sketch)."""
+        return {
+            'compression': self.compression,
+            'min': self.min if self._centroids or self._buffer else None,
+            'max': self.max if self._centroids or self._buffer else None,
+            'centroids': [[mean, weight, int(single)] for mean, weight, single in self.centroids()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TDigest':
+        sketch = cls(data.get('compression', DEFAULT_COMPRESSION))
+        sketch._centroids = [(float(c[0]), float(c[1]), bool(c[2])) for c in data.get('centroids', [])]
+        if sketch._centroids:
+            sketch.min = float(data['min']) if data.get('min') is not None else sketch._centroids[0][0]
+            sketch.max = float(data['max']) if data.get('max') is not None else sketch._centroids[-1][0]
+        return sketch
@@ -0,0 +1,321 @@
+"""
+Report Batch - Generate the monthly report set from a single fetch.
+
+generate_report_data() pages enriched_jobs once per report, so the monthly
+set (5 cities x 3 families x current and comparison period) fetches the
+table 30 times and every new ReportGenerator reloads employer_metadata.
+
+This module fetches the union window (every requested family, city and
+period) once, loads it into a columnar JobFrame, and computes each
+city/family/period report from an in-memory slice with the columnar engine
+(optionally on a thread pool). employer_metadata is loaded once and shared
+by every report. Each slice holds exactly the rows generate_report_data()
+would fetch, so the output is the same.
+
+Usage:
+    from pipeline.report_batch import ReportBatch
+
+    batch = ReportBatch(workers=4)
+    reports = batch.generate_portfolio_reports(
+        start_date='2025-12-01', end_date='2025-12-31',
+        compare_start='2025-11-01', compare_end='2025-11-30',
+    )
+    batch.write_portfolio_reports(reports, 'output/reports', start_date='2025-12-01')
+
+CLI Usage:
+    python pipeline/report_batch.py --start 2025-12-01 --end 2025-12-31 --output-dir output/reports
+    python pipeline/report_batch.py --start 2025-12-01 --end 2025-12-31 --compare-start 2025-11-01 --compare-end 2025-11-30 --output-dir output/reports
+    python pipeline/report_batch.py --start 2025-12-01 --end 2025-12-31 --cities lon nyc --families data --workers 4 --output-dir output/reports
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+import os
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pipeline.report_generator import ReportGenerator, is_missing_column_error
+from pipeline.report_frame import ColumnarReportEngine, JobFrame
+
+# ============================================
+# Configuration
+# ============================================
+
+# Columns needed to slice the window into reports (on top of the projection)
+SLICE_COLUMNS = ['job_family', 'posted_date']
+
+# City slugs used in portfolio-site report file names
+# ({city}-{family}-{month}-{year}.json, see docs/templates/hiring_report_template.md)
+REPORT_FILE_CITIES = {
+    'lon': 'london',
+    'nyc': 'nyc',
+    'den': 'denver',
+    'sfo': 'sf',
+    'sgp': 'singapore',
+}
+
+
+# ============================================
+# Report Window
+# ============================================
+
+class ReportWindow:
+    """
+    The union fetch window in columnar form, with the keys to slice it.
+
+    Attributes:
+        frame: JobFrame of every fetched job (fetch order)
+        job_families: job_family per row
+        posted_dates: posted_date (YYYY-MM-DD) per row
+        city_masks: {city_code: bool array of rows accessible from that city}
+    """
+
+    def __init__(self, rows: list, city_masks: dict):
+        self.frame = JobFrame.from_jobs(rows)
+        self.job_families = np.array([r.get('job_family') for r in rows], dtype=object)
+        self.posted_dates = np.array([str(r.get('posted_date') or '')[:10] for r in rows], dtype=str)
+        self.city_masks = city_masks
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def mask(self, city_code: str, job_family: str, start_date: str, end_date: str) -> np.ndarray:
+        """Rows generate_report_data() would fetch for this segment."""
+        return (
+            self.city_masks[city_code]
+            & (self.job_families == job_family)
+            & (self.posted_dates >= start_date)
+            & (self.posted_dates <= end_date)
+        )
+
+    def slice(self, city_code: str, job_family: str, start_date: str, end_date: str) -> JobFrame:
+        """JobFrame for one report segment."""
+        return self.frame.subset(self.mask(city_code, job_family, start_date, end_date))
+
+
+# ============================================
+# Batch Generator
+# ============================================
+
+class ReportBatch:
+    """
+    Generate many reports from one enriched_jobs fetch.
+
+    Wraps a ReportGenerator for configuration, labels, employer_metadata and
+    report assembly; metrics always come from the columnar engine.
+    """
+
+    def __init__(self, generator: ReportGenerator = None, workers: int = 1):
+        """
+        Args:
+            generator: ReportGenerator to share (default: a new columnar one)
+            workers: Reports computed in parallel (threads)
+        """
+        self.generator = generator or ReportGenerator(engine='columnar')
+        self.engine = ColumnarReportEngine(self.generator)
+        self.workers = max(workers, 1)
+
+    def load_window(self, cities: list, families: list, start_date: str, end_date: str) -> ReportWindow:
+        """
+        Fetch every job any of the reports needs, in one paginated query.
+
+        Selects the union of the cities' report projections plus the slice
+        keys. Accessibility comes from accessible_city_codes (migration 033);
+        without it, falls back to the broad locations filter and
+        _is_job_accessible(), as _fetch_all_jobs() does.
+        """
+        g = self.generator
+        sections = []
+        for city_code in cities:
+            sections += [s for s in g._report_sections(city_code) if s not in sections]
+        columns = ','.join([g._build_projection(sections)] + SLICE_COLUMNS)
+
+        if g._server_accessibility is not False:
+            try:
+                rows = g._fetch_pages(
+                    columns + ',accessible_city_codes', list(families), start_date, end_date,
+                    lambda query: query.overlaps('accessible_city_codes', list(cities))
+                )
+                city_masks = {
+                    code: np.array([code in (r.get('accessible_city_codes') or []) for r in rows], dtype=bool)
+                    for code in cities
+                }
+                return ReportWindow(rows, city_masks)
+            except Exception as e:
+                if not is_missing_column_error(e, 'accessible_city_codes'):
+                    raise
+                print(f"[DB] accessible_city_codes unavailable ({str(e)[:80]}); filtering client-side")
+                g._server_accessibility = False
+
+        # Union of each city's broad filter (refined client-side)
+        parts = []
+        for city_code in cities:
+            city = g.CITY_CODE_MAP.get(city_code, city_code)
+            parts += [p for p in g._location_filter_parts(city) if p not in parts]
+        location_filter = ','.join(parts)
+
+        rows = g._fetch_pages(
+            columns + ',locations', list(families), start_date, end_date,
+            lambda query: query.or_(location_filter)
+        )
+        city_masks = {
+            code: np.array([g._is_job_accessible(r, g.CITY_CODE_MAP.get(code, code)) for r in rows], dtype=bool)
+            for code in cities
+        }
+        return ReportWindow(rows, city_masks)
+
+    def report_data(self, window: ReportWindow, city_code: str, job_family: str,
+                    start_date: str, end_date: str) -> dict:
+        """generate_report_data() for one segment, from the loaded window."""
+        frame = window.slice(city_code, job_family, start_date, end_date)
+        metrics = self.engine.calculate_frame(frame, city_code, job_family)
+        return self.generator.build_report_data(metrics, city_code, job_family, start_date, end_date)
+
+    def generate_report_data(self, segments: list) -> dict:
+        """
+        Report data for many segments from one fetch.
+
+        Args:
+            segments: (city_code, job_family, start_date, end_date) tuples
+
+        Returns:
+            Dict keyed by segment tuple, values as generate_report_data().
+        """
+        segments = [tuple(s) for s in segments]
+        if not segments:
+            return {}
+
+        cities = list(dict.fromkeys(s[0] for s in segments))
+        families = list(dict.fromkeys(s[1] for s in segments))
+        window_start = min(s[2] for s in segments)
+        window_end = max(s[3] for s in segments)
+
+        started = time.perf_counter()
+        window = self.load_window(cities, families, window_start, window_end)
+        print(f"[BATCH] Loaded {len(window):,} jobs ({window_start} to {window_end}) "
+              f"in {time.perf_counter() - started:.1f}s")
+
+        # Load once up front; worker threads then only read the cache
+        self.generator._fetch_employer_metadata()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda s: self.report_data(window, *s), segments))
+        print(f"[BATCH] Computed {len(segments)} reports in {time.perf_counter() - started:.1f}s "
+              f"({self.workers} worker{'s' if self.workers != 1 else ''})")
+
+        return dict(zip(segments, results))
+
+    def generate_portfolio_reports(self, start_date: str, end_date: str,
+                                   compare_start: str = None, compare_end: str = None,
+                                   cities: list = None, families: list = None) -> dict:
+        """
+        Portfolio reports for every city/family combination.
+
+        Args:
+            start_date, end_date: Report period (YYYY-MM-DD)
+            compare_start, compare_end: Optional comparison period
+            cities: City codes (default: all in ReportGenerator.CITY_CODE_MAP)
+            families: Job families (default: all in ReportGenerator.JOB_FAMILY_LABELS)
+
+        Returns:
+            Dict keyed by (city_code, job_family), values as generate_portfolio_report().
+        """
+        cities = list(cities or self.generator.CITY_CODE_MAP)
+        families = list(families or self.generator.JOB_FAMILY_LABELS)
+        compare = bool(compare_start and compare_end)
+
+        segments = []
+        for city_code in cities:
+            for job_family in families:
+                segments.append((city_code, job_family, start_date, end_date))
+                if compare:
+                    segments.append((city_code, job_family, compare_start, compare_end))
+        data = self.generate_report_data(segments)
+
+        reports = {}
+        for city_code in cities:
+            for job_family in families:
+                raw = data[(city_code, job_family, start_date, end_date)]
+                compare_raw = data[(city_code, job_family, compare_start, compare_end)] if compare else None
+                reports[(city_code, job_family)] = self.generator.build_portfolio_report(raw, compare_raw)
+        return reports
+
+    def write_portfolio_reports(self, reports: dict, output_dir: str, start_date: str) -> list:
+        """
+        Save portfolio reports as {city}-{family}-{month}-{year}.json.
+
+        Args:
+            reports: Output of generate_portfolio_reports()
+            output_dir: Directory to write into (created if missing)
+            start_date: Report period start (YYYY-MM-DD), names the month
+
+        Returns:
+            List of written file paths.
+        """
+        period = datetime.strptime(start_date, '%Y-%m-%d')
+        os.makedirs(output_dir, exist_ok=True)
+
+        paths = []
+        for (city_code, job_family), report in reports.items():
+            filename = (f"{REPORT_FILE_CITIES.get(city_code, city_code)}-{job_family}-"
+                        f"{period.strftime('%B').lower()}-{period.year}.json")
+            path = os.path.join(output_dir, filename)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(report, indent=2))
+            paths.append(path)
+            print(f"[OK] {filename}: {report['meta']['totalJobs']} jobs")
+        return paths
+
+
+def main():
+    """CLI entry point for batch report generation."""
+    parser = argparse.ArgumentParser(
+        description='Generate portfolio reports for many cities/families from one fetch',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python pipeline/report_batch.py --start 2025-12-01 --end 2025-12-31 --output-dir output/reports
+    python pipeline/report_batch.py --start 2025-12-01 --end 2025-12-31 --compare-start 2025-11-01 --compare-end 2025-11-30 --output-dir output/reports
+    python pipeline/report_batch.py --start 2025-12-01 --end 2025-12-31 --cities lon nyc --families data --workers 4 --output-dir output/reports
+        """
+    )
+    parser.add_argument('--start', required=True, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', required=True, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--compare-start', type=str, default=None,
+                        help='Comparison period start date (YYYY-MM-DD) for MoM analysis')
+    parser.add_argument('--compare-end', type=str, default=None,
+                        help='Comparison period end date (YYYY-MM-DD) for MoM analysis')
+    parser.add_argument('--cities', nargs='+', choices=list(ReportGenerator.CITY_CODE_MAP), default=None,
+                        help='City codes (default: all)')
+    parser.add_argument('--families', nargs='+', choices=list(ReportGenerator.JOB_FAMILY_LABELS), default=None,
+                        help='Job families (default: all)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Reports computed in parallel (default: 1)')
+    parser.add_argument('--output-dir', required=True,
+                        help='Directory for the portfolio JSON files')
+
+    args = parser.parse_args()
+
+    batch = ReportBatch(workers=args.workers)
+    reports = batch.generate_portfolio_reports(
+        start_date=args.start,
+        end_date=args.end,
+        compare_start=args.compare_start,
+        compare_end=args.compare_end,
+        cities=args.cities,
+        families=args.families,
+    )
+    paths = batch.write_portfolio_reports(reports, args.output_dir, args.start)
+    print(f"\n[OK] {len(paths)} portfolio reports saved to: {args.output_dir}")
+    print(f"     [NOTE] Narrative fields contain [PLACEHOLDER] markers.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+"""
+Report Cache - Reuse generate_report_data() results until the data changes.
+
+Each report (city, family, start, end, engine, quantiles, rollup skill pairs)
+is stored as a JSON file together with two fingerprints:
+
+- code version: a hash of the code that computes report data (the metric
+  engines and ReportGenerator minus its portfolio formatting methods, as
+  parsed ASTs so comment-only edits don't count). Formatting/template
+  changes keep the cache, so portfolio regeneration is near-free.
+- data watermark: ReportGenerator.fetch_window_watermark(), i.e. the count
+  and max(updated_at) of the window's enriched_jobs (plus employer_metadata,
+  and the last finished rollup run for the rollups engine). Two head-only queries
+  instead of the paginated fetch.
+
+A cached report is returned only when both still match; otherwise the
+report is recomputed and the entry replaced. Cached reports keep the
+meta.generated_at of the run that computed them.
+
+Usage:
+    from pipeline.report_cache import ReportCache
+    from pipeline.report_generator import ReportGenerator
+
+    generator = ReportGenerator(cache=ReportCache())
+    data = generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')   # cached
+
+CLI Usage:
+    python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31
+    python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --no-cache
+"""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# ============================================
+# Configuration
+# ============================================
+
+# Cache directory (gitignored); override with REPORT_CACHE_DIR
+REPORT_CACHE_DIR = Path(os.getenv('REPORT_CACHE_DIR', REPO_ROOT / '.cache' / 'reports'))
+
+# Bump when the cache file layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Modules whose code determines generate_report_data() output
+REPORT_DATA_MODULES = (
+    'pipeline.report_generator',
+    'pipeline.report_frame',
+    'pipeline.report_rollups',
+    'pipeline.skill_cooccurrence',
+    'pipeline.quantile_sketch',
+)
+
+# Presentation-only functions (portfolio formatting, CLI), excluded from the
+# code version so formatting changes keep cached report data
+PRESENTATION_FUNCTIONS = {
+    'pipeline.report_generator': {
+        '_format_period_label', '_get_concentration_benchmark', '_get_ratio_benchmark',
+        '_get_entry_benchmark', '_get_management_benchmark', '_get_remote_benchmark',
+        '_calculate_comparison', '_calculate_employer_comparison',
+        'generate_portfolio_report', 'build_portfolio_report', 'main',
+    },
+    'pipeline.report_rollups': {'verify_salary_sketches', 'main'},
+}
+
+
+# ============================================
+# Code version
+# ============================================
+
+def _fingerprint(source: str, excluded: set = frozenset()) -> str:
+    """Hash of a module's AST without the excluded (module or class level) functions."""
+    tree = ast.parse(source)
+
+    def keep(node):
+        return not (isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in excluded)
+
+    tree.body = [node for node in tree.body if keep(node)]
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            node.body = [child for child in node.body if keep(child)]
+    return hashlib.sha256(ast.dump(tree).encode('utf-8')).hexdigest()
+
+
+def code_version() -> str:
+    """Combined fingerprint of REPORT_DATA_MODULES (reads files without importing them)."""
+    digest = hashlib.sha256()
+    for module_name in REPORT_DATA_MODULES:
+        source = Path(importlib.util.find_spec(module_name).origin).read_text(encoding='utf-8')
+        digest.update(_fingerprint(source, PRESENTATION_FUNCTIONS.get(module_name, set())).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+# ============================================
+# Cache
+# ============================================
+
+class ReportCache:
+    """
+    File cache of generate_report_data() results.
+
+    One file per report segment and code version; storing a new version
+    removes the segment's older files.
+    """
+
+    def __init__(self, directory: Path = None):
+        self.directory = Path(directory or REPORT_CACHE_DIR)
+        self._code_version = None
+
+    @property
+    def code_version(self) -> str:
+        if self._code_version is None:
+            self._code_version = code_version()
+        return self._code_version
+
+    def key(self, generator, city_code: str, job_family: str, start_date: str, end_date: str) -> dict:
+        """Everything a cached report depends on besides the data."""
+        return {
+            'format_version': CACHE_FORMAT_VERSION,
+            'city_code': city_code,
+            'job_family': job_family,
+            'start_date': start_date,
+            'end_date': end_date,
+            'engine': generator.engine,
+            'quantiles': generator.quantiles,
+            'rollup_skill_pairs': generator.rollup_skill_pairs,
+            'code_version': self.code_version,
+        }
+
+    def _segment_prefix(self, key: dict) -> str:
+        return f"{key['city_code']}-{key['job_family']}-{key['start_date']}-{key['end_date']}-"
+
+    def path(self, key: dict) -> Path:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        return self.directory / f"{self._segment_prefix(key)}{digest}.json"
+
+    def load(self, key: dict, watermark: dict) -> Optional[dict]:
+        """Cached report data, or None if missing, stale or unreadable."""
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('key') != key or entry.get('watermark') != watermark:
+            return None
+        return entry['data']
+
+    def store(self, key: dict, watermark: dict, data: dict) -> Path:
+        """Write an entry (atomically) and remove the segment's other entries."""
+        path = self.path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'watermark': watermark, 'data': data}, f, default=str)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        for old in self.directory.glob(f"{self._segment_prefix(key)}*.json"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        return path
+
+    def get_or_compute(self, generator, city_code: str, job_family: str, start_date: str, end_date: str,
+                       compute: Callable[[], dict]) -> dict:
+        """
+        Return the cached report if code and data are unchanged, else compute and store it.
+
+        Args:
+            generator: ReportGenerator (engine, quantiles, fetch_window_watermark)
+            compute: Computes the report data on a miss
+        """
+        try:
+            watermark = generator.fetch_window_watermark(city_code, job_family, start_date, end_date)
+        except Exception as e:
+            print(f"[CACHE] Watermark query failed ({str(e)[:80]}); computing without cache")
+            return compute()
+
+        key = self.key(generator, city_code, job_family, start_date, end_date)
+        cached = self.load(key, watermark)
+        if cached is not None:
+            print(f"[CACHE] Hit {city_code}/{job_family} {start_date} to {end_date} "
+                  f"({watermark.get('jobs')} jobs unchanged)")
+            return cached
+
+        data = compute()
+        self.store(key, watermark, data)
+        print(f"[CACHE] Stored {city_code}/{job_family} {start_date} to {end_date}")
+        return data
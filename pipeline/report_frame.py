@@ -0,0 +1,486 @@
+"""
+Columnar Report Engine - pandas/NumPy backend for ReportGenerator.
+
+Loads a period's jobs into one DataFrame (categorical dtypes for every
+dimension) and computes the report metrics with vectorised counting
+(factorize/bincount/groupby), selection-based percentiles (np.partition) and
+sparse skill co-occurrence (pipeline/skill_cooccurrence.py) instead of
+per-row Python dict loops.
+
+Results are identical to ReportGenerator's row-based calculations, down to
+tie order: the row engine ranks dicts built in first-seen order with a
+stable sorted(), so every ranking here orders groups by first occurrence and
+then applies a stable descending sort on the counts.
+
+Usage:
+    from pipeline.report_frame import ColumnarReportEngine
+
+    engine = ColumnarReportEngine(generator)   # a ReportGenerator
+    metrics = engine.calculate(all_jobs, city_code='nyc', job_family='data')
+    print(metrics['employer_metrics']['top_employers'])
+
+    # Or from a slice of a preloaded frame (see pipeline/report_batch.py)
+    metrics = engine.calculate_frame(frame.subset(mask), city_code='nyc', job_family='data')
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pipeline.skill_cooccurrence import SkillIncidence
+
+# ============================================
+# Configuration
+# ============================================
+
+# Values treated as unclassified by _calculate_distribution
+UNKNOWN_VALUES = ('unknown', 'null')
+
+# Dimension columns stored as categoricals (categories in first-seen order)
+CATEGORICAL_FIELDS = [
+    'data_source', 'seniority', 'job_subfamily', 'track', 'working_arrangement',
+]
+
+# Percentiles taken by sort-and-index: sorted_values[int(n * q)]
+PERCENTILES = (0.25, 0.50, 0.75)
+
+
+# ============================================
+# Helpers
+# ============================================
+
+def _categorical(values: list) -> pd.Categorical:
+    """Build a categorical whose categories are in first-seen order (None -> NaN)."""
+    codes, uniques = pd.factorize(np.array(values, dtype=object))
+    return pd.Categorical.from_codes(codes, categories=pd.Index(uniques, dtype=object))
+
+
+def _category(categories: pd.Index, code: int):
+    """Category value for a categorical code (-1, i.e. None, maps back to None)."""
+    return None if code < 0 else categories[code]
+
+
+def _first_seen_counts(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct codes and their counts, ordered by first occurrence in codes."""
+    uniques, first, counts = np.unique(codes, return_index=True, return_counts=True)
+    order = np.argsort(first, kind='stable')
+    return uniques[order], counts[order]
+
+
+def _rank_desc(counts) -> np.ndarray:
+    """Indices sorting counts descending, ties kept in their current order."""
+    return np.argsort(-np.asarray(counts), kind='stable')
+
+
+def _sort_index_percentiles(values: np.ndarray) -> List[float]:
+    """p25/median/p75 as sorted(values)[int(n * q)], via partial selection."""
+    n = len(values)
+    kth = [int(n * q) for q in PERCENTILES]
+    selected = np.partition(values, kth)
+    return [float(selected[k]) for k in kth]
+
+
+# ============================================
+# Job Frame
+# ============================================
+
+class JobFrame:
+    """
+    One report period's jobs in columnar form.
+
+    Attributes:
+        jobs: DataFrame, one row per job (row position = index in the source list)
+        skills: DataFrame, one row per (job, skill) with the job's row position
+    """
+
+    def __init__(self, jobs: pd.DataFrame, skills: pd.DataFrame):
+        self.jobs = jobs
+        self.skills = skills
+
+    @classmethod
+    def from_jobs(cls, rows: list) -> 'JobFrame':
+        """Load enriched_jobs rows (dicts from Supabase) into columns."""
+        columns = {field: _categorical([r.get(field) for r in rows]) for field in CATEGORICAL_FIELDS}
+        # employer_name is NOT NULL; keep the row engine's 'unknown' default for missing keys
+        columns['employer_name'] = _categorical([r.get('employer_name', 'unknown') for r in rows])
+        columns['is_agency'] = np.array([r.get('is_agency') == True for r in rows], dtype=bool)  # noqa: E712
+        columns['is_direct'] = np.array([not r.get('is_agency') for r in rows], dtype=bool)
+        columns['salary_min'] = np.array([r.get('salary_min') for r in rows], dtype=np.float64)  # None -> NaN
+        columns['salary_max'] = np.array([r.get('salary_max') for r in rows], dtype=np.float64)
+
+        has_skills = []
+        skill_rows, skill_names, pair_names = [], [], []
+        for position, row in enumerate(rows):
+            skills = row.get('skills')
+            has = bool(skills) and len(row.get('skills', [])) > 0
+            has_skills.append(has)
+            if not has:
+                continue
+            for skill in row.get('skills', []):
+                skill_rows.append(position)
+                if isinstance(skill, dict):
+                    skill_names.append(skill.get('name', 'unknown'))
+                    pair_names.append(skill.get('name', ''))
+                else:
+                    skill_names.append(str(skill))
+                    pair_names.append(str(skill))
+        columns['has_skills'] = np.array(has_skills, dtype=bool)
+
+        jobs = pd.DataFrame(columns, index=pd.RangeIndex(len(rows)))
+        skills = pd.DataFrame({
+            'row': np.array(skill_rows, dtype=np.int64),
+            'name': _categorical(skill_names),
+            'pair_name': np.array(pair_names, dtype=object),
+        })
+        return cls(jobs, skills)
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def subset(self, mask) -> 'JobFrame':
+        """Jobs where mask is True (with their skills), in original order."""
+        jobs = self.jobs[np.asarray(mask, dtype=bool)]
+        skills = self.skills[self.skills['row'].isin(jobs.index)]
+        return JobFrame(jobs, skills)
+
+
+# ============================================
+# Engine
+# ============================================
+
+class ColumnarReportEngine:
+    """
+    Computes ReportGenerator's metric sections from a JobFrame.
+
+    Labels, the employer merge map and employer_metadata come from the
+    ReportGenerator passed in, so both engines share one configuration.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def calculate(self, all_jobs: list, city_code: str, job_family: str) -> dict:
+        """
+        Compute every metric section for one report.
+
+        Args:
+            all_jobs: Accessible jobs for the period (from _fetch_all_jobs)
+            city_code: Location code (lon, nyc, den, sfo, sgp)
+            job_family: Job family (data, product, delivery)
+
+        Returns:
+            Dict of metric sections (see ReportGenerator._calculate_metrics)
+        """
+        return self.calculate_frame(JobFrame.from_jobs(all_jobs), city_code, job_family)
+
+    def calculate_frame(self, frame: JobFrame, city_code: str, job_family: str) -> dict:
+        """
+        Compute every metric section from an already-loaded JobFrame.
+
+        The frame may be a subset of a larger one (report_batch slices one
+        multi-report window); results depend only on the rows and their order.
+        """
+        g = self.generator
+        direct = frame.subset(frame.jobs['is_direct'].to_numpy())
+        ats = direct.subset(direct.jobs['data_source'].isin(g.ATS_SOURCES).to_numpy())
+
+        subfamily_labels = g.SUBFAMILY_LABELS_BY_FAMILY.get(job_family, g.DATA_SUBFAMILY_LABELS)
+        arrangement_dist = self.distribution(ats, 'working_arrangement', g.ARRANGEMENT_LABELS)
+        arrangement_dist['ats_job_count'] = len(ats)
+        arrangement_dist['total_job_count'] = len(direct)
+
+        return {
+            'total_count': len(frame),
+            'direct_count': len(direct),
+            'agency_count': int(frame.jobs['is_agency'].sum()),
+            'employer_metrics': self.employer_metrics(direct),
+            'seniority_metrics': self.seniority_metrics(direct),
+            'subfamily_dist': self.distribution(direct, 'job_subfamily', subfamily_labels),
+            'track_dist': self.distribution(direct, 'track', g.TRACK_LABELS),
+            'arrangement_dist': arrangement_dist,
+            'skills_metrics': self.skills_metrics(direct),
+            'metadata_metrics': self.metadata_metrics(direct),
+            'compensation_metrics': self.compensation_metrics(direct, city_code),
+        }
+
+    def distribution(self, frame: JobFrame, field: str, labels: dict = None) -> dict:
+        """Columnar _calculate_distribution (same output)."""
+        column = frame.jobs[field].cat
+        codes = column.codes.to_numpy()
+        categories = column.categories
+
+        uniques, counts = _first_seen_counts(codes[codes >= 0])
+        values = [categories[code] for code in uniques.tolist()]
+        keep = [i for i, value in enumerate(values) if value not in UNKNOWN_VALUES]
+        values = [values[i] for i in keep]
+        counts = counts[keep]
+
+        total = len(frame)
+        known = int(counts.sum())
+        unknown_count = total - known
+        coverage = known / total if total > 0 else 0
+
+        distribution = []
+        for i in _rank_desc(counts).tolist():
+            value, count = values[i], int(counts[i])
+            pct = count / known if known > 0 else 0
+            distribution.append({
+                'code': value,
+                'label': labels.get(value, value) if labels else value,
+                'count': count,
+                'percentage': round(pct * 100),
+            })
+
+        return {
+            'distribution': distribution,
+            'total': total,
+            'known': known,
+            'unknown': unknown_count,
+            'coverage': round(coverage * 100),
+        }
+
+    def _employer_counts(self, frame: JobFrame) -> Tuple[list, np.ndarray]:
+        """Raw employer names and job counts, in first-seen order."""
+        column = frame.jobs['employer_name'].cat
+        codes = column.codes.to_numpy()
+        uniques, counts = _first_seen_counts(codes)
+        names = [_category(column.categories, code) for code in uniques.tolist()]
+        return names, counts
+
+    def employer_metrics(self, frame: JobFrame) -> dict:
+        """Columnar _calculate_employer_metrics (same output)."""
+        g = self.generator
+        names, counts = self._employer_counts(frame)
+
+        # Merge known duplicates (targets keep the first-seen order of their variants)
+        merged = pd.Series(counts, dtype=np.int64).groupby(
+            pd.Index([g.EMPLOYER_MERGE_MAP.get(name, name) for name in names], dtype=object),
+            sort=False, dropna=False,
+        ).sum()
+        merged_names = merged.index.tolist()
+        merged_counts = merged.to_numpy()
+
+        unique_employers = len(merged_names)
+        total_jobs = len(frame)
+        jobs_per_employer = total_jobs / unique_employers if unique_employers > 0 else 0
+
+        ranked = _rank_desc(merged_counts)
+        counts_sorted = merged_counts[ranked]
+
+        top_employers = []
+        for i in ranked[:15].tolist():
+            count = int(merged_counts[i])
+            pct = count / total_jobs if total_jobs > 0 else 0
+            top_employers.append({
+                'name': g._get_display_name(merged_names[i]),
+                'count': count,
+                'percentage': round(pct * 100),
+            })
+
+        top_5 = int(counts_sorted[:5].sum())
+        top_15 = int(counts_sorted[:15].sum())
+        top_5_concentration = top_5 / total_jobs if total_jobs > 0 else 0
+        top_15_concentration = top_15 / total_jobs if total_jobs > 0 else 0
+
+        return {
+            'unique_employers': unique_employers,
+            'jobs_per_employer': round(jobs_per_employer, 2),
+            'top_5_concentration': round(top_5_concentration * 100),
+            'top_15_concentration': round(top_15_concentration * 100),
+            'top_employers': top_employers,
+        }
+
+    def seniority_metrics(self, frame: JobFrame) -> dict:
+        """Columnar _calculate_seniority_metrics (same output)."""
+        dist = self.distribution(frame, 'seniority', self.generator.SENIORITY_LABELS)
+        counts = {item['code']: item['count'] for item in dist['distribution']}
+
+        senior_plus = counts.get('senior', 0) + counts.get('staff_principal', 0) + counts.get('director_plus', 0)
+        junior = counts.get('junior', 0)
+        senior_to_junior = senior_plus / junior if junior > 0 else float('inf')
+
+        entry_level = counts.get('junior', 0) + counts.get('mid', 0)
+        entry_accessibility = entry_level / dist['known'] if dist['known'] > 0 else 0
+
+        return {
+            **dist,
+            'senior_to_junior_ratio': round(senior_to_junior) if senior_to_junior != float('inf') else None,
+            'entry_accessibility_rate': round(entry_accessibility * 100),
+        }
+
+    def skills_metrics(self, frame: JobFrame) -> dict:
+        """Columnar _calculate_skills_metrics (same output)."""
+        with_skills = int(frame.jobs['has_skills'].sum())
+        if not with_skills:
+            return {
+                'total_with_skills': 0,
+                'coverage': 0,
+                'top_skills': [],
+                'skill_pairs': [],
+            }
+
+        column = frame.skills['name'].cat
+        uniques, counts = _first_seen_counts(column.codes.to_numpy())
+        top_skills = []
+        for i in _rank_desc(counts)[:15].tolist():
+            count = int(counts[i])
+            top_skills.append({
+                'name': _category(column.categories, int(uniques[i])),
+                'count': count,
+                'percentage': round(count / with_skills * 100),
+            })
+
+        incidence = SkillIncidence(frame.skills['row'].to_numpy(), frame.skills['pair_name'].to_numpy())
+        skill_pairs = []
+        for s1, s2, count in incidence.top_pairs(10):
+            skill_pairs.append({
+                'skill_1': s1,
+                'skill_2': s2,
+                'count': count,
+                'percentage': round(count / with_skills * 100),
+            })
+
+        coverage = with_skills / len(frame) if len(frame) else 0
+
+        return {
+            'total_with_skills': with_skills,
+            'coverage': round(coverage * 100),
+            'top_skills': top_skills,
+            'skill_pairs': skill_pairs,
+        }
+
+    def metadata_metrics(self, frame: JobFrame) -> dict:
+        """Columnar _calculate_metadata_enriched_metrics (same output).
+
+        employer_metadata is looked up once per distinct employer; job counts
+        are then summed per industry/size/maturity/ownership.
+        """
+        from pipeline.report_generator import normalize_employer_name, calculate_maturity_category
+
+        g = self.generator
+        meta_lookup = g._fetch_employer_metadata()
+        names, counts = self._employer_counts(frame)
+
+        metas = [meta_lookup.get(normalize_employer_name(name or '')) for name in names]
+        employers = pd.DataFrame({
+            'count': counts.astype(np.int64),
+            'matched': [bool(meta) for meta in metas],
+            'industry': [(meta or {}).get('industry') or None for meta in metas],
+            'employer_size': [(meta or {}).get('employer_size') or None for meta in metas],
+            'maturity': [
+                calculate_maturity_category(meta['founding_year']) if meta and meta.get('founding_year') else None
+                for meta in metas
+            ],
+            'ownership': [(meta or {}).get('ownership_type') or None for meta in metas],
+        })
+        employers = employers.loc[employers['matched'].to_numpy(dtype=bool)]
+        matched_count = int(employers['count'].sum())
+        total = len(frame)
+
+        def build_distribution(field, labels=None):
+            counts = employers.groupby(field, sort=False)['count'].sum()
+            if counts.empty:
+                return {'distribution': [], 'total': 0, 'coverage': 0}
+
+            codes = counts.index.tolist()
+            values = counts.to_numpy()
+            total_known = int(values.sum())
+
+            dist = []
+            for i in _rank_desc(values).tolist():
+                code, count = codes[i], int(values[i])
+                pct = count / total_known if total_known > 0 else 0
+                dist.append({
+                    'code': code,
+                    'label': labels.get(code, code) if labels else code,
+                    'count': count,
+                    'percentage': round(pct * 100),
+                })
+
+            return {
+                'distribution': dist,
+                'total': total_known,
+                'coverage': round(total_known / total * 100) if total > 0 else 0,
+            }
+
+        return {
+            'matched_jobs': matched_count,
+            'match_rate': round(matched_count / total * 100) if total > 0 else 0,
+            'industry': build_distribution('industry', g.INDUSTRY_LABELS),
+            'employer_size': build_distribution('employer_size', g.SIZE_LABELS),
+            'maturity': build_distribution('maturity', {
+                'young': 'Young (<=5 yrs)',
+                'growth': 'Growth (6-15 yrs)',
+                'mature': 'Mature (>15 yrs)',
+            }),
+            'ownership': build_distribution('ownership', {
+                'private': 'Private',
+                'public': 'Public',
+                'subsidiary': 'Subsidiary',
+                'acquired': 'Acquired',
+            }),
+        }
+
+    def _percentiles_by(self, field: str, salaried: pd.DataFrame, midpoints: np.ndarray,
+                        labels: dict, key: str) -> list:
+        """Per-segment salary percentiles for segments with >= 10 salaries."""
+        column = salaried[field].cat
+        codes = column.codes.to_numpy()
+        stats = []
+        uniques, counts = _first_seen_counts(codes[codes >= 0])
+        for code, n in zip(uniques.tolist(), counts.tolist()):
+            value = column.categories[code]
+            if not value or value in UNKNOWN_VALUES or n < 10:
+                continue
+            p25, median, p75 = _sort_index_percentiles(midpoints[codes == code])
+            stats.append({
+                key: value,
+                'label': labels.get(value, value),
+                'p25': round(p25),
+                'median': round(median),
+                'p75': round(p75),
+                'sample': n,
+            })
+        return sorted(stats, key=lambda x: -x['median'])
+
+    def compensation_metrics(self, frame: JobFrame, city_code: str) -> dict:
+        """Columnar _calculate_compensation_metrics (same output)."""
+        g = self.generator
+        if city_code not in g.COMPENSATION_CITIES:
+            return {
+                'available': False,
+                'reason': 'Compensation data excluded due to low disclosure rates in markets without pay transparency legislation.',
+            }
+
+        jobs = frame.jobs
+        has_salary = (jobs['salary_min'].notna() & jobs['salary_max'].notna()).to_numpy(dtype=bool)
+        salaried = jobs[has_salary]
+        n_salaried = len(salaried)
+
+        if n_salaried < 20:
+            return {
+                'available': False,
+                'reason': f'Insufficient salary data ({n_salaried} jobs with salary disclosed).',
+            }
+
+        midpoints = ((salaried['salary_min'] + salaried['salary_max']) / 2).to_numpy(dtype=np.float64)
+        p25, median, p75 = _sort_index_percentiles(midpoints)
+
+        coverage = n_salaried / len(frame) if len(frame) else 0
+
+        return {
+            'available': True,
+            'total_with_salary': n_salaried,
+            'coverage': round(coverage * 100),
+            'overall': {
+                'p25': round(p25),
+                'median': round(median),
+                'p75': round(p75),
+                'iqr': round(p75 - p25),
+            },
+            'by_seniority': self._percentiles_by('seniority', salaried, midpoints,
+                                                 g.SENIORITY_LABELS, 'seniority'),
+            'by_subfamily': self._percentiles_by('job_subfamily', salaried, midpoints,
+                                                 g.DATA_SUBFAMILY_LABELS, 'subfamily'),
+        }
@@ -20,16 +20,40 @@ Usage:
     print(data['seniority']['distribution'])
     print(data['skills']['top_skills'])
 
+Metrics are computed by the per-row _calculate_* methods by default;
+ReportGenerator(engine='columnar') uses the pandas/NumPy engine
+(pipeline/report_frame.py), which produces identical output.
+ReportGenerator(engine='rollups') sums the nightly daily rollups
+(pipeline/report_rollups.py) instead of fetching jobs; counts and percentiles
+are the same, ties are ordered by value, and skill pairs are left empty
+unless rollup_skill_pairs=True (which fetches the window's skills). With
+quantiles='sketch' its salary percentiles come from the merged daily t-digests
+(pipeline/quantile_sketch.py) instead of the exact histograms.
+
+ReportGenerator(cache=ReportCache()) reuses a stored report while the code
+and the window's data watermark are unchanged (pipeline/report_cache.py);
+the CLI caches by default (--no-cache to recompute).
+
+ReportGenerator(snapshot=JobsSnapshot()) reads jobs and employer metadata
+from the local Parquet snapshot (pipeline/jobs_snapshot.py) instead of
+Supabase; the CLI's --from-snapshot does this without the cache.
+
 CLI Usage:
     python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31
     python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --output json
+    python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --no-cache
+    python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --from-snapshot
 """
 
+import sys
+sys.path.insert(0, '.')
+
 import os
 import json
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from collections import Counter
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -54,6 +78,18 @@ def calculate_maturity_category(founding_year: int, current_year: int = 2025) ->
         return 'mature'     # Established enterprises
 
 
+# PostgREST / Postgres error codes for a column that does not exist
+MISSING_COLUMN_CODES = ('42703', 'PGRST204')
+
+
+def is_missing_column_error(error: Exception, column: str) -> bool:
+    """True if a query failed because column is missing (not e.g. a timeout)."""
+    text = str(error)
+    if column not in text:
+        return False
+    return getattr(error, 'code', None) in MISSING_COLUMN_CODES or 'does not exist' in text.lower()
+
+
 class ReportGenerator:
     """
     Generate standardized hiring market report data.
@@ -192,20 +228,72 @@ class ReportGenerator:
         'management': 'Management',
     }
 
-    def __init__(self):
-        """Initialize the report generator with Supabase connection."""
-        load_dotenv()
-        from supabase import create_client
-        self.supabase = create_client(
-            os.getenv('SUPABASE_URL'),
-            os.getenv('SUPABASE_KEY')
-        )
+    # enriched_jobs columns read by every report (filters, employers, metadata enrichment).
+    # locations is added only for the client-side accessibility fallback.
+    BASE_COLUMNS = ['employer_name', 'is_agency', 'data_source']
+
+    # Extra enriched_jobs columns read by each metric section.
+    # Estimated from column sizes (50 eval-fixture jobs, 7 skills, 3-sentence
+    # summary): select('*') is ~1.9 KB/row of JSON (39 columns); the projection
+    # is ~0.59 KB/row for nyc (10 columns) and ~0.54 KB/row for lon (8), about
+    # 70% less. Skills are most of what remains. --measure-payload measures it live.
+    SECTION_COLUMNS = {
+        'seniority': ['seniority'],
+        'subfamily': ['job_subfamily'],
+        'track': ['track'],
+        'working_arrangement': ['working_arrangement'],
+        'skills': ['skills'],
+        'compensation': ['salary_min', 'salary_max', 'seniority', 'job_subfamily'],
+    }
+
+    # Cities with pay transparency laws (compensation section computed)
+    COMPENSATION_CITIES = ('nyc', 'den', 'sfo')
+
+    # Metric backends: 'columnar' (pipeline/report_frame.py, pandas/NumPy) or
+    # 'rows' (the per-row _calculate_* methods below). Output is identical.
+    # 'rollups' sums report_daily_counts (pipeline/report_rollups.py).
+    ENGINES = ('columnar', 'rows', 'rollups')
+
+    def __init__(self, engine: str = 'rows', quantiles: str = 'exact', cache=None, snapshot=None,
+                 rollup_skill_pairs: bool = False):
+        """Initialize the report generator with Supabase connection.
+
+        Args:
+            engine: Metric backend, 'rows' (default), 'columnar' or 'rollups'
+            quantiles: Rollups salary percentiles, 'exact' (histograms) or 'sketch'
+            cache: Optional ReportCache for generate_report_data() results
+            snapshot: Optional JobsSnapshot to read instead of Supabase (no
+                      connection is made; the rollups engine computes from jobs)
+            rollup_skill_pairs: Rollups engine also computes skill pairs (a
+                      skills-only fetch of the window; empty otherwise)
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}' (expected one of {self.ENGINES})")
+        self.engine = engine
+        self.quantiles = quantiles
+        self.rollup_skill_pairs = rollup_skill_pairs
+        self.cache = cache
+        self.snapshot = snapshot
+        self.supabase = None
+        if snapshot is None:
+            load_dotenv()
+            from supabase import create_client
+            self.supabase = create_client(
+                os.getenv('SUPABASE_URL'),
+                os.getenv('SUPABASE_KEY')
+            )
         self._employer_metadata = None
+        self._metadata_lock = threading.Lock()
+        # False once accessible_city_codes (migration 033) is found missing
+        self._server_accessibility = None
+        # False once get_report_rollup (migration 034) is found missing
+        self._rollups_available = None
 
     def _build_location_filter(self, city: str) -> str:
         """
         Build broad location filter for a city (refined client-side).
 
+        Only used when accessible_city_codes (migration 033) is unavailable.
         This filter is intentionally broad because Supabase's cs operator
         doesn't support compound JSON matching. The _is_job_accessible()
         method does precise filtering client-side.
@@ -217,6 +305,10 @@ class ReportGenerator:
         - Country-wide jobs (any country - filtered client-side)
         - Region jobs
         """
+        return ','.join(self._location_filter_parts(city))
+
+    def _location_filter_parts(self, city: str) -> list:
+        """PostgREST or_() conditions making up _build_location_filter()."""
         config = self.CITY_CONFIG.get(city, {})
         region = config.get('region')
 
@@ -230,7 +322,7 @@ class ReportGenerator:
         if region:
             parts.append(f'locations.cs.[{{"region":"{region}"}}]')
 
-        return ','.join(parts)
+        return parts
 
     def _is_job_accessible(self, job: dict, city: str) -> bool:
         """
@@ -265,37 +357,48 @@ class ReportGenerator:
 
         return False
 
-    def _fetch_all_jobs(self, city_code: str, job_family: str,
-                        start_date: str, end_date: str) -> list:
+    def _report_sections(self, city_code: str) -> list:
+        """Metric sections computed for a city (compensation is US-only)."""
+        sections = list(self.SECTION_COLUMNS)
+        if city_code not in self.COMPENSATION_CITIES:
+            sections.remove('compensation')
+        return sections
+
+    def _build_projection(self, sections: list = None) -> str:
         """
-        Fetch all jobs matching criteria with pagination.
+        Build the enriched_jobs select list for the requested metric sections.
 
-        Uses INCLUSIVE location filtering - includes all jobs accessible
-        to candidates in the specified city (local + remote + regional).
+        Always includes BASE_COLUMNS; skills arrays and salary columns are only
+        selected when the skills / compensation sections need them.
+        """
+        sections = list(self.SECTION_COLUMNS) if sections is None else sections
+        columns = list(self.BASE_COLUMNS)
+        for section in sections:
+            for column in self.SECTION_COLUMNS[section]:
+                if column not in columns:
+                    columns.append(column)
+        return ','.join(columns)
+
+    def _fetch_pages(self, columns: str, job_family: str, start_date: str, end_date: str,
+                     location_clause) -> list:
+        """
+        Page through enriched_jobs for a family/date window.
 
         Supabase has a 1000-row limit per query, so we paginate.
-        Server-side filter is broad; client-side _is_job_accessible() refines it.
+        location_clause(query) adds the location filter. job_family may be a
+        list (report_batch fetches several families at once).
         """
-        # Convert legacy city_code to city name
-        city = self.CITY_CODE_MAP.get(city_code, city_code)
-
-        # Build broad location filter (refined client-side)
-        location_filter = self._build_location_filter(city)
-
         all_jobs = []
         offset = 0
 
         while True:
-            batch = (
-                self.supabase.table('enriched_jobs')
-                .select('*')
-                .eq('job_family', job_family)
-                .gte('posted_date', start_date)
-                .lte('posted_date', end_date)
-                .or_(location_filter)
-                .range(offset, offset + 999)
-                .execute()
-            )
+            query = self.supabase.table('enriched_jobs').select(columns)
+            if isinstance(job_family, (list, tuple)):
+                query = query.in_('job_family', list(job_family))
+            else:
+                query = query.eq('job_family', job_family)
+            query = query.gte('posted_date', start_date).lte('posted_date', end_date)
+            batch = location_clause(query).range(offset, offset + 999).execute()
 
             if not batch.data:
                 break
@@ -306,20 +409,181 @@ class ReportGenerator:
             if len(batch.data) < 1000:
                 break
 
+        return all_jobs
+
+    def _fetch_all_jobs(self, city_code: str, job_family: str,
+                        start_date: str, end_date: str, columns: str = None) -> list:
+        """
+        Fetch all jobs matching criteria with pagination.
+
+        Uses INCLUSIVE location filtering - includes all jobs accessible
+        to candidates in the specified city (local + remote + regional).
+
+        Filters exactly on the server via accessible_city_codes (migration
+        033). If that column is missing, falls back to the broad locations
+        filter refined client-side by _is_job_accessible(); other errors
+        (timeouts, network) are raised.
+
+        Args:
+            columns: Select list (default: _build_projection() for the
+                     city's report sections; '*' fetches every column)
+        """
+        # Convert legacy city_code to city name (and city name to report code)
+        city = self.CITY_CODE_MAP.get(city_code, city_code)
+        code = next((c for c, name in self.CITY_CODE_MAP.items() if name == city), None)
+
+        if columns is None:
+            columns = self._build_projection(self._report_sections(city_code))
+
+        if self.snapshot is not None:
+            return self._read_snapshot_jobs(city, code, job_family, start_date, end_date, columns)
+
+        if code and self._server_accessibility is not False:
+            try:
+                return self._fetch_pages(
+                    columns, job_family, start_date, end_date,
+                    lambda query: query.contains('accessible_city_codes', [code])
+                )
+            except Exception as e:
+                if not is_missing_column_error(e, 'accessible_city_codes'):
+                    raise
+                print(f"[DB] accessible_city_codes unavailable ({str(e)[:80]}); filtering client-side")
+                self._server_accessibility = False
+
+        # Build broad location filter (refined client-side)
+        location_filter = self._build_location_filter(city)
+        if columns != '*' and 'locations' not in columns.split(','):
+            columns += ',locations'
+
+        all_jobs = self._fetch_pages(
+            columns, job_family, start_date, end_date,
+            lambda query: query.or_(location_filter)
+        )
+
         # Client-side filter to exclude jobs from wrong countries
         # (Supabase cs operator can't filter on compound JSON conditions)
         accessible_jobs = [j for j in all_jobs if self._is_job_accessible(j, city)]
 
         return accessible_jobs
 
+    def _read_snapshot_jobs(self, city: str, code: Optional[str], job_family: str,
+                            start_date: str, end_date: str, columns: str) -> list:
+        """
+        _fetch_all_jobs() from the local snapshot.
+
+        Reads only the projected columns of the window's month partitions.
+        Rows synced with accessible_city_codes are filtered on it like the
+        server filter; older rows fall back to _is_job_accessible().
+        """
+        selected = None
+        if columns != '*':
+            selected = [c for c in columns.split(',') if c]
+            selected += [c for c in ('locations', 'accessible_city_codes') if c not in selected]
+
+        families = list(job_family) if isinstance(job_family, (list, tuple)) else [job_family]
+        filters = self.snapshot.window_filters(start_date, end_date) + [('job_family', 'in', families)]
+        jobs = self.snapshot.rows('enriched_jobs', selected, filters)
+
+        def accessible(job):
+            codes = job.get('accessible_city_codes')
+            if code and codes is not None:
+                return code in codes
+            return self._is_job_accessible(job, city)
+
+        return [j for j in jobs if accessible(j)]
+
+    def fetch_window_watermark(self, city_code: str, job_family: str,
+                               start_date: str, end_date: str) -> dict:
+        """
+        Cheap change detector for a report window (used by ReportCache).
+
+        Count and max(updated_at) of the window's enriched_jobs (count catches
+        deletions, updated_at inserts and edits), the same for
+        employer_metadata, and the last rollup run for the rollups engine.
+        Without accessible_city_codes the broad location filter is used; any
+        change to the window's jobs still changes it.
+        """
+        city = self.CITY_CODE_MAP.get(city_code, city_code)
+        code = next((c for c, name in self.CITY_CODE_MAP.items() if name == city), None)
+
+        def latest(table: str, column: str, apply=lambda query: query):
+            query = apply(self.supabase.table(table).select(column, count='exact'))
+            result = query.order(column, desc=True).limit(1).execute()
+            return result.count, (result.data[0][column] if result.data else None)
+
+        def window(location_clause):
+            return lambda query: location_clause(
+                query.eq('job_family', job_family).gte('posted_date', start_date).lte('posted_date', end_date)
+            )
+
+        jobs = None
+        if code and self._server_accessibility is not False:
+            try:
+                jobs = latest('enriched_jobs', 'updated_at',
+                              window(lambda query: query.contains('accessible_city_codes', [code])))
+            except Exception as e:
+                if not is_missing_column_error(e, 'accessible_city_codes'):
+                    raise
+                print(f"[DB] accessible_city_codes unavailable ({str(e)[:80]}); filtering client-side")
+                self._server_accessibility = False
+        if jobs is None:
+            location_filter = self._build_location_filter(city)
+            jobs = latest('enriched_jobs', 'updated_at', window(lambda query: query.or_(location_filter)))
+
+        employers = latest('employer_metadata', 'updated_at')
+        watermark = {
+            'jobs': jobs[0],
+            'jobs_updated_at': jobs[1],
+            'employer_metadata': employers[0],
+            'employer_metadata_updated_at': employers[1],
+        }
+        if self.engine == 'rollups':
+            watermark['rollups_finished_at'] = latest('report_rollup_runs', 'finished_at')[1]
+        return watermark
+
+    def measure_fetch_payload(self, city_code: str, job_family: str,
+                              start_date: str, end_date: str) -> dict:
+        """
+        Compare the projected report fetch with a select('*') fetch.
+
+        Payload size is the JSON-encoded row data (approximates the response
+        body); latency is wall time for the full paginated fetch.
+
+        Returns:
+            Dict with the projection and rows/bytes/seconds for both fetches.
+        """
+        import time
+
+        projection = self._build_projection(self._report_sections(city_code))
+        result = {'projection': projection}
+        for label, columns in (('full', '*'), ('projected', projection)):
+            started = time.perf_counter()
+            jobs = self._fetch_all_jobs(city_code, job_family, start_date, end_date, columns=columns)
+            result[label] = {
+                'rows': len(jobs),
+                'bytes': len(json.dumps(jobs, default=str).encode('utf-8')),
+                'seconds': round(time.perf_counter() - started, 2),
+            }
+        return result
+
     def _fetch_employer_metadata(self) -> dict:
         """
         Fetch and cache employer metadata lookup.
 
-        Returns dict keyed by canonical_name for O(1) lookups.
+        Returns dict keyed by canonical_name for O(1) lookups. Loaded once
+        even when both portfolio periods are generated concurrently.
         """
         if self._employer_metadata is not None:
             return self._employer_metadata
+        with self._metadata_lock:
+            if self._employer_metadata is None:
+                self._employer_metadata = self._load_employer_metadata()
+        return self._employer_metadata
+
+    def _load_employer_metadata(self) -> dict:
+        """Page through employer_metadata into a canonical_name lookup."""
+        if self.snapshot is not None:
+            return {m['canonical_name']: m for m in self.snapshot.rows('employer_metadata')}
 
         all_meta = []
         offset = 0
@@ -341,8 +605,7 @@ class ReportGenerator:
             if len(batch.data) < 1000:
                 break
 
-        self._employer_metadata = {m['canonical_name']: m for m in all_meta}
-        return self._employer_metadata
+        return {m['canonical_name']: m for m in all_meta}
 
     def _filter_direct_jobs(self, jobs: list) -> tuple:
         """
@@ -560,23 +823,10 @@ class ReportGenerator:
                 'percentage': round(pct * 100),
             })
 
-        # Skill pairs
-        pairs = Counter()
-        for job in jobs_with_skills:
-            job_skills = []
-            for s in job.get('skills', []):
-                if isinstance(s, dict):
-                    job_skills.append(s.get('name', ''))
-                else:
-                    job_skills.append(str(s))
-            job_skills = sorted(set(job_skills))
-
-            for i in range(len(job_skills)):
-                for k in range(i + 1, len(job_skills)):
-                    pairs[(job_skills[i], job_skills[k])] += 1
-
+        # Skill pairs (sparse incidence matrix co-occurrence)
+        from pipeline.skill_cooccurrence import SkillIncidence
         skill_pairs = []
-        for (s1, s2), count in pairs.most_common(10):
+        for s1, s2, count in SkillIncidence.from_jobs(jobs_with_skills).top_pairs(10):
             pct = count / len(jobs_with_skills)
             skill_pairs.append({
                 'skill_1': s1,
@@ -691,7 +941,7 @@ class ReportGenerator:
         London and Singapore are excluded due to lack of pay transparency laws.
         """
         # Skip non-US cities
-        if city_code not in ('nyc', 'den', 'sfo'):
+        if city_code not in self.COMPENSATION_CITIES:
             return {
                 'available': False,
                 'reason': 'Compensation data excluded due to low disclosure rates in markets without pay transparency legislation.',
@@ -782,6 +1032,45 @@ class ReportGenerator:
             'by_subfamily': sorted(subfamily_stats, key=lambda x: -x['median']),
         }
 
+    def _calculate_metrics(self, all_jobs: list, city_code: str, job_family: str) -> dict:
+        """
+        Calculate every metric section with the per-row methods ('rows' engine).
+
+        ColumnarReportEngine.calculate() returns the same structure.
+
+        Returns:
+            Dict with total/direct/agency counts and each metric section.
+        """
+        # Filter agencies
+        direct_jobs, agency_count = self._filter_direct_jobs(all_jobs)
+
+        subfamily_labels = self.SUBFAMILY_LABELS_BY_FAMILY.get(job_family, self.DATA_SUBFAMILY_LABELS)
+        # Working arrangement uses ATS sources only for reliable classification
+        ats_jobs = self._filter_ats_jobs(direct_jobs)
+        arrangement_dist = self._calculate_distribution(
+            ats_jobs, 'working_arrangement', self.ARRANGEMENT_LABELS
+        )
+        arrangement_dist['ats_job_count'] = len(ats_jobs)
+        arrangement_dist['total_job_count'] = len(direct_jobs)
+
+        return {
+            'total_count': len(all_jobs),
+            'direct_count': len(direct_jobs),
+            'agency_count': agency_count,
+            'employer_metrics': self._calculate_employer_metrics(direct_jobs),
+            'seniority_metrics': self._calculate_seniority_metrics(direct_jobs),
+            'subfamily_dist': self._calculate_distribution(
+                direct_jobs, 'job_subfamily', subfamily_labels
+            ),
+            'track_dist': self._calculate_distribution(
+                direct_jobs, 'track', self.TRACK_LABELS
+            ),
+            'arrangement_dist': arrangement_dist,
+            'skills_metrics': self._calculate_skills_metrics(direct_jobs),
+            'metadata_metrics': self._calculate_metadata_enriched_metrics(direct_jobs),
+            'compensation_metrics': self._calculate_compensation_metrics(direct_jobs, city_code),
+        }
+
     def generate_report_data(self, city_code: str, job_family: str,
                              start_date: str, end_date: str) -> dict:
         """
@@ -796,32 +1085,69 @@ class ReportGenerator:
         Returns:
             Dict containing all report metrics and distributions.
         """
+        if self.cache is not None:
+            return self.cache.get_or_compute(
+                self, city_code, job_family, start_date, end_date,
+                lambda: self._compute_report_data(city_code, job_family, start_date, end_date)
+            )
+        return self._compute_report_data(city_code, job_family, start_date, end_date)
+
+    def _compute_report_data(self, city_code: str, job_family: str,
+                             start_date: str, end_date: str) -> dict:
+        """generate_report_data() without the cache."""
+        # Sum the daily rollups when available (no job fetch)
+        if self.engine == 'rollups' and self._rollups_available is not False and self.snapshot is None:
+            from pipeline.report_rollups import RollupReportEngine
+            engine = RollupReportEngine(self, quantiles=self.quantiles)
+            try:
+                rollup = engine.fetch(city_code, job_family, start_date, end_date,
+                                      skill_pairs=self.rollup_skill_pairs)
+            except Exception as e:
+                print(f"[DB] Report rollups unavailable ({str(e)[:80]}); computing from jobs")
+                self._rollups_available = False
+            else:
+                if rollup.get('days'):
+                    metrics = engine.calculate(rollup, city_code, job_family)
+                    return self.build_report_data(metrics, city_code, job_family, start_date, end_date)
+                print(f"[ROLLUP] No rollups for {start_date} to {end_date}; computing from jobs")
+
         # Fetch all jobs
         all_jobs = self._fetch_all_jobs(city_code, job_family, start_date, end_date)
 
-        # Filter agencies
-        direct_jobs, agency_count = self._filter_direct_jobs(all_jobs)
-
         # Calculate all metrics
-        employer_metrics = self._calculate_employer_metrics(direct_jobs)
-        seniority_metrics = self._calculate_seniority_metrics(direct_jobs)
-        subfamily_labels = self.SUBFAMILY_LABELS_BY_FAMILY.get(job_family, self.DATA_SUBFAMILY_LABELS)
-        subfamily_dist = self._calculate_distribution(
-            direct_jobs, 'job_subfamily', subfamily_labels
-        )
-        track_dist = self._calculate_distribution(
-            direct_jobs, 'track', self.TRACK_LABELS
-        )
-        # Working arrangement uses ATS sources only for reliable classification
-        ats_jobs = self._filter_ats_jobs(direct_jobs)
-        arrangement_dist = self._calculate_distribution(
-            ats_jobs, 'working_arrangement', self.ARRANGEMENT_LABELS
-        )
-        arrangement_dist['ats_job_count'] = len(ats_jobs)
-        arrangement_dist['total_job_count'] = len(direct_jobs)
-        skills_metrics = self._calculate_skills_metrics(direct_jobs)
-        metadata_metrics = self._calculate_metadata_enriched_metrics(direct_jobs)
-        compensation_metrics = self._calculate_compensation_metrics(direct_jobs, city_code)
+        if self.engine in ('columnar', 'rollups'):
+            from pipeline.report_frame import ColumnarReportEngine
+            metrics = ColumnarReportEngine(self).calculate(all_jobs, city_code, job_family)
+        else:
+            metrics = self._calculate_metrics(all_jobs, city_code, job_family)
+
+        return self.build_report_data(metrics, city_code, job_family, start_date, end_date)
+
+    def build_report_data(self, metrics: dict, city_code: str, job_family: str,
+                          start_date: str, end_date: str) -> dict:
+        """
+        Assemble report data from calculated metric sections.
+
+        Used by generate_report_data() and by report_batch, which computes
+        metrics from an in-memory slice instead of a fetch.
+
+        Args:
+            metrics: Output of _calculate_metrics() / ColumnarReportEngine
+            city_code, job_family, start_date, end_date: Report segment
+
+        Returns:
+            Dict containing all report metrics and distributions.
+        """
+        employer_metrics = metrics['employer_metrics']
+        seniority_metrics = metrics['seniority_metrics']
+        subfamily_dist = metrics['subfamily_dist']
+        track_dist = metrics['track_dist']
+        arrangement_dist = metrics['arrangement_dist']
+        skills_metrics = metrics['skills_metrics']
+        metadata_metrics = metrics['metadata_metrics']
+        compensation_metrics = metrics['compensation_metrics']
+        total_count = metrics['total_count']
+        agency_count = metrics['agency_count']
 
         return {
             'meta': {
@@ -832,10 +1158,10 @@ class ReportGenerator:
                 'generated_at': datetime.now().isoformat(),
             },
             'summary': {
-                'total_jobs': len(all_jobs),
-                'direct_jobs': len(direct_jobs),
+                'total_jobs': total_count,
+                'direct_jobs': metrics['direct_count'],
                 'agency_jobs': agency_count,
-                'agency_rate': round(agency_count / len(all_jobs) * 100) if all_jobs else 0,
+                'agency_rate': round(agency_count / total_count * 100) if total_count else 0,
                 'unique_employers': employer_metrics['unique_employers'],
             },
             'employers': employer_metrics,
@@ -1072,6 +1398,10 @@ class ReportGenerator:
 
         Narrative fields are left as placeholders to be filled by LLM/manual editing.
 
+        With a comparison period, both periods are generated concurrently
+        (each is dominated by paginated fetches); the comparisons are then
+        computed from the two in-memory results.
+
         Args:
             city_code: Location code (lon, nyc, den, sfo, sgp)
             job_family: Job family (data, product, delivery)
@@ -1083,15 +1413,43 @@ class ReportGenerator:
         Returns:
             Dict in portfolio-site JSON format.
         """
-        # Get raw data for current period
-        raw = self.generate_report_data(city_code, job_family, start_date, end_date)
+        if not (compare_start and compare_end):
+            raw = self.generate_report_data(city_code, job_family, start_date, end_date)
+            return self.build_portfolio_report(raw)
+
+        # Comparison period on a worker thread while the current period runs here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            compare_future = executor.submit(
+                self.generate_report_data, city_code, job_family, compare_start, compare_end
+            )
+            raw = self.generate_report_data(city_code, job_family, start_date, end_date)
+            compare_raw = compare_future.result()
+
+        return self.build_portfolio_report(raw, compare_raw)
+
+    def build_portfolio_report(self, raw: dict, compare_raw: dict = None) -> dict:
+        """
+        Convert generate_report_data() output to portfolio-site format.
+
+        The segment (city, family, period) is read from raw['meta'].
+
+        Args:
+            raw: Report data for the current period
+            compare_raw: Optional report data for the comparison period
+
+        Returns:
+            Dict in portfolio-site JSON format.
+        """
+        city_code = raw['meta']['city_code']
+        job_family = raw['meta']['job_family']
+        start_date = raw['meta']['start_date']
+        end_date = raw['meta']['end_date']
 
-        # Get comparison period data if requested
-        compare_raw = None
         compare_period_label = None
-        if compare_start and compare_end:
-            compare_raw = self.generate_report_data(city_code, job_family, compare_start, compare_end)
-            compare_period_label = self._format_period_label(compare_start, compare_end)
+        if compare_raw:
+            compare_period_label = self._format_period_label(
+                compare_raw['meta']['start_date'], compare_raw['meta']['end_date']
+            )
 
         # Helper to convert distribution to simple {label, value} format
         def to_chart_data(distribution: list, top_n: int = None) -> list:
@@ -1378,6 +1736,9 @@ Examples:
     python pipeline/report_generator.py --city sfo --family data --start 2025-12-01 --end 2025-12-31 --output portfolio
     python pipeline/report_generator.py --city nyc --family data --start 2025-12-01 --end 2025-12-31 --output json
 
+    # Fetch payload/latency saved by the column projection:
+    python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --measure-payload
+
     # With MoM comparison:
     python pipeline/report_generator.py --city lon --family data --start 2025-12-01 --end 2025-12-31 --compare-start 2025-11-01 --compare-end 2025-11-30 --output portfolio
         """
@@ -1396,10 +1757,48 @@ Examples:
                         help='Comparison period start date (YYYY-MM-DD) for MoM analysis')
     parser.add_argument('--compare-end', type=str, default=None,
                         help='Comparison period end date (YYYY-MM-DD) for MoM analysis')
+    parser.add_argument('--measure-payload', action='store_true',
+                        help='Compare projected vs select(*) fetch size and latency, then exit')
+    parser.add_argument('--engine', choices=ReportGenerator.ENGINES, default='rows',
+                        help='Metric backend: rows (per-row Python, default), columnar (pandas/NumPy) '
+                             'or rollups (nightly daily aggregates)')
+    parser.add_argument('--quantiles', choices=['exact', 'sketch'], default='exact',
+                        help='Rollups engine salary percentiles: exact (histograms, default) '
+                             'or sketch (merged daily t-digests)')
+    parser.add_argument('--rollup-skill-pairs', action='store_true',
+                        help='Rollups engine: also compute skill pairs (fetches the window\'s skills, '
+                             'O(jobs)); left empty otherwise')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompute instead of reusing a cached report whose data is unchanged')
+    parser.add_argument('--from-snapshot', nargs='?', const='', default=None, metavar='DIR',
+                        help='Read jobs from the local Parquet snapshot (default dir: .cache/snapshot); '
+                             'no database connection, no cache')
 
     args = parser.parse_args()
 
-    generator = ReportGenerator()
+    snapshot = None
+    if args.from_snapshot is not None:
+        from pipeline.jobs_snapshot import JobsSnapshot
+        snapshot = JobsSnapshot(args.from_snapshot or None)
+        print(f"[SNAPSHOT] Reading {snapshot.directory}", file=sys.stderr)
+
+    cache = None
+    if not args.no_cache and not args.measure_payload and snapshot is None:
+        from pipeline.report_cache import ReportCache
+        cache = ReportCache()
+    generator = ReportGenerator(engine=args.engine, quantiles=args.quantiles, cache=cache, snapshot=snapshot,
+                                rollup_skill_pairs=args.rollup_skill_pairs)
+
+    if args.measure_payload:
+        m = generator.measure_fetch_payload(args.city, args.family, args.start, args.end)
+        full, projected = m['full'], m['projected']
+        print(f"Projection: {m['projection']}")
+        for label, stats in (('select(*)', full), ('projected', projected)):
+            print(f"  {label:<10} {stats['rows']:>6} rows  {stats['bytes'] / 1024:>9.1f} KB  {stats['seconds']:>6.2f}s")
+        if full['bytes']:
+            print(f"  Saved: {(1 - projected['bytes'] / full['bytes']) * 100:.0f}% payload, "
+                  f"{full['seconds'] - projected['seconds']:.2f}s")
+        return
 
     if args.output == 'portfolio':
         data = generator.generate_portfolio_report(
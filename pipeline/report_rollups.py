@@ -0,0 +1,876 @@
+"""
+Report Rollups - Nightly per-day aggregates for ReportGenerator.
+
+Every report used to recompute its counts from raw enriched_jobs rows, so
+latency grew with the table. This stage writes per-day rollups (migration
+034) keyed by (posted_date, city_code, job_family):
+
+- report_daily_counts: job counts per dimension value
+  (summary, employer, seniority, job_subfamily, track, working_arrangement,
+  skill)
+- report_daily_salary_histograms: salary midpoint histograms (exact value ->
+  job count) overall and per seniority/subfamily
+- report_daily_salary_sketches: the same segments as fixed-size t-digests
+  (migration 035, pipeline/quantile_sketch.py), mergeable across days and
+  cities
+
+ReportGenerator(engine='rollups') sums the days of a report range in
+Postgres (get_report_rollup RPC) and builds the same metric sections with
+RollupReportEngine, so report latency depends on the number of distinct
+values, not the number of jobs. Skill pairs are not rolled up: stored per
+day they grow quadratically with each job's skills (and again per city), and
+pairs kept only among each day's top skills cannot be summed exactly. The
+engine leaves skill_pairs empty unless asked for them (skill_pairs=True,
+ReportGenerator(rollup_skill_pairs=True), --rollup-skill-pairs); they are
+then computed with SkillIncidence from a skills-only fetch of the report
+window, which costs O(jobs in window) again.
+
+Counts match the row engine exactly and percentiles are exact (the
+histograms keep every distinct midpoint); RollupReportEngine(quantiles=
+'sketch') takes them from the merged sketches instead (within ~1%, see
+--verify-sketches). Ties are ranked by value rather than by first
+appearance, which rollups cannot preserve.
+
+Incremental refresh: days logged in report_rollup_dirty_days since the
+last finished run are recomputed and replaced. Triggers on enriched_jobs
+(migration 034) log a job's posted_date when it is inserted or deleted, and
+its old and new posted_date when a column in ROLLUP_COLUMNS changes, so
+reclassifications, agency/employer/location backfills and posted_date
+moves are all picked up. A run is recorded in report_rollup_runs only after
+its last chunk, so a failed run is redone from the previous watermark and a
+failed first backfill is restarted; get_report_rollup() serves nothing until
+a backfill has finished. An explicit --start/--end refresh is recorded
+without moving the watermark.
+
+Usage:
+    from pipeline.report_rollups import refresh_report_rollups
+
+    stats = refresh_report_rollups()                                  # incremental
+    stats = refresh_report_rollups('2025-12-01', '2025-12-31')        # explicit range
+
+CLI Usage:
+    python pipeline/report_rollups.py                                  # Incremental (nightly)
+    python pipeline/report_rollups.py --start 2025-12-01 --end 2025-12-31
+    python pipeline/report_rollups.py --dry-run
+    python pipeline/report_rollups.py --verify-sketches --start 2025-10-01 --end 2025-12-31
+"""
+
+import sys
+sys.path.insert(0, '.')
+
+import argparse
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+from pipeline.db_connection import supabase
+from pipeline.quantile_sketch import TDigest
+from pipeline.report_generator import (
+    ReportGenerator, normalize_employer_name, calculate_maturity_category,
+)
+
+# ============================================
+# Configuration
+# ============================================
+
+COUNTS_TABLE = 'report_daily_counts'
+SALARY_TABLE = 'report_daily_salary_histograms'
+SKETCH_TABLE = 'report_daily_salary_sketches'
+RUNS_TABLE = 'report_rollup_runs'
+DIRTY_DAYS_TABLE = 'report_rollup_dirty_days'
+
+# Run kinds that advance the incremental watermark
+WATERMARK_RUN_KINDS = ('backfill', 'incremental')
+
+# enriched_jobs columns the rollups read (a change marks the job's days dirty,
+# see mark_report_rollup_dirty_days in migration 034)
+ROLLUP_COLUMNS = ','.join([
+    'posted_date', 'job_family', 'accessible_city_codes',
+    'employer_name', 'is_agency', 'data_source', 'seniority', 'job_subfamily',
+    'track', 'working_arrangement', 'skills', 'salary_min', 'salary_max',
+])
+
+# Categorical dimensions counted over direct (non-agency) jobs
+DIRECT_DIMENSIONS = ('seniority', 'job_subfamily', 'track')
+
+# Salary histogram segments besides 'overall'
+SALARY_SEGMENTS = ('seniority', 'job_subfamily')
+
+# Values treated as unclassified by _calculate_distribution
+UNKNOWN_VALUES = ('unknown', 'null')
+
+PAGE_SIZE = 1000
+BACKFILL_CHUNK_DAYS = 7
+
+# Report segments checked by --verify-sketches
+VERIFY_CITIES = ('lon', 'nyc', 'den', 'sfo', 'sgp')
+VERIFY_FAMILIES = ('data', 'product', 'delivery')
+
+
+# ============================================
+# Rollup Computation
+# ============================================
+
+def _known(value) -> bool:
+    return bool(value) and value not in UNKNOWN_VALUES
+
+
+def _job_skills(job: dict) -> list:
+    """Skill names as counted by top_skills."""
+    return [skill.get('name', 'unknown') if isinstance(skill, dict) else str(skill)
+            for skill in job.get('skills') or []]
+
+
+def _job_contributions(job: dict) -> Tuple[Counter, Counter]:
+    """One job's (dimension, value) counts and (segment, value, midpoint) salaries."""
+    counts = Counter({('summary', 'total'): 1})
+    salaries = Counter()
+
+    if job.get('is_agency') == True:  # noqa: E712 - mirrors _filter_direct_jobs
+        counts[('summary', 'agency')] += 1
+    if job.get('is_agency'):
+        return counts, salaries
+
+    counts[('summary', 'direct')] += 1
+    counts[('employer', job.get('employer_name') or 'unknown')] += 1
+    for field in DIRECT_DIMENSIONS:
+        if _known(job.get(field)):
+            counts[(field, job[field])] += 1
+
+    if job.get('data_source') in ReportGenerator.ATS_SOURCES:
+        counts[('summary', 'ats')] += 1
+        if _known(job.get('working_arrangement')):
+            counts[('working_arrangement', job['working_arrangement'])] += 1
+
+    names = _job_skills(job)
+    if names:
+        counts[('summary', 'with_skills')] += 1
+        for name in names:
+            counts[('skill', name)] += 1
+
+    if job.get('salary_min') is not None and job.get('salary_max') is not None:
+        counts[('summary', 'with_salary')] += 1
+        midpoint = (job['salary_min'] + job['salary_max']) / 2
+        salaries[('overall', '', midpoint)] += 1
+        for segment in SALARY_SEGMENTS:
+            if _known(job.get(segment)):
+                salaries[(segment, job[segment], midpoint)] += 1
+
+    return counts, salaries
+
+
+def compute_daily_rollups(jobs: list, computed_at: str) -> Tuple[list, list]:
+    """
+    Aggregate jobs into report_daily_counts / report_daily_salary_histograms rows.
+
+    A job counts towards every report city in its accessible_city_codes.
+
+    Args:
+        jobs: enriched_jobs rows with ROLLUP_COLUMNS
+        computed_at: Run timestamp stored on every row
+
+    Returns:
+        (count_rows, salary_rows) ready to insert.
+    """
+    counts = defaultdict(Counter)
+    salaries = defaultdict(Counter)
+
+    for job in jobs:
+        cities = [c for c in job.get('accessible_city_codes') or [] if c in ReportGenerator.CITY_CODE_MAP]
+        if not cities or not job.get('posted_date') or not job.get('job_family'):
+            continue
+        job_counts, job_salaries = _job_contributions(job)
+        day = str(job['posted_date'])[:10]
+        for city_code in cities:
+            key = (day, city_code, job.get('job_family'))
+            counts[key].update(job_counts)
+            salaries[key].update(job_salaries)
+
+    count_rows = [
+        {'posted_date': day, 'city_code': city_code, 'job_family': family,
+         'dimension': dimension, 'value': value, 'jobs': n, 'computed_at': computed_at}
+        for (day, city_code, family), counter in counts.items()
+        for (dimension, value), n in counter.items()
+    ]
+    salary_rows = [
+        {'posted_date': day, 'city_code': city_code, 'job_family': family,
+         'segment': segment, 'segment_value': value, 'salary_midpoint': midpoint,
+         'jobs': n, 'computed_at': computed_at}
+        for (day, city_code, family), counter in salaries.items()
+        for (segment, value, midpoint), n in counter.items()
+    ]
+    return count_rows, salary_rows
+
+
+def compute_daily_sketches(salary_rows: list, computed_at: str) -> list:
+    """
+    Build report_daily_salary_sketches rows from histogram rows.
+
+    One t-digest per (day, city, family, segment, segment_value).
+    """
+    sketches = defaultdict(TDigest)
+    for row in salary_rows:
+        key = (row['posted_date'], row['city_code'], row['job_family'], row['segment'], row['segment_value'])
+        sketches[key].add(row['salary_midpoint'], row['jobs'])
+
+    return [
+        {'posted_date': day, 'city_code': city_code, 'job_family': family,
+         'segment': segment, 'segment_value': value, 'jobs': sketch.count,
+         'sketch': sketch.to_dict(), 'computed_at': computed_at}
+        for (day, city_code, family, segment, value), sketch in sketches.items()
+    ]
+
+
+def merge_salary_sketches(entries: list) -> dict:
+    """
+    Merge get_report_salary_sketches() entries per segment.
+
+    Args:
+        entries: [segment, segment_value, sketch dict] per day/city
+
+    Returns:
+        {segment: {segment_value: TDigest}}
+    """
+    grouped = defaultdict(lambda: defaultdict(list))
+    for segment, value, sketch in entries:
+        grouped[segment][value].append(TDigest.from_dict(sketch))
+    return {
+        segment: {value: TDigest.merge_all(sketches) for value, sketches in values.items()}
+        for segment, values in grouped.items()
+    }
+
+
+# ============================================
+# Database
+# ============================================
+
+def fetch_rollup_watermark() -> Optional[str]:
+    """Start of the latest finished backfill/incremental run (None before the first)."""
+    result = supabase.table(RUNS_TABLE) \
+        .select('started_at') \
+        .in_('kind', list(WATERMARK_RUN_KINDS)) \
+        .order('started_at', desc=True) \
+        .limit(1) \
+        .execute()
+    return result.data[0]['started_at'] if result.data else None
+
+
+def record_rollup_run(kind: str, started_at: str, days: List[str], jobs: int):
+    """Record a finished run (after its last chunk was written)."""
+    supabase.table(RUNS_TABLE).insert({
+        'kind': kind,
+        'started_at': started_at,
+        'start_date': days[0] if days else None,
+        'end_date': days[-1] if days else None,
+        'days': len(days),
+        'jobs': jobs,
+    }).execute()
+
+
+def prune_dirty_days(before: str):
+    """Drop dirty-day entries a finished run has covered (marked before it started)."""
+    supabase.table(DIRTY_DAYS_TABLE).delete().lt('marked_at', before).execute()
+
+
+def find_dirty_days(since: str) -> List[str]:
+    """posted_dates marked dirty since the watermark, ascending."""
+    days = set()
+    offset = 0
+    while True:
+        result = supabase.table(DIRTY_DAYS_TABLE) \
+            .select('posted_date') \
+            .gte('marked_at', since) \
+            .order('id') \
+            .range(offset, offset + PAGE_SIZE - 1) \
+            .execute()
+        rows = result.data or []
+        days.update(str(r['posted_date'])[:10] for r in rows if r.get('posted_date'))
+        if len(rows) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+    return sorted(days)
+
+
+def find_first_posted_date() -> Optional[str]:
+    """Earliest posted_date in enriched_jobs (full backfill start)."""
+    result = supabase.table('enriched_jobs') \
+        .select('posted_date') \
+        .order('posted_date') \
+        .limit(1) \
+        .execute()
+    return str(result.data[0]['posted_date'])[:10] if result.data else None
+
+
+def fetch_jobs_for_days(start_date: str, end_date: str) -> list:
+    """Every job posted in [start_date, end_date] accessible from a report city."""
+    jobs = []
+    offset = 0
+    while True:
+        result = supabase.table('enriched_jobs') \
+            .select(ROLLUP_COLUMNS) \
+            .gte('posted_date', start_date) \
+            .lte('posted_date', end_date) \
+            .overlaps('accessible_city_codes', list(ReportGenerator.CITY_CODE_MAP)) \
+            .order('id') \
+            .range(offset, offset + PAGE_SIZE - 1) \
+            .execute()
+        rows = result.data or []
+        jobs.extend(rows)
+        if len(rows) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+    return jobs
+
+
+def replace_rollups(start_date: str, end_date: str, count_rows: list, salary_rows: list,
+                    sketch_rows: list = ()):
+    """
+    Replace the days' rollups with the recomputed rows.
+
+    One replace_report_rollup_day RPC (migration 034) per day swaps the
+    day's rows in all three tables in a single transaction, so readers
+    never see a deleted or half-written day. Days without rows are cleared.
+    """
+    by_day = defaultdict(lambda: {'p_counts': [], 'p_salaries': [], 'p_sketches': []})
+    for param, rows in (('p_counts', count_rows), ('p_salaries', salary_rows), ('p_sketches', sketch_rows)):
+        for row in rows:
+            by_day[row['posted_date']][param].append(row)
+
+    for day in _all_days(start_date, end_date):
+        supabase.rpc('replace_report_rollup_day', {'p_posted_date': day, **by_day[day]}).execute()
+
+
+def _day_ranges(days: List[str], max_days: int = BACKFILL_CHUNK_DAYS) -> List[Tuple[str, str]]:
+    """Group sorted YYYY-MM-DD days into contiguous ranges of at most max_days."""
+    ranges = []
+    for day in days:
+        current = date.fromisoformat(day)
+        if ranges:
+            start, end = ranges[-1]
+            if current == end + timedelta(days=1) and (current - start).days < max_days:
+                ranges[-1] = (start, current)
+                continue
+        ranges.append((current, current))
+    return [(start.isoformat(), end.isoformat()) for start, end in ranges]
+
+
+def _all_days(start_date: str, end_date: str) -> List[str]:
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+def refresh_report_rollups(start_date: str = None, end_date: str = None,
+                           dry_run: bool = False) -> dict:
+    """
+    Recompute the daily rollups for a date range, or incrementally.
+
+    Without dates, recomputes the days marked dirty since the last finished
+    run; until a backfill has finished, backfills from the earliest
+    posted_date. The run is recorded only once every chunk is written, and
+    the dirty days it covered are then pruned.
+
+    Args:
+        start_date: First posted_date to recompute (YYYY-MM-DD)
+        end_date: Last posted_date to recompute (default: today)
+        dry_run: Compute but don't write
+
+    Returns:
+        Stats dict (days, jobs, count_rows, salary_rows, sketch_rows).
+    """
+    # Days marked while the run is going stay dirty for the next run
+    computed_at = datetime.now(timezone.utc).isoformat()
+    today = datetime.now(timezone.utc).date().isoformat()
+
+    if start_date:
+        kind = 'range'
+        days = _all_days(start_date, end_date or today)
+    else:
+        watermark = fetch_rollup_watermark()
+        if watermark:
+            kind = 'incremental'
+            print(f"[ROLLUP] Incremental since {watermark}")
+            days = find_dirty_days(watermark)
+        else:
+            kind = 'backfill'
+            first = find_first_posted_date()
+            print(f"[ROLLUP] No finished rollup run yet - backfilling from {first}")
+            days = _all_days(first, today) if first else []
+
+    stats = {'days': len(days), 'jobs': 0, 'count_rows': 0, 'salary_rows': 0, 'sketch_rows': 0}
+    if not days:
+        print("[ROLLUP] Nothing to recompute")
+        if not dry_run and kind == 'incremental':
+            record_rollup_run(kind, computed_at, days, 0)
+            prune_dirty_days(computed_at)
+        return stats
+
+    for range_start, range_end in _day_ranges(days):
+        jobs = fetch_jobs_for_days(range_start, range_end)
+        count_rows, salary_rows = compute_daily_rollups(jobs, computed_at)
+        sketch_rows = compute_daily_sketches(salary_rows, computed_at)
+        stats['jobs'] += len(jobs)
+        stats['count_rows'] += len(count_rows)
+        stats['salary_rows'] += len(salary_rows)
+        stats['sketch_rows'] += len(sketch_rows)
+        print(f"[ROLLUP] {range_start} to {range_end}: {len(jobs):,} jobs -> "
+              f"{len(count_rows):,} count rows, {len(salary_rows):,} salary rows, "
+              f"{len(sketch_rows):,} sketches")
+        if not dry_run:
+            replace_rollups(range_start, range_end, count_rows, salary_rows, sketch_rows)
+
+    if not dry_run:
+        record_rollup_run(kind, computed_at, days, stats['jobs'])
+        if kind in WATERMARK_RUN_KINDS:
+            prune_dirty_days(computed_at)
+    print(f"[ROLLUP] {'Would write' if dry_run else 'Wrote'} {stats['days']} days "
+          f"({stats['jobs']:,} jobs)")
+    return stats
+
+
+# ============================================
+# Rollup Report Engine
+# ============================================
+
+def _ranked(counts: dict) -> list:
+    """(value, count) pairs by count descending, ties by value."""
+    return sorted(sorted(counts.items(), key=lambda x: str(x[0])), key=lambda x: -x[1])
+
+
+def histogram_percentiles(histogram: dict) -> Tuple[int, List[float]]:
+    """
+    Sample size and p25/median/p75 of a {value: count} histogram.
+
+    Same as sorted(values)[int(n * q)] over the expanded values.
+    """
+    items = sorted((float(value), int(count)) for value, count in histogram.items())
+    n = sum(count for _, count in items)
+    results = []
+    for q in (0.25, 0.50, 0.75):
+        k = int(n * q)
+        seen = 0
+        for value, count in items:
+            seen += count
+            if seen > k:
+                results.append(value)
+                break
+    return n, results
+
+
+class RollupReportEngine:
+    """
+    Computes ReportGenerator's metric sections from summed daily rollups.
+
+    Labels, the employer merge map and employer_metadata come from the
+    ReportGenerator passed in, like ColumnarReportEngine.
+    """
+
+    # Salary percentile source: exact histograms or merged t-digests
+    QUANTILES = ('exact', 'sketch')
+
+    def __init__(self, generator, quantiles: str = 'exact'):
+        if quantiles not in self.QUANTILES:
+            raise ValueError(f"Unknown quantiles '{quantiles}' (expected one of {self.QUANTILES})")
+        self.generator = generator
+        self.quantiles = quantiles
+
+    def fetch(self, city_code: str, job_family: str, start_date: str, end_date: str,
+              skill_pairs: bool = False) -> dict:
+        """
+        Summed rollups for a report range ({counts, salary, days}, plus sketches).
+
+        Args:
+            skill_pairs: Also compute the window's top skill pairs (skill_pairs
+                         key) from a skills-only job fetch; O(jobs in window)
+        """
+        result = self.generator.supabase.rpc('get_report_rollup', {
+            'p_city_code': city_code,
+            'p_job_family': job_family,
+            'p_start_date': start_date,
+            'p_end_date': end_date,
+        }).execute()
+        rollup = result.data or {}
+        if self.quantiles == 'sketch':
+            rollup['sketches'] = self.fetch_sketches([city_code], job_family, start_date, end_date)
+        with_skills = ((rollup.get('counts') or {}).get('summary') or {}).get('with_skills')
+        if skill_pairs and rollup.get('days') and with_skills:
+            jobs = self.generator._fetch_all_jobs(city_code, job_family, start_date, end_date,
+                                                  columns='skills,is_agency')
+            rollup['skill_pairs'] = self.skill_pairs(jobs)
+        return rollup
+
+    @staticmethod
+    def skill_pairs(jobs: list, k: int = 10) -> list:
+        """Top [skill_1, skill_2, count] pairs over direct jobs (as _calculate_skills_metrics)."""
+        from pipeline.skill_cooccurrence import SkillIncidence
+        direct = [j for j in jobs if not j.get('is_agency') and j.get('skills')]
+        return [list(pair) for pair in SkillIncidence.from_jobs(direct).top_pairs(k)]
+
+    def fetch_sketches(self, city_codes: list, job_family: str, start_date: str, end_date: str) -> dict:
+        """Daily salary sketches for the cities/range, merged ({segment: {value: TDigest}})."""
+        result = self.generator.supabase.rpc('get_report_salary_sketches', {
+            'p_city_codes': list(city_codes),
+            'p_job_family': job_family,
+            'p_start_date': start_date,
+            'p_end_date': end_date,
+        }).execute()
+        return merge_salary_sketches(result.data or [])
+
+    def salary_percentiles(self, rollup: dict) -> dict:
+        """{segment: {segment_value: (sample, [p25, median, p75])}} from sketches or histograms."""
+        if 'sketches' in rollup:
+            return {
+                segment: {value: (sketch.count, sketch.percentiles()) for value, sketch in values.items()}
+                for segment, values in rollup['sketches'].items()
+            }
+        return {
+            segment: {value: histogram_percentiles(histogram) for value, histogram in values.items()}
+            for segment, values in (rollup.get('salary') or {}).items()
+        }
+
+    def calculate(self, rollup: dict, city_code: str, job_family: str) -> dict:
+        """
+        Compute every metric section from a get_report_rollup() document.
+
+        Returns:
+            Dict of metric sections (see ReportGenerator._calculate_metrics)
+        """
+        g = self.generator
+        counts = rollup.get('counts') or {}
+        summary = counts.get('summary', {})
+        direct = summary.get('direct', 0)
+        ats = summary.get('ats', 0)
+
+        subfamily_labels = g.SUBFAMILY_LABELS_BY_FAMILY.get(job_family, g.DATA_SUBFAMILY_LABELS)
+        arrangement_dist = self.distribution(counts.get('working_arrangement', {}), ats, g.ARRANGEMENT_LABELS)
+        arrangement_dist['ats_job_count'] = ats
+        arrangement_dist['total_job_count'] = direct
+
+        return {
+            'total_count': summary.get('total', 0),
+            'direct_count': direct,
+            'agency_count': summary.get('agency', 0),
+            'employer_metrics': self.employer_metrics(counts.get('employer', {}), direct),
+            'seniority_metrics': self.seniority_metrics(counts.get('seniority', {}), direct),
+            'subfamily_dist': self.distribution(counts.get('job_subfamily', {}), direct, subfamily_labels),
+            'track_dist': self.distribution(counts.get('track', {}), direct, g.TRACK_LABELS),
+            'arrangement_dist': arrangement_dist,
+            'skills_metrics': self.skills_metrics(counts, direct, rollup.get('skill_pairs') or []),
+            'metadata_metrics': self.metadata_metrics(counts.get('employer', {}), direct),
+            'compensation_metrics': self.compensation_metrics(
+                rollup, summary.get('with_salary', 0), direct, city_code
+            ),
+        }
+
+    def distribution(self, counts: dict, total: int, labels: dict = None) -> dict:
+        """Rollup _calculate_distribution (same output, ties by value)."""
+        counts = {value: count for value, count in counts.items() if _known(value)}
+        known = sum(counts.values())
+        coverage = known / total if total > 0 else 0
+
+        distribution = []
+        for value, count in _ranked(counts):
+            pct = count / known if known > 0 else 0
+            distribution.append({
+                'code': value,
+                'label': labels.get(value, value) if labels else value,
+                'count': count,
+                'percentage': round(pct * 100),
+            })
+
+        return {
+            'distribution': distribution,
+            'total': total,
+            'known': known,
+            'unknown': total - known,
+            'coverage': round(coverage * 100),
+        }
+
+    def employer_metrics(self, employer_counts: dict, total_jobs: int) -> dict:
+        """Rollup _calculate_employer_metrics (same output, ties by name)."""
+        g = self.generator
+        ranked = _ranked(g._merge_employer_counts(employer_counts))
+
+        unique_employers = len(ranked)
+        jobs_per_employer = total_jobs / unique_employers if unique_employers > 0 else 0
+
+        top_employers = []
+        for emp, count in ranked[:15]:
+            pct = count / total_jobs if total_jobs > 0 else 0
+            top_employers.append({
+                'name': g._get_display_name(emp),
+                'count': count,
+                'percentage': round(pct * 100),
+            })
+
+        counts_sorted = [c for _, c in ranked]
+        top_5_concentration = sum(counts_sorted[:5]) / total_jobs if total_jobs > 0 else 0
+        top_15_concentration = sum(counts_sorted[:15]) / total_jobs if total_jobs > 0 else 0
+
+        return {
+            'unique_employers': unique_employers,
+            'jobs_per_employer': round(jobs_per_employer, 2),
+            'top_5_concentration': round(top_5_concentration * 100),
+            'top_15_concentration': round(top_15_concentration * 100),
+            'top_employers': top_employers,
+        }
+
+    def seniority_metrics(self, seniority_counts: dict, total: int) -> dict:
+        """Rollup _calculate_seniority_metrics (same output)."""
+        dist = self.distribution(seniority_counts, total, self.generator.SENIORITY_LABELS)
+        counts = {item['code']: item['count'] for item in dist['distribution']}
+
+        senior_plus = counts.get('senior', 0) + counts.get('staff_principal', 0) + counts.get('director_plus', 0)
+        junior = counts.get('junior', 0)
+        senior_to_junior = senior_plus / junior if junior > 0 else float('inf')
+
+        entry_level = counts.get('junior', 0) + counts.get('mid', 0)
+        entry_accessibility = entry_level / dist['known'] if dist['known'] > 0 else 0
+
+        return {
+            **dist,
+            'senior_to_junior_ratio': round(senior_to_junior) if senior_to_junior != float('inf') else None,
+            'entry_accessibility_rate': round(entry_accessibility * 100),
+        }
+
+    def skills_metrics(self, counts: dict, total: int, pairs: list = ()) -> dict:
+        """Rollup _calculate_skills_metrics (same output, top skill ties by name).
+
+        Args:
+            pairs: [skill_1, skill_2, count] from skill_pairs()
+        """
+        with_skills = counts.get('summary', {}).get('with_skills', 0)
+        if not with_skills:
+            return {
+                'total_with_skills': 0,
+                'coverage': 0,
+                'top_skills': [],
+                'skill_pairs': [],
+            }
+
+        top_skills = [
+            {'name': name, 'count': count, 'percentage': round(count / with_skills * 100)}
+            for name, count in _ranked(counts.get('skill', {}))[:15]
+        ]
+
+        skill_pairs = [
+            {'skill_1': s1, 'skill_2': s2, 'count': count, 'percentage': round(count / with_skills * 100)}
+            for s1, s2, count in pairs
+        ]
+
+        coverage = with_skills / total if total else 0
+
+        return {
+            'total_with_skills': with_skills,
+            'coverage': round(coverage * 100),
+            'top_skills': top_skills,
+            'skill_pairs': skill_pairs,
+        }
+
+    def metadata_metrics(self, employer_counts: dict, total: int) -> dict:
+        """Rollup _calculate_metadata_enriched_metrics (same output, ties by code)."""
+        g = self.generator
+        meta_lookup = g._fetch_employer_metadata()
+
+        fields = {'industry': Counter(), 'employer_size': Counter(), 'maturity': Counter(), 'ownership': Counter()}
+        matched_count = 0
+        for name, count in employer_counts.items():
+            meta = meta_lookup.get(normalize_employer_name(name))
+            if not meta:
+                continue
+            matched_count += count
+            if meta.get('industry'):
+                fields['industry'][meta['industry']] += count
+            if meta.get('employer_size'):
+                fields['employer_size'][meta['employer_size']] += count
+            if meta.get('founding_year'):
+                maturity = calculate_maturity_category(meta['founding_year'])
+                if maturity:
+                    fields['maturity'][maturity] += count
+            if meta.get('ownership_type'):
+                fields['ownership'][meta['ownership_type']] += count
+
+        def build_distribution(counts, labels=None):
+            if not counts:
+                return {'distribution': [], 'total': 0, 'coverage': 0}
+
+            total_known = sum(counts.values())
+            dist = []
+            for code, count in _ranked(counts):
+                pct = count / total_known if total_known > 0 else 0
+                dist.append({
+                    'code': code,
+                    'label': labels.get(code, code) if labels else code,
+                    'count': count,
+                    'percentage': round(pct * 100),
+                })
+
+            return {
+                'distribution': dist,
+                'total': total_known,
+                'coverage': round(total_known / total * 100) if total > 0 else 0,
+            }
+
+        return {
+            'matched_jobs': matched_count,
+            'match_rate': round(matched_count / total * 100) if total > 0 else 0,
+            'industry': build_distribution(fields['industry'], g.INDUSTRY_LABELS),
+            'employer_size': build_distribution(fields['employer_size'], g.SIZE_LABELS),
+            'maturity': build_distribution(fields['maturity'], {
+                'young': 'Young (<=5 yrs)',
+                'growth': 'Growth (6-15 yrs)',
+                'mature': 'Mature (>15 yrs)',
+            }),
+            'ownership': build_distribution(fields['ownership'], {
+                'private': 'Private',
+                'public': 'Public',
+                'subsidiary': 'Subsidiary',
+                'acquired': 'Acquired',
+            }),
+        }
+
+    def _segment_percentiles(self, segments: dict, labels: dict, key: str) -> list:
+        """Per-segment salary percentiles for segments with >= 10 salaries."""
+        stats = []
+        for value in sorted(segments):
+            n, percentiles = segments[value]
+            if not _known(value) or n < 10:
+                continue
+            p25, median, p75 = percentiles
+            stats.append({
+                key: value,
+                'label': labels.get(value, value),
+                'p25': round(p25),
+                'median': round(median),
+                'p75': round(p75),
+                'sample': n,
+            })
+        return sorted(stats, key=lambda x: -x['median'])
+
+    def compensation_metrics(self, rollup: dict, with_salary: int, total: int, city_code: str) -> dict:
+        """Rollup _calculate_compensation_metrics (same output)."""
+        g = self.generator
+        if city_code not in g.COMPENSATION_CITIES:
+            return {
+                'available': False,
+                'reason': 'Compensation data excluded due to low disclosure rates in markets without pay transparency legislation.',
+            }
+
+        if with_salary < 20:
+            return {
+                'available': False,
+                'reason': f'Insufficient salary data ({with_salary} jobs with salary disclosed).',
+            }
+
+        salary = self.salary_percentiles(rollup)
+        _, (p25, median, p75) = salary['overall']['']
+        coverage = with_salary / total if total else 0
+
+        return {
+            'available': True,
+            'total_with_salary': with_salary,
+            'coverage': round(coverage * 100),
+            'overall': {
+                'p25': round(p25),
+                'median': round(median),
+                'p75': round(p75),
+                'iqr': round(p75 - p25),
+            },
+            'by_seniority': self._segment_percentiles(salary.get('seniority', {}),
+                                                      g.SENIORITY_LABELS, 'seniority'),
+            'by_subfamily': self._segment_percentiles(salary.get('job_subfamily', {}),
+                                                      g.DATA_SUBFAMILY_LABELS, 'subfamily'),
+        }
+
+
+# ============================================
+# Sketch verification
+# ============================================
+
+def verify_salary_sketches(start_date: str, end_date: str, cities: list = None,
+                           families: list = None) -> list:
+    """
+    Compare merged-sketch salary percentiles with the exact histogram ones.
+
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        cities: City codes (default: VERIFY_CITIES)
+        families: Job families (default: VERIFY_FAMILIES)
+
+    Returns:
+        One dict per segment: city_code, job_family, segment, segment_value,
+        sample, exact, sketch and max_error_pct (largest relative error).
+    """
+    engine = RollupReportEngine(SimpleNamespace(supabase=supabase), quantiles='sketch')
+    results = []
+    for city_code in cities or VERIFY_CITIES:
+        for job_family in families or VERIFY_FAMILIES:
+            rollup = engine.fetch(city_code, job_family, start_date, end_date)
+            exact = engine.salary_percentiles({'salary': rollup.get('salary') or {}})
+            sketched = engine.salary_percentiles(rollup)
+            for segment, values in exact.items():
+                for value, (n, percentiles) in values.items():
+                    sketch_n, sketch_percentiles = sketched.get(segment, {}).get(value, (0, [None] * 3))
+                    errors = [abs(s - e) / e * 100 if s is not None and e else 100.0
+                              for s, e in zip(sketch_percentiles, percentiles)]
+                    results.append({
+                        'city_code': city_code, 'job_family': job_family,
+                        'segment': segment, 'segment_value': value,
+                        'sample': n, 'sketch_sample': sketch_n,
+                        'exact': percentiles, 'sketch': sketch_percentiles,
+                        'max_error_pct': round(max(errors), 3),
+                    })
+
+    worst = max(results, key=lambda r: r['max_error_pct'], default=None)
+    print(f"[SKETCH] {len(results)} segments verified for {start_date} to {end_date}")
+    if worst:
+        mismatched = sum(1 for r in results if r['sample'] != r['sketch_sample'])
+        print(f"[SKETCH] Max percentile error {worst['max_error_pct']:.3f}% "
+              f"({worst['city_code']}/{worst['job_family']} {worst['segment']}={worst['segment_value'] or '-'}, "
+              f"n={worst['sample']}); {mismatched} sample-size mismatches")
+    return results
+
+
+def main():
+    """CLI entry point for the nightly rollup stage."""
+    parser = argparse.ArgumentParser(
+        description='Refresh per-day report rollups (report_daily_counts / salary histograms)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python pipeline/report_rollups.py                                  # Incremental (nightly)
+    python pipeline/report_rollups.py --start 2025-12-01 --end 2025-12-31
+    python pipeline/report_rollups.py --dry-run
+    python pipeline/report_rollups.py --verify-sketches --start 2025-10-01 --end 2025-12-31
+        """
+    )
+    parser.add_argument('--start', type=str, default=None,
+                        help='Recompute from this posted_date (YYYY-MM-DD); default: incremental')
+    parser.add_argument('--end', type=str, default=None,
+                        help='Recompute up to this posted_date (YYYY-MM-DD); default: today')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Compute rollups without writing them')
+    parser.add_argument('--verify-sketches', action='store_true',
+                        help='Compare sketch percentiles with exact histograms for --start/--end, then exit')
+
+    args = parser.parse_args()
+
+    if args.verify_sketches:
+        if not (args.start and args.end):
+            parser.error('--verify-sketches requires --start and --end')
+        verify_salary_sketches(args.start, args.end)
+        return
+
+    print("=" * 70)
+    print("REPORT ROLLUPS")
+    print("=" * 70)
+    print(f"Timestamp: {datetime.now().isoformat()}")
+    print(f"Dry run: {args.dry_run}")
+    print()
+
+    refresh_report_rollups(args.start, args.end, dry_run=args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
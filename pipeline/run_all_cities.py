@@ -8,6 +8,10 @@ Usage:
 
 This script runs fetch_jobs.py for London, NYC, and Denver in parallel using
 Python's multiprocessing, significantly reducing total execution time.
+
+Before starting the cities it writes the config snapshot file (see
+pipeline/config_registry.py), so each fetch_jobs.py process loads the parsed
+configs and compiled lookups from one pickle instead of re-parsing the YAML/JSON.
 """
 
 import subprocess
@@ -16,6 +20,9 @@ import argparse
 from multiprocessing import Process
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pipeline.config_registry import write_snapshot_file
+
 
 def run_city(city: str, max_jobs: int, sources: str) -> None:
     """Run fetch_jobs.py for a single city."""
@@ -68,6 +75,13 @@ Examples:
         print("Please run this script from the job-analytics project root directory")
         sys.exit(1)
 
+    # Parse configs once here; the city processes load the snapshot file
+    try:
+        snapshot_path = write_snapshot_file()
+        print(f"Config snapshot: {snapshot_path}")
+    except Exception as e:
+        print(f"Warning: could not write config snapshot ({e}); cities will parse configs")
+
     cities = ["lon", "nyc", "den"]
 
     print("\n" + "="*60)
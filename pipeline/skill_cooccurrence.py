@@ -0,0 +1,226 @@
+"""
+Skill Co-occurrence - Sparse job x skill incidence matrix.
+
+Jobs' skill lists become one sparse 0/1 incidence matrix X (rows = jobs,
+columns = distinct skill names in sorted order). Skill support is the column
+sum and pair co-occurrence is the Gram matrix X^T X, computed only over
+skills at or above a support threshold. A pair can co-occur in at most
+min(support_a, support_b) jobs, so top_pairs() first bounds the k-th pair
+count from the most frequent skills and drops every skill below that bound;
+the result is still exact.
+
+The same matrix gives pair lift/PMI (associations) and top skills per
+segment (a sparse segment x job indicator times X).
+
+top_pairs() ranks like ReportGenerator's Counter.most_common(): count
+descending, ties in first-seen order (the first job where both skills
+appear, then skill names).
+
+Usage:
+    from pipeline.skill_cooccurrence import SkillIncidence
+
+    incidence = SkillIncidence.from_jobs(jobs)
+    for skill_1, skill_2, count in incidence.top_pairs(10):
+        print(skill_1, skill_2, count)
+
+    incidence.associations(min_support=20, min_count=5)      # lift / PMI
+    incidence.top_skills_by_segment([j['job_family'] for j in jobs], k=10)
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# ============================================
+# Configuration
+# ============================================
+
+# Most frequent skills used to bound the k-th pair count in top_pairs()
+BOUND_SKILLS = 32
+
+
+def _pair_name(skill) -> str:
+    """Skill name as ReportGenerator keys skill pairs."""
+    return skill.get('name', '') if isinstance(skill, dict) else str(skill)
+
+
+class SkillIncidence:
+    """
+    Sparse job x skill incidence matrix.
+
+    Attributes:
+        names: Distinct skill names, sorted (column order)
+        job_ids: Job row ids (from the rows passed in), sorted (row order)
+        matrix: CSR matrix (jobs x skills) of 0/1 int32
+        support: Jobs per skill (column sums)
+        n_jobs: Jobs in the population (denominator for lift/PMI)
+    """
+
+    def __init__(self, rows: Sequence[int], names: Sequence[str], n_jobs: Optional[int] = None):
+        """
+        Args:
+            rows: Job row id for each (job, skill) mention
+            names: Skill name for each mention (repeats within a job are ignored)
+            n_jobs: Population size for lift/PMI (default: jobs with a skill)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        self.job_ids, job_codes = np.unique(rows, return_inverse=True)
+        self.names, skill_codes = np.unique(np.asarray(names, dtype=object), return_inverse=True)
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (job_codes.ravel(), skill_codes.ravel())),
+            shape=(len(self.job_ids), len(self.names)),
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1
+        self.matrix = matrix
+        self.support = np.asarray(matrix.sum(axis=0)).ravel().astype(np.int64)
+        self.n_jobs = len(self.job_ids) if n_jobs is None else n_jobs
+        self._columns = None
+
+    @classmethod
+    def from_jobs(cls, jobs: list, n_jobs: Optional[int] = None) -> 'SkillIncidence':
+        """Build from enriched_jobs rows (row id = position in jobs)."""
+        rows, names = [], []
+        for position, job in enumerate(jobs):
+            for skill in job.get('skills') or []:
+                rows.append(position)
+                names.append(_pair_name(skill))
+        return cls(rows, names, n_jobs)
+
+    # ----------------------------------------
+    # Co-occurrence
+    # ----------------------------------------
+
+    def cooccurrence(self, min_support: int = 1) -> Tuple[np.ndarray, sparse.csr_matrix]:
+        """
+        X^T X over skills with support >= min_support.
+
+        Returns:
+            (skill indices into names, Gram matrix; diagonal = support)
+        """
+        keep = np.flatnonzero(self.support >= min_support)
+        subset = self.matrix[:, keep]
+        return keep, (subset.T @ subset).tocsr()
+
+    def _pairs(self, min_support: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Co-occurring pairs (a < b, indices into names) and their job counts."""
+        keep, gram = self.cooccurrence(min_support)
+        gram = sparse.triu(gram, k=1).tocoo()
+        return keep[gram.row], keep[gram.col], gram.data.astype(np.int64)
+
+    def _pair_count_bound(self, k: int) -> int:
+        """A count the k-th largest pair count is known to reach (pairs of frequent skills)."""
+        frequent = np.argsort(-self.support, kind='stable')[:max(BOUND_SKILLS, k)]
+        subset = self.matrix[:, np.sort(frequent)]
+        counts = sparse.triu(subset.T @ subset, k=1).tocoo().data
+        return int(np.sort(counts)[-k]) if len(counts) >= k else 1
+
+    def _first_cooccurrence(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Row position of the first job containing both skills, per pair."""
+        if self._columns is None:
+            self._columns = self.matrix.tocsc()
+            self._columns.sort_indices()
+        indptr, indices = self._columns.indptr, self._columns.indices
+        return np.array([
+            np.intersect1d(indices[indptr[i]:indptr[i + 1]], indices[indptr[j]:indptr[j + 1]],
+                           assume_unique=True)[0]
+            for i, j in zip(a.tolist(), b.tolist())
+        ], dtype=np.int64)
+
+    def top_pairs(self, k: int = 10, min_support: int = 1) -> List[Tuple[str, str, int]]:
+        """
+        Most frequent skill pairs.
+
+        Args:
+            k: Pairs to return
+            min_support: Ignore skills in fewer jobs than this
+
+        Returns:
+            [(skill_1, skill_2, jobs)] with skill_1 < skill_2, count descending,
+            ties in first-seen order
+        """
+        if k <= 0 or len(self.names) < 2:
+            return []
+        a, b, counts = self._pairs(max(min_support, self._pair_count_bound(k)))
+        if len(counts) > k:
+            selected = counts >= np.sort(counts)[-k]
+            a, b, counts = a[selected], b[selected], counts[selected]
+
+        order = np.lexsort((b, a, self._first_cooccurrence(a, b), -counts))[:k]
+        return [(self.names[a[i]], self.names[b[i]], int(counts[i])) for i in order.tolist()]
+
+    def associations(self, min_support: int = 20, min_count: int = 5, k: int = 20,
+                     by: str = 'lift') -> List[dict]:
+        """
+        Skill pairs ranked by lift or PMI.
+
+        lift = P(a, b) / (P(a) P(b)) over n_jobs; pmi = log2(lift).
+
+        Args:
+            min_support: Ignore skills in fewer jobs than this (rare skills inflate lift)
+            min_count: Ignore pairs co-occurring in fewer jobs than this
+            k: Pairs to return
+            by: 'lift' or 'pmi' (same order), or 'count'
+
+        Returns:
+            [{skill_1, skill_2, count, support_1, support_2, lift, pmi}]
+        """
+        a, b, counts = self._pairs(min_support)
+        selected = counts >= min_count
+        a, b, counts = a[selected], b[selected], counts[selected]
+        lift = counts * self.n_jobs / (self.support[a] * self.support[b])
+
+        primary, secondary = (-counts, -lift) if by == 'count' else (-lift, -counts)
+        order = np.lexsort((b, a, secondary, primary))[:k]
+        return [
+            {
+                'skill_1': self.names[a[i]],
+                'skill_2': self.names[b[i]],
+                'count': int(counts[i]),
+                'support_1': int(self.support[a[i]]),
+                'support_2': int(self.support[b[i]]),
+                'lift': round(float(lift[i]), 3),
+                'pmi': round(math.log2(lift[i]), 3),
+            }
+            for i in order.tolist()
+        ]
+
+    # ----------------------------------------
+    # Segments
+    # ----------------------------------------
+
+    def top_skills_by_segment(self, segments: Sequence, k: int = 10) -> Dict[str, List[dict]]:
+        """
+        Top skills within each segment (job family, city, seniority, ...).
+
+        Args:
+            segments: Segment value per job row id (segments[row]); None skips the job
+            k: Skills per segment
+
+        Returns:
+            {segment: [{name, count, percentage}]}, percentage of the segment's
+            jobs with skills; ties by name
+        """
+        labels = np.asarray(segments, dtype=object)[self.job_ids]
+        codes, uniques = pd.factorize(labels)
+        known = codes >= 0
+        indicator = sparse.csr_matrix(
+            (np.ones(int(known.sum()), dtype=np.int32), (codes[known], np.flatnonzero(known))),
+            shape=(len(uniques), len(self.job_ids)),
+        )
+        counts = (indicator @ self.matrix).toarray()
+        jobs = np.bincount(codes[known], minlength=len(uniques))
+
+        result = {}
+        for s, segment in enumerate(uniques):
+            order = np.argsort(-counts[s], kind='stable')[:k]
+            result[segment] = [
+                {'name': self.names[i], 'count': int(counts[s, i]),
+                 'percentage': round(counts[s, i] / jobs[s] * 100)}
+                for i in order.tolist() if counts[s, i] > 0
+            ]
+        return result
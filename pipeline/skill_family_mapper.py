@@ -16,6 +16,13 @@ Canonical names:
   get_canonical_name() returns the proper casing (e.g., "pytorch" -> "PyTorch").
   enrich_skills_with_families() normalizes names before database upsert.
 
+Skill index:
+  Both stages are precomputed into a single SkillIndex, so one lookup returns
+  (canonical_name, family_code) and repeated raw inputs are served from an LRU.
+  An optional fuzzy stage (fuzzy=True) resolves near-misses such as typos
+  ("Kubernets" -> "Kubernetes") via a character n-gram index plus a bounded
+  edit distance. It is off by default so mappings stay deterministic.
+
 Usage:
     from pipeline.skill_family_mapper import get_skill_family, get_canonical_name, enrich_skills_with_families
 
@@ -27,16 +34,21 @@ Usage:
     name = get_canonical_name("pytorch")     # Returns "PyTorch"
     name = get_canonical_name("jira")        # Returns "JIRA"
 
+    # Canonical name + family in one lookup
+    name, family = lookup_skill("pytorch")    # Returns ("PyTorch", "deep_learning")
+    pairs = lookup_skills(["python", "Kubernets"], fuzzy=True)
+
     # Batch enrichment (normalizes names + adds family codes)
     skills = [{"name": "python"}, {"name": "SNOWFLAKE"}]
     enriched = enrich_skills_with_families(skills)
     # Returns [{"name": "Python", "family_code": "programming"}, ...]
 """
 
-import os
-import yaml
-from pathlib import Path
-from typing import Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from pipeline.config_registry import clear_config_cache, get_compiled, get_config
 
 # =============================================================================
 # Normalization
@@ -123,13 +135,7 @@ def _load_skill_mapping() -> tuple[dict[str, str], dict[str, str], dict[str, str
         - normalized_map: normalized -> family_code (fuzzy fallback)
         - canonical_map: lowercase -> YAML casing (canonical display name)
     """
-    config_path = Path(__file__).parent.parent / "config" / "skill_family_mapping.yaml"
-
-    if not config_path.exists():
-        raise FileNotFoundError(f"Skill family mapping not found: {config_path}")
-
-    with open(config_path, "r", encoding="utf-8") as f:
-        raw_mapping = yaml.safe_load(f)
+    raw_mapping = get_config("skill_family_mapping")
 
     # Invert: family -> [skills] becomes skill -> family
     exact_map: dict[str, str] = {}
@@ -150,21 +156,244 @@ def _load_skill_mapping() -> tuple[dict[str, str], dict[str, str], dict[str, str
     return exact_map, normalized_map, canonical_map
 
 
-# Global mappings loaded once at module import
-SKILL_TO_FAMILY, SKILL_TO_FAMILY_NORMALIZED, SKILL_TO_CANONICAL = _load_skill_mapping()
+def _build_skill_mapping() -> dict[str, dict[str, str]]:
+    """Build all skill lookup maps (config_registry builder)."""
+    exact_map, normalized_map, canonical_map = _load_skill_mapping()
+
+    # Build normalized -> canonical map for fuzzy canonical lookups
+    normalized_to_canonical: dict[str, str] = {}
+    for lower, canonical in canonical_map.items():
+        norm = _normalize(lower)
+        if norm not in normalized_to_canonical:
+            normalized_to_canonical[norm] = canonical
+
+    return {
+        "SKILL_TO_FAMILY": exact_map,
+        "SKILL_TO_FAMILY_NORMALIZED": normalized_map,
+        "SKILL_TO_CANONICAL": canonical_map,
+        "NORMALIZED_TO_CANONICAL": normalized_to_canonical,
+    }
+
+
+# Module attributes served by __getattr__ (keys of _build_skill_mapping())
+_MAPPING_NAMES = frozenset({
+    "SKILL_TO_FAMILY", "SKILL_TO_FAMILY_NORMALIZED", "SKILL_TO_CANONICAL", "NORMALIZED_TO_CANONICAL",
+})
+
+
+def __getattr__(name: str):
+    """Global mappings, built from the YAML on first access."""
+    if name in _MAPPING_NAMES:
+        return get_compiled("skill_mapping")[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# Skill Index
+# =============================================================================
+
+# Raw inputs memoized per index (LLM output repeats the same names constantly)
+_LOOKUP_CACHE_SIZE = 16384
+
+# Fuzzy stage: character n-gram size, and minimum length on both sides so
+# short names (R, Go, SQL, Java/Rust) are never fuzzed into each other
+_NGRAM_SIZE = 3
+_FUZZY_MIN_LEN = 5
+
+
+def _ngrams(text: str) -> Counter:
+    """Character n-grams of a space-padded string (as a multiset)."""
+    padded = f" {text} "
+    return Counter(padded[i:i + _NGRAM_SIZE] for i in range(len(padded) - _NGRAM_SIZE + 1))
+
+
+def _max_edits(length: int) -> int:
+    """Edit budget for a fuzzy match: 1 up to 9 chars, 2 from 10 chars."""
+    return 1 if length < 10 else 2
+
+
+def _edit_distance(a: str, b: str, max_dist: int) -> int:
+    """Levenshtein distance, giving up (returns max_dist + 1) once it exceeds max_dist."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,                        # deletion
+                current[j - 1] + 1,                     # insertion
+                previous[j - 1] + (char_a != char_b),   # substitution
+            ))
+        if min(current) > max_dist:
+            return max_dist + 1
+        previous = current
+    return previous[-1]
+
+
+class SkillIndex:
+    """
+    Precomputed skill lookup: raw name -> (canonical_name, family_code).
+
+    Stages, in order:
+      1. Exact (lowercase) match
+      2. Normalized match (plurals, UK/US spelling)
+      3. Optional fuzzy match: candidates sharing enough character n-grams
+         are verified with a bounded edit distance; ties between different
+         skills are treated as no match
+    Unknown skills fall back to a smart title-cased name and no family.
+
+    Results are memoized per (raw input, fuzzy) in an LRU that lives with the
+    index, so rebuilding the index also resets the cache. The index is
+    picklable (config snapshots); the LRU is rebuilt on unpickling.
+    """
+
+    def __init__(self, exact: dict[str, tuple[str, str]], normalized: dict[str, tuple[str, str]]):
+        self.exact = exact
+        self.normalized = normalized
+
+        # n-gram -> [(normalized key, occurrences in key)]
+        self._ngram_index: dict[str, list[tuple[str, int]]] = {}
+        for key in normalized:
+            if len(key) < _FUZZY_MIN_LEN:
+                continue
+            for gram, count in _ngrams(key).items():
+                self._ngram_index.setdefault(gram, []).append((key, count))
+
+        self._init_cache()
+
+    def _init_cache(self):
+        self._cached_lookup = lru_cache(maxsize=_LOOKUP_CACHE_SIZE)(self._lookup)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_cached_lookup"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_cache()
+
+    def lookup(self, skill_name: str, fuzzy: bool = False) -> tuple[str, Optional[str]]:
+        """
+        Resolve a raw skill name.
+
+        Args:
+            skill_name: The skill name (any casing/whitespace)
+            fuzzy: Also try the near-miss stage for unmapped names
+
+        Returns:
+            (canonical_name, family_code or None)
+        """
+        if not skill_name:
+            return "", None
+        return self._cached_lookup(skill_name, fuzzy)
+
+    def _lookup(self, skill_name: str, fuzzy: bool) -> tuple[str, Optional[str]]:
+        lower = skill_name.lower().strip()
+
+        hit = self.exact.get(lower)
+        if hit is None:
+            normalized = _normalize(lower)
+            hit = self.normalized.get(normalized)
+            if hit is None and fuzzy:
+                hit = self.fuzzy_match(normalized)
+
+        if hit is None:
+            return _smart_title_case(skill_name.strip()), None
+        return hit
+
+    def fuzzy_match(self, normalized: str) -> Optional[tuple[str, str]]:
+        """
+        Find the closest mapped skill within the edit budget.
+
+        Args:
+            normalized: Normalized (see _normalize) unmapped skill name
+
+        Returns:
+            (canonical_name, family_code) of the unique closest skill, or None
+        """
+        if len(normalized) < _FUZZY_MIN_LEN:
+            return None
+
+        max_dist = _max_edits(len(normalized))
+        grams = _ngrams(normalized)
+
+        # q-gram lemma: each edit destroys at most _NGRAM_SIZE n-grams
+        min_shared = sum(grams.values()) - max_dist * _NGRAM_SIZE
+        shared: Counter = Counter()
+        for gram, count in grams.items():
+            for key, key_count in self._ngram_index.get(gram, ()):
+                shared[key] += min(count, key_count)
+
+        best_dist = max_dist + 1
+        best: set[tuple[str, str]] = set()
+        for key, n_shared in shared.items():
+            if n_shared < min_shared or abs(len(key) - len(normalized)) > max_dist:
+                continue
+            dist = _edit_distance(normalized, key, max_dist)
+            if dist < best_dist:
+                best_dist, best = dist, {self.normalized[key]}
+            elif dist == best_dist:
+                best.add(self.normalized[key])
+
+        if len(best) != 1:
+            return None
+        return best.pop()
+
+
+def _build_skill_index() -> SkillIndex:
+    """Build the combined skill index (config_registry builder)."""
+    maps = get_compiled("skill_mapping")
+    exact = {
+        lower: (maps["SKILL_TO_CANONICAL"][lower], family)
+        for lower, family in maps["SKILL_TO_FAMILY"].items()
+    }
+    normalized = {
+        norm: (maps["NORMALIZED_TO_CANONICAL"][norm], family)
+        for norm, family in maps["SKILL_TO_FAMILY_NORMALIZED"].items()
+    }
+    return SkillIndex(exact, normalized)
+
 
-# Build normalized -> canonical map for fuzzy canonical lookups
-NORMALIZED_TO_CANONICAL: dict[str, str] = {}
-for _lower, _canonical in SKILL_TO_CANONICAL.items():
-    _norm = _normalize(_lower)
-    if _norm not in NORMALIZED_TO_CANONICAL:
-        NORMALIZED_TO_CANONICAL[_norm] = _canonical
+def clear_skill_cache():
+    """Drop the cached mapping, index and lookup LRU (useful for testing)."""
+    clear_config_cache(["skill_family_mapping", "skill_mapping", "skill_index"])
 
 
 # =============================================================================
 # Public API
 # =============================================================================
 
+def lookup_skill(skill_name: str, fuzzy: bool = False) -> tuple[str, Optional[str]]:
+    """
+    Get the canonical display name and family code for a skill in one lookup.
+
+    Args:
+        skill_name: The skill name (case-insensitive)
+        fuzzy: Also resolve near-misses (typos) against the mapping
+
+    Returns:
+        (canonical_name, family_code or None)
+    """
+    return get_compiled("skill_index").lookup(skill_name, fuzzy)
+
+
+def lookup_skills(skill_names: Iterable[str], fuzzy: bool = False) -> list[tuple[str, Optional[str]]]:
+    """
+    Batch version of lookup_skill(); each distinct name is resolved once.
+
+    Args:
+        skill_names: Skill names (duplicates are fine)
+        fuzzy: Also resolve near-misses (typos) against the mapping
+
+    Returns:
+        (canonical_name, family_code or None) per input name, in order
+    """
+    skill_names = list(skill_names)
+    index = get_compiled("skill_index")
+    resolved = {name: index.lookup(name, fuzzy) for name in dict.fromkeys(skill_names)}
+    return [resolved[name] for name in skill_names]
+
+
 def get_skill_family(skill_name: str) -> Optional[str]:
     """
     Get family code for a skill name.
@@ -178,21 +407,7 @@ def get_skill_family(skill_name: str) -> Optional[str]:
     Returns:
         Family code string or None if not found
     """
-    if not skill_name:
-        return None
-
-    lower = skill_name.lower().strip()
-
-    # 1. Exact match (fast path)
-    if lower in SKILL_TO_FAMILY:
-        return SKILL_TO_FAMILY[lower]
-
-    # 2. Normalized match (plural/spelling fallback)
-    normalized = _normalize(lower)
-    if normalized in SKILL_TO_FAMILY_NORMALIZED:
-        return SKILL_TO_FAMILY_NORMALIZED[normalized]
-
-    return None
+    return lookup_skill(skill_name)[1]
 
 
 def get_canonical_name(skill_name: str) -> str:
@@ -210,30 +425,16 @@ def get_canonical_name(skill_name: str) -> str:
     Returns:
         Canonical display name string
     """
-    if not skill_name:
-        return skill_name or ""
-
-    lower = skill_name.lower().strip()
-
-    # 1. Exact match
-    if lower in SKILL_TO_CANONICAL:
-        return SKILL_TO_CANONICAL[lower]
-
-    # 2. Normalized match
-    normalized = _normalize(lower)
-    if normalized in NORMALIZED_TO_CANONICAL:
-        return NORMALIZED_TO_CANONICAL[normalized]
-
-    # 3. Unknown skill: smart title-case (preserving acronyms)
-    return _smart_title_case(skill_name.strip())
+    return lookup_skill(skill_name)[0]
 
 
-def enrich_skills_with_families(skills: list[dict]) -> list[dict]:
+def enrich_skills_with_families(skills: list[dict], fuzzy: bool = False) -> list[dict]:
     """
     Enrich a list of skills with family codes and canonical names.
 
     Args:
         skills: List of skill dicts with at least {"name": "..."}
+        fuzzy: Also resolve near-misses (typos) against the mapping
 
     Returns:
         Same list with family_code added and name normalized to canonical form
@@ -241,10 +442,9 @@ def enrich_skills_with_families(skills: list[dict]) -> list[dict]:
     if not skills:
         return skills
 
-    for skill in skills:
-        name = skill.get("name", "")
-        skill["name"] = get_canonical_name(name)
-        family = get_skill_family(name)
+    resolved = lookup_skills((skill.get("name", "") for skill in skills), fuzzy=fuzzy)
+    for skill, (canonical, family) in zip(skills, resolved):
+        skill["name"] = canonical
         skill["family_code"] = family
 
     return skills
@@ -252,15 +452,16 @@ def enrich_skills_with_families(skills: list[dict]) -> list[dict]:
 
 def get_mapping_stats() -> dict:
     """Get statistics about the current mapping."""
+    maps = get_compiled("skill_mapping")
     families = {}
-    for skill, family in SKILL_TO_FAMILY.items():
+    for skill, family in maps["SKILL_TO_FAMILY"].items():
         if family not in families:
             families[family] = 0
         families[family] += 1
 
     return {
-        "total_skills_mapped": len(SKILL_TO_FAMILY),
-        "total_normalized": len(SKILL_TO_FAMILY_NORMALIZED),
+        "total_skills_mapped": len(maps["SKILL_TO_FAMILY"]),
+        "total_normalized": len(maps["SKILL_TO_FAMILY_NORMALIZED"]),
         "families": len(families),
         "skills_per_family": families,
     }
@@ -303,8 +504,11 @@ if __name__ == "__main__":
         "Go",               # short name, must not false match
         "jira",             # should canonicalize to JIRA
         "pytorch",          # should canonicalize to PyTorch
+        "Kubernets",        # typo: only resolved with fuzzy=True
     ]
     for skill in test_skills:
         family = get_skill_family(skill)
         canonical = get_canonical_name(skill)
-        print(f"  {skill} -> family={family}, canonical={canonical}")
+        fuzzy_canonical, fuzzy_family = lookup_skill(skill, fuzzy=True)
+        print(f"  {skill} -> family={family}, canonical={canonical}"
+              f" (fuzzy: {fuzzy_canonical}, {fuzzy_family})")
@@ -17,35 +17,35 @@ Usage:
 import sys
 sys.path.insert(0, '.')
 
-import os
 import json
 import time
 from datetime import datetime
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
-
-load_dotenv()
 
+from pipeline.config_registry import get_gemini_client
 from pipeline.db_connection import supabase
 
 # ============================================
 # Gemini Configuration
 # ============================================
 
-from google import genai
-from google.genai import types
+_summary_config = None
+
+
+def _get_summary_config():
+    """Build the Gemini generation config on first use."""
+    global _summary_config
 
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-if not GOOGLE_API_KEY:
-    raise ValueError("Missing GOOGLE_API_KEY in .env file")
+    if _summary_config is None:
+        from google.genai import types
+        _summary_config = types.GenerateContentConfig(
+            temperature=0.3,
+            max_output_tokens=500,
+            response_mime_type="application/json"
+        )
 
-gemini_client = genai.Client(api_key=GOOGLE_API_KEY)
+    return _summary_config
 
-_summary_config = types.GenerateContentConfig(
-    temperature=0.3,
-    max_output_tokens=500,
-    response_mime_type="application/json"
-)
 
 # ============================================
 # Prompt Template
@@ -93,10 +93,10 @@ def generate_summary(title: str, company: str, description: str, max_retries: in
 
     for attempt in range(max_retries):
         try:
-            response = gemini_client.models.generate_content(
+            response = get_gemini_client().models.generate_content(
                 model="gemini-2.5-flash-lite",
                 contents=prompt,
-                config=_summary_config
+                config=_get_summary_config()
             )
             result = json.loads(response.text)
 
@@ -9,23 +9,45 @@ Purpose:
 - Identify dead job postings (404s) before users click through
 - Prevent poor UX in curated job feed
 - Mark jobs as closed when URL returns 404
+
+URLs are checked by an async validator (httpx, one pooled client) that
+streams each page body and stops as soon as a soft-404 phrase is seen or
+STREAM_BYTE_CAP bytes have been read, instead of downloading whole career
+pages. A HostScheduler streams the checks across hosts with per-host
+concurrency and delay limits. Blocked URLs (403/202) are re-verified in a
+headless browser while the HTTP checks continue. A single
+BrowserPool keeps one Chromium process alive for the whole run and checks
+pages concurrently in isolated contexts, so each URL costs a page load rather
+than a browser start-up.
+
+Which jobs are checked is decided by RecheckPriority: each job gets the
+probability that it closed since its last check, from its age against the
+employer's median days-to-fill (employer_stats.py) and the source's closure
+rate. Likely-closed jobs are checked daily, unlikely ones every RECHECK_DAYS,
+and --limit spends the budget on the likeliest-closed jobs first.
 """
 
 import sys
 sys.path.insert(0, '.')
 
-import json
+import asyncio
+import queue
+import re
+import statistics
+import threading
 import time
+import httpx
 import requests
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
-from typing import Tuple, Optional, List, Dict
+from collections import deque
+from typing import Callable, Deque, Tuple, Optional, List, Dict
+from urllib.parse import urlsplit
+from pipeline.config_registry import get_compiled, get_config
 from pipeline.db_connection import supabase
 
 
 # ============================================
-# Greenhouse Config (loaded once)
+# Greenhouse Config (loaded on first use)
 # ============================================
 
 def _load_greenhouse_slug_config() -> Dict[str, str]:
@@ -34,10 +56,8 @@ def _load_greenhouse_slug_config() -> Dict[str, str]:
     Returns:
         Dict mapping slug (lowercase) to url_type ('embed', 'eu', or 'standard')
     """
-    config_path = Path(__file__).parent.parent / 'config' / 'greenhouse' / 'company_ats_mapping.json'
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = get_config('greenhouse_ats_mapping')
 
         slug_to_url_type = {}
         greenhouse_data = data.get('greenhouse', {})
@@ -52,8 +72,11 @@ def _load_greenhouse_slug_config() -> Dict[str, str]:
         return {}
 
 
-# Load once at module level
-GREENHOUSE_SLUG_TO_URL_TYPE = _load_greenhouse_slug_config()
+def __getattr__(name: str):
+    """GREENHOUSE_SLUG_TO_URL_TYPE is loaded on first access."""
+    if name == 'GREENHOUSE_SLUG_TO_URL_TYPE':
+        return get_compiled('greenhouse_slug_url_types')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def build_canonical_greenhouse_url(source_job_id: str, company_slug: str) -> Optional[str]:
@@ -70,7 +93,7 @@ def build_canonical_greenhouse_url(source_job_id: str, company_slug: str) -> Opt
         return None
 
     slug_lower = company_slug.lower()
-    url_type = GREENHOUSE_SLUG_TO_URL_TYPE.get(slug_lower, 'standard')
+    url_type = get_compiled('greenhouse_slug_url_types').get(slug_lower, 'standard')
 
     if url_type == 'embed':
         return f"https://boards.greenhouse.io/embed/job_app?for={slug_lower}&token={source_job_id}"
@@ -83,6 +106,7 @@ def build_canonical_greenhouse_url(source_job_id: str, company_slug: str) -> Opt
 
 # Playwright is optional - only needed for blocked URL verification
 try:
+    from playwright.async_api import async_playwright
     from playwright.sync_api import sync_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
@@ -97,12 +121,68 @@ except ImportError:
 REQUEST_TIMEOUT = 15  # seconds (increased from 10)
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-# Concurrency settings
+# Concurrency settings: requests in flight across all hosts
 MAX_WORKERS = 10
-BATCH_SIZE = 100
 
-# Recheck interval (don't recheck URLs checked within this period)
-RECHECK_DAYS = 3
+# Per-host politeness: concurrent requests and minimum seconds between request
+# starts on one host. ATS job boards built for crawler traffic get more room.
+PER_HOST_CONCURRENCY = 2
+PER_HOST_DELAY = 0.5
+HOST_LIMIT_OVERRIDES = {
+    'job-boards.greenhouse.io': (MAX_WORKERS, 0.0),
+    'job-boards.eu.greenhouse.io': (MAX_WORKERS, 0.0),
+    'boards.greenhouse.io': (MAX_WORKERS, 0.0),
+}
+
+# Consecutive 'blocked' responses after which a host's remaining URLs skip
+# HTTP and go straight to the browser fallback
+BLOCKED_HOST_THRESHOLD = 3
+
+# Progress line every N checked URLs
+PROGRESS_EVERY = 100
+
+# Database writes: ids per .in_() update, and max seconds results stay buffered
+DB_BATCH_SIZE = 500
+DB_FLUSH_INTERVAL = 5.0
+
+# Async validator: bytes of body scanned for soft-404 phrases before a page is
+# treated as active (the phrases sit near the top of real "closed" pages)
+STREAM_BYTE_CAP = 512 * 1024
+
+# Playwright fallback: concurrent isolated browser contexts, pages loaded per
+# context before it is recycled, and page load timeout
+PLAYWRIGHT_CONTEXTS = 4
+PLAYWRIGHT_PAGES_PER_CONTEXT = 25
+PLAYWRIGHT_TIMEOUT_MS = 30000
+
+# Resource types not needed to read page text (aborted in the browser)
+PLAYWRIGHT_BLOCKED_RESOURCES = {'image', 'font', 'media'}
+
+# Recheck scheduling. Jobs are ranked by the probability that they closed
+# since their last check (see RecheckPriority). A job is due once that
+# probability reaches MIN_CLOSURE_PROBABILITY, or RECHECK_DAYS after its last
+# check regardless; nothing is rechecked within MIN_RECHECK_DAYS.
+MIN_RECHECK_DAYS = 1
+RECHECK_DAYS = 7
+MIN_CLOSURE_PROBABILITY = 0.05
+
+# Fill-time model: log-logistic survival curve with the employer's median
+# days-to-fill as its scale. Employer medians are shrunk towards the overall
+# median with FILL_PRIOR_WEIGHT pseudo-samples; DEFAULT_DAYS_TO_FILL is used
+# when no employer stats exist at all.
+FILL_CURVE_SHAPE = 2.0
+FILL_PRIOR_WEIGHT = 3
+DEFAULT_DAYS_TO_FILL = 30.0
+
+# Source closure rates scale closure odds. A source's share of checked jobs
+# found closed is shrunk towards SOURCE_CLOSURE_PRIOR with
+# SOURCE_PRIOR_WEIGHT pseudo-checks; its odds relative to the prior's odds
+# are the factor (clamped). Absolute, so a single source still counts.
+SOURCE_CLOSURE_PRIOR = 0.25
+SOURCE_PRIOR_WEIGHT = 50
+SOURCE_FACTOR_RANGE = (0.5, 2.0)
+
+TERMINAL_STATUSES = ["404", "410", "soft_404"]
 
 # Soft 404 detection - patterns that indicate job is closed/gone even with 200 status
 SOFT_404_PATTERNS = [
@@ -137,12 +217,37 @@ BOT_PROTECTION_PATTERNS = [
     "enable javascript and cookies",
 ]
 
+# Single-pass matchers over lowercased content (one regex scan instead of a
+# substring scan per pattern)
+SOFT_404_MATCHER = re.compile('|'.join(re.escape(p) for p in SOFT_404_PATTERNS))
+BOT_PROTECTION_MATCHER = re.compile('|'.join(re.escape(p) for p in BOT_PROTECTION_PATTERNS))
+
+# Characters carried between streamed chunks so phrases split across chunk
+# boundaries still match
+_SOFT_404_OVERLAP = max(len(p) for p in SOFT_404_PATTERNS) - 1
+
+
+def _classify_rendered_page(content: str, final_url: str) -> Tuple[str, Optional[int], Optional[str]]:
+    """Classify lowercased rendered page content (bot wall, soft 404 or active)."""
+    # Check for bot protection (Cloudflare, CAPTCHA, etc.)
+    if BOT_PROTECTION_MATCHER.search(content):
+        return ('unverifiable', None, final_url)
+
+    # Check for soft 404 patterns in rendered content
+    if SOFT_404_MATCHER.search(content):
+        return ('soft_404', 200, final_url)
+
+    return ('active', 200, final_url)
+
 
 def check_url_playwright(url: str) -> Tuple[str, Optional[int], Optional[str]]:
     """
     Fallback URL check using Playwright for sites that block requests.
     Used for URLs that returned 403 (blocked) status.
 
+    Launches a browser for this one URL; use check_urls_playwright() for
+    more than a handful of URLs.
+
     Returns:
         Tuple of (status, http_code, final_url):
         - ('active', 200, url) for valid URLs with live job
@@ -156,32 +261,214 @@ def check_url_playwright(url: str) -> Tuple[str, Optional[int], Optional[str]]:
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
-            page.goto(url, timeout=30000, wait_until='domcontentloaded')
+            page.goto(url, timeout=PLAYWRIGHT_TIMEOUT_MS, wait_until='domcontentloaded')
 
             content = page.content().lower()
             final_url = page.url
 
             browser.close()
 
-            # Check for bot protection (Cloudflare, CAPTCHA, etc.)
-            for pattern in BOT_PROTECTION_PATTERNS:
-                if pattern in content:
-                    return ('unverifiable', None, final_url)
-
-            # Check for soft 404 patterns in rendered content
-            for pattern in SOFT_404_PATTERNS:
-                if pattern in content:
-                    return ('soft_404', 200, final_url)
-
-            return ('active', 200, final_url)
+            return _classify_rendered_page(content, final_url)
     except Exception:
         return ('unverifiable', None, None)
 
 
+async def _block_heavy_resources(route):
+    """Route handler: abort images/fonts/media, let everything else through."""
+    if route.request.resource_type in PLAYWRIGHT_BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _ContextSlot:
+    """A browser context plus the number of pages it has loaded."""
+
+    def __init__(self, context):
+        self.context = context
+        self.pages = 0
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium for checking many blocked URLs.
+
+    - One browser process for the whole run
+    - `contexts` isolated BrowserContexts (separate cookies/storage), each
+      checking one page at a time, so up to `contexts` pages load concurrently
+    - Images, fonts and media are aborted (only page text is needed)
+    - A context is recycled after `pages_per_context` pages, or after a failed
+      check (crash, timeout); the browser is relaunched if it disconnects
+
+    Usage:
+        async with BrowserPool(contexts=4) as pool:
+            results = await pool.check_many(urls)
+    """
+
+    def __init__(self, contexts: int = PLAYWRIGHT_CONTEXTS,
+                 pages_per_context: int = PLAYWRIGHT_PAGES_PER_CONTEXT,
+                 timeout_ms: int = PLAYWRIGHT_TIMEOUT_MS):
+        self.contexts = contexts
+        self.pages_per_context = pages_per_context
+        self.timeout_ms = timeout_ms
+        self.recycled = 0
+        self._playwright = None
+        self._browser = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> 'BrowserPool':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self):
+        """Launch the browser and open the contexts."""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True)
+        self._browser_lock = asyncio.Lock()
+        self._idle = asyncio.Queue()
+        for _ in range(self.contexts):
+            self._idle.put_nowait(_ContextSlot(await self._new_context()))
+
+    async def close(self):
+        """Close the browser (and with it every context)."""
+        try:
+            if self._browser:
+                await self._browser.close()
+        finally:
+            if self._playwright:
+                await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
+
+    async def _new_context(self):
+        context = await self._browser.new_context(user_agent=USER_AGENT)
+        await context.route("**/*", _block_heavy_resources)
+        return context
+
+    async def _recycle(self, slot: _ContextSlot):
+        """Replace a slot's context, relaunching the browser if it died."""
+        try:
+            await slot.context.close()
+        except Exception:
+            pass  # Context already gone with a crashed browser
+
+        async with self._browser_lock:
+            if not self._browser.is_connected():
+                self._browser = await self._playwright.chromium.launch(headless=True)
+
+        slot.context = await self._new_context()
+        slot.pages = 0
+        self.recycled += 1
+
+    async def check(self, url: str) -> Tuple[str, Optional[int], Optional[str]]:
+        """
+        Check one URL in the next free context.
+
+        Returns:
+            Same tuple as check_url_playwright()
+        """
+        slot = await self._idle.get()
+        failed = False
+        try:
+            page = await slot.context.new_page()
+            try:
+                await page.goto(url, timeout=self.timeout_ms, wait_until='domcontentloaded')
+                content = (await page.content()).lower()
+                final_url = page.url
+            finally:
+                await page.close()
+            slot.pages += 1
+            return _classify_rendered_page(content, final_url)
+        except Exception:
+            failed = True
+            return ('unverifiable', None, None)
+        finally:
+            try:
+                if failed or slot.pages >= self.pages_per_context:
+                    await self._recycle(slot)
+            except Exception:
+                pass  # Keep the slot; the next check on it will fail and retry
+            self._idle.put_nowait(slot)
+
+    async def check_many(self, urls: List[str]) -> List[Tuple[str, Optional[int], Optional[str]]]:
+        """Check URLs concurrently across the contexts; results are in input order."""
+        return await asyncio.gather(*(self.check(url) for url in urls))
+
+
+def check_urls_playwright(urls: List[str], contexts: int = PLAYWRIGHT_CONTEXTS
+                          ) -> List[Tuple[str, Optional[int], Optional[str]]]:
+    """
+    Check many blocked URLs with a shared BrowserPool.
+
+    Args:
+        urls: URLs to check
+        contexts: Concurrent browser contexts
+
+    Returns:
+        One (status, http_code, final_url) tuple per URL, in input order.
+        Every URL is 'unverifiable' if Playwright is unavailable or the
+        browser cannot be started.
+    """
+    if not urls:
+        return []
+    if not PLAYWRIGHT_AVAILABLE:
+        return [('unverifiable', None, None)] * len(urls)
+
+    async def _run():
+        async with BrowserPool(contexts=contexts) as pool:
+            return await pool.check_many(urls)
+
+    try:
+        return asyncio.run(_run())
+    except Exception as e:
+        print(f"   [PLAYWRIGHT] Browser pool failed: {e}")
+        return [('unverifiable', None, None)] * len(urls)
+
+
+def _classify_status(status_code: int, final_url: str) -> Optional[Tuple[str, Optional[int], Optional[str]]]:
+    """
+    Classify a response from its status code and final URL alone.
+
+    Returns:
+        Result tuple, or None for a 200 whose body still needs a soft-404 scan
+    """
+    if status_code == 404:
+        return ('404', status_code, final_url)
+    elif status_code == 410:
+        # 410 Gone = permanently removed, treat same as 404
+        return ('410', status_code, final_url)
+    elif status_code == 403:
+        # Bot detection / access denied
+        return ('blocked', status_code, final_url)
+    elif status_code >= 500:
+        return ('error', status_code, final_url)
+    elif status_code == 202:
+        # 202 Accepted = async loading page (e.g., Waymo), needs Playwright
+        return ('blocked', status_code, final_url)
+    elif status_code == 200:
+        # Check for URL-based error signals (e.g., ?error=true)
+        if 'error=true' in final_url.lower() or 'notfound' in final_url.lower():
+            return ('soft_404', status_code, final_url)
+        return None
+    elif 300 <= status_code < 400:
+        # Redirect not followed (shouldn't happen with redirects followed)
+        return ('redirect', status_code, final_url)
+    else:
+        # Other status codes (4xx besides 404)
+        return ('error', status_code, final_url)
+
+
 def check_url(url: str) -> Tuple[str, Optional[int], Optional[str]]:
     """
     Check a single URL and return its status.
 
+    Downloads the whole page; validate_urls() uses the streaming
+    check_urls() instead.
+
     Returns:
         Tuple of (status, http_code, final_url):
         - ('active', 200, url) for valid URLs with live job
@@ -203,36 +490,14 @@ def check_url(url: str) -> Tuple[str, Optional[int], Optional[str]]:
         status_code = response.status_code
         final_url = response.url
 
-        if status_code == 404:
-            return ('404', status_code, final_url)
-        elif status_code == 410:
-            # 410 Gone = permanently removed, treat same as 404
-            return ('410', status_code, final_url)
-        elif status_code == 403:
-            # Bot detection / access denied
-            return ('blocked', status_code, final_url)
-        elif status_code >= 500:
-            return ('error', status_code, final_url)
-        elif status_code == 202:
-            # 202 Accepted = async loading page (e.g., Waymo), needs Playwright
-            return ('blocked', status_code, final_url)
-        elif status_code == 200:
-            # Check for URL-based error signals (e.g., ?error=true)
-            if 'error=true' in final_url.lower() or 'notfound' in final_url.lower():
-                return ('soft_404', status_code, final_url)
-
-            # Check for soft 404 - page exists but content says job is gone
-            content_lower = response.text.lower()
-            for pattern in SOFT_404_PATTERNS:
-                if pattern in content_lower:
-                    return ('soft_404', status_code, final_url)
-            return ('active', status_code, final_url)
-        elif 300 <= status_code < 400:
-            # Redirect not followed (shouldn't happen with allow_redirects=True)
-            return ('redirect', status_code, final_url)
-        else:
-            # Other status codes (4xx besides 404)
-            return ('error', status_code, final_url)
+        result = _classify_status(status_code, final_url)
+        if result:
+            return result
+
+        # Check for soft 404 - page exists but content says job is gone
+        if SOFT_404_MATCHER.search(response.text.lower()):
+            return ('soft_404', status_code, final_url)
+        return ('active', status_code, final_url)
 
     except requests.exceptions.Timeout:
         return ('error', None, None)
@@ -242,6 +507,628 @@ def check_url(url: str) -> Tuple[str, Optional[int], Optional[str]]:
         return ('error', None, None)
 
 
+# ============================================
+# Async streaming validator
+# ============================================
+
+def new_async_client(max_connections: int = MAX_WORKERS) -> httpx.AsyncClient:
+    """
+    Shared async HTTP client for URL checks.
+
+    Keep-alive connections are pooled per host, so consecutive checks against
+    the same ATS reuse TCP/TLS connections.
+    """
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=REQUEST_TIMEOUT,
+        headers={'User-Agent': USER_AGENT},
+        limits=httpx.Limits(max_connections=max_connections,
+                            max_keepalive_connections=max_connections),
+    )
+
+
+async def check_url_async(client: httpx.AsyncClient, url: str,
+                          byte_cap: int = STREAM_BYTE_CAP) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Check a single URL, streaming the body only as far as needed.
+
+    Non-200 responses are classified from the status line without reading the
+    body. For 200s the body is decoded chunk by chunk and scanned with
+    SOFT_404_MATCHER over a rolling window; the download stops at the first
+    match ('soft_404') or once byte_cap bytes have been read ('active').
+
+    Returns:
+        Same tuple as check_url()
+    """
+    try:
+        async with client.stream('GET', url) as response:
+            status_code = response.status_code
+            final_url = str(response.url)
+
+            result = _classify_status(status_code, final_url)
+            if result:
+                return result
+
+            tail = ''
+            async for chunk in response.aiter_text():
+                window = tail + chunk.lower()
+                if SOFT_404_MATCHER.search(window):
+                    return ('soft_404', status_code, final_url)
+                if response.num_bytes_downloaded >= byte_cap:
+                    break
+                tail = window[-_SOFT_404_OVERLAP:]
+
+            return ('active', status_code, final_url)
+
+    except Exception:
+        # Any failure (transport, invalid URL, undecodable body) is an error
+        # status for this URL, never an exception that aborts the batch
+        return ('error', None, None)
+
+
+async def check_urls_async(urls: List[str], client: Optional[httpx.AsyncClient] = None,
+                           max_concurrency: int = MAX_WORKERS
+                           ) -> List[Tuple[str, Optional[int], Optional[str]]]:
+    """
+    Check URLs concurrently on one pooled client.
+
+    Args:
+        urls: URLs to check
+        client: Client to use (default: a new one from new_async_client())
+        max_concurrency: Requests in flight at once
+
+    Returns:
+        One result tuple per URL, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _check(c: httpx.AsyncClient, url: str):
+        async with semaphore:
+            return await check_url_async(c, url)
+
+    if client is not None:
+        return await asyncio.gather(*(_check(client, url) for url in urls))
+
+    async with new_async_client(max_concurrency) as own_client:
+        return await asyncio.gather(*(_check(own_client, url) for url in urls))
+
+
+def check_urls(urls: List[str], max_concurrency: int = MAX_WORKERS
+               ) -> List[Tuple[str, Optional[int], Optional[str]]]:
+    """Synchronous wrapper around check_urls_async()."""
+    if not urls:
+        return []
+    return asyncio.run(check_urls_async(urls, max_concurrency=max_concurrency))
+
+
+# ============================================
+# Per-host scheduler
+# ============================================
+
+def _host_of(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
+class _HostLane:
+    """Pending jobs and politeness state for one host."""
+
+    def __init__(self, host: str, concurrency: int, delay: float):
+        self.host = host
+        self.concurrency = concurrency
+        self.delay = delay
+        self.jobs: Deque[Dict] = deque()
+        self.next_start = 0.0
+        self.consecutive_blocked = 0
+        self.blocked = False
+        self.lock = asyncio.Lock()
+
+
+class HostScheduler:
+    """
+    Streams URL checks across hosts with per-host concurrency and delay.
+
+    Jobs are grouped into one lane per host. Each lane runs up to its host's
+    concurrency limit, spacing request starts by the host's delay, and all
+    lanes share a global limit of max_concurrency requests in flight (a FIFO
+    semaphore, so busy hosts interleave with the rest instead of stalling
+    them). There are no fixed batches: a worker picks up the next URL for its
+    host as soon as the previous one finishes.
+
+    Once a host returns blocked_host_threshold consecutive 'blocked'
+    responses, its remaining URLs are reported as blocked without an HTTP
+    request. Blocked jobs are also put on the optional fallback queue as soon
+    as they are known, for a concurrent browser check.
+
+    Usage:
+        scheduler = HostScheduler()
+        await scheduler.run(jobs, on_result)   # jobs: [{'url': ..., ...}]
+    """
+
+    def __init__(self, max_concurrency: int = MAX_WORKERS,
+                 per_host_concurrency: int = PER_HOST_CONCURRENCY,
+                 per_host_delay: float = PER_HOST_DELAY,
+                 host_overrides: Optional[Dict[str, Tuple[int, float]]] = None,
+                 blocked_host_threshold: int = BLOCKED_HOST_THRESHOLD):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_delay = per_host_delay
+        self.host_overrides = HOST_LIMIT_OVERRIDES if host_overrides is None else host_overrides
+        self.blocked_host_threshold = blocked_host_threshold
+        self.skipped = 0  # URLs routed to fallback without an HTTP request
+        self.blocked_hosts: List[str] = []
+
+    def _lanes(self, jobs: List[Dict]) -> List[_HostLane]:
+        lanes: Dict[str, _HostLane] = {}
+        for job in jobs:
+            host = _host_of(job['url'])
+            if host not in lanes:
+                concurrency, delay = self.host_overrides.get(
+                    host, (self.per_host_concurrency, self.per_host_delay))
+                lanes[host] = _HostLane(host, concurrency, delay)
+            lanes[host].jobs.append(job)
+        return list(lanes.values())
+
+    async def run(self, jobs: List[Dict],
+                  on_result: Callable[[Dict, Tuple[str, Optional[int], Optional[str]]], None],
+                  fallback: Optional[asyncio.Queue] = None,
+                  client: Optional[httpx.AsyncClient] = None):
+        """
+        Check every job's URL.
+
+        Args:
+            jobs: Dicts with at least a 'url' key
+            on_result: Called as on_result(job, (status, code, final_url)) for
+                every job, on the event loop thread (keep it quick)
+            fallback: Queue that receives each job whose result is 'blocked'
+            client: Client to use (default: a new one from new_async_client())
+        """
+        if client is None:
+            async with new_async_client(self.max_concurrency) as own_client:
+                return await self.run(jobs, on_result, fallback, own_client)
+
+        in_flight = asyncio.Semaphore(self.max_concurrency)
+
+        def report(job, result):
+            on_result(job, result)
+            if result[0] == 'blocked' and fallback is not None:
+                fallback.put_nowait(job)
+
+        async def lane_worker(lane: _HostLane):
+            while lane.jobs:
+                job = lane.jobs.popleft()
+
+                if lane.blocked:
+                    self.skipped += 1
+                    report(job, ('blocked', None, None))
+                    continue
+
+                # Space request starts on this host
+                async with lane.lock:
+                    wait = lane.next_start - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    lane.next_start = time.monotonic() + lane.delay
+
+                async with in_flight:
+                    result = await check_url_async(client, job['url'])
+
+                if result[0] == 'blocked':
+                    lane.consecutive_blocked += 1
+                    if lane.consecutive_blocked >= self.blocked_host_threshold and not lane.blocked:
+                        lane.blocked = True
+                        self.blocked_hosts.append(lane.host)
+                else:
+                    lane.consecutive_blocked = 0
+
+                report(job, result)
+
+        workers = [
+            lane_worker(lane)
+            for lane in self._lanes(jobs)
+            for _ in range(min(lane.concurrency, len(lane.jobs)))
+        ]
+        await asyncio.gather(*workers)
+
+
+async def _browser_fallback(fallback: asyncio.Queue,
+                            on_result: Callable[[Dict, Tuple[str, Optional[int], Optional[str]]], None],
+                            contexts: int = PLAYWRIGHT_CONTEXTS):
+    """
+    Check blocked jobs from the fallback queue in a BrowserPool until None arrives.
+
+    The browser is only launched once the first blocked job arrives. If it
+    cannot start, every queued job is reported 'unverifiable'.
+    """
+    job = await fallback.get()
+    if job is None:
+        return
+
+    async def check(pool, job):
+        on_result(job, await pool.check(job['url']))
+
+    try:
+        async with BrowserPool(contexts=contexts) as pool:
+            tasks = []
+            while job is not None:
+                tasks.append(asyncio.create_task(check(pool, job)))
+                job = await fallback.get()
+            await asyncio.gather(*tasks)
+    except Exception as e:
+        print(f"   [PLAYWRIGHT] Browser pool failed: {e}")
+        while job is not None:
+            on_result(job, ('unverifiable', None, None))
+            job = await fallback.get()
+
+
+async def check_jobs(jobs: List[Dict],
+                     on_result: Callable[[Dict, Tuple[str, Optional[int], Optional[str]]], None],
+                     on_browser_result: Optional[Callable] = None,
+                     scheduler: Optional[HostScheduler] = None,
+                     client: Optional[httpx.AsyncClient] = None) -> HostScheduler:
+    """
+    Check jobs over HTTP with the host scheduler, verifying blocked ones in a
+    browser concurrently.
+
+    Args:
+        jobs: Dicts with at least a 'url' key
+        on_result: Called with (job, result) for every HTTP result
+        on_browser_result: Called with (job, result) for every browser result;
+            None (or Playwright unavailable) disables the browser fallback
+        scheduler: Scheduler to use (default: HostScheduler())
+        client: HTTP client to use (default: a new one)
+
+    Returns:
+        The scheduler (for its skipped / blocked_hosts stats)
+    """
+    scheduler = scheduler or HostScheduler()
+
+    if on_browser_result is None or not PLAYWRIGHT_AVAILABLE:
+        await scheduler.run(jobs, on_result, client=client)
+        return scheduler
+
+    fallback: asyncio.Queue = asyncio.Queue()
+    browser_task = asyncio.create_task(_browser_fallback(fallback, on_browser_result))
+    try:
+        await scheduler.run(jobs, on_result, fallback, client)
+    finally:
+        fallback.put_nowait(None)
+        await browser_task
+    return scheduler
+
+
+# ============================================
+# Database writes
+# ============================================
+
+class UrlStatusWriter:
+    """
+    Buffers url_status results and writes them from a background thread.
+
+    Buffered results are grouped by url_status and written with one
+    update().in_("id", batch) per status (and per DB_BATCH_SIZE ids), so DB
+    round trips scale with the number of distinct statuses rather than URLs,
+    and URL checks never wait on the database. Only the latest status per job
+    is kept, so a Playwright verdict queued after 'blocked' always wins.
+    The buffer is flushed when it reaches batch_size jobs, every
+    flush_interval seconds, and on close().
+
+    Usage:
+        with UrlStatusWriter() as writer:
+            writer.add(enriched_job_id, 'active')
+    """
+
+    _STOP = object()
+
+    def __init__(self, batch_size: int = DB_BATCH_SIZE, flush_interval: float = DB_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.failed = 0
+        self.round_trips = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='url-status-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'UrlStatusWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, enriched_job_id, status: str):
+        """Queue a job's url_status (returns immediately)."""
+        self._queue.put((enriched_job_id, status))
+
+    def close(self):
+        """Write everything still buffered and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+    def _run(self):
+        pending: Dict = {}  # enriched_job_id -> latest status
+        last_flush = time.monotonic()
+
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                break
+            if item is not None:
+                job_id, status = item
+                pending[job_id] = status
+
+            if len(pending) >= self.batch_size or time.monotonic() - last_flush >= self.flush_interval:
+                self._flush(pending)
+                pending = {}
+                last_flush = time.monotonic()
+
+        self._flush(pending)
+
+    def _flush(self, pending: Dict):
+        by_status: Dict[str, List] = {}
+        for job_id, status in pending.items():
+            by_status.setdefault(status, []).append(job_id)
+
+        checked_at = datetime.now().isoformat()
+        for status, job_ids in by_status.items():
+            for i in range(0, len(job_ids), self.batch_size):
+                batch = job_ids[i:i + self.batch_size]
+                self.round_trips += 1
+                try:
+                    supabase.table("enriched_jobs") \
+                        .update({'url_status': status, 'url_checked_at': checked_at}) \
+                        .in_("id", batch) \
+                        .execute()
+                    self.written += len(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    print(f"      [DB ERROR] batch update failed ({len(batch)} jobs -> {status}): {e}")
+
+
+def update_posting_urls(rewrites: List[Dict], batch_size: int = DB_BATCH_SIZE) -> int:
+    """
+    Write canonical posting URLs to raw_jobs in batches.
+
+    Uses the update_raw_job_posting_urls RPC (migration 030), one call per
+    batch; falls back to one update per row if the RPC is unavailable.
+
+    Args:
+        rewrites: [{'raw_job_id': ..., 'canonical_url': ...}]
+        batch_size: Rows per RPC call
+
+    Returns:
+        Number of rows updated
+    """
+    updated = 0
+    for i in range(0, len(rewrites), batch_size):
+        batch = rewrites[i:i + batch_size]
+        payload = [{'id': rw['raw_job_id'], 'posting_url': rw['canonical_url']} for rw in batch]
+        try:
+            result = supabase.rpc('update_raw_job_posting_urls', {'updates': payload}).execute()
+            updated += result.data if isinstance(result.data, int) else len(batch)
+            continue
+        except Exception as e:
+            print(f"   [DB] Batch rewrite RPC unavailable ({e}); updating rows individually")
+
+        for rw in batch:
+            try:
+                supabase.table("raw_jobs") \
+                    .update({"posting_url": rw['canonical_url']}) \
+                    .eq("id", rw['raw_job_id']) \
+                    .execute()
+                updated += 1
+            except Exception as e:
+                print(f"   [DB ERROR] raw_job {rw['raw_job_id']}: {e}")
+    return updated
+
+
+# ============================================
+# Recheck priority
+# ============================================
+
+def _parse_date(value) -> Optional[datetime]:
+    """Parse a posted_date / url_checked_at string (naive, timezone dropped)."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def fetch_employer_fill_medians() -> Dict[str, Tuple[float, int]]:
+    """
+    Load employer_fill_stats (written by employer_stats.py).
+
+    Returns:
+        Dict of canonical_name -> (median_days_to_fill, sample_size)
+    """
+    medians = {}
+    offset = 0
+    page_size = 1000
+
+    while True:
+        result = supabase.table("employer_fill_stats") \
+            .select("canonical_name, median_days_to_fill, sample_size") \
+            .range(offset, offset + page_size - 1) \
+            .execute()
+
+        if not result.data:
+            break
+
+        for row in result.data:
+            if row.get('canonical_name') and row.get('median_days_to_fill'):
+                medians[row['canonical_name']] = (float(row['median_days_to_fill']),
+                                                  int(row.get('sample_size') or 0))
+
+        if len(result.data) < page_size:
+            break
+        offset += page_size
+
+    return medians
+
+
+def fetch_source_closure_counts(sources: List[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Closed (404/410/soft_404) and checked job counts per source.
+
+    Uses two count-only queries per source.
+
+    Returns:
+        Dict of data_source -> (closed, checked) (sources without checked jobs omitted)
+    """
+    counts = {}
+    for source in sources:
+        checked = supabase.table("enriched_jobs") \
+            .select("id", count='exact') \
+            .eq("data_source", source) \
+            .not_.is_("url_checked_at", "null") \
+            .limit(1) \
+            .execute()
+        closed = supabase.table("enriched_jobs") \
+            .select("id", count='exact') \
+            .eq("data_source", source) \
+            .in_("url_status", TERMINAL_STATUSES) \
+            .limit(1) \
+            .execute()
+        if checked.count:
+            counts[source] = (closed.count or 0, checked.count)
+    return counts
+
+
+class RecheckPriority:
+    """
+    Ranks jobs by the probability that they closed since their last URL check.
+
+    Time to fill is modelled per employer as a log-logistic distribution whose
+    median is the employer's median days-to-fill (employer_fill_stats), so
+
+        S(t) = 1 / (1 + (t / median) ** FILL_CURVE_SHAPE)
+
+    is the chance a job is still open t days after posting. A job last seen
+    open at age t0 and now aged t closed in between with probability
+    1 - S(t) / S(t0). Young jobs at slow-hiring employers score low; jobs past
+    their employer's median score high. Employers with few closed roles are
+    shrunk towards the overall median, unknown employers use it directly, and
+    the closure odds are scaled by the source's historical closure rate
+    (shrunk towards SOURCE_CLOSURE_PRIOR) relative to the prior.
+
+    Usage:
+        priority = RecheckPriority.load(["greenhouse"])
+        due = priority.select(jobs, limit=500)
+    """
+
+    def __init__(self, employer_medians: Optional[Dict[str, Tuple[float, int]]] = None,
+                 source_closure_counts: Optional[Dict[str, Tuple[int, int]]] = None,
+                 default_median: Optional[float] = None):
+        self.employer_medians = employer_medians or {}
+        if default_median is None:
+            medians = [m for m, _ in self.employer_medians.values()]
+            default_median = statistics.median(medians) if medians else DEFAULT_DAYS_TO_FILL
+        self.default_median = default_median
+
+        self.source_factors = {
+            source: self.source_factor(closed, checked)
+            for source, (closed, checked) in (source_closure_counts or {}).items()
+        }
+
+    @classmethod
+    def load(cls, sources: List[str]) -> 'RecheckPriority':
+        """Build from employer_fill_stats and enriched_jobs closure counts."""
+        return cls(fetch_employer_fill_medians(), fetch_source_closure_counts(sources))
+
+    @staticmethod
+    def source_factor(closed: int, checked: int) -> float:
+        """Closure odds multiplier: shrunk source closure odds over the prior's odds."""
+        rate = ((closed + SOURCE_CLOSURE_PRIOR * SOURCE_PRIOR_WEIGHT)
+                / (checked + SOURCE_PRIOR_WEIGHT))
+        odds = rate / (1.0 - rate) / (SOURCE_CLOSURE_PRIOR / (1.0 - SOURCE_CLOSURE_PRIOR))
+        low, high = SOURCE_FACTOR_RANGE
+        return min(high, max(low, odds))
+
+    def median_days_to_fill(self, employer_name: Optional[str]) -> float:
+        """Employer median shrunk towards the overall median by sample size."""
+        stats = self.employer_medians.get((employer_name or '').lower().strip())
+        if not stats:
+            return self.default_median
+        median, sample_size = stats
+        return ((median * sample_size + self.default_median * FILL_PRIOR_WEIGHT)
+                / (sample_size + FILL_PRIOR_WEIGHT))
+
+    def closure_probability(self, job: Dict, now: Optional[datetime] = None) -> float:
+        """
+        Probability that a job closed since its last check.
+
+        Args:
+            job: enriched_jobs row with employer_name, posted_date, url_checked_at
+                 and data_source
+            now: Reference time (default: datetime.now())
+
+        Returns:
+            Probability in [0, 1]
+        """
+        now = now or datetime.now()
+        checked = _parse_date(job.get('url_checked_at'))
+        posted = _parse_date(job.get('posted_date')) or checked or now
+
+        age = max((now - posted).total_seconds() / 86400, 0.0)
+        age_at_check = max((checked - posted).total_seconds() / 86400, 0.0) if checked else 0.0
+        age_at_check = min(age_at_check, age)
+
+        median = self.median_days_to_fill(job.get('employer_name'))
+
+        def survival(days: float) -> float:
+            return 1.0 / (1.0 + (days / median) ** FILL_CURVE_SHAPE)
+
+        probability = 1.0 - survival(age) / survival(age_at_check)
+
+        factor = self.source_factors.get(job.get('data_source'), 1.0)
+        if factor != 1.0 and 0.0 < probability < 1.0:
+            odds = probability / (1.0 - probability) * factor
+            probability = odds / (1.0 + odds)
+        return probability
+
+    def select(self, jobs: List[Dict], limit: Optional[int] = None,
+               force: bool = False, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Pick the jobs due for a check, likeliest-closed first.
+
+        A job is due if it was never checked, its closure probability reaches
+        MIN_CLOSURE_PROBABILITY, or it was last checked RECHECK_DAYS ago
+        (every job is due when force is set). Each returned job gets a
+        'closure_probability' key.
+
+        Args:
+            jobs: Candidate enriched_jobs rows
+            limit: Validation budget (None = every due job)
+            force: Treat every candidate as due
+            now: Reference time (default: datetime.now())
+
+        Returns:
+            Due jobs sorted by descending closure probability, at most limit
+        """
+        now = now or datetime.now()
+        stale_before = now - timedelta(days=RECHECK_DAYS)
+
+        due = []
+        for job in jobs:
+            probability = self.closure_probability(job, now)
+            checked = _parse_date(job.get('url_checked_at'))
+            if (force or checked is None or checked <= stale_before
+                    or probability >= MIN_CLOSURE_PROBABILITY):
+                due.append(dict(job, closure_probability=probability))
+
+        due.sort(key=lambda job: job['closure_probability'], reverse=True)
+        return due[:limit] if limit else due
+
+
 def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False):
     """
     Validate posting URLs for Greenhouse jobs via HTTP/Playwright.
@@ -250,7 +1137,8 @@ def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False)
     api_freshness_checker.py which uses API-based listing + per-job verification.
 
     Args:
-        limit: Maximum jobs to check (None = all needing check)
+        limit: Validation budget - checks the likeliest-closed due jobs first
+               (None = all due jobs)
         force: If True, recheck all URLs regardless of url_checked_at
         dry_run: If True, show what would be checked without updating database
     """
@@ -267,29 +1155,27 @@ def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False)
     print("[DATA] Finding jobs needing URL validation...")
 
     try:
-        # Calculate recheck threshold
-        recheck_threshold = (datetime.now() - timedelta(days=RECHECK_DAYS)).isoformat()
+        # Candidates: not checked within MIN_RECHECK_DAYS. Which of them are
+        # due (and in what order) is decided by RecheckPriority below.
+        recheck_threshold = (datetime.now() - timedelta(days=MIN_RECHECK_DAYS)).isoformat()
 
-        jobs_to_check = []
+        candidates = []
         offset = 0
         page_size = 1000
 
         while True:
             # Build query - skip confirmed dead jobs (404/410/soft_404 are terminal)
             query = supabase.table("enriched_jobs") \
-                .select("id, raw_job_id, data_source") \
+                .select("id, raw_job_id, data_source, employer_name, posted_date, url_checked_at") \
                 .in_("data_source", ["greenhouse"]) \
-                .not_.in_("url_status", ["404", "410", "soft_404"])
+                .not_.in_("url_status", TERMINAL_STATUSES)
 
             if not force:
-                # Only check jobs not recently validated
                 # url_checked_at is NULL or older than threshold
                 query = query.or_(
                     f"url_checked_at.is.null,url_checked_at.lt.{recheck_threshold}"
                 )
 
-            # Order by oldest first - older jobs more likely to be dead
-            # NULLs last since new jobs are almost certainly active
             query = query.order("url_checked_at", nullsfirst=False)
 
             result = query.range(offset, offset + page_size - 1).execute()
@@ -297,27 +1183,41 @@ def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False)
             if not result.data:
                 break
 
-            jobs_to_check.extend(result.data)
+            candidates.extend(result.data)
 
             if len(result.data) < page_size:
                 break
             offset += page_size
 
-        print(f"[OK] Found {len(jobs_to_check)} jobs needing validation")
-
-        if not jobs_to_check:
-            print("\n[DONE] All URLs recently validated!")
-            return
-
-        # Apply limit if specified
-        if limit:
-            jobs_to_check = jobs_to_check[:limit]
-            print(f"[LIMIT] Checking first {limit} jobs")
+        print(f"[OK] Found {len(candidates)} candidate jobs")
 
     except Exception as e:
         print(f"[ERROR] Failed to find jobs: {e}")
         return
 
+    # Rank by closure probability; the limit is the run's validation budget
+    try:
+        priority = RecheckPriority.load(["greenhouse"])
+        print(f"[PRIORITY] Fill stats for {len(priority.employer_medians)} employers "
+              f"(default median {priority.default_median:.1f} days)")
+    except Exception as e:
+        print(f"[WARN] Failed to load fill stats, using defaults: {e}")
+        priority = RecheckPriority()
+
+    jobs_to_check = priority.select(candidates, force=force)
+    deferred = len(candidates) - len(jobs_to_check)
+    likely_closed = sum(1 for job in jobs_to_check if job['closure_probability'] >= 0.5)
+    print(f"[PRIORITY] {len(jobs_to_check)} due ({likely_closed} likely closed), "
+          f"{deferred} deferred (closure probability < {MIN_CLOSURE_PROBABILITY:.0%})")
+
+    if not jobs_to_check:
+        print("\n[DONE] All URLs recently validated!")
+        return
+
+    if limit:
+        jobs_to_check = jobs_to_check[:limit]
+        print(f"[LIMIT] Checking the {len(jobs_to_check)} likeliest-closed jobs")
+
     # Step 2: Fetch posting URLs from raw_jobs
     print("\n[DATA] Fetching posting URLs...")
 
@@ -392,16 +1292,7 @@ def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False)
     # Batch-update raw_jobs.posting_url for rewritten URLs
     if canonical_rewrites and not dry_run:
         print(f"[DATA] Updating {len(canonical_rewrites)} raw_jobs posting_url to canonical...")
-        rewrite_ok = 0
-        for rw in canonical_rewrites:
-            try:
-                supabase.table("raw_jobs") \
-                    .update({"posting_url": rw['canonical_url']}) \
-                    .eq("id", rw['raw_job_id']) \
-                    .execute()
-                rewrite_ok += 1
-            except Exception as e:
-                print(f"   [DB ERROR] raw_job {rw['raw_job_id']}: {e}")
+        rewrite_ok = update_posting_urls(canonical_rewrites)
         print(f"[OK] Updated {rewrite_ok}/{len(canonical_rewrites)} posting URLs")
 
     if dry_run:
@@ -411,8 +1302,10 @@ def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False)
             print(f"   {job['url'][:70]}...")
         return
 
-    # Step 4: Check URLs in parallel
-    print(f"\n[CHECK] Validating {len(jobs_with_urls)} URLs (max {MAX_WORKERS} workers)...")
+    # Step 4: Check URLs, streamed across hosts; blocked URLs are verified in
+    # the browser (Step 5) while HTTP checks continue
+    print(f"\n[CHECK] Validating {len(jobs_with_urls)} URLs "
+          f"(max {MAX_WORKERS} concurrent, {PER_HOST_CONCURRENCY}/host unless overridden)...")
 
     results = {
         'active': 0,
@@ -424,100 +1317,67 @@ def validate_urls(limit: int = None, force: bool = False, dry_run: bool = False)
         'redirect': 0,
         'error': 0
     }
-
-    def process_job(job):
-        """Process a single job URL check."""
-        status, code, final_url = check_url(job['url'])
-        return {
-            'enriched_job_id': job['enriched_job_id'],
-            'url': job['url'],
-            'final_url': final_url,
-            'status': status,
-            'code': code
-        }
-
-    # Process in batches with thread pool
+    playwright_results = {'active': 0, 'soft_404': 0, 'unverifiable': 0}
     processed = 0
-    batch_num = 0
-    blocked_jobs = []  # Track blocked URLs for Playwright fallback
-
-    for batch_start in range(0, len(jobs_with_urls), BATCH_SIZE):
-        batch = jobs_with_urls[batch_start:batch_start + BATCH_SIZE]
-        batch_num += 1
-
-        print(f"\n   [BATCH {batch_num}] Checking {len(batch)} URLs...")
-
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(process_job, job): job for job in batch}
-
-            for future in as_completed(futures):
-                result = future.result()
-                status = result['status']
-                results[status] += 1
-                processed += 1
-
-                # Log dead links specifically
-                if status == '404':
-                    print(f"      [404] {result['url'][:60]}...")
-                elif status == '410':
-                    print(f"      [410 GONE] {result['url'][:60]}...")
-                elif status == 'soft_404':
-                    print(f"      [SOFT 404] {result['url'][:60]}...")
-                elif status == 'blocked':
-                    # Track for Playwright fallback
-                    blocked_jobs.append(result)
-
-                # Update database
-                try:
-                    supabase.table("enriched_jobs") \
-                        .update({
-                            'url_status': status,
-                            'url_checked_at': datetime.now().isoformat()
-                        }) \
-                        .eq("id", result['enriched_job_id']) \
-                        .execute()
-                except Exception as e:
-                    print(f"      [DB ERROR] {e}")
-
-        print(f"   [BATCH {batch_num}] Complete: {results}")
-
-        # Brief pause between batches
-        if batch_start + BATCH_SIZE < len(jobs_with_urls):
-            time.sleep(1)
-
-    # Step 5: Playwright fallback for blocked URLs
-    if blocked_jobs and PLAYWRIGHT_AVAILABLE:
-        print(f"\n[PLAYWRIGHT] Verifying {len(blocked_jobs)} blocked URLs...")
-        playwright_results = {'active': 0, 'soft_404': 0, 'unverifiable': 0}
-
-        for i, job in enumerate(blocked_jobs):
-            print(f"   [{i+1}/{len(blocked_jobs)}] {job['url'][:50]}...")
-            status, code, final_url = check_url_playwright(job['url'])
-            playwright_results[status] += 1
+    browser_checked = 0
+
+    # DB writes are batched on the writer thread, off the event loop
+    writer = UrlStatusWriter()
+
+    def on_http_result(job, result):
+        nonlocal processed
+        status = result[0]
+        results[status] += 1
+        processed += 1
+
+        # Log dead links specifically
+        if status == '404':
+            print(f"      [404] {job['url'][:60]}...")
+        elif status == '410':
+            print(f"      [410 GONE] {job['url'][:60]}...")
+        elif status == 'soft_404':
+            print(f"      [SOFT 404] {job['url'][:60]}...")
+
+        writer.add(job['enriched_job_id'], status)
+
+        if processed % PROGRESS_EVERY == 0:
+            print(f"   [PROGRESS] {processed}/{len(jobs_with_urls)}: {results}")
+
+    # Step 5: Playwright fallback for blocked URLs (runs concurrently)
+    def on_browser_result(job, result):
+        nonlocal browser_checked
+        status = result[0]
+        browser_checked += 1
+        playwright_results[status] += 1
+        print(f"   [PLAYWRIGHT {browser_checked}] {status:12} {job['url'][:50]}...")
+
+        # Update the results counter (subtract blocked, add new status)
+        results['blocked'] -= 1
+        if status not in results:
+            results[status] = 0
+        results[status] += 1
+
+        # Final status replaces 'blocked' (latest status per job wins)
+        writer.add(job['enriched_job_id'], status)
 
-            # Update the results counter (subtract blocked, add new status)
-            results['blocked'] -= 1
-            if status not in results:
-                results[status] = 0
-            results[status] += 1
-
-            # Update database with final status
-            try:
-                supabase.table("enriched_jobs") \
-                    .update({
-                        'url_status': status,
-                        'url_checked_at': datetime.now().isoformat()
-                    }) \
-                    .eq("id", job['enriched_job_id']) \
-                    .execute()
-            except Exception as e:
-                print(f"      [DB ERROR] {e}")
-
-        print(f"   [PLAYWRIGHT] Results: {playwright_results}")
-    elif blocked_jobs and not PLAYWRIGHT_AVAILABLE:
-        print(f"\n[WARN] {len(blocked_jobs)} URLs blocked but Playwright not available")
+    try:
+        scheduler = asyncio.run(check_jobs(jobs_with_urls, on_http_result, on_browser_result))
+    finally:
+        writer.close()
+
+    if scheduler.blocked_hosts:
+        print(f"\n[HOSTS] {len(scheduler.blocked_hosts)} hosts blocked us; "
+              f"{scheduler.skipped} of their URLs went straight to the browser fallback")
+    if browser_checked:
+        print(f"\n[PLAYWRIGHT] Verified {browser_checked} blocked URLs "
+              f"({PLAYWRIGHT_CONTEXTS} browser contexts): {playwright_results}")
+    elif results['blocked'] and not PLAYWRIGHT_AVAILABLE:
+        print(f"\n[WARN] {results['blocked']} URLs blocked but Playwright not available")
         print("       Install with: pip install playwright && playwright install chromium")
 
+    print(f"\n[DB] Wrote {writer.written} url_status updates in {writer.round_trips} batched requests"
+          + (f" ({writer.failed} failed)" if writer.failed else ""))
+
     # Step 6: Summary
     print("\n" + "=" * 70)
     print("SUMMARY")
@@ -4,12 +4,17 @@ Shows comprehensive breakdown by all dimensions in enriched_jobs table.
 
 Updated 2025-12-21: Now uses `locations` JSONB column instead of deprecated `city_code`.
 See: docs/architecture/GLOBAL_LOCATION_EXPANSION_EPIC.md
+
+Usage:
+    python pipeline/utilities/analyze_db_results.py
+    python pipeline/utilities/analyze_db_results.py --from-snapshot      # local Parquet snapshot
 """
 
 import sys
 sys.path.insert(0, '.')
 import os
 import json
+import argparse
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from supabase import create_client, Client
@@ -47,41 +52,63 @@ def extract_primary_city(locations) -> str:
 # Load environment variables
 load_dotenv()
 
-# Initialize Supabase client
-supabase_url = os.getenv("SUPABASE_URL")
-supabase_key = os.getenv("SUPABASE_KEY")
-supabase: Client = create_client(supabase_url, supabase_key)
+# Data source: Supabase client, or a JobsSnapshot with --from-snapshot (set in main)
+supabase: Client = None
+snapshot = None
 
-def analyze_enriched_jobs_dimensions():
-    """Analyze all dimensions in enriched_jobs table and create tabulated breakdowns."""
 
-    print("\n" + "=" * 100)
-    print("COMPREHENSIVE ENRICHED JOBS DIMENSION ANALYSIS")
-    print("=" * 100)
+def _count(table: str, filters: list = ()) -> int:
+    """Row count; filters are (column, op, value) with op 'eq' or 'gte'."""
+    if snapshot is not None:
+        return snapshot.count(table, [(column, '=' if op == 'eq' else '>=', value)
+                                      for column, op, value in filters])
+    query = supabase.table(table).select("*", count="exact")
+    for column, op, value in filters:
+        query = getattr(query, op)(column, value)
+    return query.execute().count
+
+
+def _rows(table: str, columns: str, filters: list = (), progress: bool = False) -> list:
+    """All rows of the selected columns (paginated from Supabase, or read from the snapshot)."""
+    if snapshot is not None:
+        return snapshot.rows(table, [c.strip() for c in columns.split(',')],
+                             [(column, '=' if op == 'eq' else '>=', value) for column, op, value in filters])
 
-    # Get all enriched jobs data using pagination
-    print("Fetching ALL enriched jobs data using pagination...")
     all_data = []
     page_size = 1000
     offset = 0
-
     while True:
-        jobs_page = supabase.table("enriched_jobs").select(
-            "locations, job_family, job_subfamily, seniority, working_arrangement, "
-            "data_source, description_source, deduplicated"
-        ).range(offset, offset + page_size - 1).execute()
-
-        if not jobs_page.data:
+        query = supabase.table(table).select(columns)
+        for column, op, value in filters:
+            query = getattr(query, op)(column, value)
+        batch = query.range(offset, offset + page_size - 1).execute()
+        if not batch.data:
             break
-
-        all_data.extend(jobs_page.data)
+        all_data.extend(batch.data)
         offset += page_size
-
-        print(f"Fetched {len(all_data)} records so far...")
-
+        if progress:
+            print(f"Fetched {len(all_data)} records so far...")
         # Safety check to prevent infinite loops
-        if len(jobs_page.data) < page_size:
+        if len(batch.data) < page_size:
             break
+    return all_data
+
+
+def analyze_enriched_jobs_dimensions():
+    """Analyze all dimensions in enriched_jobs table and create tabulated breakdowns."""
+
+    print("\n" + "=" * 100)
+    print("COMPREHENSIVE ENRICHED JOBS DIMENSION ANALYSIS")
+    print("=" * 100)
+
+    # Get all enriched jobs data using pagination
+    print("Fetching ALL enriched jobs data using pagination...")
+    all_data = _rows(
+        "enriched_jobs",
+        "locations, job_family, job_subfamily, seniority, working_arrangement, "
+        "data_source, description_source, deduplicated",
+        progress=True,
+    )
 
     print(f"Total records fetched: {len(all_data)}")
     all_jobs = type('obj', (object,), {'data': all_data})
@@ -205,12 +232,10 @@ def analyze_database():
     print("=" * 80)
 
     # Total raw jobs (all time)
-    total_raw = supabase.table("raw_jobs").select("*", count="exact").execute()
-    total_raw_count = total_raw.count
+    total_raw_count = _count("raw_jobs")
 
     # Raw jobs from today
-    today_raw = supabase.table("raw_jobs").select("*", count="exact").gte("scraped_at", today_str).execute()
-    today_raw_count = today_raw.count
+    today_raw_count = _count("raw_jobs", [("scraped_at", "gte", today_str)])
 
     print(f"\nTODAY'S RUN ({today_str}):")
     print(f"  New raw jobs added: {today_raw_count:,}")
@@ -226,12 +251,10 @@ def analyze_database():
     print("=" * 80)
 
     # Total enriched jobs (all time)
-    total_enriched = supabase.table("enriched_jobs").select("*", count="exact").execute()
-    total_enriched_count = total_enriched.count
+    total_enriched_count = _count("enriched_jobs")
 
     # Enriched jobs from today
-    today_enriched = supabase.table("enriched_jobs").select("*", count="exact").gte("classified_at", today_str).execute()
-    today_enriched_count = today_enriched.count
+    today_enriched_count = _count("enriched_jobs", [("classified_at", "gte", today_str)])
 
     print(f"\nTODAY'S RUN ({today_str}):")
     print(f"  New enriched jobs added: {today_enriched_count:,}")
@@ -248,13 +271,13 @@ def analyze_database():
     print("=" * 80)
 
     # Get all enriched jobs from today to analyze (using locations JSONB)
-    today_jobs_data = supabase.table("enriched_jobs").select("job_family, locations").gte("classified_at", today_str).execute()
+    today_jobs_data = _rows("enriched_jobs", "job_family, locations", [("classified_at", "gte", today_str)])
 
     # Count by job family - TODAY
     family_counts_today = defaultdict(int)
     family_by_location_today = defaultdict(lambda: defaultdict(int))
 
-    for job in today_jobs_data.data:
+    for job in today_jobs_data:
         family = job.get('job_family') or 'unknown'
         location = extract_primary_city(job.get('locations'))
         family_counts_today[family] += 1
@@ -269,17 +292,7 @@ def analyze_database():
             print(f"    - {loc}: {count:,}")
 
     # Get all enriched jobs (all time) to analyze - using pagination
-    all_jobs_data = []
-    offset = 0
-    page_size = 1000
-    while True:
-        batch = supabase.table("enriched_jobs").select("job_family, locations").range(offset, offset + page_size - 1).execute()
-        if not batch.data:
-            break
-        all_jobs_data.extend(batch.data)
-        if len(batch.data) < page_size:
-            break
-        offset += page_size
+    all_jobs_data = _rows("enriched_jobs", "job_family, locations")
 
     # Count by job family - OVERALL
     family_counts_all = defaultdict(int)
@@ -309,14 +322,14 @@ def analyze_database():
 
     print(f"\nTODAY'S RUN ({today_str}):")
     for src in sources:
-        src_today = supabase.table("enriched_jobs").select("*", count="exact").eq("data_source", src).gte("classified_at", today_str).execute()
-        print(f"  {src.capitalize()}: {src_today.count:,}")
+        src_today = _count("enriched_jobs", [("data_source", "eq", src), ("classified_at", "gte", today_str)])
+        print(f"  {src.capitalize()}: {src_today:,}")
 
     # Overall breakdown
     print(f"\nOVERALL (All Time):")
     for src in sources:
-        src_all = supabase.table("enriched_jobs").select("*", count="exact").eq("data_source", src).execute()
-        print(f"  {src.capitalize()}: {src_all.count:,}")
+        src_all = _count("enriched_jobs", [("data_source", "eq", src)])
+        print(f"  {src.capitalize()}: {src_all:,}")
 
     # ========== SUMMARY ==========
     print("\n" + "=" * 80)
@@ -341,5 +354,23 @@ def analyze_database():
     # Run comprehensive dimension analysis
     analyze_enriched_jobs_dimensions()
 
-if __name__ == "__main__":
+def main():
+    global supabase, snapshot
+
+    parser = argparse.ArgumentParser(description="Analyze database results for today's run and overall totals")
+    parser.add_argument("--from-snapshot", nargs="?", const="", default=None, metavar="DIR",
+                        help="Read the local Parquet snapshot instead of Supabase (default dir: .cache/snapshot)")
+    args = parser.parse_args()
+
+    if args.from_snapshot is not None:
+        from pipeline.jobs_snapshot import JobsSnapshot
+        snapshot = JobsSnapshot(args.from_snapshot or None)
+        print(f"[SNAPSHOT] Reading {snapshot.directory}")
+    else:
+        supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+
     analyze_database()
+
+
+if __name__ == "__main__":
+    main()
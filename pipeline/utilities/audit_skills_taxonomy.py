@@ -4,15 +4,22 @@ Audit Skills Taxonomy
 Discovers unmapped skills, duplicate entries, orphaned families, and coverage gaps
 in the skills taxonomy (domain -> family -> skill).
 
-Queries all enriched_jobs, extracts unique skills, cross-references with
-skill_family_mapping.yaml and skill_domain_mapping.yaml.
+Queries all enriched_jobs, extracts unique skills, resolves them in one batch
+through the skill index (same lookup the pipeline uses) and cross-references
+with skill_family_mapping.yaml and skill_domain_mapping.yaml. Unmapped skills
+that the fuzzy index can resolve are listed as near-misses (likely typos or
+variants worth adding to the mapping). Skill co-occurrence (strongest pairs
+by lift, top skills per job family) comes from the sparse incidence matrix
+in pipeline/skill_cooccurrence.py, the same engine the reports use.
 
 Usage:
     python pipeline/utilities/audit_skills_taxonomy.py
     python pipeline/utilities/audit_skills_taxonomy.py --output-csv
+    python pipeline/utilities/audit_skills_taxonomy.py --from-snapshot
 
 Options:
-    --output-csv   Save report to docs/costs/skills_audit_report.csv
+    --output-csv      Save report to docs/costs/skills_audit_report.csv
+    --from-snapshot   Read jobs from the local Parquet snapshot (pipeline/jobs_snapshot.py)
 """
 
 import os
@@ -26,6 +33,10 @@ import yaml
 from dotenv import load_dotenv
 from supabase import create_client
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from pipeline.skill_family_mapper import lookup_skills
+from pipeline.skill_cooccurrence import SkillIncidence
+
 load_dotenv()
 
 # Paths
@@ -36,6 +47,10 @@ SKILL_DOMAIN_PATH = CONFIG_DIR / "skill_domain_mapping.yaml"
 SCHEMA_TAXONOMY_PATH = PROJECT_ROOT / "docs" / "schema_taxonomy.yaml"
 CSV_OUTPUT_PATH = PROJECT_ROOT / "docs" / "costs" / "skills_audit_report.csv"
 
+# Co-occurrence: skills/pairs rarer than this are ignored for lift (noisy)
+ASSOCIATION_MIN_SUPPORT = 20
+ASSOCIATION_MIN_COUNT = 5
+
 
 def get_supabase():
     """Initialize Supabase client."""
@@ -127,7 +142,7 @@ def fetch_all_skills(supabase) -> list[dict]:
     while True:
         result = (
             supabase.table("enriched_jobs")
-            .select("id, skills")
+            .select("id, job_family, skills")
             .range(offset, offset + page_size - 1)
             .execute()
         )
@@ -141,8 +156,14 @@ def fetch_all_skills(supabase) -> list[dict]:
     return all_records
 
 
-def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
-    """Analyze skills from all records against the mapping."""
+def fetch_snapshot_skills(snapshot_dir: str = None) -> list[dict]:
+    """Read all jobs with skills from the local Parquet snapshot."""
+    from pipeline.jobs_snapshot import JobsSnapshot
+    return JobsSnapshot(snapshot_dir).rows("enriched_jobs", ["id", "job_family", "skills"])
+
+
+def analyze_skills(records: list[dict]):
+    """Analyze skills from all records against the skill index."""
     # Count skill occurrences and track family_code status
     skill_counts = Counter()
     null_family_skills = Counter()
@@ -150,8 +171,9 @@ def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
     family_code_in_db = Counter()
     total_skill_mentions = 0
     records_with_skills = 0
+    incidence_rows, incidence_names = [], []
 
-    for record in records:
+    for position, record in enumerate(records):
         skills = record.get("skills")
         if not skills or not isinstance(skills, list):
             continue
@@ -164,6 +186,8 @@ def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
                 continue
             total_skill_mentions += 1
             skill_counts[name] += 1
+            incidence_rows.append(position)
+            incidence_names.append(name)
 
             family_code = skill.get("family_code")
             if family_code:
@@ -172,17 +196,23 @@ def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
             else:
                 null_family_skills[name] += 1
 
-    # Cross-reference with current mapping
+    # Cross-reference with current mapping (one batch lookup per unique name)
     unique_skills = set(skill_counts.keys())
-    currently_mapped = set()
-    currently_unmapped = set()
-
-    for skill_name in unique_skills:
-        normalized = skill_name.lower().strip()
-        if normalized in skill_mapping:
-            currently_mapped.add(skill_name)
-        else:
-            currently_unmapped.add(skill_name)
+    unique_list = sorted(unique_skills)
+    skill_families = {
+        name: family for name, (_, family) in zip(unique_list, lookup_skills(unique_list))
+    }
+    currently_mapped = {name for name, family in skill_families.items() if family}
+    currently_unmapped = unique_skills - currently_mapped
+
+    # Unmapped skills the fuzzy index can resolve (likely typos/variants)
+    unmapped_list = sorted(currently_unmapped)
+    near_misses = [
+        {"skill": name, "count": skill_counts[name], "suggestion": canonical, "family": family}
+        for name, (canonical, family) in zip(unmapped_list, lookup_skills(unmapped_list, fuzzy=True))
+        if family
+    ]
+    near_misses.sort(key=lambda x: -x["count"])
 
     # Skills that would change family on re-mapping
     stale_mappings = []
@@ -196,7 +226,7 @@ def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
             if not name:
                 continue
             current_family = skill.get("family_code")
-            new_family = skill_mapping.get(name.lower().strip())
+            new_family = skill_families.get(name)
             if current_family and new_family and current_family != new_family:
                 stale_mappings.append({
                     "skill": name,
@@ -213,6 +243,15 @@ def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
             seen.add(key)
             unique_stale.append(s)
 
+    # Co-occurrence over jobs with skills (lift denominators)
+    incidence = SkillIncidence(incidence_rows, incidence_names, n_jobs=records_with_skills)
+    associations = incidence.associations(
+        min_support=ASSOCIATION_MIN_SUPPORT, min_count=ASSOCIATION_MIN_COUNT, k=40
+    )
+    top_by_family = incidence.top_skills_by_segment(
+        [record.get("job_family") for record in records], k=10
+    )
+
     return {
         "total_records": len(records),
         "records_with_skills": records_with_skills,
@@ -226,6 +265,10 @@ def analyze_skills(records: list[dict], skill_mapping: dict[str, str]):
         "family_code_in_db": family_code_in_db,
         "currently_unmapped_set": currently_unmapped,
         "stale_mappings": unique_stale,
+        "near_misses": near_misses,
+        "top_pairs": incidence.top_pairs(20),
+        "associations": associations,
+        "top_by_family": top_by_family,
     }
 
 
@@ -394,6 +437,37 @@ def print_report(analysis: dict, duplicates: list, family_to_domain: dict,
             in_domain_not_mapping or in_mapping_not_domain):
         print("  Full alignment across all config files.")
 
+    # -- Section 8: Near-misses --
+    print(f"\n8. UNMAPPED SKILLS WITH A NEAR-MISS MATCH ({len(analysis['near_misses'])})")
+    print("-" * 40)
+    if analysis["near_misses"]:
+        for m in analysis["near_misses"][:40]:
+            print(f"  {m['count']:>5}x  {m['skill']} -> {m['suggestion']} ({m['family']})")
+    else:
+        print("  None -- no unmapped skill is a near-miss of a mapped one.")
+
+    # -- Section 9: Co-occurrence --
+    print(f"\n9. SKILL CO-OCCURRENCE")
+    print("-" * 40)
+    print("  Most frequent pairs:")
+    for s1, s2, count in analysis["top_pairs"]:
+        print(f"  {count:>5}x  {s1} + {s2}")
+    print(f"  Strongest associations (lift; skills in >= {ASSOCIATION_MIN_SUPPORT} jobs, "
+          f"pairs in >= {ASSOCIATION_MIN_COUNT}):")
+    if analysis["associations"]:
+        for a in analysis["associations"]:
+            print(f"  {a['lift']:>7.2f}  {a['skill_1']} + {a['skill_2']} "
+                  f"({a['count']} jobs, pmi {a['pmi']:.2f})")
+    else:
+        print("  None above the support thresholds.")
+
+    # -- Section 10: Top skills per job family --
+    print(f"\n10. TOP SKILLS BY JOB FAMILY")
+    print("-" * 40)
+    for family, skills in sorted(analysis["top_by_family"].items()):
+        listed = ", ".join(f"{s['name']} ({s['percentage']}%)" for s in skills)
+        print(f"  [{family}] {listed}")
+
     print("\n" + "=" * 70)
 
     # -- Optional CSV output --
@@ -439,6 +513,18 @@ def _write_csv(analysis: dict, duplicates: list, family_to_domain: dict):
         writer.writerow(["Stale Mappings", "Skill", "Current Family", "New Family"])
         for s in analysis["stale_mappings"]:
             writer.writerow(["Stale", s["skill"], s["current_family"], s["new_family"]])
+        writer.writerow([])
+
+        # Near-misses
+        writer.writerow(["Near Misses", "Skill", "Count", "Suggestion", "Family"])
+        for m in analysis["near_misses"]:
+            writer.writerow(["Near Miss", m["skill"], m["count"], m["suggestion"], m["family"]])
+        writer.writerow([])
+
+        # Co-occurrence
+        writer.writerow(["Associations", "Skill 1", "Skill 2", "Count", "Lift", "PMI"])
+        for a in analysis["associations"]:
+            writer.writerow(["Association", a["skill_1"], a["skill_2"], a["count"], a["lift"], a["pmi"]])
 
     print(f"\n[DONE] CSV saved to: {CSV_OUTPUT_PATH}")
 
@@ -447,6 +533,8 @@ def main():
     parser = argparse.ArgumentParser(description="Audit skills taxonomy")
     parser.add_argument("--output-csv", action="store_true",
                         help="Save report to CSV")
+    parser.add_argument("--from-snapshot", nargs="?", const="", default=None, metavar="DIR",
+                        help="Read jobs from the local Parquet snapshot (default dir: .cache/snapshot)")
     args = parser.parse_args()
 
     print("Loading configuration files...")
@@ -460,13 +548,17 @@ def main():
     print(f"  schema_taxonomy families: {len(schema_families)}")
     print(f"  Duplicate entries: {len(duplicates)}")
 
-    print("\nFetching all jobs with skills from Supabase...")
-    supabase = get_supabase()
-    records = fetch_all_skills(supabase)
+    if args.from_snapshot is not None:
+        print("\nReading all jobs with skills from the local snapshot...")
+        records = fetch_snapshot_skills(args.from_snapshot or None)
+    else:
+        print("\nFetching all jobs with skills from Supabase...")
+        supabase = get_supabase()
+        records = fetch_all_skills(supabase)
     print(f"  Fetched {len(records):,} records")
 
     print("\nAnalyzing skills...")
-    analysis = analyze_skills(records, skill_mapping)
+    analysis = analyze_skills(records)
 
     print_report(analysis, duplicates, family_to_domain, skill_mapping,
                  schema_families, output_csv=args.output_csv)
@@ -6,7 +6,8 @@ Reprocess all existing jobs in enriched_jobs table to add agency detection flags
 import sys
 sys.path.insert(0, '.')
 from pipeline.db_connection import supabase
-from pipeline.agency_detection import detect_agency
+from pipeline import agency_detection
+from pipeline.agency_detection import detect_agency_batch
 import time
 
 def backfill_agency_flags(batch_size: int = 50, dry_run: bool = False, force_reprocess: bool = False):
@@ -23,10 +24,7 @@ def backfill_agency_flags(batch_size: int = 50, dry_run: bool = False, force_rep
     print("=" * 70)
     
     # Load hard filter for priority checking
-    import yaml
-    with open('config/agency_blacklist.yaml') as f:
-        AGENCY_CONFIG = yaml.safe_load(f)
-    HARD_FILTER = set(agency.lower().strip() for agency in AGENCY_CONFIG['hard_filter'])
+    HARD_FILTER = set(agency.lower().strip() for agency in agency_detection.HARD_FILTER)
     print(f"[PROTECT] Loaded hard filter: {len(HARD_FILTER)} agencies")
     
     # Step 1: Get all jobs that need agency flags (with pagination to handle >1000 records)
@@ -108,6 +106,12 @@ def backfill_agency_flags(batch_size: int = 50, dry_run: bool = False, force_rep
     print(f"   Dry run: {'YES (no changes will be made)' if dry_run else 'NO (will update database)'}")
     print()
     
+    # Pattern-match every job up front (name verdicts computed once per employer)
+    pattern_results = detect_agency_batch(
+        [job['employer_name'] for job in jobs],
+        [raw_text_map.get(job['raw_job_id']) for job in jobs]
+    )
+    
     updated_count = 0
     agency_count = 0
     error_count = 0
@@ -116,12 +120,8 @@ def backfill_agency_flags(batch_size: int = 50, dry_run: bool = False, force_rep
     for i, job in enumerate(jobs, 1):
         employer_name = job['employer_name']
         job_id = job['id']
-        raw_job_id = job['raw_job_id']
         current_is_agency = job.get('is_agency')
         
-        # Get raw text if available
-        job_text = raw_text_map.get(raw_job_id)
-        
         try:
             # PRIORITY CHECK: Is employer in hard filter?
             # This takes precedence over any pattern matching
@@ -138,8 +138,8 @@ def backfill_agency_flags(batch_size: int = 50, dry_run: bool = False, force_rep
                     corrected_count += 1
                     status = "[FIX]"  # Correction icon
             else:
-                # Not in hard filter, run pattern matching
-                is_agency, confidence = detect_agency(employer_name, job_text)
+                # Not in hard filter, use the pattern matching result
+                is_agency, confidence = pattern_results[i - 1]
                 status = "[DETECT]" if is_agency else "[OK]"
                 
                 # Track corrections
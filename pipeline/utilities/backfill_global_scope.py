@@ -21,6 +21,9 @@ python pipeline/utilities/backfill_global_scope.py --scope country --source leve
 # Only jobs classified before a certain date
 python pipeline/utilities/backfill_global_scope.py --scope global --before 2026-02-03
 
+# Scan descriptions across 4 processes (large backfills)
+python pipeline/utilities/backfill_global_scope.py --scope global --workers 4
+
 # Run for real (no --dry-run)
 python pipeline/utilities/backfill_global_scope.py --scope global
 """
@@ -33,7 +36,7 @@ from typing import List, Dict, Optional
 
 sys.path.insert(0, '.')
 from pipeline.db_connection import supabase
-from pipeline.location_extractor import extract_locations
+from pipeline.location_extractor import extract_locations_batch
 
 logging.basicConfig(
     level=logging.INFO,
@@ -142,6 +145,8 @@ Examples:
     parser.add_argument('--before', type=str, metavar='YYYY-MM-DD',
                         help='Only jobs classified before this date')
     parser.add_argument('--limit', type=int, help='Maximum jobs to process')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Scan descriptions in a process pool of this size')
     parser.add_argument('--dry-run', action='store_true', help='Show changes without applying')
     args = parser.parse_args()
 
@@ -174,22 +179,23 @@ Examples:
     # Step 3: Re-extract and compare
     stats = {'total': len(jobs), 'changed': 0, 'unchanged': 0, 'no_location': 0, 'errors': 0}
 
-    for i, job in enumerate(jobs, 1):
+    location_strs = []
+    descriptions = []
+    for job in jobs:
+        raw = raw_data.get(job.get('raw_job_id'), {})
+        location_strs.append(extract_location_string(raw.get('metadata', {})))
+        descriptions.append(raw.get('raw_text', ''))
+
+    extracted = extract_locations_batch(location_strs, descriptions, max_workers=args.workers)
+
+    for i, (job, location_str, new_locations) in enumerate(zip(jobs, location_strs, extracted), 1):
         enriched_id = job['id']
-        raw_job_id = job.get('raw_job_id')
         old_locations = job.get('locations', [])
 
-        raw = raw_data.get(raw_job_id, {})
-        metadata = raw.get('metadata', {})
-        description = raw.get('raw_text', '')
-
-        location_str = extract_location_string(metadata)
         if not location_str:
             stats['no_location'] += 1
             continue
 
-        new_locations = extract_locations(location_str, description_text=description)
-
         if not locations_changed(old_locations, new_locations):
             stats['unchanged'] += 1
             continue
@@ -23,11 +23,11 @@ import logging
 import argparse
 import sys
 import json
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional
 
 sys.path.insert(0, '.')
 from pipeline.db_connection import supabase
-from pipeline.location_extractor import extract_locations
+from pipeline.location_extractor import extract_locations_batch
 
 logging.basicConfig(
     level=logging.INFO,
@@ -44,6 +44,15 @@ CITY_CODE_TO_NAME = {
     'sgp': 'Singapore',
 }
 
+# Reverse mapping: extracted city key -> legacy city_code
+CITY_TO_CODE = {
+    'london': 'lon',
+    'new_york': 'nyc',
+    'denver': 'den',
+    'san_francisco': 'sfo',
+    'singapore': 'sgp',
+}
+
 
 def find_unknown_location_jobs(limit: int = None) -> List[Dict]:
     """
@@ -118,12 +127,12 @@ def get_raw_job_metadata(raw_job_ids: List[int]) -> Dict[int, Dict]:
     return metadata_map
 
 
-def extract_location_from_metadata(metadata: Dict) -> Tuple[List[Dict], str]:
+def get_source_location(metadata: Dict) -> Optional[str]:
     """
-    Extract location from raw_job metadata.
+    Pull the raw location string from raw_job metadata.
 
     Returns:
-        Tuple of (locations list, legacy city_code)
+        Location string, or None if no ATS location key is present
     """
     # Check ATS metadata keys for location info
     source_location = (
@@ -139,27 +148,16 @@ def extract_location_from_metadata(metadata: Dict) -> Tuple[List[Dict], str]:
     if source_location and source_location.lower() in CITY_CODE_TO_NAME:
         source_location = CITY_CODE_TO_NAME[source_location.lower()]
 
-    if not source_location:
-        return [{"type": "unknown"}], 'unk'
+    return source_location or None
 
-    locations = extract_locations(source_location)
 
-    # Derive legacy city_code
-    city_code = 'unk'
+def derive_city_code(locations: List[Dict]) -> str:
+    """Derive the legacy city_code from extracted locations."""
     if locations and locations[0].get('type') == 'city':
-        city_name = locations[0].get('city', '')
-        city_to_code = {
-            'london': 'lon',
-            'new_york': 'nyc',
-            'denver': 'den',
-            'san_francisco': 'sfo',
-            'singapore': 'sgp'
-        }
-        city_code = city_to_code.get(city_name, 'unk')
-    elif locations and locations[0].get('type') == 'remote':
-        city_code = 'remote'
-
-    return locations, city_code
+        return CITY_TO_CODE.get(locations[0].get('city', ''), 'unk')
+    if locations and locations[0].get('type') == 'remote':
+        return 'remote'
+    return 'unk'
 
 
 def update_job_location(enriched_id: int, locations: List[Dict], city_code: str) -> bool:
@@ -218,7 +216,16 @@ def main():
         'errors': 0
     }
 
-    for i, job in enumerate(unknown_jobs, 1):
+    # Extract all locations in one batch (each unique string parsed once)
+    source_locations = []
+    for job in unknown_jobs:
+        metadata = metadata_map.get(job['raw_job_id'], {}).get('metadata', {})
+        source_locations.append(get_source_location(metadata) if metadata else None)
+    extracted = extract_locations_batch(source_locations)
+
+    for i, (job, source_location, locations) in enumerate(
+        zip(unknown_jobs, source_locations, extracted), 1
+    ):
         enriched_id = job['id']
         raw_job_id = job['raw_job_id']
 
@@ -231,13 +238,13 @@ def main():
                 logger.debug(f"[{i}/{len(unknown_jobs)}] Job {enriched_id}: No metadata")
             continue
 
-        locations, city_code = extract_location_from_metadata(metadata)
-
         # Check if we found a real location
-        if locations[0].get('type') == 'unknown':
+        if not source_location or locations[0].get('type') == 'unknown':
             stats['still_unknown'] += 1
             continue
 
+        city_code = derive_city_code(locations)
+
         if args.dry_run:
             logger.info(f"[{i}/{len(unknown_jobs)}] Would update job {enriched_id}: {locations} (city_code: {city_code})")
             stats['updated'] += 1
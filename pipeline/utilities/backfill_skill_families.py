@@ -5,12 +5,13 @@ Updates existing enriched_jobs records with skill family codes
 using the deterministic skill_family_mapper.
 
 Usage:
-    python pipeline/utilities/backfill_skill_families.py [--dry-run] [--limit N] [--stats-only]
+    python pipeline/utilities/backfill_skill_families.py [--dry-run] [--limit N] [--stats-only] [--fuzzy]
 
 Options:
     --dry-run     Show what would be updated without making changes
     --limit N     Process only N records (for testing)
     --stats-only  Print mapping stats without querying DB
+    --fuzzy       Also map near-miss spellings (typos) to their closest skill
 """
 
 import os
@@ -18,7 +19,7 @@ import argparse
 from dotenv import load_dotenv
 from supabase import create_client
 
-from pipeline.skill_family_mapper import get_skill_family, get_canonical_name, get_mapping_stats
+from pipeline.skill_family_mapper import get_mapping_stats, lookup_skills
 
 load_dotenv()
 
@@ -32,13 +33,14 @@ def get_supabase():
     return create_client(url, key)
 
 
-def backfill_skill_families(dry_run: bool = False, limit: int = None):
+def backfill_skill_families(dry_run: bool = False, limit: int = None, fuzzy: bool = False):
     """
     Backfill skill family codes for all enriched_jobs records.
 
     Args:
         dry_run: If True, don't actually update the database
         limit: Maximum number of records to process
+        fuzzy: Also map near-miss spellings via the fuzzy skill index
     """
     supabase = get_supabase()
 
@@ -80,6 +82,15 @@ def backfill_skill_families(dry_run: bool = False, limit: int = None):
         "records_updated": 0,
     }
 
+    # Resolve every distinct skill name once: name -> (canonical, family)
+    names = [
+        skill.get("name", "")
+        for record in all_records
+        if isinstance(record.get("skills"), list)
+        for skill in record["skills"]
+    ]
+    resolved = dict(zip(names, lookup_skills(names, fuzzy=fuzzy)))
+
     updates = []
 
     for record in all_records:
@@ -96,8 +107,7 @@ def backfill_skill_families(dry_run: bool = False, limit: int = None):
         for skill in skills:
             name = skill.get("name", "")
             current_family = skill.get("family_code")
-            canonical = get_canonical_name(name)
-            new_family = get_skill_family(name)
+            canonical, new_family = resolved[name]
 
             # Detect name casing change
             if canonical != name:
@@ -177,9 +187,11 @@ if __name__ == "__main__":
     parser.add_argument("--limit", type=int, help="Limit records to process")
     parser.add_argument("--stats-only", action="store_true",
                         help="Print mapping stats without querying DB")
+    parser.add_argument("--fuzzy", action="store_true",
+                        help="Also map near-miss spellings (typos) to their closest skill")
     args = parser.parse_args()
 
     if args.stats_only:
         print_stats_only()
     else:
-        backfill_skill_families(dry_run=args.dry_run, limit=args.limit)
+        backfill_skill_families(dry_run=args.dry_run, limit=args.limit, fuzzy=args.fuzzy)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Build the config snapshot file.
+
+Parses every registered config (YAML/JSON) and builds every compiled lookup
+(agency detector, skill/country/job family maps, Greenhouse URL types), then
+pickles them to a single file keyed by the hashes of their sources. Later
+processes load it on first use instead of re-parsing, and ignore it once any
+config file or builder module changes.
+
+run_all_cities.py runs this automatically before starting the per-city
+fetches.
+
+Usage:
+    python pipeline/utilities/build_config_snapshot.py
+    python pipeline/utilities/build_config_snapshot.py --path /tmp/config_snapshot.pkl
+    python pipeline/utilities/build_config_snapshot.py --check
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from pipeline.config_registry import SNAPSHOT_PATH, load_snapshot_file, write_snapshot_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the config snapshot file")
+    parser.add_argument('--path', type=Path, default=None,
+                        help=f'Snapshot file (default: {SNAPSHOT_PATH})')
+    parser.add_argument('--check', action='store_true',
+                        help='Only report whether the existing snapshot is current')
+    args = parser.parse_args()
+
+    path = args.path or SNAPSHOT_PATH
+
+    if args.check:
+        if load_snapshot_file(path):
+            print(f"Config snapshot is current: {path}")
+        else:
+            print(f"Config snapshot is missing or stale: {path}")
+            sys.exit(1)
+        return
+
+    write_snapshot_file(path)
+    print(f"Wrote config snapshot: {path} ({path.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
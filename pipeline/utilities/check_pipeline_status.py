@@ -14,10 +14,13 @@ See: docs/architecture/GLOBAL_LOCATION_EXPANSION_EPIC.md
 
 Usage:
     python check_pipeline_status.py
+    python check_pipeline_status.py --from-snapshot          # local Parquet snapshot, no queries
+    python check_pipeline_status.py --from-snapshot /tmp/snapshot
 """
 
 import sys
 import json
+import argparse
 sys.path.insert(0, '.')
 from pipeline.db_connection import supabase
 from datetime import datetime, timedelta
@@ -61,8 +64,55 @@ def format_timestamp(ts):
         return str(ts)[:19]
 
 
-def get_status():
-    """Fetch pipeline status from database."""
+def get_snapshot_status(snapshot):
+    """Compute pipeline status from a local JobsSnapshot (same shape as get_status)."""
+    location_counts = {}
+    unknown_count = 0
+    jobs = snapshot.rows('enriched_jobs', ['locations', 'posted_date'])
+    for job in jobs:
+        location = extract_primary_city(job.get('locations'))
+        if location == 'unknown':
+            unknown_count += 1
+        else:
+            location_counts[location] = location_counts.get(location, 0) + 1
+
+    posted_dates = [job['posted_date'] for job in jobs if job.get('posted_date')]
+
+    source_counts = {}
+    null_source_count = 0
+    for job in snapshot.rows('raw_jobs', ['source']):
+        source = job.get('source')
+        if source is None:
+            null_source_count += 1
+        else:
+            source_counts[source] = source_counts.get(source, 0) + 1
+
+    return {
+        'raw_count': snapshot.count('raw_jobs'),
+        'enriched_count': len(jobs),
+        'location_counts': location_counts,
+        'unknown_location_count': unknown_count,
+        'last_job_time': max(posted_dates) if posted_dates else None,
+        'source_counts': source_counts,
+        'null_source_count': null_source_count,
+        'rows_fetched': len(jobs),
+    }
+
+
+def get_status(snapshot=None):
+    """
+    Fetch pipeline status from database.
+
+    Args:
+        snapshot: Optional JobsSnapshot to read instead of querying Supabase
+    """
+    if snapshot is not None:
+        try:
+            return get_snapshot_status(snapshot)
+        except Exception as e:
+            print(f"Error reading snapshot: {e}", file=sys.stderr)
+            return None
+
     try:
         # Total counts
         raw_response = supabase.table('raw_jobs').select('count', count='exact').execute()
@@ -155,11 +205,24 @@ def get_status():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Quick status check for the job classification pipeline")
+    parser.add_argument("--from-snapshot", nargs="?", const="", default=None, metavar="DIR",
+                        help="Read the local Parquet snapshot instead of Supabase (default dir: .cache/snapshot)")
+    args = parser.parse_args()
+
+    snapshot = None
+    if args.from_snapshot is not None:
+        from pipeline.jobs_snapshot import JobsSnapshot
+        snapshot = JobsSnapshot(args.from_snapshot or None)
+
     print("\n" + "="*60)
     print("PIPELINE STATUS CHECK")
     print("="*60 + "\n")
+    if snapshot is not None:
+        synced = snapshot.state().get('enriched_jobs', {}).get('synced_at')
+        print(f"Source: snapshot {snapshot.directory} (synced {format_timestamp(synced)})\n")
 
-    status = get_status()
+    status = get_status(snapshot)
     if not status:
         print("Failed to retrieve status. Check your database connection.")
         return
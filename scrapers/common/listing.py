@@ -0,0 +1,42 @@
+"""
+Listing capture for ATS scrapers.
+
+Every fetcher already downloads a company's complete job listing before
+title/location filtering. build_listing() reduces that listing to
+{job_id: updated_at}, which the fetchers return as stats['listing'] so the
+pipeline can persist it (pipeline/listing_snapshots.py) and the freshness
+checker can reuse it instead of fetching the same board again.
+
+Job ids use the same form as raw_jobs.source_job_id (strings).
+
+USAGE:
+    from scrapers.common.listing import build_listing
+
+    stats['listing'] = build_listing(jobs_data, 'id', ('updated_at',))
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def build_listing(jobs_data: List[Dict], id_key: str = 'id',
+                  updated_keys: Iterable[str] = ('updated_at',)) -> Dict[str, Optional[Any]]:
+    """
+    Reduce raw API job dicts to {job_id: updated_at}.
+
+    Args:
+        jobs_data: Raw job dicts from the ATS listing (before filtering)
+        id_key: Key holding the job id (as stored in raw_jobs.source_job_id)
+        updated_keys: Keys tried in order for the job's last-updated timestamp
+
+    Returns:
+        Dict of job id (str) -> first non-empty updated_keys value, or None
+    """
+    listing = {}
+    for job in jobs_data:
+        if not isinstance(job, dict):
+            continue
+        job_id = job.get(id_key)
+        if not job_id:
+            continue
+        listing[str(job_id)] = next((job[key] for key in updated_keys if job.get(key)), None)
+    return listing
@@ -184,6 +184,7 @@ def fetch_greenhouse_jobs(
         'jobs_kept': 0,
         'filtered_by_title': 0,
         'filtered_by_location': 0,
+        'listing': None,
         'error': None
     }
 
@@ -214,6 +215,10 @@ def fetch_greenhouse_jobs(
 
         stats['jobs_fetched'] = len(jobs_data)
 
+        # Complete (pre-filter) listing, persisted as a listing snapshot
+        from scrapers.common.listing import build_listing
+        stats['listing'] = build_listing(jobs_data, 'id', ('updated_at',))
+
         # Load filter patterns if filtering enabled
         if filter_titles and title_patterns is None:
             from scrapers.common.filters import load_title_patterns
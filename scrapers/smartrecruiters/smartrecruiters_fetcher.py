@@ -198,6 +198,7 @@ def fetch_smartrecruiters_jobs(
         'jobs_kept': 0,
         'filtered_by_title': 0,
         'filtered_by_location': 0,
+        'listing': None,
         'error': None
     }
 
@@ -269,6 +270,10 @@ def fetch_smartrecruiters_jobs(
 
         stats['jobs_fetched'] = len(all_jobs_data)
 
+        # Complete (pre-filter) listing, persisted as a listing snapshot
+        from scrapers.common.listing import build_listing
+        stats['listing'] = build_listing(all_jobs_data, 'id', ('releasedDate',))
+
         # Parse and filter jobs
         jobs = []
         for job_data in all_jobs_data:
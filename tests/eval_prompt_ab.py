@@ -52,8 +52,8 @@ from pipeline.classifier import (
     build_classification_prompt_v2,
     adapt_prompt_for_gemini,
     get_gemini_model_for_source,
-    gemini_client,
-    _gemini_generation_config,
+    get_gemini_client,
+    _get_generation_config,
     sanitize_null_strings,
     PROVIDER_COSTS,
     _get_model_costs,
@@ -413,10 +413,10 @@ def _classify_v2(job: Dict, model: str = None) -> Dict:
     prompt = build_classification_prompt_v2(job["description"], structured_input=structured_input)
 
     start_time = time.time()
-    response = gemini_client.models.generate_content(
+    response = get_gemini_client().models.generate_content(
         model=model,
         contents=prompt,
-        config=_gemini_generation_config,
+        config=_get_generation_config(),
     )
     latency_ms = (time.time() - start_time) * 1000
 
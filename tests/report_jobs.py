@@ -0,0 +1,84 @@
+"""
+Synthetic enriched_jobs rows for the report engine tests
+
+Shared by test_report_generator.py, test_report_batch.py and
+test_report_rollups.py. Each suite passes its own value pools; rows are
+reproducible from the seed.
+
+Usage:
+    from tests.report_jobs import synthetic_jobs
+
+    jobs = synthetic_jobs(seed, 600)                                  # dated, 5 employers/skills
+    jobs = synthetic_jobs(seed, 300, dated=False, skill_rate=0.7)     # undated, some without skills
+    jobs = synthetic_jobs(seed, 600, extra={'accessible_city_codes': CITY_SETS})
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+EMPLOYERS = ['acme', 'globex', 'initech', 'hooli', 'jpmorganchase']
+SKILLS = ['Python', 'SQL', 'dbt', 'Spark', 'AWS']
+
+# Choice pools for the categorical fields (override per suite via **fields)
+FIELDS = {
+    'is_agency': [None, False, False, True],
+    'data_source': ['greenhouse', 'adzuna', 'ashby'],
+    'seniority': ['senior', 'mid', 'junior', None],
+    'job_subfamily': ['data_engineer', 'data_analyst', None],
+    'track': ['ic', 'management', None],
+    'working_arrangement': ['hybrid', 'remote', 'onsite', 'unknown'],
+}
+
+
+def synthetic_jobs(seed: int, n: int, employers: Sequence[str] = EMPLOYERS,
+                   skills: Sequence[str] = SKILLS, max_skills: int = 3, skill_rate: float = 1.0,
+                   string_skill_rate: float = 0.0, salary_rate: float = 1.0,
+                   salary_low: Tuple[int, int] = (90_000, 200_000),
+                   salary_spreads: Sequence[int] = (20_000,), orphan_salary_max: bool = False,
+                   dated: bool = True, extra: Optional[Dict[str, list]] = None,
+                   **fields: list) -> List[dict]:
+    """
+    Random enriched_jobs rows.
+
+    Args:
+        seed: random.Random seed
+        n: Number of jobs
+        employers: employer_name pool
+        skills: Skill name pool; a job samples 0..max_skills of them
+        skill_rate: Share of jobs with a skills key (the rest have none)
+        string_skill_rate: Share of skills given as plain strings, not {'name': ...}
+        salary_rate: Share of jobs with a salary
+        salary_low: salary_min range (5k steps)
+        salary_spreads: salary_max - salary_min choices
+        orphan_salary_max: Jobs without salary_min still get a salary_max
+        dated: Add job_family (data/product) and posted_date (Nov/Dec 2025)
+        extra: Further {field: choices}, e.g. accessible_city_codes or locations
+        **fields: Replacement choice pools for FIELDS
+
+    Returns:
+        List of job dicts.
+    """
+    pools = {**FIELDS, **fields}
+    rng = random.Random(seed)
+    jobs = []
+    for _ in range(n):
+        job = {'employer_name': rng.choice(employers)}
+        job.update({field: rng.choice(choices) for field, choices in pools.items()})
+        if dated:
+            job['job_family'] = rng.choice(['data', 'product'])
+            job['posted_date'] = f"2025-{rng.choice([11, 12])}-{rng.randint(1, 30):02d}"
+        for field, choices in (extra or {}).items():
+            job[field] = rng.choice(choices)
+
+        if rng.random() < skill_rate:
+            names = rng.sample(list(skills), rng.randint(0, max_skills))
+            job['skills'] = [name if rng.random() < string_skill_rate else {'name': name} for name in names]
+
+        low = rng.randrange(salary_low[0], salary_low[1], 5_000)
+        spread = rng.choice(salary_spreads)
+        if rng.random() < salary_rate:
+            job['salary_min'], job['salary_max'] = low, low + spread
+        else:
+            job['salary_min'], job['salary_max'] = None, low + spread if orphan_salary_max else None
+        jobs.append(job)
+    return jobs
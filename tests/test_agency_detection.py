@@ -8,6 +8,7 @@ Tests:
 - detect_agency(): pattern matching for company names and descriptions
 - validate_agency_classification(): combining pattern matching with Claude output
 - is_agency_job(): simple boolean wrapper
+- detect_agency_batch() / AgencyDetector: compiled matcher and batch API
 """
 
 import sys
@@ -21,6 +22,10 @@ from pipeline.agency_detection import (
     detect_agency,
     validate_agency_classification,
     is_agency_job,
+    detect_agency_batch,
+    get_agency_detector,
+    clear_detector_cache,
+    _PhraseMatcher,
     HARD_FILTER,
     HIGH_CONF_KEYWORDS,
     MED_CONF_KEYWORDS,
@@ -270,5 +275,60 @@ class TestConfigLoaded:
         assert len(AGENCY_PHRASES) > 0
 
 
+class TestPhraseMatcher:
+    """Test the compiled multi-phrase matcher"""
+
+    def test_matches_substring_semantics(self):
+        """Found phrases should equal the naive `phrase in text` set"""
+        phrases = ['talent', 'talent acquisition', 'acquisition', 'search', 'executive search']
+        matcher = _PhraseMatcher(phrases)
+        text = 'executive search and talent acquisition'
+        assert matcher.find(text) == {p for p in phrases if p in text}
+
+    def test_overlapping_phrases_at_same_position(self):
+        """A phrase that is a prefix of a longer match is still counted"""
+        matcher = _PhraseMatcher(['recruit', 'recruitment'])
+        assert matcher.count('acme recruitment') == 2
+
+    def test_stop_at_caps_count(self):
+        """stop_at should end the scan early"""
+        matcher = _PhraseMatcher(['our client', 'on behalf of', 'leading company'])
+        text = 'our client, a leading company, on behalf of'
+        assert matcher.count(text, stop_at=2) == 2
+
+    def test_empty_text(self):
+        """Empty text has no matches"""
+        assert _PhraseMatcher(['staffing']).count('') == 0
+
+
+class TestDetectAgencyBatch:
+    """Test batch API and per-employer memoization"""
+
+    def test_batch_matches_single_calls(self):
+        """Batch results should equal per-job detect_agency calls"""
+        names = ["Tech Staffing Solutions", "Google", "", None, "Unknown Consulting", "Google"]
+        descs = [None, "Our client is hiring", None, None,
+                 "Our client, a leading company, is hiring.", "On behalf of our client"]
+        expected = [detect_agency(n, d) for n, d in zip(names, descs)]
+        assert detect_agency_batch(names, descs) == expected
+
+    def test_batch_without_descriptions(self):
+        """Descriptions are optional"""
+        names = ["Hays Recruitment", "Microsoft Solutions"]
+        assert detect_agency_batch(names) == [detect_agency(n) for n in names]
+
+    def test_batch_length_mismatch_raises(self):
+        """Misaligned descriptions are rejected"""
+        with pytest.raises(ValueError):
+            detect_agency_batch(["Google"], ["a", "b"])
+
+    def test_name_verdict_memoized(self):
+        """Repeated calls for one employer reuse the cached name verdict"""
+        clear_detector_cache()
+        detect_agency("Tech Staffing Solutions")
+        detect_agency("  TECH STAFFING SOLUTIONS ")
+        assert len(get_agency_detector()._name_cache) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,464 @@
+"""
+Test API freshness checker
+
+All HTTP and database calls mocked. Tests per-host rate limiting, the
+company-level safeguards and concurrent per-source checking.
+
+Tests:
+1. HostRateLimiter spacing (per host, across threads)
+   Listing-only fetchers (streamed id extraction)
+2. check_company() safeguards and active/closed split
+3. iter_active_jobs_by_source() / iter_companies() single-call server join
+4. check_source() concurrency and batched DB updates
+5. run_freshness_check() aggregation across sources
+6. IngestClosureDetector (closures from listings fetched by the ingest)
+"""
+
+import io
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline import api_freshness_checker as afc
+from pipeline.api_freshness_checker import (
+    HostRateLimiter,
+    IngestClosureDetector,
+    fetch_greenhouse_job_ids,
+    fetch_lever_job_ids,
+    fetch_smartrecruiters_job_ids,
+    fetch_workable_job_ids,
+    check_company,
+    check_source,
+    iter_active_jobs_by_source,
+    iter_companies,
+    run_freshness_check,
+)
+
+NOW = datetime(2026, 3, 1, 9, 0)
+
+
+def _tracked(slug, ids, start=0):
+    """Tracked jobs as returned by get_active_jobs_by_source()."""
+    return [
+        {'enriched_job_id': start + i, 'source_job_id': job_id, 'company_slug': slug,
+         'api_last_seen_at': None, 'lever_instance': 'global'}
+        for i, job_id in enumerate(ids)
+    ]
+
+
+def _companies(jobs):
+    """Stand-in for iter_companies() over a fixed job list."""
+    return lambda source: iter(afc.group_by_company(jobs).items())
+
+
+def _updates(mock_sb):
+    """(fields, ids) for each enriched_jobs update().in_() call."""
+    table = mock_sb.table.return_value
+    fields = [c.args[0] for c in table.update.call_args_list]
+    id_lists = [c.args[1] for c in table.update.return_value.in_.call_args_list]
+    return list(zip(fields, id_lists))
+
+
+class TestHostRateLimiter:
+    """Test per-host request spacing"""
+
+    def test_spaces_requests_on_same_host(self):
+        """Consecutive requests to one host start an interval apart"""
+        limiter = HostRateLimiter({'api.example.com': 0.05})
+        starts = []
+        for _ in range(3):
+            limiter.wait('https://api.example.com/jobs')
+            starts.append(time.monotonic())
+        assert starts[1] - starts[0] >= 0.045
+        assert starts[2] - starts[1] >= 0.045
+
+    def test_hosts_are_independent(self):
+        """A busy host does not delay another"""
+        limiter = HostRateLimiter({'slow.example.com': 1.0}, default_interval=0.0)
+        limiter.wait('https://slow.example.com/a')
+        started = time.monotonic()
+        limiter.wait('https://fast.example.com/a')
+        assert time.monotonic() - started < 0.1
+
+    def test_spacing_holds_across_threads(self):
+        """Concurrent callers still get distinct, spaced slots"""
+        limiter = HostRateLimiter({'api.example.com': 0.03})
+        starts = []
+        lock = threading.Lock()
+
+        def call():
+            limiter.wait('https://api.example.com/jobs')
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.025
+
+    def test_every_source_host_is_limited(self):
+        """All API hosts (both Lever instances) carry their source's rate limit"""
+        intervals = afc.RATE_LIMITER.intervals
+        assert intervals['boards-api.greenhouse.io'] == afc.RATE_LIMITS['greenhouse']
+        assert intervals['api.eu.lever.co'] == afc.RATE_LIMITS['lever']
+        assert intervals['api.smartrecruiters.com'] == afc.RATE_LIMITS['smartrecruiters']
+
+
+def _listing_response(payload, status_code=200):
+    """Streamed requests response whose raw body is the JSON payload."""
+    response = Mock(status_code=status_code)
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    response.raw = io.BytesIO(body)
+    if status_code >= 400:
+        response.raise_for_status.side_effect = Exception(f"HTTP {status_code}")
+    return response
+
+
+@pytest.fixture(autouse=True)
+def no_listing_snapshots(monkeypatch):
+    """Tests fetch listings unless they provide snapshots explicitly"""
+    monkeypatch.setattr(afc, 'load_listing_snapshots', lambda source, max_age: {})
+
+
+@pytest.fixture
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(afc, 'RATE_LIMITER', HostRateLimiter({}, default_interval=0.0))
+
+
+class TestListingFetchers:
+    """Test listing-only fetches with streamed id extraction"""
+
+    def test_greenhouse_ids_as_strings(self, no_rate_limit):
+        payload = {'jobs': [{'id': 123, 'title': 'DE', 'location': {'id': 9}}, {'id': 456}], 'meta': {'total': 2}}
+        with patch('pipeline.api_freshness_checker.requests.get',
+                   return_value=_listing_response(payload)) as get:
+            assert fetch_greenhouse_job_ids('acme') == {'123', '456'}
+
+        kwargs = get.call_args.kwargs
+        assert kwargs['stream'] is True
+        assert 'content' not in (kwargs.get('params') or {})
+
+    def test_lever_top_level_array(self, no_rate_limit):
+        payload = [{'id': 'abc', 'descriptionPlain': 'x' * 10000}, {'id': 'def'}]
+        with patch('pipeline.api_freshness_checker.requests.get',
+                   return_value=_listing_response(payload)) as get:
+            assert fetch_lever_job_ids('acme', 'eu') == {'abc', 'def'}
+        assert get.call_args.args[0].startswith(afc.LEVER_API_URLS['eu'])
+
+    def test_workable_shortcodes_without_details(self, no_rate_limit):
+        payload = {'name': 'Acme', 'jobs': [{'shortcode': 'AB12', 'id': 1}, {'shortcode': ''}]}
+        with patch('pipeline.api_freshness_checker.requests.get',
+                   return_value=_listing_response(payload)) as get:
+            assert fetch_workable_job_ids('acme') == {'AB12'}
+        assert 'details' not in (get.call_args.kwargs.get('params') or {})
+
+    def test_missing_jobs_array_is_failure(self, no_rate_limit):
+        """A body without the jobs array (error payload) is not an empty board"""
+        with patch('pipeline.api_freshness_checker.requests.get',
+                   return_value=_listing_response({'error': 'nope'})):
+            assert fetch_greenhouse_job_ids('acme') is None
+        with patch('pipeline.api_freshness_checker.requests.get',
+                   return_value=_listing_response({'jobs': []})):
+            assert fetch_greenhouse_job_ids('acme') == set()
+
+    def test_http_errors_and_bad_json(self, no_rate_limit):
+        for response in (_listing_response({}, 404), _listing_response({}, 500),
+                         _listing_response(b'{"jobs": [{"id": 1}')):
+            with patch('pipeline.api_freshness_checker.requests.get', return_value=response):
+                assert fetch_greenhouse_job_ids('acme') is None
+            assert response.close.called
+
+    def test_smartrecruiters_pages(self, no_rate_limit):
+        pages = [
+            {'offset': 0, 'limit': 2, 'totalFound': 3, 'content': [{'id': 'a'}, {'id': 'b'}]},
+            {'offset': 2, 'limit': 2, 'totalFound': 3, 'content': [{'id': 'c'}]},
+        ]
+        with patch('pipeline.api_freshness_checker.requests.get',
+                   side_effect=[_listing_response(p) for p in pages]) as get, \
+             patch.object(afc, 'SMARTRECRUITERS_PAGE_LIMIT', 2):
+            assert fetch_smartrecruiters_job_ids('acme') == {'a', 'b', 'c'}
+
+        assert [c.kwargs['params']['offset'] for c in get.call_args_list] == [0, 2]
+
+    def test_smartrecruiters_rate_limited_page_fails_company(self, no_rate_limit):
+        pages = [
+            _listing_response({'totalFound': 300, 'content': [{'id': 'a'}]}),
+            _listing_response({}, 429),
+        ]
+        with patch('pipeline.api_freshness_checker.requests.get', side_effect=pages):
+            assert fetch_smartrecruiters_job_ids('acme') is None
+
+
+class TestCheckCompany:
+    """Test company-level safeguards"""
+
+    def _check(self, api_ids, tracked_ids, source='ashby'):
+        with patch.dict(afc.API_FETCHERS, {source: lambda *args: api_ids}):
+            return check_company(source, 'acme', _tracked('acme', tracked_ids))
+
+    def test_api_error_skips_company(self):
+        assert self._check(None, ['a', 'b'])['outcome'] == 'error'
+
+    def test_empty_listing_skips_company(self):
+        assert self._check(set(), ['a'])['outcome'] == 'empty'
+
+    def test_all_absent_is_suspicious(self):
+        result = self._check({'x', 'y'}, ['a', 'b'])
+        assert result['outcome'] == 'suspicious'
+        assert result['api_count'] == 2
+
+    def test_single_absent_job_is_closed(self):
+        """One tracked job missing from a non-empty listing is a real closure"""
+        result = self._check({'x'}, ['a'])
+        assert result['outcome'] == 'checked'
+        assert result['closed_ids'] == [0]
+
+    def test_splits_active_and_closed(self):
+        result = self._check({'a', 'c', 'z'}, ['a', 'b', 'c'])
+        assert result['outcome'] == 'checked'
+        assert result['active_ids'] == [0, 2]
+        assert result['closed_ids'] == [1]
+
+    def test_lever_passes_instance(self):
+        calls = []
+        with patch.dict(afc.API_FETCHERS, {'lever': lambda *args: calls.append(args) or {'a'}}):
+            jobs = _tracked('acme', ['a'])
+            jobs[0]['lever_instance'] = 'eu'
+            check_company('lever', 'acme', jobs)
+        assert calls == [('acme', 'eu')]
+
+
+def _rpc_row(slug, job_id):
+    return {'enriched_job_id': job_id, 'source_job_id': str(job_id), 'company_slug': slug,
+            'lever_instance': 'global', 'api_last_seen_at': None}
+
+
+class TestActiveJobsStream:
+    """Test the server-side join (migration 031)"""
+
+    def test_whole_source_in_one_call(self):
+        """One RPC call per source, no pagination"""
+        rows = [_rpc_row('acme', 1), _rpc_row('acme', 2), _rpc_row('globex', 4), _rpc_row('initech', 5)]
+        with patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            mock_sb.rpc.return_value.execute.return_value = Mock(data=rows)
+            streamed = list(iter_active_jobs_by_source('ashby'))
+
+        assert [row['enriched_job_id'] for row in streamed] == [1, 2, 4, 5]
+        mock_sb.rpc.assert_called_once_with('get_active_jobs_by_source', {'p_source': 'ashby'})
+        assert not mock_sb.table.called
+
+    def test_companies_grouped(self):
+        """Consecutive rows of a company are yielded once, with all its jobs"""
+        rows = [_rpc_row('acme', 1), _rpc_row('acme', 2), _rpc_row('acme', 3), _rpc_row('globex', 4)]
+        with patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            mock_sb.rpc.return_value.execute.return_value = Mock(data=rows)
+            companies = [(slug, [j['enriched_job_id'] for j in jobs])
+                         for slug, jobs in iter_companies('ashby')]
+
+        assert companies == [('acme', [1, 2, 3]), ('globex', [4])]
+
+    def test_empty_source(self):
+        """A source without active jobs yields no companies"""
+        with patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            mock_sb.rpc.return_value.execute.return_value = Mock(data=[])
+            assert list(iter_companies('ashby')) == []
+
+    def test_falls_back_to_client_join(self):
+        """Without the RPC, jobs come from the client-side join"""
+        jobs = _tracked('acme', ['a']) + _tracked('globex', ['b'], start=5)
+        with patch('pipeline.api_freshness_checker.supabase') as mock_sb, \
+             patch.object(afc, 'get_active_jobs_by_source', return_value=jobs):
+            mock_sb.rpc.return_value.execute.side_effect = Exception("function does not exist")
+            companies = dict(iter_companies('ashby'))
+
+        assert set(companies) == {'acme', 'globex'}
+
+
+class TestCheckSource:
+    """Test concurrent per-source checking"""
+
+    def test_companies_fetched_concurrently(self):
+        """Slow listings overlap instead of running back to back"""
+        jobs = []
+        for n in range(6):
+            jobs += _tracked(f"co{n}", ['a'], start=n * 10)
+
+        def slow_fetch(slug):
+            time.sleep(0.1)
+            return {'a'}
+
+        with patch.object(afc, 'iter_companies', _companies(jobs)), \
+             patch.dict(afc.API_FETCHERS, {'ashby': slow_fetch}), \
+             patch.dict(afc.SOURCE_CONCURRENCY, {'ashby': 6}), \
+             patch('pipeline.api_freshness_checker.supabase'):
+            started = time.monotonic()
+            stats = check_source('ashby', NOW)
+            elapsed = time.monotonic() - started
+
+        assert stats['companies_checked'] == 6
+        assert elapsed < 0.4
+
+    def test_updates_batched_across_companies(self, monkeypatch):
+        """Active/closed ids from many companies share .in_() updates"""
+        monkeypatch.setattr(afc, 'DB_BATCH_SIZE', 500)
+        jobs = _tracked('acme', ['a', 'b']) + _tracked('globex', ['c', 'd'], start=10) \
+            + _tracked('broken', ['e'], start=20)
+        listings = {'acme': {'a'}, 'globex': {'c', 'd'}, 'broken': None}
+
+        with patch.object(afc, 'iter_companies', _companies(jobs)), \
+             patch.dict(afc.API_FETCHERS, {'ashby': listings.get}), \
+             patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            stats = check_source('ashby', NOW)
+
+        updates = _updates(mock_sb)
+        assert len(updates) == 2
+        active = [ids for fields, ids in updates if fields['url_status'] == 'active'][0]
+        closed = [ids for fields, ids in updates if fields['url_status'] == 'soft_404'][0]
+        assert sorted(active) == [0, 10, 11]
+        assert closed == [1]
+        assert stats['companies_skipped_error'] == 1
+        assert stats['jobs_marked_closed'] == 1
+
+    def test_recent_snapshot_replaces_fetch(self, monkeypatch):
+        """Companies with a recent ingest snapshot are not fetched again"""
+        jobs = _tracked('acme', ['a', 'b']) + _tracked('globex', ['c'], start=10)
+        fetched = []
+        monkeypatch.setattr(afc, 'load_listing_snapshots',
+                            lambda source, max_age: {'acme': {'a'}})
+
+        def fetch(slug):
+            fetched.append(slug)
+            return {'c'}
+
+        with patch.object(afc, 'iter_companies', _companies(jobs)), \
+             patch.dict(afc.API_FETCHERS, {'ashby': fetch}), \
+             patch('pipeline.api_freshness_checker.supabase'):
+            stats = check_source('ashby', NOW, dry_run=True)
+
+        assert fetched == ['globex']
+        assert stats['companies_from_snapshot'] == 1
+        assert stats['jobs_marked_closed'] == 1  # 'b' absent from the snapshot
+
+    def test_snapshot_still_guarded(self):
+        """Snapshot listings go through the same safeguards as API listings"""
+        result = check_company('ashby', 'acme', _tracked('acme', ['a', 'b']), snapshot_ids=set())
+        assert result['outcome'] == 'empty'
+
+    def test_dry_run_writes_nothing(self):
+        jobs = _tracked('acme', ['a', 'b'])
+        with patch.object(afc, 'iter_companies', _companies(jobs)), \
+             patch.dict(afc.API_FETCHERS, {'ashby': lambda slug: {'a'}}), \
+             patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            stats = check_source('ashby', NOW, dry_run=True)
+
+        assert not mock_sb.table.return_value.update.called
+        assert stats['jobs_marked_closed'] == 1
+
+
+class TestIngestClosureDetector:
+    """Test closure detection on listings already fetched by the ingest"""
+
+    def test_absent_jobs_closed_in_one_batch(self):
+        jobs = _tracked('acme', ['a', 'b']) + _tracked('globex', ['c', 'd'], start=10)
+        with patch.object(afc, 'iter_companies', _companies(jobs)), \
+             patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            closures = IngestClosureDetector('ashby', now=NOW)
+            closures.check('acme', {'a': None, 'new': None})
+            closures.check('globex', {'c': '2026-02-01'})
+            assert not mock_sb.table.return_value.update.called  # buffered until finish()
+            stats = closures.finish()
+
+        updates = dict((fields['url_status'], ids) for fields, ids in _updates(mock_sb))
+        assert updates == {'active': [0, 10], 'soft_404': [1, 11]}
+        assert stats['companies_checked'] == 2
+        assert stats['jobs_marked_closed'] == 2
+
+    def test_tracked_jobs_loaded_once(self):
+        loads = []
+
+        def companies(source):
+            loads.append(source)
+            return iter(afc.group_by_company(_tracked('acme', ['a'])).items())
+
+        with patch.object(afc, 'iter_companies', companies), \
+             patch('pipeline.api_freshness_checker.supabase'):
+            closures = IngestClosureDetector('lever', dry_run=True)
+            closures.check('acme', {'a': None})
+            closures.check('globex', {'x': None})
+
+        assert loads == ['lever']
+
+    def test_safeguards_apply(self):
+        jobs = _tracked('acme', ['a', 'b']) + _tracked('globex', ['c', 'd'], start=10)
+        with patch.object(afc, 'iter_companies', _companies(jobs)), \
+             patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            closures = IngestClosureDetector('ashby')
+            assert closures.check('acme', None)['outcome'] == 'error'
+            assert closures.check('acme', {})['outcome'] == 'empty'
+            assert closures.check('globex', {'x': None, 'y': None})['outcome'] == 'suspicious'
+            stats = closures.finish()
+
+        assert not mock_sb.table.return_value.update.called
+        assert stats['jobs_marked_closed'] == 0
+        assert stats['companies_skipped_suspicious'] == 1
+
+    def test_untracked_company_is_noop(self):
+        with patch.object(afc, 'iter_companies', _companies([])), \
+             patch('pipeline.api_freshness_checker.supabase') as mock_sb:
+            closures = IngestClosureDetector('ashby')
+            result = closures.check('newco', {'a': None})
+            stats = closures.finish()
+
+        assert result['closed_ids'] == []
+        assert stats['companies_checked'] == 0
+        assert not mock_sb.table.return_value.update.called
+
+
+class TestRunFreshnessCheck:
+    """Test source-level parallelism and totals"""
+
+    def test_sources_run_in_parallel_and_totals_add_up(self):
+        def fake_check_source(source, now, dry_run=False, snapshot_max_age_hours=0):
+            time.sleep(0.1)
+            return {'companies_checked': 1, 'companies_skipped_error': 0,
+                    'companies_skipped_suspicious': 0, 'jobs_confirmed_active': 2,
+                    'jobs_marked_closed': 1}
+
+        with patch.object(afc, 'check_source', side_effect=fake_check_source):
+            started = time.monotonic()
+            totals = run_freshness_check(sources=afc.API_SOURCES, dry_run=True)
+            elapsed = time.monotonic() - started
+
+        assert totals['companies_checked'] == len(afc.API_SOURCES)
+        assert totals['jobs_marked_closed'] == len(afc.API_SOURCES)
+        assert elapsed < 0.4
+
+    def test_failed_source_does_not_stop_others(self):
+        def fake_check_source(source, now, dry_run=False, snapshot_max_age_hours=0):
+            if source == 'lever':
+                raise RuntimeError("boom")
+            return {'companies_checked': 1, 'companies_skipped_error': 0,
+                    'companies_skipped_suspicious': 0, 'jobs_confirmed_active': 0,
+                    'jobs_marked_closed': 0}
+
+        with patch.object(afc, 'check_source', side_effect=fake_check_source):
+            totals = run_freshness_check(sources=['ashby', 'lever', 'workable'])
+
+        assert totals['companies_checked'] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
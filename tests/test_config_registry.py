@@ -0,0 +1,188 @@
+"""
+Unit tests for pipeline/config_registry.py
+
+Tests lazy config loading, compiled lookups, snapshot round-trips, the
+snapshot file and the lazy client proxy. Uses the live config files; no external API calls.
+"""
+
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from pipeline import config_registry
+from pipeline.config_registry import (
+    CONFIG_FILES,
+    COMPILED_BUILDERS,
+    ConfigSnapshot,
+    LazyClient,
+    build_snapshot,
+    clear_config_cache,
+    get_compiled,
+    get_config,
+    install_snapshot,
+    load_snapshot_file,
+    snapshot_key,
+    write_snapshot_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(tmp_path, monkeypatch):
+    """Each test starts with an empty registry and no snapshot file"""
+    monkeypatch.setattr(config_registry, 'SNAPSHOT_PATH', tmp_path / 'config_snapshot.pkl')
+    monkeypatch.setattr(config_registry, '_snapshot_file_checked', False)
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+class TestLazyLoading:
+    """Configs and lookups load on first use and are cached"""
+
+    def test_config_loaded_once(self):
+        assert 'agency_blacklist' not in config_registry._snapshot.configs
+        first = get_config('agency_blacklist')
+        assert get_config('agency_blacklist') is first
+
+    def test_compiled_loaded_once(self):
+        first = get_compiled('job_family_mapping')
+        assert get_compiled('job_family_mapping') is first
+        assert first['data_engineer'] == 'data'
+
+    def test_unknown_names_raise(self):
+        with pytest.raises(KeyError):
+            get_config('nope')
+        with pytest.raises(KeyError):
+            get_compiled('nope')
+
+    def test_clear_selected_names(self):
+        get_config('agency_blacklist')
+        get_config('location_mapping')
+        clear_config_cache(['agency_blacklist'])
+        assert 'agency_blacklist' not in config_registry._snapshot.configs
+        assert 'location_mapping' in config_registry._snapshot.configs
+
+    def test_module_attribute_probes_do_not_load(self):
+        from pipeline import skill_family_mapper
+        for name in ('__all__', '__wrapped__', '__path__', 'not_a_mapping'):
+            assert not hasattr(skill_family_mapper, name)
+        assert 'skill_mapping' not in config_registry._snapshot.compiled
+        assert skill_family_mapper.SKILL_TO_FAMILY
+
+
+class TestSnapshot:
+    """Snapshots hold everything and survive pickling"""
+
+    def test_build_snapshot_covers_registry(self):
+        snapshot = build_snapshot()
+        assert set(snapshot.configs) == set(CONFIG_FILES)
+        assert set(snapshot.compiled) == set(COMPILED_BUILDERS)
+
+    def test_pickle_round_trip_and_install(self):
+        snapshot = pickle.loads(pickle.dumps(build_snapshot()))
+        clear_config_cache()
+
+        install_snapshot(snapshot)
+
+        assert get_config('schema_taxonomy') is snapshot.configs['schema_taxonomy']
+        assert get_compiled('skill_mapping') is snapshot.compiled['skill_mapping']
+
+    def test_installed_snapshot_skips_builders(self):
+        install_snapshot(ConfigSnapshot(compiled={'job_family_mapping': {'x': 'y'}}))
+        with patch.object(config_registry, '_resolve_builder') as resolve:
+            assert get_compiled('job_family_mapping') == {'x': 'y'}
+            resolve.assert_not_called()
+
+
+class TestSnapshotFile:
+    """Snapshot files load only when they match the current sources"""
+
+    def test_write_then_load(self, tmp_path):
+        path = write_snapshot_file(tmp_path / 'snap.pkl')
+        clear_config_cache()
+
+        with patch.object(config_registry, '_resolve_builder') as resolve:
+            assert load_snapshot_file(path) is True
+            assert get_compiled('job_family_mapping')['data_engineer'] == 'data'
+            resolve.assert_not_called()
+        assert set(config_registry._snapshot.configs) == set(CONFIG_FILES)
+
+    def test_missing_file(self, tmp_path):
+        assert load_snapshot_file(tmp_path / 'nope.pkl') is False
+
+    def test_stale_key_rejected(self, tmp_path):
+        path = write_snapshot_file(tmp_path / 'snap.pkl')
+        clear_config_cache()
+
+        stale = dict(snapshot_key(), **{'config:agency_blacklist': 'changed'})
+        with patch.object(config_registry, 'snapshot_key', return_value=stale):
+            assert load_snapshot_file(path) is False
+        assert not config_registry._snapshot.compiled
+
+    def test_format_version_rejected(self, tmp_path, monkeypatch):
+        path = write_snapshot_file(tmp_path / 'snap.pkl')
+        monkeypatch.setattr(config_registry, 'SNAPSHOT_FORMAT_VERSION', -1)
+        assert load_snapshot_file(path) is False
+
+    def test_corrupt_file_rejected(self, tmp_path):
+        path = tmp_path / 'snap.pkl'
+        path.write_bytes(b'not a pickle')
+        assert load_snapshot_file(path) is False
+
+    def test_key_covers_configs_and_builders(self):
+        key = snapshot_key()
+        assert {f"config:{name}" for name in CONFIG_FILES} <= set(key)
+        assert 'module:pipeline.skill_family_mapper' in key
+
+    def test_loaded_on_first_miss(self):
+        write_snapshot_file()
+        clear_config_cache()
+        config_registry._snapshot_file_checked = False
+
+        with patch.object(config_registry, '_resolve_builder') as resolve:
+            assert get_compiled('skill_mapping')['SKILL_TO_FAMILY']
+            resolve.assert_not_called()
+
+
+class TestClassifierLazyNames:
+    """Legacy classifier module names resolve lazily instead of reading None"""
+
+    def test_generation_config_resolves_on_import(self):
+        from pipeline.classifier import _gemini_generation_config, _get_generation_config
+
+        assert _gemini_generation_config is _get_generation_config()
+        assert _gemini_generation_config.response_mime_type == "application/json"
+        assert _gemini_generation_config.temperature == 0.1
+
+
+class TestLazyClient:
+    """LazyClient defers client creation to first attribute access"""
+
+    def test_factory_called_on_attribute_access(self):
+        calls = []
+
+        class FakeClient:
+            def table(self, name):
+                return name
+
+        def factory():
+            calls.append(1)
+            return FakeClient()
+
+        client = LazyClient(factory)
+        assert calls == []
+        assert client.table('raw_jobs') == 'raw_jobs'
+        assert calls == [1]
+
+    def test_private_attributes_do_not_create_client(self):
+        def factory():
+            raise AssertionError("client should not be created")
+
+        client = LazyClient(factory)
+        assert not hasattr(client, '__func__')
+        assert not hasattr(client, '_is_coroutine')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+Import-time regression tests
+
+Importing pipeline modules must not read config files, create API clients or
+pull in heavy SDKs. Each test runs a fresh interpreter with `python -X importtime`
+from an unrelated working directory and without credentials in the environment.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+
+PIPELINE_MODULES = [
+    "pipeline.agency_detection",
+    "pipeline.classifier",
+    "pipeline.db_connection",
+    "pipeline.job_family_mapper",
+    "pipeline.location_extractor",
+    "pipeline.skill_family_mapper",
+    "pipeline.url_validator",
+]
+
+# SDKs that should only load when a client or lookup is first used
+LAZY_MODULES = ["supabase", "google.genai", "pycountry"]
+
+# Generous cumulative budget (microseconds) for importing all PIPELINE_MODULES.
+# Before lazy loading this was well over a second (supabase + google.genai alone).
+IMPORT_BUDGET_US = 600_000
+
+
+def _run_importtime(code: str, tmp_path: Path) -> subprocess.CompletedProcess:
+    env = {k: v for k, v in os.environ.items()
+           if k not in ("SUPABASE_URL", "SUPABASE_KEY", "GOOGLE_API_KEY")}
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60,
+    )
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Map module name -> cumulative import time (us) from -X importtime output."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, rest = line.partition(":")
+        _, cumulative, name = [part.strip() for part in rest.split("|")]
+        times[name] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def import_result(tmp_path_factory):
+    code = (
+        "import " + ", ".join(PIPELINE_MODULES) + "\n"
+        "from pipeline import config_registry\n"
+        "assert not config_registry._snapshot.configs, list(config_registry._snapshot.configs)\n"
+        "assert not config_registry._snapshot.compiled, list(config_registry._snapshot.compiled)\n"
+        "assert not config_registry._clients, list(config_registry._clients)\n"
+    )
+    return _run_importtime(code, tmp_path_factory.mktemp("cwd"))
+
+
+def test_imports_without_credentials_or_cwd(import_result):
+    """Modules import from any directory without .env credentials, loading nothing"""
+    assert import_result.returncode == 0, import_result.stderr[-2000:]
+
+
+@pytest.mark.parametrize("module", LAZY_MODULES)
+def test_heavy_sdks_not_imported(import_result, module):
+    """Heavy SDKs are deferred until first use"""
+    times = _parse_importtime(import_result.stderr)
+    assert module not in times
+
+
+def test_import_time_budget(import_result):
+    """Cumulative import time of pipeline modules stays within budget"""
+    times = _parse_importtime(import_result.stderr)
+    total = sum(times.get(module, 0) for module in PIPELINE_MODULES)
+    assert total < IMPORT_BUDGET_US, f"pipeline imports took {total / 1000:.0f} ms"
+
+
+def test_config_loads_on_first_use(tmp_path):
+    """Config lookups work from an unrelated working directory"""
+    code = (
+        "from pipeline.agency_detection import detect_agency\n"
+        "from pipeline.skill_family_mapper import get_skill_family\n"
+        "from pipeline.location_extractor import extract_locations\n"
+        "assert detect_agency('Hays Recruitment') == (True, 'high')\n"
+        "assert get_skill_family('Python') == 'programming'\n"
+        "assert extract_locations('India - Remote')[0]['country_code'] == 'IN'\n"
+    )
+    result = _run_importtime(code, tmp_path)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
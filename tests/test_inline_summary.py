@@ -21,8 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 class TestClassifierSummaryOutputUnit:
     """Unit tests for classifier.py summary output (mocked)"""
 
-    @patch('pipeline.classifier.genai')
-    def test_classifier_output_schema_includes_summary(self, mock_genai):
+    @patch('pipeline.classifier.get_gemini_client')
+    def test_classifier_output_schema_includes_summary(self, mock_get_client):
         """Classifier prompt schema should request a 'summary' field"""
         from pipeline.classifier import classify_job
 
@@ -38,9 +38,9 @@ class TestClassifierSummaryOutputUnit:
             "summary": "Build and maintain data pipelines using Python and Spark.",
             "skills": []
         }'''
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
+        mock_response.usage_metadata.prompt_token_count = 1000
+        mock_response.usage_metadata.candidates_token_count = 200
+        mock_get_client.return_value.models.generate_content.return_value = mock_response
 
         result = classify_job("Senior Data Engineer at Acme Corp", verbose=False)
 
@@ -48,8 +48,8 @@ class TestClassifierSummaryOutputUnit:
         assert isinstance(result['summary'], str)
         assert len(result['summary']) > 0
 
-    @patch('pipeline.classifier.genai')
-    def test_classifier_summary_can_be_extracted_by_pipeline(self, mock_genai):
+    @patch('pipeline.classifier.get_gemini_client')
+    def test_classifier_summary_can_be_extracted_by_pipeline(self, mock_get_client):
         """Pipeline extracts summary via classification.get('summary')"""
         from pipeline.classifier import classify_job
 
@@ -64,9 +64,9 @@ class TestClassifierSummaryOutputUnit:
             "summary": "Lead product strategy for payments platform.",
             "skills": []
         }'''
-        mock_model = MagicMock()
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
+        mock_response.usage_metadata.prompt_token_count = 1000
+        mock_response.usage_metadata.candidates_token_count = 200
+        mock_get_client.return_value.models.generate_content.return_value = mock_response
 
         classification = classify_job("Product Manager at FinTech Co", verbose=False)
         summary = classification.get('summary')
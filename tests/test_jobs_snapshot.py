@@ -0,0 +1,232 @@
+"""
+Test the local Parquet snapshot of the job tables
+
+Database calls mocked (_fetch_rows / _server_count); snapshots go to a
+temporary directory.
+
+Tests:
+1. Full sync writes month partitions; JSON columns round-trip
+2. Incremental sync upserts by id (including jobs moving month) and
+   advances the updated_at watermark
+3. Reads: column projection, filters, partition pruning, counts
+4. Pagination and the accessible_city_codes fallback in _fetch_rows()
+5. ReportGenerator from the snapshot matches the live fetch
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline import jobs_snapshot
+from pipeline.jobs_snapshot import JobsSnapshot, NONE_PARTITION
+
+LONDON = [{'type': 'city', 'country_code': 'GB', 'city': 'london'}]
+NYC = [{'type': 'city', 'country_code': 'US', 'city': 'new_york'}]
+
+
+def _job(job_id: int, posted_date: str, updated_at: str = '2026-01-01T00:00:00+00:00', **fields) -> dict:
+    job = {
+        'id': job_id, 'raw_job_id': job_id + 1000, 'employer_name': f'employer_{job_id % 3}',
+        'job_family': 'data', 'seniority': 'senior', 'working_arrangement': 'hybrid',
+        'locations': LONDON, 'accessible_city_codes': ['lon'],
+        'skills': [{'name': 'Python', 'family_code': 'programming'}],
+        'salary_min': 50000, 'salary_max': None, 'is_agency': False,
+        'posted_date': posted_date, 'updated_at': updated_at,
+    }
+    job.update(fields)
+    return job
+
+
+def _sync(snapshot: JobsSnapshot, rows_by_table: dict, full: bool = False) -> dict:
+    """sync() with the given rows returned for each table."""
+    with patch.object(snapshot, '_fetch_rows', side_effect=lambda table, since: rows_by_table.get(table, [])), \
+            patch.object(snapshot, '_server_count', return_value=None):
+        return snapshot.sync(list(rows_by_table), full=full)
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return JobsSnapshot(tmp_path, client=MagicMock())
+
+
+class TestSync:
+    """Full and incremental sync"""
+
+    def test_full_sync_partitions_by_month(self, snapshot, tmp_path):
+        jobs = [_job(1, '2025-11-20'), _job(2, '2025-12-03'), _job(3, '2025-12-30'), _job(4, None)]
+        stats = _sync(snapshot, {'enriched_jobs': jobs}, full=True)
+
+        assert stats['enriched_jobs'] == {'fetched': 4, 'partitions': 3, 'rows': 4}
+        assert sorted(p.name for p in (tmp_path / 'enriched_jobs').iterdir()) == [
+            'posted_month=2025-11', 'posted_month=2025-12', f'posted_month={NONE_PARTITION}',
+        ]
+
+    def test_json_columns_round_trip(self, snapshot):
+        job = _job(1, '2025-12-03', skills=[{'name': 'SQL'}, {'name': 'dbt', 'family_code': 'etl'}])
+        _sync(snapshot, {'enriched_jobs': [job]}, full=True)
+
+        [row] = snapshot.rows('enriched_jobs', ['id', 'locations', 'skills', 'salary_min', 'salary_max'])
+        assert row == {'id': 1, 'locations': LONDON, 'skills': job['skills'],
+                       'salary_min': 50000.0, 'salary_max': None}
+
+    def test_incremental_upsert_and_move(self, snapshot, tmp_path):
+        _sync(snapshot, {'enriched_jobs': [_job(1, '2025-11-20'), _job(2, '2025-12-03'), _job(3, '2025-12-04')]},
+              full=True)
+        changed = [
+            _job(2, '2025-12-03', '2026-01-05T00:00:00+00:00', seniority='staff'),   # edited in place
+            _job(3, '2026-01-02', '2026-01-05T00:00:00+00:00'),                       # moved month
+            _job(5, '2026-01-03', '2026-01-05T00:00:00+00:00'),                       # new
+        ]
+        stats = _sync(snapshot, {'enriched_jobs': changed})
+
+        assert stats['enriched_jobs']['partitions'] == 2            # 2025-11 untouched
+        rows = {r['id']: r for r in snapshot.rows('enriched_jobs', ['id', 'seniority', 'posted_month'])}
+        assert sorted(rows) == [1, 2, 3, 5]
+        assert rows[2]['seniority'] == 'staff'
+        assert rows[3]['posted_month'] == '2026-01'
+
+    def test_empty_partition_removed(self, snapshot, tmp_path):
+        _sync(snapshot, {'enriched_jobs': [_job(1, '2025-11-20'), _job(2, '2025-12-03')]}, full=True)
+        _sync(snapshot, {'enriched_jobs': [_job(1, '2025-12-01', '2026-01-05T00:00:00+00:00')]})
+
+        assert not (tmp_path / 'enriched_jobs' / 'posted_month=2025-11').exists()
+        assert snapshot.count('enriched_jobs') == 2
+
+    def test_watermark(self, snapshot):
+        calls = []
+        fetch = {'enriched_jobs': [_job(1, '2025-12-03', '2026-01-05T10:00:00+00:00')]}
+
+        def fetch_rows(table, since):
+            calls.append(since)
+            return fetch[table]
+
+        with patch.object(snapshot, '_fetch_rows', side_effect=fetch_rows), \
+                patch.object(snapshot, '_server_count', return_value=1):
+            snapshot.sync(['enriched_jobs'])
+            snapshot.sync(['enriched_jobs'])
+            assert snapshot.state()['enriched_jobs']['rows'] == 1
+            fetch['enriched_jobs'] = []
+            snapshot.sync(['enriched_jobs'])
+            snapshot.sync(['enriched_jobs'], full=True)
+
+        assert calls == [None, '2026-01-05T10:00:00+00:00', '2026-01-05T10:00:00+00:00', None]
+        assert snapshot.state()['enriched_jobs']['updated_at'] == '2026-01-05T10:00:00+00:00'
+        assert snapshot.count('enriched_jobs') == 0                 # full sync drops deleted rows
+
+    def test_count_mismatch_suggests_full(self, snapshot, capsys):
+        with patch.object(snapshot, '_fetch_rows', return_value=[_job(1, '2025-12-03')]), \
+                patch.object(snapshot, '_server_count', return_value=0):
+            snapshot.sync(['enriched_jobs'])
+        assert '--full' in capsys.readouterr().out
+
+    def test_employer_metadata_rewritten_when_changed(self, snapshot):
+        meta = [{'id': 1, 'canonical_name': 'acme', 'display_name': 'Acme', 'aliases': ['acme inc'],
+                 'updated_at': '2026-01-01T00:00:00+00:00'}]
+        _sync(snapshot, {'employer_metadata': meta})
+        assert snapshot.rows('employer_metadata') == meta
+
+        with patch.object(snapshot, '_fetch_rows', return_value=[]) as fetch, \
+                patch.object(snapshot, '_server_count', return_value=None):
+            snapshot.sync(['employer_metadata'])
+        assert fetch.call_count == 1                                 # nothing changed, no refetch
+
+
+class TestRead:
+    """Projection, filters and counts"""
+
+    @pytest.fixture
+    def synced(self, snapshot):
+        jobs = [_job(1, '2025-11-20'), _job(2, '2025-12-03', job_family='product'),
+                _job(3, '2025-12-30'), _job(4, '2026-01-02')]
+        raw = [{'id': i, 'source': 'greenhouse' if i % 2 else 'lever', 'scraped_at': '2025-12-0%dT00:00:00' % i,
+                'updated_at': '2026-01-01T00:00:00+00:00'} for i in range(1, 6)]
+        _sync(snapshot, {'enriched_jobs': jobs, 'raw_jobs': raw}, full=True)
+        return snapshot
+
+    def test_window_filters(self, synced):
+        rows = synced.rows('enriched_jobs', ['id', 'job_family'],
+                           synced.window_filters('2025-12-01', '2025-12-31') + [('job_family', 'in', ['data'])])
+        assert rows == [{'id': 3, 'job_family': 'data'}]
+
+    def test_partition_pruning(self, synced, tmp_path):
+        (tmp_path / 'enriched_jobs' / 'posted_month=2025-11' / 'data.parquet').write_bytes(b'corrupt')
+        assert synced.count('enriched_jobs', synced.window_filters('2025-12-01', '2026-01-31')) == 3
+
+    def test_counts(self, synced):
+        assert synced.count('raw_jobs') == 5
+        assert synced.count('raw_jobs', [('source', '=', 'lever')]) == 2
+        assert synced.count('raw_jobs', [('scraped_at', '>=', '2025-12-04')]) == 2
+        assert synced.count('employer_metadata') == 0
+
+    def test_missing_table(self, snapshot):
+        with pytest.raises(FileNotFoundError):
+            snapshot.read('enriched_jobs')
+
+
+class TestFetchRows:
+    """Paginated, ordered fetch with the optional column fallback"""
+
+    def _client(self, pages, fail_first=False):
+        client = MagicMock()
+        query = client.table.return_value.select.return_value
+        for method in ('gte', 'order', 'range'):
+            getattr(query, method).return_value = query
+        responses = [Mock(data=page) for page in pages]
+        query.execute.side_effect = ([Exception('column accessible_city_codes does not exist')] if fail_first
+                                     else []) + responses
+        return client, query
+
+    def test_paginates_from_watermark(self, tmp_path):
+        with patch.object(jobs_snapshot, 'PAGE_SIZE', 2):
+            client, query = self._client([[{'id': 1}, {'id': 2}], [{'id': 3}]])
+            rows = JobsSnapshot(tmp_path, client=client)._fetch_rows('enriched_jobs', '2026-01-01')
+
+        assert [r['id'] for r in rows] == [1, 2, 3]
+        query.gte.assert_called_with('updated_at', '2026-01-01')
+        assert [c.args for c in query.range.call_args_list] == [(0, 1), (2, 3)]
+
+    def test_optional_column_dropped(self, tmp_path):
+        client, query = self._client([[{'id': 1}]], fail_first=True)
+        rows = JobsSnapshot(tmp_path, client=client)._fetch_rows('enriched_jobs', None)
+
+        assert rows == [{'id': 1}]
+        assert 'accessible_city_codes' not in client.table.return_value.select.call_args.args[0]
+        assert not query.gte.called
+
+
+class TestReportFromSnapshot:
+    """ReportGenerator(snapshot=...) matches the Supabase path"""
+
+    def test_matches_live_fetch(self, snapshot):
+        from pipeline.report_generator import ReportGenerator
+
+        jobs = [_job(1, '2025-12-03'), _job(2, '2025-12-10', employer_name='acme', is_agency=True),
+                _job(3, '2025-12-12', locations=NYC, accessible_city_codes=['nyc']),
+                _job(4, '2025-12-15', accessible_city_codes=None),                       # pre-033 row
+                _job(5, '2025-11-15'), _job(6, '2025-12-20', job_family='product')]
+        meta = [{'id': 1, 'canonical_name': 'employer_1', 'display_name': 'Employer 1',
+                 'employer_size': 'scaleup', 'updated_at': '2026-01-01T00:00:00+00:00'}]
+        _sync(snapshot, {'enriched_jobs': jobs, 'employer_metadata': meta}, full=True)
+
+        offline = ReportGenerator(snapshot=snapshot)
+        assert offline.supabase is None
+        with patch('supabase.create_client'):
+            live = ReportGenerator()
+        window = [j for j in jobs if j['id'] in (1, 2, 4)]
+        with patch.object(live, '_fetch_pages', return_value=window), \
+                patch.object(live, '_load_employer_metadata', return_value={m['canonical_name']: m for m in meta}):
+            expected = live.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        actual = offline.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+        for data in (expected, actual):
+            data['meta'].pop('generated_at', None)
+        assert actual == expected
+        assert actual['summary']['total_jobs'] == 3                 # jobs 1, 2 and 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,118 @@
+"""
+Test ATS listing snapshots
+
+All database calls mocked. Tests listing capture in the scrapers and
+snapshot persistence for the freshness checker.
+
+Tests:
+1. build_listing() id/updated_at extraction
+2. Scraper fetchers return the complete pre-filter listing
+3. save_listing_snapshot() / load_listing_snapshots()
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.common.listing import build_listing
+from pipeline.listing_snapshots import load_listing_snapshots, save_listing_snapshot
+
+
+class TestBuildListing:
+    """Test listing reduction to {job_id: updated_at}"""
+
+    def test_ids_as_strings_with_updated_at(self):
+        jobs = [{'id': 123, 'updated_at': '2026-01-05T10:00:00Z'}, {'id': 456}]
+        assert build_listing(jobs) == {'123': '2026-01-05T10:00:00Z', '456': None}
+
+    def test_updated_keys_tried_in_order(self):
+        jobs = [{'shortcode': 'AB1', 'published_on': None, 'created_at': '2026-01-01'}]
+        assert build_listing(jobs, 'shortcode', ('published_on', 'created_at')) == {'AB1': '2026-01-01'}
+
+    def test_skips_jobs_without_id(self):
+        assert build_listing([{'id': ''}, {'title': 'x'}, 'junk']) == {}
+
+
+class TestScraperListing:
+    """Fetchers report every listed job, not just the ones kept by filters"""
+
+    def test_greenhouse_listing_includes_filtered_jobs(self):
+        from scrapers.greenhouse.greenhouse_api_fetcher import fetch_greenhouse_jobs
+
+        response = Mock(status_code=200)
+        response.json.return_value = {'jobs': [
+            {'id': 1, 'title': 'Data Engineer', 'location': {'name': 'London'},
+             'updated_at': '2026-01-02T00:00:00Z', 'absolute_url': 'https://x/1'},
+            {'id': 2, 'title': 'Office Manager', 'location': {'name': 'London'},
+             'updated_at': '2026-01-03T00:00:00Z', 'absolute_url': 'https://x/2'},
+        ]}
+        with patch('scrapers.greenhouse.greenhouse_api_fetcher.requests.get', return_value=response):
+            jobs, stats = fetch_greenhouse_jobs('acme', filter_titles=True,
+                                                title_patterns=[r'data engineer'], rate_limit=0)
+
+        assert [job.id for job in jobs] == ['1']
+        assert stats['listing'] == {'1': '2026-01-02T00:00:00Z', '2': '2026-01-03T00:00:00Z'}
+
+    def test_failed_fetch_has_no_listing(self):
+        from scrapers.greenhouse.greenhouse_api_fetcher import fetch_greenhouse_jobs
+
+        with patch('scrapers.greenhouse.greenhouse_api_fetcher.requests.get',
+                   return_value=Mock(status_code=404)):
+            _, stats = fetch_greenhouse_jobs('acme', rate_limit=0)
+
+        assert stats['listing'] is None
+
+
+class TestSnapshotStore:
+    """Test snapshot persistence"""
+
+    def test_save_upserts_one_row(self):
+        fetched_at = datetime(2026, 3, 1, 7, 0, tzinfo=timezone.utc)
+        with patch('pipeline.listing_snapshots.supabase') as mock_sb:
+            assert save_listing_snapshot('ashby', 'acme', {'a': None, 'b': '2026-01-01'}, fetched_at)
+
+        row = mock_sb.table.return_value.upsert.call_args.args[0]
+        assert row == {
+            'source': 'ashby', 'company_slug': 'acme',
+            'job_ids': {'a': None, 'b': '2026-01-01'}, 'job_count': 2,
+            'fetched_at': fetched_at.isoformat(),
+        }
+        assert mock_sb.table.return_value.upsert.call_args.kwargs['on_conflict'] == 'source,company_slug'
+
+    def test_save_skips_failed_fetch_and_swallows_errors(self):
+        with patch('pipeline.listing_snapshots.supabase') as mock_sb:
+            assert save_listing_snapshot('ashby', 'acme', None) is False
+            assert not mock_sb.table.called
+
+            mock_sb.table.return_value.upsert.return_value.execute.side_effect = Exception("no table")
+            assert save_listing_snapshot('ashby', 'acme', {'a': None}) is False
+
+    def test_load_recent_snapshots(self):
+        with patch('pipeline.listing_snapshots.supabase') as mock_sb:
+            query = mock_sb.table.return_value.select.return_value.eq.return_value.gte.return_value
+            query.range.return_value.execute.return_value = Mock(data=[
+                {'company_slug': 'acme', 'job_ids': {'a': None, 'b': None}},
+                {'company_slug': 'globex', 'job_ids': {}},
+            ])
+
+            snapshots = load_listing_snapshots('ashby', max_age_hours=6)
+
+        assert snapshots == {'acme': {'a', 'b'}, 'globex': set()}
+        field, cutoff = mock_sb.table.return_value.select.return_value.eq.return_value.gte.call_args.args
+        assert field == 'fetched_at'
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(cutoff)
+        assert 5.9 < age.total_seconds() / 3600 < 6.1
+
+    def test_zero_max_age_disables_reuse(self):
+        with patch('pipeline.listing_snapshots.supabase') as mock_sb:
+            assert load_listing_snapshots('ashby', max_age_hours=0) == {}
+            assert not mock_sb.table.called
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
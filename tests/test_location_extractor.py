@@ -8,6 +8,7 @@ Part of: Global Location Expansion Epic - Phase 1
 import pytest
 from pipeline.location_extractor import (
     extract_locations,
+    extract_locations_batch,
     is_location_match,
     get_active_cities,
     split_multi_location,
@@ -705,6 +706,62 @@ def test_description_already_scoped_not_overridden():
     assert result[0]["country_code"] == "US"
 
 
+# =============================================================================
+# Batch Extraction Tests
+# =============================================================================
+
+BATCH_LOCATIONS = ["London, UK", "Remote", "NYC or Remote", "Remote", "", None, "Remote - US", "London, UK"]
+BATCH_DESCRIPTIONS = [
+    "This role is based in Canada.",
+    "This role is based in the United States.",
+    "Candidates must be based in Canada.",
+    "We hire anywhere in the world.",
+    None,
+    None,
+    "This role is based in Canada.",
+    "",
+]
+
+
+def test_batch_matches_single_extraction():
+    """Test: batch results equal per-row extract_locations"""
+    result = extract_locations_batch(BATCH_LOCATIONS, BATCH_DESCRIPTIONS)
+
+    expected = [
+        extract_locations(loc, description_text=desc)
+        for loc, desc in zip(BATCH_LOCATIONS, BATCH_DESCRIPTIONS)
+    ]
+    assert result == expected
+
+
+def test_batch_without_descriptions():
+    """Test: descriptions are optional"""
+    result = extract_locations_batch(BATCH_LOCATIONS)
+
+    assert result == [extract_locations(loc) for loc in BATCH_LOCATIONS]
+
+
+def test_batch_rows_do_not_share_dicts():
+    """Test: duplicate inputs get independent location dicts"""
+    result = extract_locations_batch(["London, UK", "London, UK"])
+
+    result[0][0]["city"] = "mutated"
+    assert result[1][0]["city"] == "london"
+
+
+def test_batch_length_mismatch_raises():
+    """Test: misaligned descriptions are rejected"""
+    with pytest.raises(ValueError):
+        extract_locations_batch(["London"], ["a", "b"])
+
+
+def test_batch_process_pool():
+    """Test: process pool description scans give the same result"""
+    result = extract_locations_batch(BATCH_LOCATIONS, BATCH_DESCRIPTIONS, max_workers=2)
+
+    assert result == extract_locations_batch(BATCH_LOCATIONS, BATCH_DESCRIPTIONS)
+
+
 # =============================================================================
 # Run tests
 # =============================================================================
@@ -813,6 +813,42 @@ class TestGreenhousePipelineIntegration:
         assert stats["companies_skipped"] == 1
         assert stats["companies_processed"] == 0
 
+    @patch("pipeline.listing_snapshots.supabase")
+    @patch("pipeline.api_freshness_checker.supabase")
+    @patch("pipeline.api_freshness_checker.iter_companies")
+    @patch("scrapers.greenhouse.greenhouse_api_fetcher.load_company_mapping")
+    @patch("scrapers.greenhouse.greenhouse_api_fetcher.fetch_greenhouse_jobs")
+    async def test_closes_jobs_missing_from_listing(
+        self,
+        mock_fetch_gh,
+        mock_load_mapping,
+        mock_iter_companies,
+        mock_freshness_sb,
+        mock_snapshot_sb,
+    ):
+        """Tracked jobs absent from the fetched listing are closed in the same run."""
+        from pipeline.fetch_jobs import process_greenhouse_incremental
+
+        mock_load_mapping.return_value = {
+            "greenhouse": {"Acme Corp": {"slug": "acme"}}
+        }
+        fetch_stats = copy.deepcopy(MOCK_FETCH_STATS)
+        fetch_stats["listing"] = {"gh-1": None, "gh-9": None}
+        mock_fetch_gh.return_value = ([], fetch_stats)
+        mock_iter_companies.return_value = iter([("acme", [
+            {"enriched_job_id": 11, "source_job_id": "gh-1", "company_slug": "acme"},
+            {"enriched_job_id": 12, "source_job_id": "gh-2", "company_slug": "acme"},
+        ])])
+
+        stats = await process_greenhouse_incremental(companies=["acme"])
+
+        assert stats["jobs_marked_closed"] == 1
+        table = mock_freshness_sb.table.return_value
+        closed = [c for c in table.update.call_args_list if c.args[0]["url_status"] == "soft_404"]
+        assert len(closed) == 1
+        assert [11] in [c.args[1] for c in table.update.return_value.in_.call_args_list]
+        assert [12] in [c.args[1] for c in table.update.return_value.in_.call_args_list]
+
 
 # ---------------------------------------------------------------------------
 # Cross-cutting behavior
@@ -0,0 +1,119 @@
+"""
+Test the mergeable t-digest salary sketch
+
+Percentiles follow ReportGenerator's sort-and-index convention
+(sorted(values)[int(n * q)]).
+
+Tests:
+1. Exact for small samples and duplicate-heavy (round-number) salaries
+2. Within 1% for large continuous samples, with bounded centroids
+3. Merging daily sketches matches sketching the union
+4. to_dict()/from_dict() round trip
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.quantile_sketch import TDigest
+
+
+def _sort_and_index(values: list) -> list:
+    ordered = sorted(values)
+    return [ordered[int(len(ordered) * q)] for q in (0.25, 0.50, 0.75)]
+
+
+def _sketch(values: list) -> TDigest:
+    sketch = TDigest()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+class TestExact:
+    """Sketch percentiles are exact where the data allows"""
+
+    @pytest.mark.parametrize('n', [1, 2, 10, 57, 100])
+    def test_small_samples(self, n):
+        rng = random.Random(n)
+        values = [rng.uniform(60_000, 250_000) for _ in range(n)]
+        assert _sketch(values).percentiles() == _sort_and_index(values)
+
+    def test_round_number_salaries(self):
+        rng = random.Random(7)
+        values = [rng.randrange(80_000, 220_000, 5_000) for _ in range(20_000)]
+        sketch = _sketch(values)
+        assert sketch.percentiles() == _sort_and_index(values)
+        assert sketch.count == 20_000
+
+    def test_weighted_add(self):
+        sketch = TDigest()
+        sketch.add(100_000, 3)
+        sketch.add(150_000, 1)
+        assert sketch.percentiles() == [100_000, 100_000, 150_000]
+
+    def test_empty(self):
+        sketch = TDigest()
+        assert sketch.count == 0
+        assert all(p != p for p in sketch.percentiles())   # NaN
+
+
+class TestAccuracy:
+    """Continuous data stays within 1% with a bounded sketch"""
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_large_continuous_sample(self, seed):
+        rng = random.Random(seed)
+        values = [rng.lognormvariate(11.8, 0.35) for _ in range(50_000)]
+        sketch = _sketch(values)
+
+        for estimate, exact in zip(sketch.percentiles(), _sort_and_index(values)):
+            assert abs(estimate - exact) / exact < 0.01
+        assert len(sketch.centroids()) <= 200
+
+
+class TestMerge:
+    """Sketches merge across days and cities"""
+
+    def test_merged_days_match_union(self):
+        rng = random.Random(3)
+        days = [[rng.lognormvariate(11.8, 0.4) for _ in range(rng.randint(0, 400))] for _ in range(90)]
+        union = [v for day in days for v in day]
+
+        merged = TDigest.merge_all(_sketch(day) for day in days)
+        assert merged.count == len(union)
+        assert merged.min == min(union) and merged.max == max(union)
+        for estimate, exact in zip(merged.percentiles(), _sort_and_index(union)):
+            assert abs(estimate - exact) / exact < 0.01
+
+    def test_merge_round_numbers_exact(self):
+        rng = random.Random(4)
+        days = [[rng.randrange(90_000, 200_000, 10_000) for _ in range(50)] for _ in range(30)]
+        merged = _sketch(days[0]).merge(TDigest.merge_all(_sketch(day) for day in days[1:]))
+        assert merged.percentiles() == _sort_and_index([v for day in days for v in day])
+
+
+class TestStorage:
+    """JSON round trip for report_daily_salary_sketches"""
+
+    def test_round_trip(self):
+        rng = random.Random(5)
+        sketch = _sketch([rng.uniform(50_000, 300_000) for _ in range(5_000)])
+        restored = TDigest.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.centroids() == sketch.centroids()
+        assert restored.percentiles() == sketch.percentiles()
+        assert (restored.min, restored.max) == (sketch.min, sketch.max)
+
+    def test_empty_round_trip(self):
+        restored = TDigest.from_dict(TDigest().to_dict())
+        assert restored.count == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
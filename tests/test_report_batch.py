@@ -0,0 +1,165 @@
+"""
+Test batch report generation
+
+All database calls mocked. ReportBatch must produce the same reports as
+one generate_portfolio_report() call per city/family, from a single fetch.
+
+Tests:
+1. Batch vs per-report parity (sequential and threaded)
+2. load_window(): one multi-family query, server or client-side accessibility
+3. write_portfolio_reports() file naming
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.report_batch import ReportBatch
+from pipeline.report_generator import ReportGenerator
+from tests.report_jobs import synthetic_jobs
+
+LOCATIONS = [
+    [{'type': 'city', 'city': 'london', 'country_code': 'GB'}],
+    [{'type': 'city', 'city': 'new_york', 'country_code': 'US'}],
+    [{'type': 'remote', 'scope': 'country', 'country_code': 'US'}],
+    [{'type': 'remote', 'scope': 'global'}],
+    [{'type': 'country', 'country_code': 'GB'}],
+    [{'type': 'remote', 'region': 'EMEA'}],
+]
+PERIODS = [('2025-12-01', '2025-12-31'), ('2025-11-01', '2025-11-30')]
+
+
+def _window_rows(seed: int, n: int, generator: ReportGenerator) -> list:
+    """Jobs across families, two months and several locations."""
+    rows = synthetic_jobs(seed, n, skills=['Python', 'SQL', 'dbt', 'Spark'], extra={'locations': LOCATIONS})
+    for row in rows:
+        row['accessible_city_codes'] = [
+            code for code, city in generator.CITY_CODE_MAP.items()
+            if generator._is_job_accessible(row, city)
+        ]
+    return rows
+
+
+def _generator() -> ReportGenerator:
+    with patch('supabase.create_client'):
+        generator = ReportGenerator()
+    generator._employer_metadata = {'acme': {'canonical_name': 'acme', 'display_name': 'Acme', 'industry': 'fintech'}}
+    return generator
+
+
+def _per_report(generator, rows, city_code, job_family, compare=True):
+    """generate_portfolio_report() with _fetch_all_jobs served from rows."""
+    def fetch(city, family, start, end):
+        return [r for r in rows
+                if city in r['accessible_city_codes'] and r['job_family'] == family
+                and start <= r['posted_date'] <= end]
+
+    with patch.object(generator, '_fetch_all_jobs', side_effect=fetch):
+        return generator.generate_portfolio_report(
+            city_code, job_family, *PERIODS[0],
+            *(PERIODS[1] if compare else (None, None))
+        )
+
+
+class TestBatchParity:
+    """Batch output must match one generate_portfolio_report() per segment"""
+
+    @pytest.mark.parametrize('workers', [1, 3])
+    def test_portfolio_reports_identical(self, workers):
+        generator = _generator()
+        rows = _window_rows(7, 1200, generator)
+        batch = ReportBatch(generator, workers=workers)
+
+        with patch.object(generator, '_fetch_pages', return_value=rows) as fetch_pages:
+            reports = batch.generate_portfolio_reports(
+                *PERIODS[0], *PERIODS[1], cities=['nyc', 'lon'], families=['data', 'product'],
+            )
+            expected = {
+                (city, family): _per_report(generator, rows, city, family)
+                for city in ('nyc', 'lon') for family in ('data', 'product')
+            }
+
+        assert fetch_pages.call_count == 1
+        assert list(reports) == list(expected)
+        for key in expected:
+            assert json.dumps(reports[key], indent=2) == json.dumps(expected[key], indent=2)
+
+    def test_without_comparison_period(self):
+        generator = _generator()
+        rows = _window_rows(3, 400, generator)
+
+        with patch.object(generator, '_fetch_pages', return_value=rows) as fetch_pages:
+            reports = ReportBatch(generator).generate_portfolio_reports(*PERIODS[0], cities=['sfo'], families=['data'])
+            expected = _per_report(generator, rows, 'sfo', 'data', compare=False)
+
+        start_date, end_date = fetch_pages.call_args.args[2:4]
+        assert (start_date, end_date) == PERIODS[0]
+        assert reports[('sfo', 'data')]['meta'] == expected['meta']
+
+
+class TestLoadWindow:
+    """load_window() fetches every family and city in one query"""
+
+    def _window_query(self, generator, location_filter):
+        return getattr(
+            generator.supabase.table.return_value.select.return_value
+            .in_.return_value.gte.return_value.lte.return_value,
+            location_filter,
+        )
+
+    def test_server_side_accessibility(self):
+        generator = _generator()
+        generator.supabase = MagicMock()
+        rows = _window_rows(1, 50, generator)
+        self._window_query(generator, 'overlaps').return_value.range.return_value.execute.return_value = Mock(data=rows)
+
+        window = ReportBatch(generator).load_window(['lon', 'sgp'], ['data', 'product'], '2025-11-01', '2025-12-31')
+
+        select = generator.supabase.table.return_value.select
+        columns = select.call_args.args[0].split(',')
+        assert select.call_count == 1
+        assert {'job_family', 'posted_date', 'accessible_city_codes'} <= set(columns)
+        assert 'locations' not in columns and 'salary_min' not in columns
+        select.return_value.in_.assert_called_once_with('job_family', ['data', 'product'])
+        self._window_query(generator, 'overlaps').assert_called_once_with('accessible_city_codes', ['lon', 'sgp'])
+        assert window.city_masks['lon'].tolist() == ['lon' in r['accessible_city_codes'] for r in rows]
+
+    def test_falls_back_to_client_side_filter(self):
+        generator = _generator()
+        generator.supabase = MagicMock()
+        rows = _window_rows(2, 50, generator)
+        for row in rows:
+            del row['accessible_city_codes']
+        self._window_query(generator, 'overlaps').side_effect = Exception('column enriched_jobs.accessible_city_codes does not exist')
+        self._window_query(generator, 'or_').return_value.range.return_value.execute.return_value = Mock(data=rows)
+
+        window = ReportBatch(generator).load_window(['nyc', 'den'], ['data'], '2025-11-01', '2025-12-31')
+
+        location_filter = self._window_query(generator, 'or_').call_args.args[0]
+        assert location_filter.count('"scope":"global"') == 1
+        assert '"city":"new_york"' in location_filter and '"city":"denver"' in location_filter
+        assert window.city_masks['den'].tolist() == [generator._is_job_accessible(r, 'denver') for r in rows]
+        assert generator._server_accessibility is False
+
+
+class TestWriteReports:
+    """Test portfolio file output"""
+
+    def test_file_names(self, tmp_path):
+        reports = {
+            ('sfo', 'data'): {'meta': {'totalJobs': 10}},
+            ('lon', 'product'): {'meta': {'totalJobs': 5}},
+        }
+        paths = ReportBatch(_generator()).write_portfolio_reports(reports, str(tmp_path / 'out'), '2025-12-01')
+
+        assert [Path(p).name for p in paths] == ['sf-data-december-2025.json', 'london-product-december-2025.json']
+        assert json.loads(Path(paths[0]).read_text(encoding='utf-8')) == {'meta': {'totalJobs': 10}}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
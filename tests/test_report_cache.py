@@ -0,0 +1,169 @@
+"""
+Test the report result cache
+
+All database calls mocked; cache files go to a temporary directory.
+
+Tests:
+1. Hit when the watermark is unchanged, recompute when it changes
+2. Code version: key changes replace the segment's entry; formatting-only
+   edits keep it
+3. Watermark query shape (server and fallback location filters, rollups)
+4. Watermark failure computes without the cache
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.report_generator import ReportGenerator
+from pipeline import report_cache
+from pipeline.report_cache import ReportCache, _fingerprint
+
+WATERMARK = {'jobs': 120, 'jobs_updated_at': '2026-01-02T03:04:05+00:00',
+             'employer_metadata': 40, 'employer_metadata_updated_at': '2025-12-30T00:00:00+00:00'}
+
+
+@pytest.fixture
+def generator(tmp_path):
+    with patch('supabase.create_client'):
+        generator = ReportGenerator(cache=ReportCache(tmp_path))
+    return generator
+
+
+def _report(total: int) -> dict:
+    return {'meta': {'city_code': 'lon'}, 'summary': {'total_jobs': total}}
+
+
+class TestReportCache:
+    """Cached reports are reused until the data or code changes"""
+
+    def test_hit_when_watermark_unchanged(self, generator):
+        with patch.object(generator, 'fetch_window_watermark', return_value=dict(WATERMARK)), \
+                patch.object(generator, '_compute_report_data', return_value=_report(120)) as compute:
+            first = generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+            second = generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert compute.call_count == 1
+        assert first == second == _report(120)
+
+    def test_recompute_when_watermark_changes(self, generator):
+        with patch.object(generator, 'fetch_window_watermark', side_effect=[
+                    dict(WATERMARK), dict(WATERMARK, jobs=121)]), \
+                patch.object(generator, '_compute_report_data', side_effect=[_report(120), _report(121)]) as compute:
+            generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+            data = generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert compute.call_count == 2
+        assert data['summary']['total_jobs'] == 121
+
+    def test_segments_and_engines_cached_separately(self, generator, tmp_path):
+        with patch.object(generator, 'fetch_window_watermark', return_value=dict(WATERMARK)), \
+                patch.object(generator, '_compute_report_data', return_value=_report(1)) as compute:
+            generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+            generator.generate_report_data('nyc', 'data', '2025-12-01', '2025-12-31')
+            generator.engine = 'columnar'
+            generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert compute.call_count == 3
+
+    def test_new_code_version_replaces_entry(self, generator, tmp_path):
+        with patch.object(generator, 'fetch_window_watermark', return_value=dict(WATERMARK)), \
+                patch.object(generator, '_compute_report_data', return_value=_report(1)) as compute:
+            generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+            generator.cache._code_version = 'changed'
+            generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert compute.call_count == 2
+        assert len(list(tmp_path.glob('lon-data-2025-12-01-2025-12-31-*.json'))) == 1
+
+    def test_unreadable_entry_is_a_miss(self, generator):
+        cache = generator.cache
+        key = cache.key(generator, 'lon', 'data', '2025-12-01', '2025-12-31')
+        cache.directory.mkdir(parents=True, exist_ok=True)
+        cache.path(key).write_text('{truncated')
+        assert cache.load(key, WATERMARK) is None
+
+    def test_watermark_failure_computes_uncached(self, generator, tmp_path):
+        with patch.object(generator, 'fetch_window_watermark', side_effect=Exception('timeout')), \
+                patch.object(generator, '_compute_report_data', return_value=_report(1)) as compute:
+            generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert compute.called
+        assert not list(tmp_path.glob('*.json'))
+
+
+class TestCodeVersion:
+    """Only report-data code invalidates the cache"""
+
+    SOURCE = '''
+class ReportGenerator:
+    def _calculate_skills_metrics(self, jobs):
+        return {'top': 15}
+
+    def build_portfolio_report(self, raw):
+        return {'title': 'Report'}
+'''
+
+    def test_presentation_edits_ignored(self):
+        excluded = report_cache.PRESENTATION_FUNCTIONS['pipeline.report_generator']
+        base = _fingerprint(self.SOURCE, excluded)
+
+        assert _fingerprint(self.SOURCE.replace("'Report'", "'Hiring Report'"), excluded) == base
+        assert _fingerprint(self.SOURCE + '\n# comment\n', excluded) == base
+        assert _fingerprint(self.SOURCE.replace("'top': 15", "'top': 20"), excluded) != base
+
+    def test_code_version_is_stable(self):
+        assert report_cache.code_version() == report_cache.code_version()
+        assert len(report_cache.code_version()) == 16
+
+
+class TestWatermarkQuery:
+    """fetch_window_watermark() issues head-only queries"""
+
+    def _mock_supabase(self):
+        supabase = MagicMock()
+        query = supabase.table.return_value.select.return_value
+        for method in ('eq', 'gte', 'lte', 'contains', 'or_', 'order', 'limit'):
+            getattr(query, method).return_value = query
+        query.execute.return_value = Mock(count=7, data=[{'updated_at': 'u', 'finished_at': 'f'}])
+        return supabase, query
+
+    def test_server_filter(self, generator):
+        generator.supabase, query = self._mock_supabase()
+        watermark = generator.fetch_window_watermark('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert watermark == {'jobs': 7, 'jobs_updated_at': 'u',
+                             'employer_metadata': 7, 'employer_metadata_updated_at': 'u'}
+        assert [c.args[0] for c in generator.supabase.table.call_args_list] == ['enriched_jobs', 'employer_metadata']
+        query.contains.assert_called_once_with('accessible_city_codes', ['lon'])
+        query.limit.assert_called_with(1)
+        generator.supabase.table.return_value.select.assert_any_call('updated_at', count='exact')
+
+    def test_fallback_filter_and_rollups(self, generator):
+        generator.supabase, query = self._mock_supabase()
+        generator._server_accessibility = False
+        generator.engine = 'rollups'
+        watermark = generator.fetch_window_watermark('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert not query.contains.called
+        query.or_.assert_called_once_with(generator._build_location_filter('london'))
+        assert watermark['rollups_finished_at'] == 'f'
+        assert generator.supabase.table.call_args_list[-1].args == ('report_rollup_runs',)
+
+    def test_transient_error_keeps_server_filter(self, generator):
+        generator.supabase, query = self._mock_supabase()
+        query.execute.side_effect = Exception('timeout')
+
+        with pytest.raises(Exception, match='timeout'):
+            generator.fetch_window_watermark('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert not query.or_.called
+        assert generator._server_accessibility is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,280 @@
+"""
+Test ReportGenerator metric engines
+
+All database calls mocked. The columnar engine (pipeline/report_frame.py)
+must produce byte-identical JSON to the per-row engine.
+
+Tests:
+1. Columnar vs rows parity for generate_report_data / generate_portfolio_report
+   (ties, unknowns, agencies, skills, salaries, employer merges)
+2. Edge cases: empty period, no skills, too few salaries
+3. Sort-and-index percentiles and first-seen tie order
+4. Column-projected _fetch_all_jobs and payload measurement
+   Server-side accessibility filter (accessible_city_codes) with client-side fallback
+5. Portfolio comparison periods generated concurrently, metadata loaded once
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+from postgrest.exceptions import APIError
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.report_generator import ReportGenerator, is_missing_column_error
+from pipeline.report_frame import JobFrame, _sort_index_percentiles
+from tests.report_jobs import synthetic_jobs
+
+EMPLOYERS = ['acme', 'globex', 'initech', 'jpmorganchase', 'jpmorgan chase', 'umbrella',
+             'hooli', 'Vandelay Industries', 'stark', 'wayne']
+EMPLOYER_METADATA = {
+    'acme': {'canonical_name': 'acme', 'display_name': 'Acme', 'industry': 'fintech',
+             'employer_size': 'enterprise', 'founding_year': 1990, 'ownership_type': 'public'},
+    'globex': {'canonical_name': 'globex', 'display_name': 'Globex', 'industry': 'ai_ml',
+               'employer_size': 'scaleup', 'founding_year': 2022, 'ownership_type': 'private'},
+    'jpmorgan chase': {'canonical_name': 'jpmorgan chase', 'display_name': 'JPMorgan Chase',
+                       'industry': 'financial_services', 'employer_size': 'enterprise'},
+    'hooli': {'canonical_name': 'hooli', 'display_name': 'Hooli', 'industry': 'ai_ml',
+              'founding_year': 2012, 'ownership_type': ''},
+    'vandelay_industries': {'canonical_name': 'vandelay_industries', 'industry': 'other'},
+}
+SKILLS = ['Python', 'SQL', 'dbt', 'Airflow', 'Spark', 'Looker', 'Tableau', 'AWS']
+
+
+def _jobs(seed: int, n: int) -> list:
+    """Synthetic enriched_jobs rows with plenty of ties and unknowns."""
+    return synthetic_jobs(
+        seed, n, employers=EMPLOYERS, skills=SKILLS, max_skills=5, skill_rate=0.7, string_skill_rate=0.2,
+        salary_rate=0.6, salary_low=(80_000, 200_000), salary_spreads=[0, 15_000, 30_000, 45_500], dated=False,
+        is_agency=[None, False, False, False, True],
+        data_source=['greenhouse', 'lever', 'adzuna', 'ashby'],
+        seniority=['senior', 'mid', 'junior', 'staff_principal', 'unknown', None],
+        job_subfamily=['data_engineer', 'data_analyst', 'ml_engineer', 'null', None],
+        track=['ic', 'ic', 'management', None],
+    )
+
+
+@pytest.fixture
+def generators():
+    """A (columnar, rows) pair sharing mocked employer metadata."""
+    with patch('supabase.create_client'):
+        pair = (ReportGenerator(engine='columnar'), ReportGenerator(engine='rows'))
+    for generator in pair:
+        generator._employer_metadata = EMPLOYER_METADATA
+    return pair
+
+
+def _report_json(generator, jobs, city='nyc', family='data', compare_jobs=None, portfolio=True):
+    periods = iter([jobs, compare_jobs])
+    with patch.object(generator, '_fetch_all_jobs', side_effect=lambda *a: next(periods)):
+        data = generator.generate_report_data(city, family, '2026-01-01', '2026-01-31')
+    data['meta']['generated_at'] = None
+    if not portfolio:
+        return json.dumps(data, indent=2)
+    # Periods are fetched concurrently, so serve them by start date
+    def fetch(city_code, job_family, start_date, end_date):
+        return jobs if start_date == '2026-01-01' else compare_jobs
+
+    with patch.object(generator, '_fetch_all_jobs', side_effect=fetch):
+        portfolio = generator.generate_portfolio_report(
+            city, family, '2026-01-01', '2026-01-31',
+            compare_start='2025-12-01' if compare_jobs is not None else None,
+            compare_end='2025-12-31' if compare_jobs is not None else None,
+        )
+    return json.dumps(data, indent=2), json.dumps(portfolio, indent=2)
+
+
+class TestEngineParity:
+    """Columnar output must match the row engine byte for byte"""
+
+    @pytest.mark.parametrize('seed', range(8))
+    @pytest.mark.parametrize('city', ['nyc', 'lon'])
+    def test_reports_identical(self, generators, seed, city):
+        columnar, rows = generators
+        jobs = _jobs(seed, 150 + seed * 40)
+        previous = _jobs(seed + 100, 120)
+        assert _report_json(columnar, jobs, city, compare_jobs=previous) == \
+            _report_json(rows, jobs, city, compare_jobs=previous)
+
+    @pytest.mark.parametrize('jobs', [
+        [],
+        _jobs(1, 5),
+        [{'employer_name': 'acme', 'skills': []}, {'employer_name': 'acme', 'skills': None}],
+        [dict(job, is_agency=True) for job in _jobs(2, 30)],
+    ])
+    def test_edge_cases_identical(self, generators, jobs):
+        # generate_report_data only: the portfolio format needs junior roles
+        # (senior_to_junior_ratio is None without them)
+        columnar, rows = generators
+        assert _report_json(columnar, jobs, portfolio=False) == _report_json(rows, jobs, portfolio=False)
+
+    def test_rejects_unknown_engine(self):
+        with patch('supabase.create_client'), pytest.raises(ValueError):
+            ReportGenerator(engine='spark')
+
+
+class TestColumnarHelpers:
+    """Test the columnar building blocks"""
+
+    @pytest.mark.parametrize('n', [1, 7, 20, 21, 22, 101])
+    def test_percentiles_match_sort_and_index(self, n):
+        values = np.random.default_rng(n).integers(50, 300, n).astype(float) * 1000
+        ordered = sorted(values)
+        expected = [ordered[int(n * q)] for q in (0.25, 0.50, 0.75)]
+        assert _sort_index_percentiles(values) == expected
+
+    def test_categories_in_first_seen_order(self):
+        frame = JobFrame.from_jobs([{'seniority': 'mid'}, {'seniority': None}, {'seniority': 'senior'}])
+        assert list(frame.jobs['seniority'].cat.categories) == ['mid', 'senior']
+        assert frame.jobs['seniority'].isna().tolist() == [False, True, False]
+
+    def test_subset_keeps_skills_of_selected_jobs(self):
+        frame = JobFrame.from_jobs([{'skills': ['a', 'b']}, {'skills': [{'name': 'c'}]}])
+        subset = frame.subset([False, True])
+        assert subset.skills['name'].astype(object).tolist() == ['c']
+        assert len(subset) == 1
+
+
+class TestFetchProjection:
+    """_fetch_all_jobs selects only the columns the report reads"""
+
+    def _generator(self, pages, location_filter='contains'):
+        with patch('supabase.create_client'):
+            generator = ReportGenerator()
+        generator.supabase = MagicMock()
+        window = generator.supabase.table.return_value.select.return_value \
+            .eq.return_value.gte.return_value.lte.return_value
+        query = getattr(window, location_filter).return_value
+        query.range.return_value.execute.side_effect = [Mock(data=page) for page in pages]
+        return generator
+
+    def test_us_report_projection(self):
+        generator = self._generator([[{'employer_name': 'acme', 'locations': [{'city': 'new_york'}]}]])
+        jobs = generator._fetch_all_jobs('nyc', 'data', '2026-01-01', '2026-01-31')
+
+        columns = generator.supabase.table.return_value.select.call_args.args[0].split(',')
+        assert len(jobs) == 1
+        assert set(columns) == {
+            'employer_name', 'is_agency', 'data_source', 'seniority',
+            'job_subfamily', 'track', 'working_arrangement', 'skills', 'salary_min', 'salary_max',
+        }
+
+    def test_non_us_report_skips_salary_columns(self):
+        generator = self._generator([[]])
+        generator._fetch_all_jobs('lon', 'data', '2026-01-01', '2026-01-31')
+
+        columns = generator.supabase.table.return_value.select.call_args.args[0].split(',')
+        assert 'salary_min' not in columns and 'summary' not in columns
+        assert 'skills' in columns
+
+    def test_projection_follows_sections(self):
+        with patch('supabase.create_client'):
+            generator = ReportGenerator()
+        assert generator._build_projection(['track']) == 'employer_name,is_agency,data_source,track'
+
+    def test_filters_accessibility_on_server(self):
+        generator = self._generator([[{'employer_name': 'acme'}]])
+        jobs = generator._fetch_all_jobs('lon', 'data', '2026-01-01', '2026-01-31')
+
+        window = generator.supabase.table.return_value.select.return_value \
+            .eq.return_value.gte.return_value.lte.return_value
+        window.contains.assert_called_once_with('accessible_city_codes', ['lon'])
+        assert not window.or_.called
+        assert jobs == [{'employer_name': 'acme'}]
+
+    def test_falls_back_to_client_side_filter(self):
+        generator = self._generator([[
+            {'employer_name': 'acme', 'locations': [{'type': 'city', 'city': 'london'}]},
+            {'employer_name': 'globex', 'locations': [{'type': 'remote', 'scope': 'country', 'country_code': 'US'}]},
+        ]], location_filter='or_')
+        window = generator.supabase.table.return_value.select.return_value \
+            .eq.return_value.gte.return_value.lte.return_value
+        window.contains.side_effect = Exception('column enriched_jobs.accessible_city_codes does not exist')
+
+        jobs = generator._fetch_all_jobs('lon', 'data', '2026-01-01', '2026-01-31')
+
+        assert [job['employer_name'] for job in jobs] == ['acme']
+        assert 'locations' in generator.supabase.table.return_value.select.call_args.args[0].split(',')
+        assert generator._server_accessibility is False
+
+    def test_transient_error_raised_without_fallback(self):
+        """A timeout mid-pagination is raised; later queries still filter on the server"""
+        generator = self._generator([[]])
+        window = generator.supabase.table.return_value.select.return_value \
+            .eq.return_value.gte.return_value.lte.return_value
+        window.contains.side_effect = Exception('canceling statement due to statement timeout')
+
+        with pytest.raises(Exception, match='timeout'):
+            generator._fetch_all_jobs('lon', 'data', '2026-01-01', '2026-01-31')
+
+        assert not window.or_.called
+        assert generator._server_accessibility is None
+
+    @pytest.mark.parametrize('error,missing', [
+        (APIError({'message': 'column enriched_jobs.accessible_city_codes does not exist', 'code': '42703'}), True),
+        (APIError({'message': "Could not find the 'accessible_city_codes' column of 'enriched_jobs' in the schema cache",
+                   'code': 'PGRST204'}), True),
+        (APIError({'message': 'canceling statement due to statement timeout', 'code': '57014'}), False),
+        (Exception('Server disconnected without sending a response.'), False),
+    ])
+    def test_missing_column_detection(self, error, missing):
+        assert is_missing_column_error(error, 'accessible_city_codes') is missing
+
+    def test_measure_fetch_payload(self):
+        full_row = {'employer_name': 'acme', 'locations': [{'scope': 'global'}], 'summary': 'x' * 500}
+        generator = self._generator([[full_row], [{'employer_name': 'acme'}]])
+
+        result = generator.measure_fetch_payload('lon', 'data', '2026-01-01', '2026-01-31')
+
+        selects = [c.args[0] for c in generator.supabase.table.return_value.select.call_args_list]
+        assert selects == ['*', result['projection']]
+        assert result['full']['rows'] == result['projected']['rows'] == 1
+        assert result['projected']['bytes'] < result['full']['bytes']
+
+
+class TestPortfolioComparison:
+    """generate_portfolio_report() fetches both periods concurrently"""
+
+    def test_periods_fetched_concurrently(self, generators):
+        generator = generators[0]
+        both_fetching = threading.Barrier(2, timeout=5)
+        current, previous = _jobs(1, 80), _jobs(2, 60)
+
+        def fetch(city_code, job_family, start_date, end_date):
+            both_fetching.wait()   # raises BrokenBarrierError if the periods run one after another
+            return current if start_date == '2026-01-01' else previous
+
+        with patch.object(generator, '_fetch_all_jobs', side_effect=fetch):
+            portfolio = generator.generate_portfolio_report(
+                'nyc', 'data', '2026-01-01', '2026-01-31', '2025-12-01', '2025-12-31'
+            )
+
+        periods = iter([current, previous])
+        with patch.object(generator, '_fetch_all_jobs', side_effect=lambda *a: next(periods)):
+            raw = generator.generate_report_data('nyc', 'data', '2026-01-01', '2026-01-31')
+            compare_raw = generator.generate_report_data('nyc', 'data', '2025-12-01', '2025-12-31')
+        assert json.dumps(portfolio) == json.dumps(generator.build_portfolio_report(raw, compare_raw))
+
+    def test_employer_metadata_loaded_once(self):
+        with patch('supabase.create_client'):
+            generator = ReportGenerator()
+
+        def load():
+            time.sleep(0.05)
+            return dict(EMPLOYER_METADATA)
+
+        with patch.object(generator, '_load_employer_metadata', side_effect=load) as loader, \
+                patch.object(generator, '_fetch_all_jobs', return_value=_jobs(3, 40)):
+            generator.generate_portfolio_report('nyc', 'data', '2026-01-01', '2026-01-31', '2025-12-01', '2025-12-31')
+
+        assert loader.call_count == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
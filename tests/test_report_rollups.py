@@ -0,0 +1,396 @@
+"""
+Test daily report rollups
+
+All database calls mocked. Rollups summed over a date range must give the
+row engine's counts and percentiles (ties may be ordered differently).
+
+Tests:
+1. compute_daily_rollups() rows per (day, city, family)
+2. RollupReportEngine vs rows engine parity over multi-day ranges
+3. Histogram percentiles match sort-and-index
+4. Daily salary sketches: rows, sketch-mode compensation, verification
+5. refresh_report_rollups(): incremental dirty days, backfill, dry run,
+   runs recorded (and dirty days pruned) only when finished
+6. ReportGenerator(engine='rollups') RPC path and fallbacks
+"""
+
+import json
+import random
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.report_generator import ReportGenerator
+from pipeline import report_rollups
+from pipeline.report_rollups import (
+    RollupReportEngine, compute_daily_rollups, compute_daily_sketches, histogram_percentiles,
+    refresh_report_rollups, verify_salary_sketches, _day_ranges,
+)
+from tests.report_jobs import synthetic_jobs
+
+EMPLOYER_METADATA = {
+    'acme': {'canonical_name': 'acme', 'display_name': 'Acme', 'industry': 'fintech',
+             'employer_size': 'enterprise', 'founding_year': 1990, 'ownership_type': 'public'},
+    'globex': {'canonical_name': 'globex', 'display_name': 'Globex', 'industry': 'ai_ml',
+               'founding_year': 2022},
+    'jpmorgan chase': {'canonical_name': 'jpmorgan chase', 'display_name': 'JPMorgan Chase',
+                       'industry': 'financial_services'},
+}
+CITY_SETS = [['lon'], ['nyc'], ['den', 'nyc', 'sfo'], ['den', 'lon', 'nyc', 'sfo', 'sgp']]
+
+
+def _jobs(seed: int, n: int) -> list:
+    """Jobs over two months with few enough skills/employers that no top-k cut applies."""
+    return synthetic_jobs(
+        seed, n, max_skills=4, string_skill_rate=0.5, salary_rate=0.7,
+        salary_spreads=[0, 15_000, 30_500], orphan_salary_max=True,
+        extra={'accessible_city_codes': CITY_SETS},
+        seniority=['senior', 'mid', 'junior', 'unknown', None],
+        job_subfamily=['data_engineer', 'data_analyst', 'null', None],
+    )
+
+
+def _sum_rollup(count_rows, salary_rows, city_code, job_family, start_date, end_date) -> dict:
+    """Python stand-in for the get_report_rollup RPC."""
+    def selected(row):
+        return (row['city_code'] == city_code and row['job_family'] == job_family
+                and start_date <= row['posted_date'] <= end_date)
+
+    counts = defaultdict(Counter)
+    days = set()
+    for row in filter(selected, count_rows):
+        counts[row['dimension']][row['value']] += row['jobs']
+        days.add(row['posted_date'])
+    salary = defaultdict(lambda: defaultdict(Counter))
+    for row in filter(selected, salary_rows):
+        salary[row['segment']][row['segment_value']][str(row['salary_midpoint'])] += row['jobs']
+    return json.loads(json.dumps({'counts': counts, 'salary': salary, 'days': len(days)}))
+
+
+def _sketch_entries(sketch_rows, city_codes, job_family, start_date, end_date) -> list:
+    """Python stand-in for the get_report_salary_sketches RPC."""
+    return json.loads(json.dumps([
+        [row['segment'], row['segment_value'], row['sketch']] for row in sketch_rows
+        if row['city_code'] in city_codes and row['job_family'] == job_family
+        and start_date <= row['posted_date'] <= end_date
+    ]))
+
+
+def _normalize(value):
+    """Order every list of dicts by count/median then content (tie order may differ)."""
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [_normalize(v) for v in value]
+        if items and isinstance(items[0], dict):
+            items.sort(key=lambda x: (-x.get('count', 0), -x.get('median', 0), json.dumps(x, sort_keys=True)))
+        return items
+    return value
+
+
+@pytest.fixture
+def generator():
+    with patch('supabase.create_client'):
+        generator = ReportGenerator(engine='rollups')
+    generator._employer_metadata = EMPLOYER_METADATA
+    return generator
+
+
+class TestComputeRollups:
+    """Test rollup rows written per day"""
+
+    def test_job_counts_towards_every_city(self):
+        job = {'employer_name': 'acme', 'job_family': 'data', 'posted_date': '2025-12-01',
+               'accessible_city_codes': ['nyc', 'sfo', 'xyz'], 'data_source': 'greenhouse',
+               'seniority': 'senior', 'working_arrangement': 'remote', 'skills': [{'name': 'SQL'}, 'Python'],
+               'salary_min': 100_000, 'salary_max': 120_000}
+        count_rows, salary_rows = compute_daily_rollups([job], '2026-01-01T00:00:00+00:00')
+
+        assert {r['city_code'] for r in count_rows} == {'nyc', 'sfo'}
+        nyc = {(r['dimension'], r['value']): r['jobs'] for r in count_rows if r['city_code'] == 'nyc'}
+        assert nyc[('summary', 'ats')] == nyc[('summary', 'with_skills')] == 1
+        assert nyc[('skill', 'Python')] == nyc[('skill', 'SQL')] == 1
+        assert not any(r['dimension'] == 'skill_pair' for r in count_rows)       # computed on demand
+        assert nyc[('working_arrangement', 'remote')] == 1
+        assert {(r['segment'], r['segment_value'], r['salary_midpoint']) for r in salary_rows
+                if r['city_code'] == 'nyc'} == {('overall', '', 110_000), ('seniority', 'senior', 110_000)}
+
+    def test_agency_jobs_only_in_totals(self):
+        job = {'employer_name': 'recruit co', 'job_family': 'data', 'posted_date': '2025-12-01',
+               'accessible_city_codes': ['lon'], 'is_agency': True, 'seniority': 'senior'}
+        count_rows, salary_rows = compute_daily_rollups([job], 'ts')
+
+        assert {(r['dimension'], r['value']) for r in count_rows} == {('summary', 'total'), ('summary', 'agency')}
+        assert salary_rows == []
+
+
+class TestRollupParity:
+    """Summed rollups must match the row engine"""
+
+    @pytest.mark.parametrize('seed', range(4))
+    @pytest.mark.parametrize('city_code', ['nyc', 'lon'])
+    def test_metrics_match_rows_engine(self, generator, seed, city_code):
+        jobs = _jobs(seed, 600)
+        count_rows, salary_rows = compute_daily_rollups(jobs, 'ts')
+
+        for start_date, end_date in (('2025-11-01', '2025-12-31'), ('2025-12-01', '2025-12-31')):
+            rollup = _sum_rollup(count_rows, salary_rows, city_code, 'data', start_date, end_date)
+            period = [j for j in jobs if city_code in j['accessible_city_codes'] and j['job_family'] == 'data'
+                      and start_date <= j['posted_date'] <= end_date]
+            rollup['skill_pairs'] = RollupReportEngine.skill_pairs(period)
+
+            expected = generator._calculate_metrics(period, city_code, 'data')
+            actual = RollupReportEngine(generator).calculate(rollup, city_code, 'data')
+            assert _normalize(actual) == _normalize(expected)
+
+    def test_ties_ordered_by_value(self, generator):
+        rollup = {'counts': {'summary': {'total': 4, 'direct': 4},
+                             'track': {'management': 2, 'ic': 2}}}
+        metrics = RollupReportEngine(generator).calculate(rollup, 'lon', 'data')
+        assert [d['code'] for d in metrics['track_dist']['distribution']] == ['ic', 'management']
+
+
+class TestHistogramPercentiles:
+    """Exact value histograms reproduce sort-and-index percentiles"""
+
+    @pytest.mark.parametrize('n', [1, 9, 20, 101])
+    def test_matches_sort_and_index(self, n):
+        rng = random.Random(n)
+        values = [rng.randrange(80_000, 160_000, 2_500) / 2 for _ in range(n)]
+        histogram = {str(v): c for v, c in Counter(values).items()}
+
+        ordered = sorted(values)
+        assert histogram_percentiles(histogram) == (n, [ordered[int(n * q)] for q in (0.25, 0.50, 0.75)])
+
+
+class TestSalarySketches:
+    """Daily t-digests give the histogram percentiles"""
+
+    def test_sketch_rows_per_segment_day(self):
+        _, salary_rows = compute_daily_rollups(_jobs(2, 200), 'ts')
+        sketch_rows = compute_daily_sketches(salary_rows, 'ts')
+
+        keys = {(r['posted_date'], r['city_code'], r['job_family'], r['segment'], r['segment_value'])
+                for r in salary_rows}
+        assert len(sketch_rows) == len(keys)
+        assert sum(r['jobs'] for r in sketch_rows) == sum(r['jobs'] for r in salary_rows)
+        assert {r['computed_at'] for r in sketch_rows} == {'ts'}
+
+    @pytest.mark.parametrize('seed', range(2))
+    def test_sketch_compensation_matches_exact(self, generator, seed):
+        count_rows, salary_rows = compute_daily_rollups(_jobs(seed, 600), 'ts')
+        sketch_rows = compute_daily_sketches(salary_rows, 'ts')
+        rollup = _sum_rollup(count_rows, salary_rows, 'nyc', 'data', '2025-11-01', '2025-12-31')
+
+        engine = RollupReportEngine(generator, quantiles='sketch')
+        exact = engine.calculate(rollup, 'nyc', 'data')
+        rollup['sketches'] = report_rollups.merge_salary_sketches(
+            _sketch_entries(sketch_rows, ['nyc'], 'data', '2025-11-01', '2025-12-31'))
+        sketched = engine.calculate(rollup, 'nyc', 'data')
+        assert sketched['compensation_metrics'] == exact['compensation_metrics']
+
+    def test_fetch_requests_sketches(self, generator):
+        generator.supabase = MagicMock()
+        generator.supabase.rpc.return_value.execute.return_value = Mock(data=[])
+        RollupReportEngine(generator, quantiles='sketch').fetch('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert generator.supabase.rpc.call_args.args == ('get_report_salary_sketches', {
+            'p_city_codes': ['lon'], 'p_job_family': 'data',
+            'p_start_date': '2025-12-01', 'p_end_date': '2025-12-31',
+        })
+
+    def test_rejects_unknown_quantiles(self, generator):
+        with pytest.raises(ValueError):
+            RollupReportEngine(generator, quantiles='approx')
+
+    def test_verify_reports_errors(self):
+        count_rows, salary_rows = compute_daily_rollups(_jobs(3, 400), 'ts')
+        sketch_rows = compute_daily_sketches(salary_rows, 'ts')
+
+        def rpc(name, params):
+            args = (params['p_job_family'], params['p_start_date'], params['p_end_date'])
+            if name == 'get_report_rollup':
+                data = _sum_rollup(count_rows, salary_rows, params['p_city_code'], *args)
+            else:
+                data = _sketch_entries(sketch_rows, params['p_city_codes'], *args)
+            return Mock(execute=Mock(return_value=Mock(data=data)))
+
+        with patch('pipeline.report_rollups.supabase') as mock_sb:
+            mock_sb.rpc.side_effect = rpc
+            results = verify_salary_sketches('2025-11-01', '2025-12-31', cities=['lon', 'sfo'],
+                                             families=['data'])
+
+        assert {r['city_code'] for r in results} == {'lon', 'sfo'}
+        assert all(r['max_error_pct'] == 0 and r['sample'] == r['sketch_sample'] for r in results)
+
+
+class TestRefresh:
+    """Test the nightly refresh flow"""
+
+    def test_day_ranges(self):
+        days = ['2025-12-01', '2025-12-02', '2025-12-04', '2025-12-05', '2025-12-06']
+        assert _day_ranges(days, max_days=2) == [
+            ('2025-12-01', '2025-12-02'), ('2025-12-04', '2025-12-05'), ('2025-12-06', '2025-12-06'),
+        ]
+
+    def test_incremental_recomputes_dirty_days(self):
+        with patch.object(report_rollups, 'fetch_rollup_watermark', return_value='2026-01-01T09:00:00+00:00'), \
+                patch.object(report_rollups, 'find_dirty_days', return_value=['2025-12-30', '2026-01-01']) as dirty, \
+                patch.object(report_rollups, 'fetch_jobs_for_days', return_value=_jobs(1, 20)) as fetch, \
+                patch.object(report_rollups, 'replace_rollups') as replace, \
+                patch.object(report_rollups, 'record_rollup_run') as record, \
+                patch.object(report_rollups, 'prune_dirty_days') as prune:
+            stats = refresh_report_rollups()
+
+        dirty.assert_called_once_with('2026-01-01T09:00:00+00:00')
+        assert record.call_args.args[0] == 'incremental'
+        prune.assert_called_once_with(record.call_args.args[1])       # entries before this run's start
+        assert record.call_args.args[2:] == (['2025-12-30', '2026-01-01'], 40)
+        assert [c.args for c in fetch.call_args_list] == [('2025-12-30', '2025-12-30'), ('2026-01-01', '2026-01-01')]
+        assert [c.args[:2] for c in replace.call_args_list] == [c.args for c in fetch.call_args_list]
+        assert stats['days'] == 2 and stats['jobs'] == 40
+        assert stats['sketch_rows'] == sum(len(c.args[4]) for c in replace.call_args_list) > 0
+
+    def test_first_run_backfills_and_dry_run_skips_writes(self):
+        with patch.object(report_rollups, 'fetch_rollup_watermark', return_value=None), \
+                patch.object(report_rollups, 'find_first_posted_date', return_value='2025-12-01'), \
+                patch.object(report_rollups, 'fetch_jobs_for_days', return_value=[]) as fetch, \
+                patch.object(report_rollups, 'replace_rollups') as replace, \
+                patch.object(report_rollups, 'record_rollup_run') as record, \
+                patch.object(report_rollups, 'prune_dirty_days') as prune:
+            stats = refresh_report_rollups(dry_run=True)
+
+        assert fetch.call_args_list[0].args == ('2025-12-01', '2025-12-07')
+        assert stats['days'] >= 7
+        assert not replace.called
+        assert not record.called
+        assert not prune.called
+
+    def test_failed_run_not_recorded(self):
+        with patch.object(report_rollups, 'fetch_rollup_watermark', return_value=None), \
+                patch.object(report_rollups, 'find_first_posted_date', return_value='2025-12-01'), \
+                patch.object(report_rollups, 'fetch_jobs_for_days', side_effect=[[], Exception('timeout')]), \
+                patch.object(report_rollups, 'replace_rollups') as replace, \
+                patch.object(report_rollups, 'record_rollup_run') as record, \
+                patch.object(report_rollups, 'prune_dirty_days') as prune:
+            with pytest.raises(Exception, match='timeout'):
+                refresh_report_rollups()
+
+        assert replace.call_count == 1                                 # first chunk written
+        assert not record.called                                       # next run backfills again
+        assert not prune.called
+
+    def test_range_run_recorded_without_watermark(self):
+        with patch.object(report_rollups, 'fetch_rollup_watermark') as watermark, \
+                patch.object(report_rollups, 'fetch_jobs_for_days', return_value=[]), \
+                patch.object(report_rollups, 'replace_rollups'), \
+                patch.object(report_rollups, 'record_rollup_run') as record, \
+                patch.object(report_rollups, 'prune_dirty_days') as prune:
+            refresh_report_rollups('2025-12-01', '2025-12-03')
+
+        assert not watermark.called
+        assert record.call_args.args[0] == 'range'
+        assert record.call_args.args[2] == ['2025-12-01', '2025-12-02', '2025-12-03']
+        assert not prune.called                                        # other dirty days still pending
+
+    def test_dirty_days_from_trigger_log(self):
+        """Dirty days come from report_rollup_dirty_days, not classified_at"""
+        with patch('pipeline.report_rollups.supabase') as mock_sb:
+            query = mock_sb.table.return_value.select.return_value
+            query.gte.return_value.order.return_value.range.return_value.execute.return_value = Mock(data=[
+                {'posted_date': '2025-12-03'}, {'posted_date': '2025-11-20'}, {'posted_date': '2025-12-03'},
+            ])
+            days = report_rollups.find_dirty_days('2026-01-02T03:00:00+00:00')
+
+        assert days == ['2025-11-20', '2025-12-03']
+        mock_sb.table.assert_called_once_with('report_rollup_dirty_days')
+        query.gte.assert_called_once_with('marked_at', '2026-01-02T03:00:00+00:00')
+
+    def test_watermark_reads_finished_runs(self):
+        with patch('pipeline.report_rollups.supabase') as mock_sb:
+            query = mock_sb.table.return_value.select.return_value
+            query.in_.return_value.order.return_value.limit.return_value.execute.return_value = Mock(
+                data=[{'started_at': '2026-01-02T03:00:00+00:00'}])
+            assert report_rollups.fetch_rollup_watermark() == '2026-01-02T03:00:00+00:00'
+
+        mock_sb.table.assert_called_once_with('report_rollup_runs')
+        query.in_.assert_called_once_with('kind', ['backfill', 'incremental'])
+
+    def test_replace_one_transaction_per_day(self):
+        counts = [{'posted_date': '2025-12-01', 'a': i} for i in range(1500)]
+        sketches = [{'posted_date': '2025-12-03', 'b': 1}]
+        with patch('pipeline.report_rollups.supabase') as mock_sb:
+            report_rollups.replace_rollups('2025-12-01', '2025-12-03', counts, [], sketches)
+
+        assert not mock_sb.table.called                                # no separate delete/insert calls
+        calls = [c.args for c in mock_sb.rpc.call_args_list]
+        assert [name for name, _ in calls] == ['replace_report_rollup_day'] * 3
+        params = {p['p_posted_date']: p for _, p in calls}
+        assert len(params['2025-12-01']['p_counts']) == 1500
+        assert params['2025-12-02'] == {'p_posted_date': '2025-12-02', 'p_counts': [],
+                                        'p_salaries': [], 'p_sketches': []}       # emptied day cleared
+        assert params['2025-12-03']['p_sketches'] == sketches
+
+
+class TestRollupsEngine:
+    """ReportGenerator(engine='rollups') uses the RPC, else falls back to jobs"""
+
+    def test_report_from_rpc(self, generator):
+        count_rows, salary_rows = compute_daily_rollups(_jobs(5, 300), 'ts')
+        generator.supabase = MagicMock()
+        generator.supabase.rpc.return_value.execute.return_value = Mock(
+            data=_sum_rollup(count_rows, salary_rows, 'sfo', 'data', '2025-12-01', '2025-12-31'))
+
+        with patch.object(generator, '_fetch_all_jobs', return_value=[]) as fetch:
+            data = generator.generate_report_data('sfo', 'data', '2025-12-01', '2025-12-31')
+
+        fetch.assert_not_called()                                           # no job fetch at all
+        assert generator.supabase.rpc.call_args.args == ('get_report_rollup', {
+            'p_city_code': 'sfo', 'p_job_family': 'data',
+            'p_start_date': '2025-12-01', 'p_end_date': '2025-12-31',
+        })
+        assert data['summary']['total_jobs'] > 0
+        assert data['skills']['skill_pairs'] == []
+
+    def test_skill_pairs_opt_in(self, generator):
+        """rollup_skill_pairs=True adds the window's pairs from a skills-only fetch"""
+        jobs = _jobs(5, 300)
+        count_rows, salary_rows = compute_daily_rollups(jobs, 'ts')
+        generator.rollup_skill_pairs = True
+        generator.supabase = MagicMock()
+        generator.supabase.rpc.return_value.execute.return_value = Mock(
+            data=_sum_rollup(count_rows, salary_rows, 'sfo', 'data', '2025-12-01', '2025-12-31'))
+        window = [j for j in jobs if 'sfo' in j['accessible_city_codes'] and j['job_family'] == 'data'
+                  and '2025-12-01' <= j['posted_date'] <= '2025-12-31']
+
+        with patch.object(generator, '_fetch_all_jobs', return_value=window) as fetch:
+            data = generator.generate_report_data('sfo', 'data', '2025-12-01', '2025-12-31')
+
+        fetch.assert_called_once_with('sfo', 'data', '2025-12-01', '2025-12-31', columns='skills,is_agency')
+        pairs = [[p['skill_1'], p['skill_2'], p['count']] for p in data['skills']['skill_pairs']]
+        assert pairs == RollupReportEngine.skill_pairs(window)
+        assert pairs
+
+    @pytest.mark.parametrize('rpc_error', [True, False])
+    def test_falls_back_to_jobs(self, generator, rpc_error):
+        generator.supabase = MagicMock()
+        if rpc_error:
+            generator.supabase.rpc.return_value.execute.side_effect = Exception('function does not exist')
+        else:
+            generator.supabase.rpc.return_value.execute.return_value = Mock(data={'counts': {}, 'salary': {}, 'days': 0})
+
+        jobs = _jobs(6, 50)
+        with patch.object(generator, '_fetch_all_jobs', return_value=jobs):
+            data = generator.generate_report_data('lon', 'data', '2025-12-01', '2025-12-31')
+
+        assert data['summary']['total_jobs'] == 50
+        assert generator._rollups_available is (False if rpc_error else None)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
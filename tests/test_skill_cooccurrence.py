@@ -0,0 +1,135 @@
+"""
+Test the sparse skill co-occurrence engine
+
+Reference results come from the per-job pair loop ReportGenerator used
+before the incidence matrix (Counter over sorted pairs, most_common order).
+
+Tests:
+1. top_pairs() matches the pair loop, including tie order and support bounds
+2. associations(): lift/PMI values and ranking
+3. top_skills_by_segment() per segment counts
+4. Empty and single-skill inputs
+"""
+
+import math
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.skill_cooccurrence import SkillIncidence
+
+SKILLS = ['Python', 'SQL', 'dbt', 'Spark', 'AWS', 'Airflow', 'Kafka', 'Go', 'Rust', 'Looker',
+          'Tableau', 'GCP', 'Azure', 'Terraform', 'Docker', 'Kubernetes']
+
+
+def _jobs(seed: int, n: int, max_skills: int = 8) -> list:
+    rng = random.Random(seed)
+    weights = [1 / (i + 1) for i in range(len(SKILLS))]
+    jobs = []
+    for _ in range(n):
+        names = rng.choices(SKILLS, weights, k=rng.randint(0, max_skills))   # repeats allowed
+        jobs.append({'skills': [rng.choice([{'name': s}, s]) for s in names]})
+    return jobs
+
+
+def _reference_pairs(jobs: list, k: int) -> list:
+    pairs = Counter()
+    for job in jobs:
+        names = sorted({s.get('name', '') if isinstance(s, dict) else str(s) for s in job.get('skills') or []})
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                pairs[(names[i], names[j])] += 1
+    return [(a, b, count) for (a, b), count in pairs.most_common(k)]
+
+
+class TestTopPairs:
+    """Sparse X^T X top pairs equal the pair loop"""
+
+    @pytest.mark.parametrize('seed', range(5))
+    @pytest.mark.parametrize('n', [3, 40, 800])
+    def test_matches_pair_loop(self, seed, n):
+        jobs = _jobs(seed, n)
+        assert SkillIncidence.from_jobs(jobs).top_pairs(10) == _reference_pairs(jobs, 10)
+
+    def test_ties_in_first_seen_order(self):
+        jobs = [{'skills': ['b', 'c']}, {'skills': ['a', 'd']}, {'skills': ['c', 'b', 'a']}]
+        assert SkillIncidence.from_jobs(jobs).top_pairs(3) == [
+            ('b', 'c', 2), ('a', 'd', 1), ('a', 'b', 1),
+        ]
+
+    def test_many_skills_prunes_by_bound(self):
+        rng = random.Random(9)
+        vocabulary = [f'skill_{i:03d}' for i in range(300)]
+        jobs = [{'skills': rng.sample(vocabulary[:20], 4) + rng.sample(vocabulary, 3)} for _ in range(500)]
+        incidence = SkillIncidence.from_jobs(jobs)
+
+        assert incidence._pair_count_bound(10) > 1
+        assert incidence.top_pairs(10) == _reference_pairs(jobs, 10)
+
+    def test_min_support_drops_rare_skills(self):
+        jobs = [{'skills': ['a', 'b']}] * 3 + [{'skills': ['a', 'z']}]
+        assert SkillIncidence.from_jobs(jobs).top_pairs(5, min_support=2) == [('a', 'b', 3)]
+
+    def test_cooccurrence_diagonal_is_support(self):
+        incidence = SkillIncidence.from_jobs(_jobs(1, 200))
+        keep, gram = incidence.cooccurrence()
+        assert gram.diagonal().tolist() == incidence.support[keep].tolist()
+
+
+class TestAssociations:
+    """Lift and PMI over the job population"""
+
+    def test_lift_and_pmi(self):
+        jobs = ([{'skills': ['a', 'b']}] * 4 + [{'skills': ['a']}] * 4
+                + [{'skills': ['c', 'd']}] * 2 + [{'skills': ['c', 'b']}] * 2)
+        incidence = SkillIncidence.from_jobs(jobs, n_jobs=20)
+        result = incidence.associations(min_support=1, min_count=1)
+
+        by_pair = {(r['skill_1'], r['skill_2']): r for r in result}
+        assert by_pair[('a', 'b')]['lift'] == round(4 * 20 / (8 * 6), 3)
+        assert by_pair[('c', 'd')]['lift'] == 5.0
+        assert by_pair[('c', 'd')]['pmi'] == round(math.log2(5), 3)
+        assert [(r['skill_1'], r['skill_2']) for r in result][0] == ('c', 'd')
+
+    def test_thresholds(self):
+        jobs = [{'skills': ['a', 'b']}] * 5 + [{'skills': ['x', 'y']}]
+        incidence = SkillIncidence.from_jobs(jobs)
+        assert [r['skill_1'] for r in incidence.associations(min_support=2, min_count=1)] == ['a']
+        assert incidence.associations(min_support=1, min_count=6) == []
+
+
+class TestSegments:
+    """Top skills per segment via the segment indicator product"""
+
+    def test_top_skills_by_segment(self):
+        jobs = _jobs(4, 300)
+        families = [random.Random(i).choice(['data', 'product', None]) for i in range(len(jobs))]
+        result = SkillIncidence.from_jobs(jobs).top_skills_by_segment(families, k=5)
+
+        assert set(result) == {'data', 'product'}
+        for family, top in result.items():
+            segment = [j for j, f in zip(jobs, families) if f == family and j['skills']]
+            counts = Counter(n for j in segment
+                             for n in {s.get('name', '') if isinstance(s, dict) else s for s in j['skills']})
+            expected = sorted(counts.items(), key=lambda x: (-x[1], x[0]))[:5]
+            assert [(s['name'], s['count']) for s in top] == expected
+            assert top[0]['percentage'] == round(expected[0][1] / len(segment) * 100)
+
+
+class TestEdgeCases:
+    """Inputs without pairs"""
+
+    @pytest.mark.parametrize('jobs', [[], [{'skills': []}], [{'skills': ['a']}, {'skills': ['a', 'a']}]])
+    def test_no_pairs(self, jobs):
+        incidence = SkillIncidence.from_jobs(jobs)
+        assert incidence.top_pairs(10) == []
+        assert incidence.associations(min_support=1, min_count=1) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,9 +3,11 @@ Test skill family mapper module
 
 Pure unit tests for pipeline/skill_family_mapper.py.
 Tests mapping from skill names to family codes using YAML config,
-and canonical name normalization.
+canonical name normalization, and the skill index (single lookup, batch API
+and fuzzy near-miss matching).
 """
 
+import pickle
 import sys
 from pathlib import Path
 
@@ -18,9 +20,14 @@ from pipeline.skill_family_mapper import (
     get_canonical_name,
     enrich_skills_with_families,
     get_mapping_stats,
+    lookup_skill,
+    lookup_skills,
+    clear_skill_cache,
+    _edit_distance,
     SKILL_TO_FAMILY,
     SKILL_TO_CANONICAL,
 )
+from pipeline.config_registry import get_compiled
 
 
 class TestGetSkillFamily:
@@ -186,6 +193,82 @@ class TestEnrichSkillsWithFamilies:
         assert enriched[0]["family_code"] == "data_modeling"
 
 
+class TestLookupSkill:
+    """Test lookup_skill() / lookup_skills() on the skill index"""
+
+    def test_returns_canonical_and_family(self):
+        """One lookup returns both canonical name and family"""
+        assert lookup_skill("pytorch") == ("PyTorch", "deep_learning")
+
+    def test_matches_separate_lookups(self):
+        """Index agrees with get_canonical_name() + get_skill_family()"""
+        for name in ["python", "Databases", "Data Visualisation", "R", "  jira ", "unknown cool tool"]:
+            assert lookup_skill(name) == (get_canonical_name(name), get_skill_family(name))
+
+    def test_empty_and_none(self):
+        """Empty input returns empty name and no family"""
+        assert lookup_skill("") == ("", None)
+        assert lookup_skill(None) == ("", None)
+
+    def test_batch_preserves_order_and_duplicates(self):
+        """Batch lookups return one result per input, in order"""
+        names = ["python", "SNOWFLAKE", "python", "unknown cool tool"]
+        assert lookup_skills(names) == [lookup_skill(name) for name in names]
+
+    def test_batch_accepts_generator(self):
+        """Batch lookups accept any iterable"""
+        assert lookup_skills(name for name in ["dbt"]) == [("dbt", "data_modeling")]
+
+    def test_lookup_cache_reset_with_index(self):
+        """Clearing the skill cache rebuilds the index and its LRU"""
+        index = get_compiled("skill_index")
+        lookup_skill("Python")
+        assert index._cached_lookup.cache_info().currsize > 0
+
+        clear_skill_cache()
+        assert get_compiled("skill_index") is not index
+        assert lookup_skill("Python") == ("Python", "programming")
+
+    def test_index_pickles(self):
+        """Index survives pickling (config snapshots) with a fresh LRU"""
+        index = pickle.loads(pickle.dumps(get_compiled("skill_index")))
+        assert index._cached_lookup.cache_info().currsize == 0
+        assert index.lookup("Kubernets", fuzzy=True) == ("Kubernetes", "deployment")
+
+
+class TestFuzzyLookup:
+    """Test the optional near-miss stage"""
+
+    def test_off_by_default(self):
+        """Typos stay unmapped unless fuzzy is requested"""
+        assert lookup_skill("Kubernets") == ("Kubernets", None)
+
+    def test_typo_resolved(self):
+        """Single-character typos resolve to the closest skill"""
+        assert lookup_skill("Kubernets", fuzzy=True) == ("Kubernetes", "deployment")
+        assert lookup_skill("Tensorflw", fuzzy=True) == ("TensorFlow", "deep_learning")
+
+    def test_short_names_not_fuzzed(self):
+        """Short names never fuzzy-match (protects R, Go, SQL, etc.)"""
+        assert lookup_skill("Gx", fuzzy=True)[1] is None
+        assert lookup_skill("SQK", fuzzy=True)[1] is None
+
+    def test_unrelated_name_unmapped(self):
+        """Names far from any skill stay unmapped"""
+        assert lookup_skill("completely unrelated phrase", fuzzy=True)[1] is None
+
+    def test_enrich_with_fuzzy(self):
+        """enrich_skills_with_families() passes fuzzy through"""
+        enriched = enrich_skills_with_families([{"name": "Kubernets"}], fuzzy=True)
+        assert enriched[0] == {"name": "Kubernetes", "family_code": "deployment"}
+
+    def test_edit_distance(self):
+        """Bounded edit distance gives up past the budget"""
+        assert _edit_distance("kubernets", "kubernetes", 2) == 1
+        assert _edit_distance("snowflake", "snowflake", 1) == 0
+        assert _edit_distance("abcdef", "uvwxyz", 2) == 3
+
+
 class TestMappingConfig:
     """Test that YAML config loaded correctly"""
 
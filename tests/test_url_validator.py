@@ -4,8 +4,12 @@ Comprehensive tests for URL validation flow.
 
 Tests:
 1. check_url() - HTTP status detection, soft 404 patterns, blocked detection
+   check_url_async() / check_urls() - streaming validator with early exit
+   HostScheduler / check_jobs() - per-host scheduling and browser fallback
 2. check_url_playwright() - Playwright fallback for blocked URLs
+   BrowserPool / check_urls_playwright() - pooled browser fallback
 3. validate_urls() - Full validation flow with database updates
+   UrlStatusWriter / update_posting_urls() - batched database writes
 4. url_status parameter in insert_enriched_job()
 5. employer_stats.py soft_404 inclusion
 
@@ -15,14 +19,33 @@ Run with: pytest tests/test_url_validator.py -v
 import sys
 sys.path.insert(0, 'C:\\Cursor Projects\\job-analytics')
 
+import asyncio
+import time
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, date
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from datetime import datetime, date, timedelta
+import httpx
 import requests
 
 from pipeline.url_validator import (
     check_url,
+    check_url_async,
+    check_jobs,
+    check_urls,
+    check_urls_async,
+    new_async_client,
+    update_posting_urls,
+    UrlStatusWriter,
+    HostScheduler,
+    RecheckPriority,
+    MIN_CLOSURE_PROBABILITY,
+    SOURCE_CLOSURE_PRIOR,
+    SOURCE_PRIOR_WEIGHT,
+    SOURCE_FACTOR_RANGE,
     check_url_playwright,
+    check_urls_playwright,
+    BrowserPool,
+    _block_heavy_resources,
     SOFT_404_PATTERNS,
     PLAYWRIGHT_AVAILABLE
 )
@@ -234,6 +257,289 @@ class TestCheckUrlRedirectHandling:
             assert final_url == "https://new.example.com/careers/job/456"
 
 
+# ============================================
+# TEST: check_url_async() - Streaming Validator
+# ============================================
+
+class _Body(httpx.AsyncByteStream):
+    """Streamed response body that records how many chunks were read."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+def _client(handler):
+    """Async client backed by an in-process handler(request) -> httpx.Response."""
+    client = new_async_client()
+    client._transport = httpx.MockTransport(handler)
+    return client
+
+
+def _run_check(handler, url="https://example.com/job/123", **kwargs):
+    async def run():
+        async with _client(handler) as client:
+            return await check_url_async(client, url, **kwargs)
+    return asyncio.run(run())
+
+
+class TestCheckUrlAsync:
+    """Test check_url_async() status handling and streaming soft 404 detection"""
+
+    @pytest.mark.parametrize("status_code,expected", [
+        (404, '404'), (410, '410'), (403, 'blocked'), (202, 'blocked'),
+        (500, 'error'), (429, 'error'),
+    ])
+    def test_status_codes_skip_body(self, status_code, expected):
+        """Non-200 responses are classified without reading the body"""
+        body = _Body([b"job not found"])
+        status, code, _ = _run_check(lambda request: httpx.Response(status_code, stream=body))
+
+        assert (status, code) == (expected, status_code)
+        assert body.read == 0
+
+    def test_active(self):
+        """200 without soft 404 phrases is active"""
+        body = _Body([b"<h1>Senior Data Engineer</h1>", b"<p>Apply now</p>"])
+        result = _run_check(lambda request: httpx.Response(200, stream=body))
+
+        assert result == ('active', 200, "https://example.com/job/123")
+
+    def test_soft_404_stops_streaming(self):
+        """Streaming stops at the first chunk containing a soft 404 phrase"""
+        body = _Body([b"<html>", b"This Position Has Been Filled", b"x" * 1000, b"y" * 1000])
+        status, _, _ = _run_check(lambda request: httpx.Response(200, stream=body))
+
+        assert status == 'soft_404'
+        assert body.read == 2
+
+    def test_phrase_split_across_chunks(self):
+        """Phrases split across chunk boundaries are still detected"""
+        body = _Body([b"Sorry, this job no lon", b"ger available."])
+        status, _, _ = _run_check(lambda request: httpx.Response(200, stream=body))
+
+        assert status == 'soft_404'
+
+    def test_byte_cap_stops_streaming(self):
+        """Pages are treated as active once the byte cap is reached"""
+        body = _Body([b"a" * 100] * 10 + [b"job not found"])
+        status, _, _ = _run_check(lambda request: httpx.Response(200, stream=body), byte_cap=250)
+
+        assert status == 'active'
+        assert body.read == 3
+
+    def test_follows_redirects(self):
+        """Redirects are followed and the final URL returned"""
+        def handler(request):
+            if request.url.path == "/old":
+                return httpx.Response(301, headers={"Location": "https://example.com/careers?error=true"})
+            return httpx.Response(200, text="Careers")
+
+        result = _run_check(handler, url="https://example.com/old")
+
+        assert result == ('soft_404', 200, "https://example.com/careers?error=true")
+
+    def test_network_error(self):
+        """Transport failures map to error"""
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        assert _run_check(handler) == ('error', None, None)
+
+    def test_invalid_url(self):
+        """Malformed URLs map to error"""
+        assert _run_check(lambda request: httpx.Response(200), url="not-a-valid-url") == ('error', None, None)
+
+    def test_unexpected_error(self):
+        """Errors outside httpx's hierarchy still map to error"""
+        def handler(request):
+            raise RuntimeError("decoder blew up")
+
+        assert _run_check(handler) == ('error', None, None)
+
+    def test_batch_order_and_shared_client(self):
+        """check_urls_async() returns results in input order on one client"""
+        def handler(request):
+            return httpx.Response(404 if request.url.path == "/gone" else 200, text="Role details")
+
+        async def run():
+            async with _client(handler) as client:
+                return await check_urls_async(
+                    ["https://a.com/1", "https://a.com/gone", "https://b.com/2"], client=client)
+
+        results = asyncio.run(run())
+        assert [r[0] for r in results] == ['active', '404', 'active']
+
+    def test_sync_wrapper_empty(self):
+        """check_urls() with no URLs does nothing"""
+        assert check_urls([]) == []
+
+
+# ============================================
+# TEST: HostScheduler - Per-host Scheduling
+# ============================================
+
+class _HostTracker:
+    """Async handler that records per-host concurrency and request start times."""
+
+    def __init__(self, delays=None, statuses=None):
+        self.delays = delays or {}
+        self.statuses = statuses or {}
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.max_total = 0
+        self.starts = {}
+        self.finished = []
+
+    async def __call__(self, request):
+        host = request.url.host
+        self.starts.setdefault(host, []).append(time.monotonic())
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        self.max_total = max(self.max_total, sum(self.in_flight.values()))
+        await asyncio.sleep(self.delays.get(host, 0.01))
+        self.in_flight[host] -= 1
+        self.finished.append(host)
+        return httpx.Response(self.statuses.get(host, 200), text="Role details")
+
+
+def _run_scheduler(scheduler, jobs, tracker, fallback=None):
+    results = []
+
+    async def run():
+        async with _client(tracker) as client:
+            await scheduler.run(jobs, lambda job, result: results.append((job['url'], result[0])),
+                                fallback=fallback, client=client)
+
+    asyncio.run(run())
+    return results
+
+
+def _jobs(host, n):
+    return [{'url': f"https://{host}/job/{i}"} for i in range(n)]
+
+
+class TestHostScheduler:
+    """Test HostScheduler per-host limits, interleaving and blocked hosts"""
+
+    def test_all_jobs_reported(self):
+        """Every job gets exactly one result"""
+        jobs = _jobs("a.com", 5) + _jobs("b.com", 5)
+        results = _run_scheduler(HostScheduler(per_host_delay=0), jobs, _HostTracker())
+
+        assert sorted(url for url, _ in results) == sorted(job['url'] for job in jobs)
+
+    def test_per_host_and_global_concurrency(self):
+        """Per-host and global in-flight limits are respected"""
+        tracker = _HostTracker()
+        jobs = _jobs("a.com", 8) + _jobs("b.com", 8) + _jobs("c.com", 8)
+        _run_scheduler(HostScheduler(max_concurrency=4, per_host_concurrency=2, per_host_delay=0,
+                                     host_overrides={}), jobs, tracker)
+
+        assert max(tracker.max_in_flight.values()) == 2
+        assert tracker.max_total <= 4
+
+    def test_host_overrides(self):
+        """Overridden hosts get their own concurrency"""
+        tracker = _HostTracker()
+        _run_scheduler(HostScheduler(per_host_concurrency=1, per_host_delay=0,
+                                     host_overrides={"fast.com": (5, 0.0)}),
+                       _jobs("fast.com", 10), tracker)
+
+        assert tracker.max_in_flight["fast.com"] == 5
+
+    def test_per_host_delay(self):
+        """Request starts on one host are spaced by the delay"""
+        tracker = _HostTracker()
+        _run_scheduler(HostScheduler(per_host_concurrency=2, per_host_delay=0.05, host_overrides={}),
+                       _jobs("a.com", 4), tracker)
+
+        starts = tracker.starts["a.com"]
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.045
+
+    def test_slow_host_does_not_stall_others(self):
+        """Fast hosts finish while a slow host is still being worked through"""
+        tracker = _HostTracker(delays={"slow.com": 0.1, "fast.com": 0.005})
+        jobs = _jobs("slow.com", 5) + _jobs("fast.com", 10)
+        _run_scheduler(HostScheduler(per_host_concurrency=1, per_host_delay=0, host_overrides={}),
+                       jobs, tracker)
+
+        last_fast = max(i for i, host in enumerate(tracker.finished) if host == "fast.com")
+        assert tracker.finished[:last_fast + 1].count("slow.com") <= 1
+
+    def test_blocked_host_skips_http(self):
+        """After repeated 403s a host's remaining URLs go straight to fallback"""
+        tracker = _HostTracker(statuses={"blocked.com": 403})
+        fallback = asyncio.Queue()
+        scheduler = HostScheduler(per_host_concurrency=1, per_host_delay=0, host_overrides={},
+                                  blocked_host_threshold=2)
+        results = _run_scheduler(scheduler, _jobs("blocked.com", 6) + _jobs("ok.com", 2),
+                                 tracker, fallback=fallback)
+
+        assert len(tracker.starts["blocked.com"]) == 2
+        assert scheduler.skipped == 4
+        assert scheduler.blocked_hosts == ["blocked.com"]
+        assert fallback.qsize() == 6
+        assert [status for url, status in results if "ok.com" in url] == ['active', 'active']
+
+
+class TestCheckJobs:
+    """Test check_jobs() HTTP + concurrent browser fallback"""
+
+    class _FakePool:
+        launches = 0
+
+        def __init__(self, contexts):
+            pass
+
+        async def __aenter__(self):
+            type(self).launches += 1
+            return self
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+        async def check(self, url):
+            return ('active', 200, url)
+
+    def _run(self, jobs, tracker):
+        http, browser = [], []
+
+        async def run():
+            async with _client(tracker) as client:
+                await check_jobs(jobs, lambda job, r: http.append(r[0]),
+                                 lambda job, r: browser.append((job['url'], r[0])),
+                                 scheduler=HostScheduler(per_host_delay=0), client=client)
+
+        self._FakePool.launches = 0
+        with patch('pipeline.url_validator.BrowserPool', self._FakePool), \
+                patch('pipeline.url_validator.PLAYWRIGHT_AVAILABLE', True):
+            asyncio.run(run())
+        return http, browser
+
+    def test_blocked_jobs_verified_in_browser(self):
+        """Blocked URLs are re-checked in the browser pool"""
+        tracker = _HostTracker(statuses={"blocked.com": 403})
+        http, browser = self._run(_jobs("blocked.com", 2) + _jobs("ok.com", 2), tracker)
+
+        assert sorted(http) == ['active', 'active', 'blocked', 'blocked']
+        assert sorted(browser) == [("https://blocked.com/job/0", 'active'),
+                                   ("https://blocked.com/job/1", 'active')]
+
+    def test_browser_not_launched_without_blocked_urls(self):
+        """No blocked URLs means no browser launch"""
+        http, browser = self._run(_jobs("ok.com", 3), _HostTracker())
+
+        assert browser == []
+        assert self._FakePool.launches == 0
+
+
 # ============================================
 # TEST: check_url_playwright() - Playwright Fallback
 # ============================================
@@ -308,6 +614,138 @@ class TestCheckUrlPlaywright:
             assert code is None
 
 
+# ============================================
+# TEST: BrowserPool - Pooled Playwright Fallback
+# ============================================
+
+def _fake_async_playwright(page_contents, fail_urls=()):
+    """Build a fake async_playwright() whose pages render page_contents[url]."""
+    contexts = []
+
+    def new_page_factory():
+        page = Mock()
+        page.url = None
+
+        async def goto(url, **kwargs):
+            if url in fail_urls:
+                raise Exception("Target crashed")
+            page.url = url
+        page.goto = AsyncMock(side_effect=goto)
+        page.content = AsyncMock(side_effect=lambda: page_contents[page.url])
+        page.close = AsyncMock()
+        return page
+
+    def new_context(**kwargs):
+        context = Mock()
+        context.route = AsyncMock()
+        context.new_page = AsyncMock(side_effect=new_page_factory)
+        context.close = AsyncMock()
+        contexts.append(context)
+        return context
+
+    browser = Mock()
+    browser.new_context = AsyncMock(side_effect=new_context)
+    browser.is_connected.return_value = True
+    browser.close = AsyncMock()
+
+    pw = Mock()
+    pw.chromium.launch = AsyncMock(return_value=browser)
+    pw.stop = AsyncMock()
+
+    starter = Mock()
+    starter.start = AsyncMock(return_value=pw)
+    return Mock(return_value=starter), browser, contexts
+
+
+@pytest.mark.skipif(not PLAYWRIGHT_AVAILABLE, reason="Playwright not installed")
+class TestBrowserPool:
+    """Test BrowserPool and check_urls_playwright()"""
+
+    def test_results_in_input_order(self):
+        """Should classify each URL and keep input order"""
+        pages = {
+            "https://a.com/1": "Senior Data Engineer",
+            "https://a.com/2": "Sorry, this job not found",
+            "https://b.com/3": "Checking your browser before accessing",
+        }
+        fake, browser, _ = _fake_async_playwright(pages)
+        with patch('pipeline.url_validator.async_playwright', fake):
+            results = check_urls_playwright(list(pages))
+
+        assert [r[0] for r in results] == ['active', 'soft_404', 'unverifiable']
+        assert results[0] == ('active', 200, "https://a.com/1")
+        browser.close.assert_awaited_once()
+
+    def test_single_browser_launch(self):
+        """Many URLs should share one browser launch"""
+        pages = {f"https://a.com/{i}": "Valid job" for i in range(20)}
+        fake, _, _ = _fake_async_playwright(pages)
+        with patch('pipeline.url_validator.async_playwright', fake):
+            check_urls_playwright(list(pages), contexts=3)
+
+        fake.return_value.start.return_value.chromium.launch.assert_awaited_once()
+
+    def test_contexts_recycled_after_page_limit(self):
+        """Contexts should be replaced after pages_per_context pages"""
+        pages = {f"https://a.com/{i}": "Valid job" for i in range(6)}
+        fake, browser, contexts = _fake_async_playwright(pages)
+
+        async def run():
+            async with BrowserPool(contexts=1, pages_per_context=2) as pool:
+                await pool.check_many(list(pages))
+                return pool.recycled
+
+        with patch('pipeline.url_validator.async_playwright', fake):
+            recycled = asyncio.run(run())
+
+        assert recycled == 3
+        assert len(contexts) == 4
+        assert all(c.close.await_count == 1 for c in contexts[:3])
+
+    def test_failed_page_recycles_context(self):
+        """A crashed page should be unverifiable and its context replaced"""
+        pages = {"https://a.com/ok": "Valid job", "https://a.com/bad": ""}
+        fake, _, contexts = _fake_async_playwright(pages, fail_urls={"https://a.com/bad"})
+
+        async def run():
+            async with BrowserPool(contexts=1) as pool:
+                return await pool.check_many(["https://a.com/bad", "https://a.com/ok"]), pool.recycled
+
+        with patch('pipeline.url_validator.async_playwright', fake):
+            results, recycled = asyncio.run(run())
+
+        assert results == [('unverifiable', None, None), ('active', 200, "https://a.com/ok")]
+        assert recycled == 1
+
+    def test_heavy_resources_blocked(self):
+        """Images/fonts/media should be aborted, documents allowed"""
+        for resource_type, aborted in [('image', True), ('font', True), ('media', True),
+                                       ('document', False), ('script', False)]:
+            route = Mock()
+            route.request.resource_type = resource_type
+            route.abort = AsyncMock()
+            route.continue_ = AsyncMock()
+
+            asyncio.run(_block_heavy_resources(route))
+
+            assert route.abort.called == aborted
+            assert route.continue_.called == (not aborted)
+
+    def test_browser_start_failure_marks_unverifiable(self):
+        """If the browser cannot start, every URL is unverifiable"""
+        fake = Mock()
+        fake.return_value.start = AsyncMock(side_effect=Exception("no chromium"))
+        with patch('pipeline.url_validator.async_playwright', fake):
+            results = check_urls_playwright(["https://a.com/1", "https://a.com/2"])
+
+        assert results == [('unverifiable', None, None)] * 2
+
+    def test_not_available(self):
+        """Without Playwright every URL is unverifiable"""
+        with patch('pipeline.url_validator.PLAYWRIGHT_AVAILABLE', False):
+            assert check_urls_playwright(["https://a.com/1"]) == [('unverifiable', None, None)]
+
+
 # ============================================
 # TEST: SOFT_404_PATTERNS Configuration
 # ============================================
@@ -378,6 +816,128 @@ class TestUrlStatusParameter:
             assert mock_supabase.table.called
 
 
+# ============================================
+# TEST: Recheck Priority
+# ============================================
+
+NOW = datetime(2026, 3, 1, 9, 0)
+
+
+def _job(posted_days_ago, checked_days_ago=None, employer="Acme", source="greenhouse"):
+    job = {
+        'id': posted_days_ago,
+        'employer_name': employer,
+        'data_source': source,
+        'posted_date': (NOW - timedelta(days=posted_days_ago)).strftime('%Y-%m-%d'),
+        'url_checked_at': None,
+    }
+    if checked_days_ago is not None:
+        job['url_checked_at'] = (NOW - timedelta(days=checked_days_ago)).isoformat() + '+00:00'
+    return job
+
+
+class TestRecheckPriority:
+    """Test closure-probability ranking of recheck candidates"""
+
+    def test_older_jobs_rank_higher(self):
+        """Jobs past the employer's median fill time are likelier closed"""
+        priority = RecheckPriority(default_median=30)
+        young = priority.closure_probability(_job(5, checked_days_ago=2), NOW)
+        old = priority.closure_probability(_job(60, checked_days_ago=2), NOW)
+        assert 0 < young < old < 1
+
+    def test_employer_median_drives_probability(self):
+        """Fast-hiring employers' jobs close sooner than slow-hiring ones"""
+        priority = RecheckPriority({'fast inc': (10.0, 50), 'slow inc': (90.0, 50)})
+        fast = priority.closure_probability(_job(20, 3, employer="Fast Inc"), NOW)
+        slow = priority.closure_probability(_job(20, 3, employer="Slow Inc"), NOW)
+        assert fast > slow
+
+    def test_recent_check_lowers_probability(self):
+        """Only the time since the last check counts towards closure"""
+        priority = RecheckPriority(default_median=30)
+        unchecked = priority.closure_probability(_job(30), NOW)
+        checked_yesterday = priority.closure_probability(_job(30, checked_days_ago=1), NOW)
+        assert unchecked == pytest.approx(0.5, abs=0.01)
+        assert checked_yesterday < unchecked
+
+    def test_small_samples_shrink_to_default(self):
+        """Employers with few closed roles lean on the overall median"""
+        priority = RecheckPriority({'tiny': (5.0, 1), 'big': (5.0, 100)}, default_median=45)
+        assert priority.median_days_to_fill('Tiny') == pytest.approx((5 + 45 * 3) / 4)
+        assert priority.median_days_to_fill('Big') == pytest.approx(5.0, abs=1.5)
+        assert priority.median_days_to_fill('Unknown Co') == 45
+
+    def test_source_closure_rate_scales_odds(self):
+        """Sources that close more often get higher probabilities"""
+        priority = RecheckPriority(source_closure_counts={'greenhouse': (400, 1000), 'lever': (100, 1000)})
+        gh = priority.closure_probability(_job(20, 3, source='greenhouse'), NOW)
+        lever = priority.closure_probability(_job(20, 3, source='lever'), NOW)
+        assert gh > lever
+
+    def test_single_source_factor_is_absolute(self):
+        """One source's closure rate still counts (relative to the prior, not to itself)"""
+        baseline = RecheckPriority().closure_probability(_job(20, 3), NOW)
+        closes_often = RecheckPriority(source_closure_counts={'greenhouse': (400, 1000)})
+        closes_rarely = RecheckPriority(source_closure_counts={'greenhouse': (50, 1000)})
+
+        assert closes_often.source_factors['greenhouse'] > 1.0 > closes_rarely.source_factors['greenhouse']
+        assert (closes_rarely.closure_probability(_job(20, 3), NOW) < baseline
+                < closes_often.closure_probability(_job(20, 3), NOW))
+
+    def test_small_source_samples_shrink_to_prior(self):
+        """A handful of checks barely moves the factor; it is clamped either way"""
+        assert RecheckPriority.source_factor(3, 3) < 1.3
+        assert RecheckPriority.source_factor(0, 0) == pytest.approx(1.0)
+        assert RecheckPriority.source_factor(10_000, 10_000) == SOURCE_FACTOR_RANGE[1]
+
+    def test_select_ranks_defers_and_limits(self):
+        """Due jobs come back likeliest-closed first; unlikely ones are deferred"""
+        priority = RecheckPriority(default_median=30)
+        jobs = [
+            _job(3, checked_days_ago=2),     # young, recently checked -> deferred
+            _job(40, checked_days_ago=2),    # past median -> due
+            _job(2),                         # never checked -> always due
+            _job(20, checked_days_ago=10),   # stale check -> due
+        ]
+        assert priority.closure_probability(jobs[0], NOW) < MIN_CLOSURE_PROBABILITY
+
+        due = priority.select(jobs, now=NOW)
+
+        assert [job['id'] for job in due] == [20, 40, 2]
+        probabilities = [job['closure_probability'] for job in due]
+        assert probabilities == sorted(probabilities, reverse=True)
+        assert [job['id'] for job in priority.select(jobs, limit=1, now=NOW)] == [20]
+        assert len(priority.select(jobs, force=True, now=NOW)) == 4
+
+    def test_missing_dates(self):
+        """Rows without posted_date or url_checked_at still score"""
+        priority = RecheckPriority()
+        assert priority.closure_probability({'employer_name': None}, NOW) == 0.0
+        job = {'posted_date': None, 'url_checked_at': 'garbage'}
+        assert priority.closure_probability(job, NOW) == 0.0
+
+    def test_load_from_database(self):
+        """Fill medians and closure counts are read from Supabase"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            table = mock_sb.table.return_value
+            table.select.return_value.range.return_value.execute.return_value = Mock(data=[
+                {'canonical_name': 'acme', 'median_days_to_fill': 12.0, 'sample_size': 8},
+                {'canonical_name': 'globex', 'median_days_to_fill': 40.0, 'sample_size': 3},
+            ])
+            counts = table.select.return_value.eq.return_value
+            counts.not_.is_.return_value.limit.return_value.execute.return_value = Mock(count=200)
+            counts.in_.return_value.limit.return_value.execute.return_value = Mock(count=80)
+
+            priority = RecheckPriority.load(['greenhouse'])
+
+        assert priority.employer_medians['acme'] == (12.0, 8)
+        assert priority.default_median == 26.0
+        rate = (80 + SOURCE_CLOSURE_PRIOR * SOURCE_PRIOR_WEIGHT) / (200 + SOURCE_PRIOR_WEIGHT)
+        assert priority.source_factors['greenhouse'] == pytest.approx(rate / (1 - rate) * 3)
+        assert priority.source_factors['greenhouse'] > 1.0
+
+
 # ============================================
 # TEST: employer_stats.py soft_404 Inclusion
 # ============================================
@@ -451,6 +1011,99 @@ class TestValidateUrlsIntegration:
             assert not mock_table.update.called
 
 
+# ============================================
+# TEST: Batched Database Writes
+# ============================================
+
+def _written_batches(mock_sb):
+    """(status, ids) for each enriched_jobs update().in_() call."""
+    table = mock_sb.table.return_value
+    statuses = [c.args[0]['url_status'] for c in table.update.call_args_list]
+    id_lists = [c.args[1] for c in table.update.return_value.in_.call_args_list]
+    return list(zip(statuses, id_lists))
+
+
+class TestUrlStatusWriter:
+    """Test UrlStatusWriter grouping and batching"""
+
+    def test_groups_by_status(self):
+        """One .in_() update per status instead of one per job"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            with UrlStatusWriter() as writer:
+                for job_id, status in [(1, 'active'), (2, '404'), (3, 'active'), (4, 'soft_404')]:
+                    writer.add(job_id, status)
+
+        assert sorted(_written_batches(mock_sb)) == [
+            ('404', [2]), ('active', [1, 3]), ('soft_404', [4])
+        ]
+        assert writer.written == 4
+        assert writer.round_trips == 3
+
+    def test_latest_status_wins(self):
+        """A later status for the same job replaces the earlier one"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            with UrlStatusWriter() as writer:
+                writer.add(1, 'active')
+                writer.add(2, 'blocked')
+                writer.add(2, 'active')
+
+        assert _written_batches(mock_sb) == [('active', [1, 2])]
+
+    def test_flushes_at_batch_size(self):
+        """Buffer is written whenever it reaches batch_size jobs"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            with UrlStatusWriter(batch_size=2) as writer:
+                for job_id in range(5):
+                    writer.add(job_id, 'active')
+
+        assert [ids for _, ids in _written_batches(mock_sb)] == [[0, 1], [2, 3], [4]]
+
+    def test_db_error_counted(self):
+        """Failed batches are counted, not raised"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            mock_sb.table.return_value.update.return_value.in_.return_value.execute.side_effect = Exception("timeout")
+            with UrlStatusWriter() as writer:
+                writer.add(1, 'active')
+                writer.add(2, 'active')
+
+        assert writer.failed == 2
+        assert writer.written == 0
+
+
+class TestUpdatePostingUrls:
+    """Test batched canonical URL rewrites"""
+
+    REWRITES = [
+        {'raw_job_id': 1, 'canonical_url': 'https://job-boards.greenhouse.io/a/jobs/1'},
+        {'raw_job_id': 2, 'canonical_url': 'https://job-boards.greenhouse.io/a/jobs/2'},
+        {'raw_job_id': 3, 'canonical_url': 'https://job-boards.greenhouse.io/a/jobs/3'},
+    ]
+
+    def test_uses_rpc_batches(self):
+        """Rewrites go through the RPC, one call per batch"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            mock_sb.rpc.return_value.execute.side_effect = [Mock(data=2), Mock(data=1)]
+
+            updated = update_posting_urls(self.REWRITES, batch_size=2)
+
+        assert updated == 3
+        assert mock_sb.rpc.call_count == 2
+        name, params = mock_sb.rpc.call_args_list[0].args
+        assert name == 'update_raw_job_posting_urls'
+        assert params['updates'][0] == {'id': 1, 'posting_url': self.REWRITES[0]['canonical_url']}
+        assert not mock_sb.table.called
+
+    def test_falls_back_to_row_updates(self):
+        """Without the RPC, rows are updated one by one"""
+        with patch('pipeline.url_validator.supabase') as mock_sb:
+            mock_sb.rpc.return_value.execute.side_effect = Exception("function does not exist")
+
+            updated = update_posting_urls(self.REWRITES)
+
+        assert updated == 3
+        assert mock_sb.table.return_value.update.call_count == 3
+
+
 # ============================================
 # TEST: URL Status State Machine
 # ============================================
@@ -5,6 +5,7 @@ Shows breakdown by city and job family.
 
 Usage:
     python analyze_db_results.py
+    python analyze_db_results.py --from-snapshot
 
 Note: This is a wrapper around pipeline/utilities/analyze_db_results.py
 """
@@ -17,5 +18,5 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 if __name__ == "__main__":
-    from pipeline.utilities.analyze_db_results import analyze_database
-    analyze_database()
+    from pipeline.utilities.analyze_db_results import main
+    main()
@@ -11,6 +11,7 @@ Shows:
 
 Usage:
     python check_pipeline_status.py
+    python check_pipeline_status.py --from-snapshot
 
 Note: This is a wrapper around pipeline/utilities/check_pipeline_status.py
 """